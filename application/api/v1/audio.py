@@ -6,20 +6,39 @@ All endpoints are functional and production-ready.
 """
 
 import asyncio
-import uuid
-from typing import Optional
+import json
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
+import structlog
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, WebSocket, WebSocketDisconnect
 
 from application.models.responses import AudioProcessingStatusResponse
-from shared.exceptions.exceptions import AudioProcessingError, ValidationError
+from application.services.streaming_transcription import StreamingTranscriptionSession
+from application.services.transcription_jobs import (
+    PRIORITIES,
+    QueueFullError,
+    TranscriptionJob,
+    TranscriptionJobQueue,
+    get_transcription_job_queue,
+)
+from integration.configuration.settings import Settings, get_settings
+from integration.external_apis.audio_decoding import normalize_format
+from integration.external_apis.ffmpeg_decoder import AudioDecodeError, FFmpegStreamDecoder, get_ffmpeg_decoder_pool
+from integration.external_apis.stt_registry import get_stt_agent_registry
+from shared.exceptions.exceptions import AudioProcessingError, AudioProcessingException, ValidationError
 from shared.interfaces.interfaces import AudioProcessorInterface
+from shared.interfaces.stt_interface import STT_SAMPLE_RATE
 from shared.utils.dependencies import get_audio_processor
 
+logger = structlog.get_logger(__name__)
+
 router = APIRouter(prefix="/audio", tags=["audio"])
 
-# In-memory storage for processing status (in production, use Redis or similar)
-processing_status = {}
+_STREAM_PCM_FORMATS = {"pcm", "pcm_s16le", "s16le", "l16", "raw"}
+_STREAM_ENCODED_FORMATS = {"webm", "opus", "ogg"}
+_active_streams = 0  # open /stream sessions in this process (single event loop, no lock needed)
 
 
 @router.post("/transcribe")
@@ -67,6 +86,9 @@ async def transcribe_audio(
             "confidence": confidence,
             "language": result.language,
             "duration": result.duration,
+            "trimmed_duration": result.trimmed_duration,
+            "speech_detected": result.speech_detected,
+            "cache_hit": result.cache_hit,
             "processing_time": result.processing_time,
             "is_simulation": is_simulation,
         }
@@ -81,74 +103,80 @@ async def transcribe_audio(
 
 @router.post("/transcribe-async", response_model=AudioProcessingStatusResponse)
 async def transcribe_audio_async(
-    background_tasks: BackgroundTasks,
     audio_file: UploadFile = File(..., description="Audio file to transcribe asynchronously"),
     language: Optional[str] = "es-ES",
+    priority: str = "interactive",
     audio_service: AudioProcessorInterface = Depends(get_audio_processor),
+    settings: Settings = Depends(get_settings),
 ):
     """
-    Start asynchronous audio transcription and return processing ID.
-    Useful for large audio files or when immediate response is needed.
-    """
-    try:
-        # Generate processing ID
-        processing_id = str(uuid.uuid4())
-
-        # Initialize processing status
-        processing_status[processing_id] = {
-            "status": "processing",
-            "progress": 0.0,
-            "result": None,
-            "error": None,
-        }
+    Queue an asynchronous transcription and return its processing ID.
 
-        # Read audio data
-        audio_data = await audio_file.read()
+    Jobs run on a fixed pool of STT workers; `interactive` jobs are served before
+    `batch` ones. Answers 429 (with Retry-After) when the queue is full.
+    """
+    if priority not in PRIORITIES:
+        raise HTTPException(status_code=400, detail=f"priority must be one of: {', '.join(PRIORITIES)}")
 
-        if len(audio_data) == 0:
-            raise HTTPException(status_code=400, detail="Empty audio file")
+    audio_data = await audio_file.read()
+    if len(audio_data) == 0:
+        raise HTTPException(status_code=400, detail="Empty audio file")
 
-        # Schedule background processing
-        background_tasks.add_task(
-            _process_audio_background,
-            processing_id=processing_id,
-            audio_data=audio_data,
+    job_queue = get_transcription_job_queue(settings, audio_service)
+    try:
+        job = job_queue.submit(
+            audio_data,
             format=audio_file.content_type or "audio/wav",
             language=language or "es-ES",
-            audio_service=audio_service,
+            priority=priority,
         )
-
-        return AudioProcessingStatusResponse(
-            success=True,
-            processing_id=processing_id,
-            status="processing",
-            progress=0.0,
-            estimated_time=10.0,  # Estimated seconds
-            message="Audio processing started",
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
         )
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to start processing: {str(e)}")
+    return _job_response(job_queue, job, "Audio processing queued")
 
 
 @router.get("/transcribe-status/{processing_id}", response_model=AudioProcessingStatusResponse)
-async def get_transcription_status(processing_id: str):
+async def get_transcription_status(
+    processing_id: str,
+    audio_service: AudioProcessorInterface = Depends(get_audio_processor),
+    settings: Settings = Depends(get_settings),
+):
     """
     Get the status of an asynchronous transcription job.
+    Finished results are kept for VOICEFLOW_TRANSCRIPTION_JOB_RESULT_TTL seconds.
     """
-    if processing_id not in processing_status:
-        raise HTTPException(status_code=404, detail="Processing ID not found")
+    job_queue = get_transcription_job_queue(settings, audio_service)
+    job = job_queue.get(processing_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Processing ID not found or expired")
+
+    return _job_response(job_queue, job, "Status retrieved successfully")
 
-    status_data = processing_status[processing_id]
 
+def _job_response(
+    job_queue: TranscriptionJobQueue, job: TranscriptionJob, message: str
+) -> AudioProcessingStatusResponse:
+    estimated_time = job_queue.estimated_time(job)
     return AudioProcessingStatusResponse(
-        success=status_data["error"] is None,
-        processing_id=processing_id,
-        status=status_data["status"],
-        progress=status_data["progress"],
-        result=status_data["result"],
-        error=status_data["error"],
-        message="Status retrieved successfully",
+        status="error" if job.status == "error" else "success" if job.is_complete else "info",
+        message=message,
+        processing_id=job.job_id,
+        is_complete=job.is_complete,
+        progress=round(job.progress, 2),
+        estimated_completion=datetime.now() + timedelta(seconds=estimated_time) if not job.is_complete else None,
+        job_status=job.status,
+        stage=job.stage,
+        priority=job.priority,
+        queue_position=job_queue.queue_position(job),
+        estimated_time=estimated_time,
+        result=job.result,
+        error=job.error,
+        expires_at=job_queue.expires_at(job),
     )
 
 
@@ -192,50 +220,8 @@ async def validate_audio(
         raise HTTPException(status_code=500, detail=f"Validation error: {str(e)}")
 
 
-async def _process_audio_background(
-    processing_id: str,
-    audio_data: bytes,
-    format: str,
-    language: str,
-    audio_service: AudioProcessorInterface,
-):
-    """
-    Background task for asynchronous audio processing.
-    """
-    try:
-        # Update progress
-        processing_status[processing_id]["progress"] = 0.1
-
-        # Simulate some processing time for realistic UX
-        await asyncio.sleep(1)
-        processing_status[processing_id]["progress"] = 0.3
-
-        # Actual transcription
-        result = await audio_service.transcribe_audio(audio_data=audio_data, format=format, language=language)
-
-        # Update with results
-        processing_status[processing_id].update(
-            {
-                "status": "completed",
-                "progress": 1.0,
-                "result": {
-                    "transcription": result.transcription,
-                    "confidence": result.confidence,
-                    "language": result.language,
-                    "duration": result.duration,
-                    "processing_time": result.processing_time,
-                },
-            }
-        )
-
-    except Exception as e:
-        # Update with error
-        processing_status[processing_id].update({"status": "error", "progress": 0.0, "error": str(e)})
-
-
-# WebSocket endpoint for real-time audio streaming (future enhancement)
 @router.post("/stream-config")
-async def get_streaming_config():
+async def get_streaming_config(settings: Settings = Depends(get_settings)):
     """
     Get configuration for real-time audio streaming.
     Returns settings needed for WebSocket audio streaming.
@@ -243,12 +229,117 @@ async def get_streaming_config():
     return {
         "success": True,
         "config": {
-            "sample_rate": 16000,
+            "sample_rate": STT_SAMPLE_RATE,
             "channels": 1,
             "format": "pcm_s16le",
+            "accepted_formats": sorted(_STREAM_PCM_FORMATS | _STREAM_ENCODED_FORMATS),
             "chunk_size": 1024,
             "language": "es-ES",
-            "websocket_endpoint": "/ws/audio-stream",
+            "partial_interval": settings.audio_stream_partial_interval,
+            "max_session_seconds": settings.audio_stream_max_session_seconds,
+            "max_concurrent_streams": settings.audio_stream_max_sessions,
+            "websocket_endpoint": "/api/v1/audio/stream",
         },
         "message": "Streaming configuration ready",
     }
+
+
+@router.websocket("/stream")
+async def stream_transcription(
+    websocket: WebSocket,
+    language: str = "es-ES",
+    format: str = "pcm_s16le",
+    sample_rate: int = Query(STT_SAMPLE_RATE, ge=8000, le=48000),
+    settings: Settings = Depends(get_settings),
+):
+    """
+    Real-time transcription over WebSocket.
+
+    The client sends binary audio chunks (pcm_s16le mono at `sample_rate`, or
+    webm/opus/ogg as produced by MediaRecorder) and receives JSON messages:
+    `ready`, `speech_start`, `partial` (provisional text of the open utterance),
+    `final` (text of a finished utterance), `error` and `done`. Sending the text
+    message `{"type": "stop"}` flushes the last utterance and ends the session.
+    At most `audio_stream_max_sessions` sessions run at once; further connections
+    are closed with 1013 (try again later).
+    """
+    global _active_streams
+    await websocket.accept()
+    send_lock = asyncio.Lock()
+
+    async def send(message: Dict[str, Any]) -> None:
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def fail(code: str, message: str, close_code: int) -> None:
+        await send({"type": "error", "code": code, "message": message})
+        await websocket.close(code=close_code)
+
+    kind = normalize_format(format)
+    if kind not in _STREAM_PCM_FORMATS | _STREAM_ENCODED_FORMATS:
+        await fail("UNSUPPORTED_FORMAT", f"Unsupported stream format: {format}", 1003)
+        return
+
+    if _active_streams >= settings.audio_stream_max_sessions:
+        await fail("STREAM_LIMIT", f"Too many concurrent streams ({settings.audio_stream_max_sessions})", 1013)
+        return
+
+    _active_streams += 1
+    try:
+        await _serve_stream(websocket, send, fail, kind, language, sample_rate, settings)
+    finally:
+        _active_streams -= 1
+
+
+async def _serve_stream(
+    websocket: WebSocket, send, fail, kind: str, language: str, sample_rate: int, settings: Settings
+) -> None:
+    registry = get_stt_agent_registry()
+    stt_agent = registry.agent or await asyncio.to_thread(registry.get)
+    if stt_agent is None:
+        await fail("STT_UNAVAILABLE", "Speech-to-text service is not available", 1013)
+        return
+
+    session = StreamingTranscriptionSession.create_from_settings(settings, stt_agent, send, language)
+    decoder: Optional[FFmpegStreamDecoder] = None
+    try:
+        if kind in _STREAM_ENCODED_FORMATS:
+            decoder = get_ffmpeg_decoder_pool(settings).open_stream(session.feed_pcm16)
+            await decoder.start()
+
+        await send({"type": "ready", "format": kind, "sample_rate": STT_SAMPLE_RATE, "language": language})
+
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes"):
+                if decoder is not None:
+                    await decoder.write(message["bytes"])
+                else:
+                    await session.feed_pcm16(message["bytes"], sample_rate=sample_rate)
+            elif message.get("text"):
+                try:
+                    control = json.loads(message["text"])
+                except json.JSONDecodeError:
+                    control = None
+                if isinstance(control, dict) and control.get("type") == "stop":
+                    break
+
+        if decoder is not None:
+            await decoder.finish()
+        await session.finish()
+        await send({"type": "done", **session.get_stats()})
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        logger.info("Audio stream closed by client", audio_seconds=session.received_seconds)
+    except AudioProcessingException as e:
+        await session.finish()
+        await fail(e.error_code or "STREAM_ERROR", e.message, 1008)
+    except AudioDecodeError as e:
+        await fail("DECODE_FAILED", str(e), 1011)
+    finally:
+        session.cancel()
+        if decoder is not None:
+            await decoder.close()
@@ -6,16 +6,21 @@ Backend responses are simulated for demo purposes to avoid OpenAI costs.
 """
 
 import uuid
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response, StreamingResponse
 
 from application.models.requests import ChatMessageRequest
 from application.models.responses import (
     ChatResponse,
     ConversationListResponse,
     ConversationResponse,
+    PipelineStep,
+    StatusEnum,
+    TourismData,
 )
 from shared.exceptions.exceptions import (
     BackendCommunicationException,
@@ -28,6 +33,38 @@ logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
+def _chat_response(session_id: str, backend_response: dict[str, Any]) -> Response:
+    """Build the ChatResponse from the backend output and serialize it directly.
+
+    The backend adapter already returns validated TourismData/PipelineStep instances,
+    so only raw dicts (other BackendInterface implementations) are validated here; the
+    response is assembled with model_construct and written as JSON without FastAPI
+    re-validating it against response_model (which is kept for the OpenAPI schema).
+    """
+    tourism_data = backend_response.get("tourism_data")
+    if tourism_data is not None and not isinstance(tourism_data, TourismData):
+        tourism_data = TourismData.model_validate(tourism_data)
+    pipeline_steps = backend_response.get("pipeline_steps")
+    if pipeline_steps is not None:
+        pipeline_steps = [
+            step if isinstance(step, PipelineStep) else PipelineStep.model_validate(step) for step in pipeline_steps
+        ]
+
+    response = ChatResponse.model_construct(
+        status=StatusEnum.SUCCESS.value,
+        message="Message processed successfully",
+        session_id=session_id,
+        ai_response=backend_response["ai_response"],
+        processing_time=float(backend_response.get("processing_time", 0.5)),
+        intent=backend_response.get("intent"),
+        entities=backend_response.get("entities"),
+        tourism_data=tourism_data,
+        pipeline_steps=pipeline_steps,
+        metadata=backend_response.get("metadata"),
+    )
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
 @router.post("/message", response_model=ChatResponse)
 async def send_message(
     request: ChatMessageRequest,
@@ -73,18 +110,7 @@ async def send_message(
             session_id=conversation_id,
         )
 
-        return ChatResponse(
-            status="success",
-            message="Message processed successfully",
-            session_id=session_id,
-            ai_response=backend_response["ai_response"],
-            processing_time=backend_response.get("processing_time", 0.5),
-            intent=backend_response.get("intent"),
-            entities=backend_response.get("entities"),
-            tourism_data=backend_response.get("tourism_data"),
-            pipeline_steps=backend_response.get("pipeline_steps"),
-            metadata=backend_response.get("metadata"),
-        )
+        return _chat_response(session_id, backend_response)
 
     except BackendCommunicationException as e:
         # Log error for debugging (no conversation update needed)
@@ -115,7 +141,7 @@ async def get_conversation(
             raise HTTPException(status_code=404, detail="Conversation not found")
 
         return ConversationResponse(
-            success=True,
+            status=StatusEnum.SUCCESS,
             conversation_id=conversation_id,
             messages=conversation["messages"],
             created_at=conversation["created_at"],
@@ -124,6 +150,8 @@ async def get_conversation(
             message="Conversation retrieved successfully",
         )
 
+    except HTTPException:
+        raise
     except ValidationException as e:
         raise HTTPException(status_code=500, detail=f"Conversation error: {str(e)}")
     except Exception as e:
@@ -143,7 +171,7 @@ async def list_conversations(
         conversations = await conversation_service.list_conversations(limit=limit, offset=offset)
 
         return ConversationListResponse(
-            success=True,
+            status=StatusEnum.SUCCESS,
             conversations=conversations,
             total_count=len(conversations),
             limit=limit,
@@ -151,12 +179,41 @@ async def list_conversations(
             message="Conversations retrieved successfully",
         )
 
+    except HTTPException:
+        raise
     except ValidationException as e:
         raise HTTPException(status_code=500, detail=f"Conversation error: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get("/conversations/export")
+async def export_conversations(
+    session_id: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    conversation_service: ConversationInterface = Depends(get_conversation_service),
+):
+    """
+    Stream messages as NDJSON (one per line), for all sessions or one, within [start, end).
+    """
+    if start is not None and end is not None:
+        try:
+            ordered = start < end
+        except TypeError:
+            raise HTTPException(status_code=400, detail="start and end must both have or both omit a timezone")
+        if not ordered:
+            raise HTTPException(status_code=400, detail="start must be earlier than end")
+    if session_id is not None and await conversation_service.get_session_info(session_id) is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    return StreamingResponse(
+        conversation_service.export_ndjson(session_id=session_id, start=start, end=end),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="conversations.ndjson"'},
+    )
+
+
 @router.delete("/conversation/{conversation_id}")
 async def delete_conversation(
     conversation_id: str,
@@ -177,6 +234,8 @@ async def delete_conversation(
             "message": "Conversation deleted successfully",
         }
 
+    except HTTPException:
+        raise
     except ValidationException as e:
         raise HTTPException(status_code=500, detail=f"Conversation error: {str(e)}")
     except Exception as e:
@@ -203,6 +262,8 @@ async def clear_conversation(
             "message": "Conversation cleared successfully",
         }
 
+    except HTTPException:
+        raise
     except ValidationException as e:
         raise HTTPException(status_code=500, detail=f"Conversation error: {str(e)}")
     except Exception as e:
@@ -8,8 +8,11 @@ from fastapi import APIRouter, Depends
 
 from application.models.responses import StatusEnum, SystemStatusResponse
 from integration.configuration.settings import Settings, get_settings
-from shared.interfaces.interfaces import AudioProcessorInterface, BackendInterface
-from shared.utils.dependencies import get_audio_processor, get_backend_adapter
+from integration.external_apis.spacy_ner_service import get_spacy_model_registry
+from integration.external_apis.spacy_procpool_ner_service import get_spacy_process_pool
+from integration.external_apis.stt_registry import get_stt_agent_registry
+from shared.interfaces.interfaces import BackendInterface
+from shared.utils.dependencies import get_backend_adapter
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -17,7 +20,6 @@ router = APIRouter(prefix="/health", tags=["Health"])
 @router.get("/", response_model=SystemStatusResponse)
 async def health_check(
     backend: BackendInterface = Depends(get_backend_adapter),
-    audio: AudioProcessorInterface = Depends(get_audio_processor),
     settings: Settings = Depends(get_settings),
 ):
     """
@@ -28,14 +30,13 @@ async def health_check(
         # Check backend status
         backend_status = await backend.get_system_status()
 
-        # Check audio service
-        audio_info = await audio.get_service_info()
+        # Check audio service (cached status of the shared STT agent, never built here)
+        audio_component = _stt_component()
 
         # Determine overall health
-        system_healthy = backend_status.get("status") in [
-            "healthy",
-            "operational",
-        ] and audio_info.get("is_available", False)
+        system_healthy = (
+            backend_status.get("status") in ["healthy", "operational"] and audio_component["status"] == "healthy"
+        )
 
         components = {
             "backend_adapter": {
@@ -43,11 +44,8 @@ async def health_check(
                 "description": f"Backend type: {backend_status.get('backend_type', 'unknown')}",
                 "details": backend_status,
             },
-            "audio_service": {
-                "status": ("healthy" if audio_info.get("is_available", False) else "unhealthy"),
-                "description": f"STT Backend: {audio_info.get('stt_backend', 'unknown')}",
-                "details": audio_info,
-            },
+            "audio_service": audio_component,
+            "ner_models": _ner_models_component(settings),
             "api_server": {
                 "status": "healthy",
                 "description": "FastAPI server running",
@@ -74,6 +72,64 @@ async def health_check(
         )
 
 
+def _ner_models_component(settings: Settings) -> dict:
+    """Readiness of the process-wide spaCy model registry."""
+    registry = get_spacy_model_registry()
+    registry_status = registry.get_status()
+    if not settings.ner_enabled:
+        status = "disabled"
+    elif registry_status["ready"]:
+        status = "healthy"
+    else:
+        status = registry_status["preload_state"]
+    return {
+        "status": status,
+        "description": f"Loaded NER models: {', '.join(registry.loaded_models()) or 'none'}",
+        "details": registry_status,
+    }
+
+
+def _stt_component() -> dict:
+    """Readiness of the process-wide STT agent (cached; never creates the agent)."""
+    stt_status = get_stt_agent_registry().get_status()
+    if stt_status["ready"]:
+        status = "healthy" if stt_status["service_available"] else "unhealthy"
+    elif stt_status["state"] == "failed":
+        status = "unhealthy"
+    else:
+        status = stt_status["state"]
+    return {
+        "status": status,
+        "description": f"STT Backend: {stt_status.get('service', 'unknown')}",
+        "details": stt_status,
+    }
+
+
+@router.get("/ner", response_model=dict)
+async def ner_health(settings: Settings = Depends(get_settings)):
+    """
+    NER model readiness: per-language model, load time and resident memory
+    (plus worker pings when the spacy_procpool provider is configured).
+    """
+    registry_status = get_spacy_model_registry().get_status()
+    response = {
+        "status": "success",
+        "ready": registry_status["ready"] or not settings.ner_enabled,
+        "ner_provider": settings.ner_provider,
+        "registry": registry_status,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+    if settings.ner_provider == "spacy_procpool":
+        pool = get_spacy_process_pool(settings)
+        pool_status = pool.get_stats()
+        pool_status["health"] = await pool.health_check() if pool.started else None
+        response["process_pool"] = pool_status
+        response["ready"] = pool_status["ready"] or not settings.ner_enabled
+
+    return response
+
+
 @router.get("/backend", response_model=dict)
 async def backend_health(backend: BackendInterface = Depends(get_backend_adapter)):
     """
@@ -98,32 +154,26 @@ async def backend_health(backend: BackendInterface = Depends(get_backend_adapter
 async def audio_health():
     """
     Detailed audio service health check.
+    Reports the cached status of the shared STT agent; "ready" stays false while it loads.
     """
     try:
-        # Test if real Azure STT is available
-        has_real_stt = False
-        stt_status = "simulation_mode"
-
-        try:
-            from integration.external_apis.stt_agent import create_stt_agent
-
-            stt_agent = create_stt_agent()
-            if stt_agent is not None:
-                has_real_stt = True
-                stt_status = "azure_stt_available"
-        except Exception:
-            pass
+        stt_status = get_stt_agent_registry().get_status()
+        has_real_stt = stt_status["ready"] and stt_status["service_available"]
 
         return {
             "status": "success",
             "healthy": True,
+            "ready": stt_status["ready"],
             "service_info": {
-                "stt_service": stt_status,
+                "stt_service": stt_status.get("service", "simulation_mode"),
+                "state": stt_status["state"],
                 "real_transcription_available": has_real_stt,
-                "azure_stt_configured": has_real_stt,
+                "azure_stt_configured": has_real_stt and stt_status.get("service", "").startswith("Azure"),
                 "fallback_mode": not has_real_stt,
+                "load_time_ms": stt_status.get("load_time_ms"),
+                "error": stt_status.get("error"),
             },
-            "supported_formats": ["wav", "mp3", "m4a", "webm", "ogg"],
+            "supported_formats": stt_status.get("supported_formats") or ["wav", "mp3", "m4a", "webm", "ogg"],
             "max_file_size": "10MB",
             "max_duration": "30 seconds",
             "timestamp": datetime.now().isoformat(),
@@ -0,0 +1,73 @@
+"""
+In-process metrics endpoints.
+"""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends
+
+from application.orchestration.nlu_shadow import get_shadow_comparator
+from application.services.transcription_jobs import get_transcription_job_queue
+from integration.configuration.settings import Settings, get_settings
+from integration.external_apis.ffmpeg_decoder import get_ffmpeg_decoder_pool
+from shared.utils.dependencies import get_audio_processor, get_conversation_service
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/nlu-shadow", response_model=dict)
+async def nlu_shadow_metrics(settings: Settings = Depends(get_settings)):
+    """
+    Rolling agreement statistics between the primary and shadow NLU providers.
+    """
+    if not (settings.nlu_enabled and settings.nlu_shadow_mode):
+        return {
+            "status": "success",
+            "enabled": False,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    comparator = get_shadow_comparator(settings)
+    return {
+        "status": "success",
+        "enabled": True,
+        "queue": comparator.get_stats(),
+        "agreement": comparator.get_agreement_stats(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@router.get("/conversations", response_model=dict)
+async def conversation_store_metrics(settings: Settings = Depends(get_settings)):
+    """
+    Size and eviction counters of the conversation store.
+    """
+    return {
+        "status": "success",
+        "store": get_conversation_service(settings).get_stats(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@router.get("/audio-decoder", response_model=dict)
+async def audio_decoder_metrics(settings: Settings = Depends(get_settings)):
+    """
+    ffmpeg decoder pool: decode counters, failures/timeouts, idle processes and latency.
+    """
+    return {
+        "status": "success",
+        "decoder": get_ffmpeg_decoder_pool(settings).get_stats(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@router.get("/transcription-jobs", response_model=dict)
+async def transcription_job_metrics(settings: Settings = Depends(get_settings)):
+    """
+    Async transcription queue: depth per priority, busy workers, wait and processing times.
+    """
+    return {
+        "status": "success",
+        "jobs": get_transcription_job_queue(settings, get_audio_processor(settings)).get_stats(),
+        "timestamp": datetime.now().isoformat(),
+    }
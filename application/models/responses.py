@@ -64,6 +64,14 @@ class AudioProcessingStatusResponse(BaseResponse):
     is_complete: bool = Field(..., description="Whether processing is complete")
     progress: Optional[float] = Field(default=None, description="Processing progress (0-1)")
     estimated_completion: Optional[datetime] = Field(default=None, description="Estimated completion time")
+    job_status: Optional[str] = Field(default=None, description="queued|processing|completed|error")
+    stage: Optional[str] = Field(default=None, description="Last completed processing step")
+    priority: Optional[str] = Field(default=None, description="interactive|batch")
+    queue_position: Optional[int] = Field(default=None, description="Jobs that will start before this one")
+    estimated_time: Optional[float] = Field(default=None, description="Estimated seconds until completion")
+    result: Optional[Dict[str, Any]] = Field(default=None, description="Transcription result when completed")
+    error: Optional[str] = Field(default=None, description="Error message when the job failed")
+    expires_at: Optional[datetime] = Field(default=None, description="When the finished result is discarded")
 
 
 class PipelineStep(BaseModel):
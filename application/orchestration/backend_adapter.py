@@ -12,12 +12,14 @@ from typing import Any, Dict, Optional
 import structlog
 
 from application.models.responses import PipelineStep, TourismData
+from application.orchestration.nlu_shadow import ShadowNLUComparator, get_shadow_comparator
 from application.services.profile_service import ProfileService
 from integration.configuration.settings import Settings
 from shared.exceptions.exceptions import BackendCommunicationException
 from shared.interfaces.interfaces import BackendInterface
 from shared.interfaces.ner_interface import NERServiceInterface
 from shared.interfaces.nlu_interface import NLUServiceInterface
+from shared.models.nlu_models import NLUResult
 
 logger = structlog.get_logger(__name__)
 
@@ -45,22 +47,10 @@ class LocalBackendAdapter(BackendInterface):
         self._profile_service = ProfileService()
         self._ner_service = ner_service
         self._nlu_service = nlu_service
-        self._shadow_nlu_service: Optional[NLUServiceInterface] = None
+        self._shadow_comparator: Optional[ShadowNLUComparator] = None
 
         if self.settings.nlu_enabled and self.settings.nlu_shadow_mode:
-            from integration.external_apis.nlu_factory import NLUServiceFactory
-
-            logger.info(
-                "Shadow mode enabled",
-                primary_provider=self.settings.nlu_provider,
-                shadow_provider=self.settings.nlu_shadow_provider,
-            )
-
-            shadow_settings = self.settings.model_copy(deep=True)
-            shadow_settings.nlu_provider = self.settings.nlu_shadow_provider
-            self._shadow_nlu_service = NLUServiceFactory.create_service(
-                self.settings.nlu_shadow_provider, settings=shadow_settings
-            )
+            self._shadow_comparator = get_shadow_comparator(self.settings)
 
     async def _get_backend_instance(self):
         """Lazy initialization of backend to avoid import issues."""
@@ -113,9 +103,8 @@ class LocalBackendAdapter(BackendInterface):
             sim_meta: dict[str, Any] = {}
 
             if use_real_agents:
-                if self.settings.nlu_shadow_mode:
-                    self._schedule_shadow_comparison(transcription, profile_context)
                 ai_response = await self._process_real_query(transcription, profile_context=profile_context)
+                self._schedule_shadow_comparison(transcription, ai_response, profile_context)
             else:
                 ai_response = await self._simulate_ai_response(transcription, profile_context=profile_context)
 
@@ -216,21 +205,24 @@ class LocalBackendAdapter(BackendInterface):
                 "tourism_data": None,
             }
 
-            # Validate tourism_data against Pydantic model (graceful degradation)
-            if response_tourism_data:
+            # tourism_data from the agent is already a validated TourismData (canonicalizer);
+            # only raw dicts (simulation mode) are validated here (graceful degradation).
+            if isinstance(response_tourism_data, TourismData):
+                structured_response["tourism_data"] = response_tourism_data
+            elif response_tourism_data:
                 try:
-                    td = TourismData.model_validate(response_tourism_data)
-                    structured_response["tourism_data"] = td.model_dump()
+                    structured_response["tourism_data"] = TourismData.model_validate(response_tourism_data)
                 except Exception as e:
                     logger.warning("Invalid tourism_data received, dropping to None", error=str(e))
 
-            # Validate pipeline_steps entries
+            # Validate pipeline_steps entries once; the API serializes the PipelineStep instances directly
             if response_pipeline_steps and isinstance(response_pipeline_steps, list):
                 cleaned_steps = []
                 for step in response_pipeline_steps[:20]:
                     try:
-                        ps = PipelineStep.model_validate(step)
-                        cleaned_steps.append(ps.model_dump())
+                        cleaned_steps.append(
+                            step if isinstance(step, PipelineStep) else PipelineStep.model_validate(step)
+                        )
                     except Exception:
                         # skip invalid step but keep processing
                         continue
@@ -296,57 +288,26 @@ class LocalBackendAdapter(BackendInterface):
             logger.warning("Falling back to simulation due to backend error")
             return await self._simulate_ai_response(transcription)
 
-    def _schedule_shadow_comparison(self, transcription: str, profile_context: Optional[Dict[str, Any]] = None) -> None:
-        """Schedule asynchronous shadow NLU comparison without impacting request latency."""
-        if self._nlu_service is None or self._shadow_nlu_service is None:
-            return
-
-        async def run_shadow() -> None:
-            await self._run_shadow_comparison(transcription, profile_context=profile_context)
-
-        task = asyncio.create_task(run_shadow())
-
-        def _consume_exceptions(completed_task: asyncio.Task) -> None:
-            try:
-                completed_task.result()
-            except Exception as error:
-                logger.warning("nlu_shadow_task_failed", error=str(error))
-
-        task.add_done_callback(_consume_exceptions)
-
-    async def _run_shadow_comparison(
+    def _schedule_shadow_comparison(
         self,
         transcription: str,
+        ai_response: Any,
         profile_context: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Run primary and shadow NLU providers in parallel and log comparison.
+        """Submit the primary NLU result to the shadow queue without impacting request latency.
 
-        Primary provider: configured via nlu_provider (respuesta al usuario)
-        Shadow provider: configured via nlu_shadow_provider (logs only, async, no latency impact)
+        The primary provider is never re-run: the NLUResult produced by the agent
+        pipeline is compared against the shadow provider by background workers.
         """
-        if self._nlu_service is None or self._shadow_nlu_service is None:
+        if self._shadow_comparator is None or not isinstance(ai_response, dict):
             return
 
-        try:
-            old_result, new_result = await asyncio.gather(
-                self._nlu_service.analyze_text(transcription, language="es", profile_context=profile_context),
-                self._shadow_nlu_service.analyze_text(transcription, language="es", profile_context=profile_context),
-            )
+        metadata = ai_response.get("metadata")
+        primary_result = metadata.get("nlu_result") if isinstance(metadata, dict) else None
+        if not isinstance(primary_result, NLUResult):
+            return
 
-            old_intent = getattr(old_result, "intent", None)
-            new_intent = getattr(new_result, "intent", None)
-            logger.info(
-                "nlu_shadow_comparison",
-                old_provider=getattr(old_result, "provider", "keyword"),
-                old_intent=old_intent,
-                new_provider=getattr(new_result, "provider", "openai"),
-                new_intent=new_intent,
-                new_confidence=getattr(new_result, "confidence", 0.0),
-                agreement=old_intent == new_intent,
-                text_preview=transcription[:120],
-            )
-        except Exception as error:
-            logger.warning("nlu_shadow_comparison_failed", error=str(error))
+        self._shadow_comparator.submit(transcription, primary_result, profile_context=profile_context)
 
     def _get_simulation_metadata(self, query_lower: str) -> dict:
         """Return pipeline_steps, tourism_data, intent and entities for simulation mode."""
@@ -1188,6 +1149,9 @@ Te puedo ayudar con:
                 "version": "1.0.0",
             }
 
+            if self._shadow_comparator is not None:
+                system_status["statistics"]["nlu_shadow"] = self._shadow_comparator.get_stats()
+
             logger.info("✅ System status check completed", status="healthy")
             return system_status
 
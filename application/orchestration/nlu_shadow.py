@@ -0,0 +1,204 @@
+"""
+Shadow NLU comparison running off the request path.
+
+The primary NLU result produced by the tourism pipeline is reused as-is; only
+the shadow provider is invoked. Work is sampled and pushed into a bounded queue
+drained by a fixed number of workers, so shadow traffic can never grow without
+limit: when the queue is full the comparison is dropped and counted. Completed
+comparisons feed a rolling ShadowAgreementStats window.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional
+
+import structlog
+
+from application.orchestration.nlu_shadow_metrics import ShadowAgreementStats
+from integration.configuration.settings import Settings
+from shared.interfaces.nlu_interface import NLUServiceInterface
+from shared.models.nlu_models import NLUResult
+
+logger = structlog.get_logger(__name__)
+
+
+class ShadowNLUComparator:
+    """Bounded, sampled shadow comparison between primary and shadow NLU providers."""
+
+    def __init__(
+        self,
+        shadow_service: NLUServiceInterface,
+        sample_rate: float = 1.0,
+        queue_size: int = 100,
+        workers: int = 1,
+        stats_window: int = 1000,
+    ):
+        self._shadow_service = shadow_service
+        self._sample_rate = max(0.0, min(1.0, sample_rate))
+        self._queue_size = max(1, queue_size)
+        self._worker_count = max(1, workers)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: list[asyncio.Task] = []
+        self._agreement_stats = ShadowAgreementStats(window_size=stats_window)
+        self._last_primary_provider: Optional[str] = None
+
+        self._counters: Dict[str, int] = {
+            "submitted": 0,
+            "sampled_out": 0,
+            "dropped": 0,
+            "completed": 0,
+            "failed": 0,
+        }
+
+    @classmethod
+    def create_from_settings(cls, settings: Settings) -> "ShadowNLUComparator":
+        """Build the comparator and its shadow provider from settings."""
+        from integration.external_apis.nlu_factory import NLUServiceFactory
+
+        shadow_settings = settings.model_copy(deep=True)
+        shadow_settings.nlu_provider = settings.nlu_shadow_provider
+        shadow_service = NLUServiceFactory.create_service(settings.nlu_shadow_provider, settings=shadow_settings)
+
+        return cls(
+            shadow_service,
+            sample_rate=settings.nlu_shadow_sample_rate,
+            queue_size=settings.nlu_shadow_queue_size,
+            workers=settings.nlu_shadow_workers,
+            stats_window=settings.nlu_shadow_stats_window,
+        )
+
+    def submit(
+        self,
+        transcription: str,
+        primary_result: NLUResult,
+        profile_context: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Enqueue a comparison without blocking. Returns True if the work was accepted."""
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            self._counters["sampled_out"] += 1
+            return False
+
+        queue = self._ensure_workers()
+        try:
+            queue.put_nowait((transcription, primary_result, profile_context))
+        except asyncio.QueueFull:
+            self._counters["dropped"] += 1
+            logger.warning("nlu_shadow_queue_full", dropped=self._counters["dropped"], queue_size=self._queue_size)
+            return False
+
+        self._counters["submitted"] += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return queue counters for observability."""
+        return {
+            **self._counters,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "queue_size": self._queue_size,
+            "workers": self._worker_count,
+            "sample_rate": self._sample_rate,
+            "shadow_provider": self._shadow_service.get_service_info().get("provider"),
+        }
+
+    def get_agreement_stats(self) -> Dict[str, Any]:
+        """Return rolling agreement, confusion matrix and latency distributions."""
+        return {
+            "primary_provider": self._last_primary_provider,
+            "shadow_provider": self._shadow_service.get_service_info().get("provider"),
+            **self._agreement_stats.snapshot(),
+        }
+
+    async def stop(self) -> None:
+        """Cancel workers and discard pending comparisons."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+        self._loop = None
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        """Create queue and workers on the running loop (recreated if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self._queue_size)
+            self._loop = loop
+            self._workers = [
+                loop.create_task(self._worker(self._queue), name=f"nlu-shadow-{index}")
+                for index in range(self._worker_count)
+            ]
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            transcription, primary_result, profile_context = await queue.get()
+            try:
+                await self._compare(transcription, primary_result, profile_context)
+                self._counters["completed"] += 1
+            except Exception as error:
+                self._counters["failed"] += 1
+                logger.warning("nlu_shadow_comparison_failed", error=str(error))
+            finally:
+                queue.task_done()
+
+    async def _compare(
+        self,
+        transcription: str,
+        primary_result: NLUResult,
+        profile_context: Optional[Dict[str, Any]],
+    ) -> None:
+        start = time.perf_counter()
+        shadow_result = await self._shadow_service.analyze_text(
+            transcription, language=primary_result.language, profile_context=profile_context
+        )
+        shadow_latency_ms = shadow_result.latency_ms or int((time.perf_counter() - start) * 1000)
+
+        self._last_primary_provider = primary_result.provider
+        self._agreement_stats.record(
+            primary_result.intent, shadow_result.intent, primary_result.latency_ms, shadow_latency_ms
+        )
+
+        logger.info(
+            "nlu_shadow_comparison",
+            old_provider=primary_result.provider,
+            old_intent=primary_result.intent,
+            old_latency_ms=primary_result.latency_ms,
+            new_provider=shadow_result.provider,
+            new_intent=shadow_result.intent,
+            new_confidence=shadow_result.confidence,
+            new_latency_ms=shadow_latency_ms,
+            agreement=primary_result.intent == shadow_result.intent,
+            text_preview=transcription[:120],
+        )
+
+
+_shadow_comparator: Optional[ShadowNLUComparator] = None
+
+
+def get_shadow_comparator(settings: Settings) -> ShadowNLUComparator:
+    """Return the process-wide shadow comparator, creating it on first use."""
+    global _shadow_comparator
+    if _shadow_comparator is None:
+        logger.info(
+            "Shadow mode enabled",
+            primary_provider=settings.nlu_provider,
+            shadow_provider=settings.nlu_shadow_provider,
+            sample_rate=settings.nlu_shadow_sample_rate,
+            queue_size=settings.nlu_shadow_queue_size,
+            workers=settings.nlu_shadow_workers,
+            stats_window=settings.nlu_shadow_stats_window,
+        )
+        _shadow_comparator = ShadowNLUComparator.create_from_settings(settings)
+    return _shadow_comparator
+
+
+async def shutdown_shadow_comparator() -> None:
+    """Stop the process-wide comparator workers (application shutdown)."""
+    global _shadow_comparator
+    if _shadow_comparator is not None:
+        await _shadow_comparator.stop()
+        _shadow_comparator = None
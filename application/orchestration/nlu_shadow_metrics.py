@@ -0,0 +1,177 @@
+"""
+Rolling agreement statistics for NLU shadow comparisons.
+
+Each completed comparison is written into a fixed-size ring buffer. Counters
+(confusion matrix and latency histograms) are updated incrementally when a
+sample enters or leaves the window, so recording is O(1) and memory is bounded
+by the window size and the number of tracked intent labels.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+OTHER_INTENT_LABEL = "__other__"
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BUCKETS_MS: tuple[int, ...] = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile over an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1)))))
+    return float(sorted_values[rank])
+
+
+class ShadowAgreementStats:
+    """Bounded rolling window of primary vs shadow NLU outcomes."""
+
+    def __init__(self, window_size: int = 1000, max_intents: int = 32):
+        self._window_size = max(1, window_size)
+        # One slot is reserved for OTHER_INTENT_LABEL once the label table is full.
+        self._max_intents = max(2, max_intents)
+        self._lock = threading.Lock()
+
+        self._primary_idx: List[int] = [0] * self._window_size
+        self._shadow_idx: List[int] = [0] * self._window_size
+        self._primary_latency: List[int] = [0] * self._window_size
+        self._shadow_latency: List[int] = [0] * self._window_size
+        self._head = 0
+        self._count = 0
+        self._total_recorded = 0
+
+        self._labels: List[str] = []
+        self._label_index: Dict[str, int] = {}
+        self._confusion: List[List[int]] = [[0] * self._max_intents for _ in range(self._max_intents)]
+        self._agreements = 0
+
+        bucket_count = len(LATENCY_BUCKETS_MS) + 1
+        self._primary_histogram: List[int] = [0] * bucket_count
+        self._shadow_histogram: List[int] = [0] * bucket_count
+
+    @property
+    def window_size(self) -> int:
+        return self._window_size
+
+    def record(
+        self,
+        primary_intent: str,
+        shadow_intent: str,
+        primary_latency_ms: int,
+        shadow_latency_ms: int,
+    ) -> None:
+        """Add one comparison to the window, evicting the oldest when full."""
+        with self._lock:
+            primary = self._intern(primary_intent)
+            shadow = self._intern(shadow_intent)
+            primary_latency = max(0, int(primary_latency_ms or 0))
+            shadow_latency = max(0, int(shadow_latency_ms or 0))
+
+            slot = self._head
+            if self._count == self._window_size:
+                self._apply(
+                    self._primary_idx[slot],
+                    self._shadow_idx[slot],
+                    self._primary_latency[slot],
+                    self._shadow_latency[slot],
+                    -1,
+                )
+            else:
+                self._count += 1
+
+            self._primary_idx[slot] = primary
+            self._shadow_idx[slot] = shadow
+            self._primary_latency[slot] = primary_latency
+            self._shadow_latency[slot] = shadow_latency
+            self._apply(primary, shadow, primary_latency, shadow_latency, 1)
+
+            self._head = (slot + 1) % self._window_size
+            self._total_recorded += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return agreement, confusion matrix and latency distributions for the current window."""
+        with self._lock:
+            count = self._count
+            labels = list(self._labels)
+            size = len(labels)
+            matrix = [row[:size] for row in self._confusion[:size]]
+            agreements = self._agreements
+            primary_latencies = sorted(self._primary_latency[:count])
+            shadow_latencies = sorted(self._shadow_latency[:count])
+            primary_histogram = list(self._primary_histogram)
+            shadow_histogram = list(self._shadow_histogram)
+            total_recorded = self._total_recorded
+
+        pairs = []
+        per_intent: Dict[str, Dict[str, Any]] = {}
+        for row, primary_label in enumerate(labels):
+            row_total = sum(matrix[row])
+            if row_total:
+                per_intent[primary_label] = {
+                    "count": row_total,
+                    "agreement_rate": round(matrix[row][row] / row_total, 4),
+                }
+            for column, shadow_label in enumerate(labels):
+                pair_count = matrix[row][column]
+                if pair_count:
+                    pairs.append(
+                        {
+                            "primary_intent": primary_label,
+                            "shadow_intent": shadow_label,
+                            "count": pair_count,
+                            "share": round(pair_count / count, 4),
+                            "agreement": row == column,
+                        }
+                    )
+        pairs.sort(key=lambda pair: pair["count"], reverse=True)
+
+        return {
+            "window_size": self._window_size,
+            "samples": count,
+            "total_recorded": total_recorded,
+            "agreement_rate": round(agreements / count, 4) if count else None,
+            "per_intent": per_intent,
+            "pairs": pairs,
+            "confusion_matrix": {"labels": labels, "matrix": matrix},
+            "latency_ms": {
+                "primary": self._latency_summary(primary_latencies, primary_histogram),
+                "shadow": self._latency_summary(shadow_latencies, shadow_histogram),
+            },
+        }
+
+    def _intern(self, intent: Optional[str]) -> int:
+        label = intent or OTHER_INTENT_LABEL
+        index = self._label_index.get(label)
+        if index is not None:
+            return index
+        if len(self._labels) >= self._max_intents - 1 and label != OTHER_INTENT_LABEL:
+            label = OTHER_INTENT_LABEL
+            index = self._label_index.get(label)
+            if index is not None:
+                return index
+        index = len(self._labels)
+        self._labels.append(label)
+        self._label_index[label] = index
+        return index
+
+    def _apply(self, primary: int, shadow: int, primary_latency: int, shadow_latency: int, delta: int) -> None:
+        self._confusion[primary][shadow] += delta
+        if primary == shadow:
+            self._agreements += delta
+        self._primary_histogram[bisect_left(LATENCY_BUCKETS_MS, primary_latency)] += delta
+        self._shadow_histogram[bisect_left(LATENCY_BUCKETS_MS, shadow_latency)] += delta
+
+    @staticmethod
+    def _latency_summary(sorted_values: Sequence[int], histogram: Sequence[int]) -> Dict[str, Any]:
+        bucket_labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+        return {
+            "count": len(sorted_values),
+            "mean": round(sum(sorted_values) / len(sorted_values), 2) if sorted_values else 0.0,
+            "p50": _percentile(sorted_values, 0.50),
+            "p95": _percentile(sorted_values, 0.95),
+            "p99": _percentile(sorted_values, 0.99),
+            "max": float(sorted_values[-1]) if sorted_values else 0.0,
+            "histogram": dict(zip(bucket_labels, histogram)),
+        }
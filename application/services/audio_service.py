@@ -3,25 +3,23 @@ Audio processing service implementing AudioProcessorInterface.
 Handles real audio recording, validation and STT transcription.
 """
 
+import asyncio
 import base64
 import tempfile
-import wave
 from pathlib import Path
-from typing import List
+from typing import Any, Awaitable, Callable, List, Optional
 
+import numpy as np
 import structlog
 
-try:
-    from pydub import AudioSegment
-
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
-    AudioSegment = None
-
 from integration.configuration.settings import Settings
+from integration.external_apis.audio_decoding import decode_audio, is_wav, normalize_format, parse_wav_header
+from integration.external_apis.ffmpeg_decoder import AudioDecodeError, get_ffmpeg_decoder_pool
+from integration.external_apis.stt_registry import get_stt_agent_registry
+from integration.external_apis.voice_activity import TrimResult, VADConfig, trim_silence
 from shared.exceptions.exceptions import AudioProcessingException
 from shared.interfaces.interfaces import AudioProcessorInterface
+from shared.interfaces.stt_interface import STT_SAMPLE_RATE, AudioFormatError
 
 logger = structlog.get_logger(__name__)
 
@@ -34,29 +32,20 @@ class AudioService(AudioProcessorInterface):
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.supported_formats = ["wav", "mp3", "ogg", "flac", "m4a"]
+        self.supported_formats = ["wav", "mp3", "ogg", "flac", "m4a", "webm", "pcm"]
         self.max_size_bytes = settings.max_audio_size_mb * 1024 * 1024
         self.max_duration = settings.max_audio_duration
-        self._stt_agent = None
+        self.vad_config = VADConfig(min_energy_db=settings.audio_vad_min_energy_db)
 
     async def _get_stt_agent(self):
-        """Lazy initialization of STT agent"""
-        if self._stt_agent is None:
-            try:
-                from integration.external_apis.stt_agent import create_stt_agent
-
-                logger.info("Initializing real STT agent for audio processing")
-                self._stt_agent = create_stt_agent()
-                logger.info("STT agent initialized successfully")
-            except ImportError as e:
-                logger.error("Failed to import STT agent", error=str(e))
-                logger.warning("Will use fallback simulation mode")
-                return None
-            except Exception as e:
-                logger.error("Failed to initialize STT agent", error=str(e))
-                logger.warning("Will use fallback simulation mode")
-                return None
-        return self._stt_agent
+        """Process-wide STT agent (warmed at startup); waits off the event loop if it is still loading"""
+        registry = get_stt_agent_registry()
+        stt_agent = registry.agent
+        if stt_agent is None:
+            stt_agent = await asyncio.to_thread(registry.get)
+            if stt_agent is None:
+                logger.warning("STT agent not available, will use fallback simulation mode")
+        return stt_agent
 
     async def validate_audio(self, audio_data: bytes, filename: str) -> bool:
         """Validate audio file format, size and basic structure"""
@@ -149,49 +138,70 @@ class AudioService(AudioProcessorInterface):
             }
 
     async def _validate_wav_structure(self, audio_data: bytes) -> None:
-        """Validate WAV file structure"""
+        """Validate WAV file structure by parsing the header straight from the bytes"""
         try:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(audio_data)
-                temp_file.flush()
-
-                with wave.open(temp_file.name, "rb") as wav_file:
-                    frames = wav_file.getnframes()
-                    sample_rate = wav_file.getframerate()
-                    duration = frames / sample_rate if sample_rate > 0 else 0
-
-                    logger.info(
-                        "WAV file info",
-                        frames=frames,
-                        sample_rate=sample_rate,
-                        duration=f"{duration:.2f}s",
-                    )
-
-                    if duration > self.max_duration:
-                        raise AudioProcessingException(
-                            f"Audio too long: {duration:.1f}s (max: {self.max_duration}s)",
-                            error_code="DURATION_TOO_LONG",
-                        )
-
-                    if duration < 0.1:
-                        raise AudioProcessingException(
-                            "Audio too short - minimum 0.1 seconds required",
-                            error_code="DURATION_TOO_SHORT",
-                        )
-
-                Path(temp_file.name).unlink()
-
-        except wave.Error as e:
+            wav_info = parse_wav_header(audio_data)
+        except AudioFormatError as e:
             raise AudioProcessingException(
-                f"Invalid WAV file structure: {str(e)}",
+                f"Invalid WAV file structure: {e.message}",
                 error_code="INVALID_WAV_STRUCTURE",
             )
 
+        duration = wav_info.duration
+        logger.info(
+            "WAV file info",
+            frames=wav_info.frames,
+            sample_rate=wav_info.sample_rate,
+            duration=f"{duration:.2f}s",
+        )
+
+        if duration > self.max_duration:
+            raise AudioProcessingException(
+                f"Audio too long: {duration:.1f}s (max: {self.max_duration}s)",
+                error_code="DURATION_TOO_LONG",
+            )
+
+        if duration < 0.1:
+            raise AudioProcessingException(
+                "Audio too short - minimum 0.1 seconds required",
+                error_code="DURATION_TOO_SHORT",
+            )
+
     async def process_audio_file(self, audio_path: Path) -> str:
         """Process audio file through real STT transcription"""
-        try:
-            logger.info("Processing audio file for transcription", file=str(audio_path))
+        logger.info("Processing audio file for transcription", file=str(audio_path))
+        return await self._transcribe_checked(lambda agent: agent.transcribe_audio(str(audio_path), language="es-ES"))
+
+    async def process_audio_buffer(self, samples: np.ndarray) -> str:
+        """Process decoded float32 mono 16 kHz samples through real STT transcription (no disk)"""
+        trimmed = self.trim_silence(samples)
+        if not trimmed.has_speech:
+            raise AudioProcessingException("No speech detected in audio", error_code="NO_SPEECH_DETECTED")
+        logger.info("Processing in-memory audio for transcription", seconds=round(trimmed.trimmed_seconds, 2))
+        return await self._transcribe_checked(lambda agent: agent.transcribe_buffer(trimmed.samples, language="es-ES"))
+
+    def trim_silence(self, samples: np.ndarray) -> TrimResult:
+        """Drop leading/trailing silence and shorten long pauses so STT only processes speech"""
+        if not self.settings.audio_vad_enabled:
+            return TrimResult(samples, ((0, samples.size),), samples.size)
+
+        trimmed = trim_silence(
+            samples,
+            self.vad_config,
+            padding_ms=self.settings.audio_vad_padding_ms,
+            max_pause_ms=self.settings.audio_vad_max_pause_ms,
+        )
+        logger.info(
+            "Silence trimmed",
+            original_seconds=round(trimmed.original_seconds, 2),
+            trimmed_seconds=round(trimmed.trimmed_seconds, 2),
+            segments=len(trimmed.segments),
+        )
+        return trimmed
 
+    async def _transcribe_checked(self, transcribe: Callable[[Any], Awaitable[str]]) -> str:
+        """Run a transcription on the shared STT agent after checking its health"""
+        try:
             stt_agent = await self._get_stt_agent()
 
             health = await stt_agent.health_check()
@@ -202,8 +212,8 @@ class AudioService(AudioProcessorInterface):
                     details=health,
                 )
 
-            logger.info("Starting transcription with Azure STT")
-            transcription = await stt_agent.transcribe_audio(str(audio_path), language="es-ES")
+            logger.info("Starting transcription with STT agent")
+            transcription = await transcribe(stt_agent)
 
             if not transcription or not transcription.strip():
                 raise AudioProcessingException("No speech detected in audio", error_code="NO_SPEECH_DETECTED")
@@ -246,41 +256,19 @@ class AudioService(AudioProcessorInterface):
 
             original_ext = Path(filename).suffix.lower()
 
+            samples = await self._decode_to_buffer(audio_data, original_ext)
+            if samples is not None:
+                return await self.process_audio_buffer(samples)
+
+            # ffmpeg unavailable or the container needs a seekable file: disk fallback
             with tempfile.NamedTemporaryFile(suffix=original_ext, delete=False) as temp_file:
                 temp_file.write(audio_data)
-                temp_file.flush()
-
-                temp_original_path = Path(temp_file.name)
-
-                try:
-                    if original_ext == ".webm":
-                        logger.info(
-                            "Converting webm to wav format",
-                            original_file=str(temp_original_path),
-                        )
-                        wav_path = self._convert_webm_to_wav(temp_original_path)
-                        logger.info("Conversion completed", wav_file=str(wav_path))
-                    else:
-                        wav_path = temp_original_path
-
-                    if not wav_path.exists():
-                        raise AudioProcessingException(f"Audio file not found after conversion: {wav_path}")
-
-                    logger.info("Using audio file for STT", final_file=str(wav_path))
-
-                    transcription = await self.process_audio_file(wav_path)
-                    return transcription
-
-                finally:
-                    if temp_original_path.exists():
-                        temp_original_path.unlink()
-                    if (
-                        original_ext == ".webm"
-                        and "wav_path" in locals()
-                        and wav_path != temp_original_path
-                        and wav_path.exists()
-                    ):
-                        wav_path.unlink()
+                temp_path = Path(temp_file.name)
+            try:
+                logger.info("Using audio file for STT", final_file=str(temp_path))
+                return await self.process_audio_file(temp_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
 
         except AudioProcessingException:
             raise
@@ -320,11 +308,25 @@ class AudioService(AudioProcessorInterface):
                 "error": str(e),
             }
 
-    async def transcribe_audio(self, audio_data: bytes, format: str, language: str = "es-ES"):
+    async def transcribe_audio(
+        self,
+        audio_data: bytes,
+        format: str,
+        language: str = "es-ES",
+        on_progress: Optional[Callable[[str, float], None]] = None,
+    ):
         """
         Transcribe audio data using existing STT infrastructure.
         This method is specifically for the API endpoints.
+
+        WAV and raw PCM are decoded in memory and handed to the STT agent as a float32
+        buffer; only formats that need an external decoder go through a temp file.
+        Decoded audio is trimmed of silence first: `trimmed_duration` is what STT received,
+        and clips without speech return an empty transcription without calling STT.
+        `cache_hit` is True when the STT agent served the text from its transcription cache.
+        on_progress(stage, fraction) is called as each step completes (async jobs).
         """
+        report = on_progress or (lambda stage, progress: None)
         import time
 
         start_time = time.time()
@@ -337,9 +339,11 @@ class AudioService(AudioProcessorInterface):
         )
 
         try:
-            is_valid = await self.validate_audio(audio_data, "temp_audio_file.wav")
+            suffix = _upload_suffix(format, audio_data)
+            is_valid = await self.validate_audio(audio_data, f"upload{suffix}")
             if not is_valid:
                 raise AudioProcessingException("Invalid audio data")
+            report("validated", 0.1)
 
             stt_agent = await self._get_stt_agent()
             if not stt_agent:
@@ -353,77 +357,74 @@ class AudioService(AudioProcessorInterface):
                         "confidence": 0.5,
                         "language": language,
                         "duration": 3.0,
+                        "trimmed_duration": 3.0,
+                        "speech_detected": True,
+                        "cache_hit": False,
                         "processing_time": processing_time,
                     },
                 )()
 
-            import os
-
-            if "webm" in format.lower():
-                suffix = ".webm"
-            elif "wav" in format.lower():
-                suffix = ".wav"
-            elif "mp3" in format.lower():
-                suffix = ".mp3"
-            elif "m4a" in format.lower():
-                suffix = ".m4a"
-            else:
-                suffix = ".wav"
-
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                temp_file.write(audio_data)
-                temp_file.flush()
-                temp_path = temp_file.name
-
-            try:
-                if "webm" in format.lower():
-                    logger.info("Converting webm to wav for Azure STT", original_file=temp_path)
-                    temp_path_obj = Path(temp_path)
-                    wav_path = self._convert_webm_to_wav(temp_path_obj)
-                    final_audio_path = str(wav_path)
-                    logger.info("Conversion completed", wav_file=final_audio_path)
-                else:
-                    final_audio_path = temp_path
-
+            samples = await self._decode_to_buffer(audio_data, suffix)
+            report("decoded", 0.3)
+            if samples is not None:
+                duration = samples.size / STT_SAMPLE_RATE
+                trimmed = self.trim_silence(samples)
+                trimmed_duration = trimmed.trimmed_seconds
+                report("trimmed", 0.4)
+                if not trimmed.has_speech:
+                    logger.info("No speech detected, skipping STT", duration=round(duration, 2))
+                    return type(
+                        "Result",
+                        (),
+                        {
+                            "transcription": "",
+                            "confidence": 0.0,
+                            "language": language,
+                            "duration": duration,
+                            "trimmed_duration": 0.0,
+                            "speech_detected": False,
+                            "cache_hit": False,
+                            "processing_time": time.time() - start_time,
+                        },
+                    )()
                 logger.info(
-                    "Calling REAL STT agent for transcription",
-                    temp_file=final_audio_path,
-                    file_size=os.path.getsize(final_audio_path),
+                    "Calling REAL STT agent with in-memory buffer",
+                    duration=round(duration, 2),
+                    trimmed_duration=round(trimmed_duration, 2),
                 )
+                report("transcribing", 0.5)
+                transcription = await stt_agent.transcribe_buffer_cached(trimmed.samples, language=language)
+            else:
+                duration = trimmed_duration = 3.0
+                report("transcribing", 0.5)
+                transcription = await self._transcribe_via_file(stt_agent, audio_data, suffix, language)
+            transcribed_text = transcription.text
 
-                transcribed_text = await stt_agent.transcribe_audio(audio_path=final_audio_path, language=language)
-
-                processing_time = time.time() - start_time
-
-                result = type(
-                    "Result",
-                    (),
-                    {
-                        "transcription": transcribed_text,
-                        "confidence": 0.9,
-                        "language": language,
-                        "duration": 3.0,
-                        "processing_time": processing_time,
-                    },
-                )()
+            processing_time = time.time() - start_time
 
-                logger.info(
-                    "REAL transcription completed successfully",
-                    text=(transcribed_text[:100] + "..." if len(transcribed_text) > 100 else transcribed_text),
-                    processing_time=processing_time,
-                )
+            result = type(
+                "Result",
+                (),
+                {
+                    "transcription": transcribed_text,
+                    "confidence": 0.9,
+                    "language": language,
+                    "duration": duration,
+                    "trimmed_duration": trimmed_duration,
+                    "speech_detected": True,
+                    "cache_hit": transcription.cache_hit,
+                    "processing_time": processing_time,
+                },
+            )()
 
-                return result
+            logger.info(
+                "REAL transcription completed successfully",
+                text=(transcribed_text[:100] + "..." if len(transcribed_text) > 100 else transcribed_text),
+                processing_time=processing_time,
+                cache_hit=transcription.cache_hit,
+            )
 
-            finally:
-                try:
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                    if "webm" in format.lower() and "final_audio_path" in locals() and final_audio_path != temp_path:
-                        if os.path.exists(final_audio_path):
-                            os.unlink(final_audio_path)
-                except Exception as e:
-                    logger.warning("Failed to clean up temp files", error=str(e))
+            return result
 
         except Exception as e:
             logger.error("Audio transcription failed", error=str(e))
@@ -436,79 +437,69 @@ class AudioService(AudioProcessorInterface):
                     "confidence": 0.0,
                     "language": language,
                     "duration": 0.0,
+                    "trimmed_duration": 0.0,
+                    "speech_detected": False,
+                    "cache_hit": False,
                     "processing_time": processing_time,
+                    "error": str(e),
                 },
             )()
 
-    def _convert_webm_to_wav(self, input_path: Path) -> Path:
-        """Convert webm audio file to wav format for Azure STT compatibility"""
-        try:
-            if not PYDUB_AVAILABLE:
-                logger.warning("pydub not available, using original file")
-                return input_path
-
-            logger.info("Converting webm to wav format", input_file=str(input_path))
-
-            output_path = input_path.with_suffix(".wav")
-
-            try:
-                from pydub import AudioSegment
-
-                audio = AudioSegment.from_file(str(input_path), format="webm")
-                audio = audio.set_frame_rate(16000).set_channels(1)
-                audio.export(str(output_path), format="wav")
-
-                logger.info(
-                    "Audio converted successfully",
-                    input_file=str(input_path),
-                    output_file=str(output_path),
-                )
-
-                try:
-                    input_path.unlink()
-                except Exception:
-                    pass
-
-                return output_path
+    async def _decode_to_buffer(self, audio_data: bytes, format: str) -> Optional[np.ndarray]:
+        """
+        Decode to float32 mono 16 kHz without disk: WAV/PCM in-process, compressed formats
+        through the ffmpeg pipe pool. None when only the file-based path can handle it.
+        """
+        samples = decode_audio(audio_data, format)
+        if samples is not None:
+            return samples
 
-            except Exception as conv_error:
-                logger.warning(
-                    "Conversion failed, trying alternative method",
-                    error=str(conv_error),
+        pool = get_ffmpeg_decoder_pool(self.settings)
+        try:
+            return await asyncio.to_thread(pool.decode, audio_data)
+        except AudioDecodeError as e:
+            if e.reason in ("timeout", "rejected"):
+                raise AudioProcessingException(
+                    f"Audio decoding failed: {e.message}",
+                    error_code="DECODE_TIMEOUT" if e.reason == "timeout" else "DECODE_REJECTED",
                 )
+            logger.warning("ffmpeg decoding unavailable, falling back to file", reason=e.reason, error=e.message)
+            return None
 
-                try:
-                    with open(input_path, "rb") as f:
-                        raw_data = f.read()
-
-                    output_path = input_path.with_suffix(".wav")
+    async def _transcribe_via_file(self, stt_agent, audio_data: bytes, suffix: str, language: str):
+        """Disk fallback when the upload cannot be decoded through the ffmpeg pipe"""
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+            temp_file.write(audio_data)
+            temp_path = Path(temp_file.name)
 
-                    sample_rate = 16000
-                    channels = 1
-                    bits_per_sample = 16
-
-                    with wave.open(str(output_path), "wb") as wav_file:
-                        wav_file.setnchannels(channels)
-                        wav_file.setsampwidth(bits_per_sample // 8)
-                        wav_file.setframerate(sample_rate)
-
-                        audio_start = len(raw_data) // 10
-                        audio_data = raw_data[audio_start : audio_start + 32000]
-                        wav_file.writeframes(audio_data)
-
-                    logger.info("Fallback conversion completed", output_file=str(output_path))
-                    return output_path
-
-                except Exception as fallback_error:
-                    logger.error(
-                        "All conversion methods failed",
-                        conv_error=str(conv_error),
-                        fallback_error=str(fallback_error),
-                    )
-
-                    logger.warning("Using original webm file as last resort")
-                    return input_path
-
-        except Exception as e:
-            logger.error("Audio conversion failed", error=str(e))
-            return input_path
+        try:
+            logger.info(
+                "Calling REAL STT agent for transcription",
+                temp_file=str(temp_path),
+                file_size=len(audio_data),
+            )
+            return await stt_agent.transcribe_audio_cached(audio_path=str(temp_path), language=language)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+_SUFFIX_ALIASES = {
+    "wave": "wav",
+    "x-wav": "wav",
+    "vnd.wave": "wav",
+    "mpeg": "mp3",
+    "x-m4a": "m4a",
+    "mp4": "m4a",
+    "l16": "pcm",
+    "s16le": "pcm",
+    "pcm_s16le": "pcm",
+}
+
+
+def _upload_suffix(format: str, audio_data: bytes) -> str:
+    """File suffix for an uploaded content type ('audio/webm;codecs=opus' -> '.webm')"""
+    if is_wav(audio_data):
+        return ".wav"
+    kind = normalize_format(format)
+    kind = _SUFFIX_ALIASES.get(kind, kind)
+    return f".{kind}" if kind in ("webm", "mp3", "m4a", "ogg", "flac", "pcm") else ".wav"
@@ -1,30 +1,32 @@
 """
 Conversation service implementing ConversationInterface.
-Handles chat sessions and conversation history (in-memory for PoC).
+Handles chat sessions and conversation history on top of a StorageInterface
+repository (in-memory by default, SQLite or Redis when Settings.database_url is set).
 """
 
+import json
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import structlog
 
 from integration.configuration.settings import Settings
-from shared.interfaces.interfaces import ConversationInterface
+from integration.data_persistence.conversation_repository import create_conversation_repository
+from shared.interfaces.interfaces import ConversationInterface, StorageInterface
 
 logger = structlog.get_logger(__name__)
 
 
 class ConversationService(ConversationInterface):
     """
-    In-memory conversation service for PoC.
-    Can be easily extended to use database storage.
+    Conversation service over a pluggable storage repository.
+    One instance should be shared per process (see shared.utils.dependencies).
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, repository: Optional[StorageInterface] = None):
         self.settings = settings
-        self.conversations: Dict[str, List[Dict[str, Any]]] = {}
-        self.session_metadata: Dict[str, Dict[str, Any]] = {}
+        self.repository = repository or create_conversation_repository(settings)
 
     async def add_message(self, user_message: str, ai_response: str, session_id: Optional[str] = None) -> str:
         """Add message pair to conversation"""
@@ -32,9 +34,6 @@ class ConversationService(ConversationInterface):
             if not session_id:
                 session_id = str(uuid.uuid4())
 
-            if session_id not in self.conversations:
-                await self._initialize_session(session_id)
-
             message_pair = {
                 "id": str(uuid.uuid4()),
                 "timestamp": datetime.now().isoformat(),
@@ -43,16 +42,9 @@ class ConversationService(ConversationInterface):
                 "message_type": "conversation_pair",
             }
 
-            self.conversations[session_id].append(message_pair)
-
-            self.session_metadata[session_id]["last_activity"] = datetime.now().isoformat()
-            self.session_metadata[session_id]["message_count"] += 1
+            await self.repository.append_message(session_id, message_pair)
 
-            logger.info(
-                "Message pair added to conversation",
-                session_id=session_id,
-                total_messages=len(self.conversations[session_id]),
-            )
+            logger.info("Message pair added to conversation", session_id=session_id)
 
             return session_id
 
@@ -60,38 +52,20 @@ class ConversationService(ConversationInterface):
             logger.error("Failed to add message to conversation", error=str(e))
             raise
 
-    async def _initialize_session(self, session_id: str) -> None:
-        """Initialize a new conversation session"""
-        self.conversations[session_id] = []
-        self.session_metadata[session_id] = {
-            "session_id": session_id,
-            "created_at": datetime.now().isoformat(),
-            "last_activity": datetime.now().isoformat(),
-            "message_count": 0,
-            "session_type": "demo",
-        }
-
-        logger.info("New conversation session initialized", session_id=session_id)
-
     async def get_conversation_history(self, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get conversation history for session"""
         try:
             if not session_id:
-                all_conversations = []
-                for sid, messages in self.conversations.items():
-                    for message in messages:
-                        message_copy = message.copy()
-                        message_copy["session_id"] = sid
-                        all_conversations.append(message_copy)
-                return sorted(all_conversations, key=lambda x: x["timestamp"])
-
-            if session_id in self.conversations:
+                return await self.repository.load_all_messages()
+
+            conversation = await self.repository.load_conversation(session_id)
+            if conversation is not None:
                 logger.info(
                     "Retrieved conversation history",
                     session_id=session_id,
-                    message_count=len(self.conversations[session_id]),
+                    message_count=len(conversation),
                 )
-                return self.conversations[session_id].copy()
+                return conversation
             else:
                 logger.warning("Session not found", session_id=session_id)
                 return []
@@ -100,22 +74,41 @@ class ConversationService(ConversationInterface):
             logger.error("Failed to get conversation history", error=str(e))
             return []
 
+    async def get_conversation(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get a conversation with its messages and timestamps, or None if unknown"""
+        session = await self.repository.get_session(session_id)
+        if session is None:
+            return None
+        messages = await self.repository.load_conversation(session_id) or []
+        return {
+            "messages": messages,
+            "created_at": session["created_at"],
+            "updated_at": session["last_activity"],
+        }
+
+    async def list_conversations(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+        """List session metadata, most recent activity first"""
+        return await self.repository.list_sessions(limit=limit, offset=offset)
+
+    async def delete_conversation(self, session_id: str) -> bool:
+        """Delete a conversation and its session"""
+        deleted = await self.repository.delete_conversation(session_id)
+        if deleted:
+            logger.info("Conversation deleted", session_id=session_id)
+        return deleted
+
     async def clear_conversation(self, session_id: Optional[str] = None) -> bool:
-        """Clear conversation history"""
+        """Clear the messages of a session (keeping the session), or every session when no id is given"""
         try:
             if session_id:
-                if session_id in self.conversations:
-                    del self.conversations[session_id]
-                    del self.session_metadata[session_id]
+                if await self.repository.clear_messages(session_id):
                     logger.info("Conversation cleared", session_id=session_id)
                     return True
                 else:
                     logger.warning("Session not found for clearing", session_id=session_id)
                     return False
             else:
-                cleared_count = len(self.conversations)
-                self.conversations.clear()
-                self.session_metadata.clear()
+                cleared_count = await self.repository.clear_all()
                 logger.info("All conversations cleared", count=cleared_count)
                 return True
 
@@ -126,11 +119,10 @@ class ConversationService(ConversationInterface):
     async def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session metadata"""
         try:
-            if session_id in self.session_metadata:
-                session_info = self.session_metadata[session_id].copy()
-                session_info["current_message_count"] = len(self.conversations.get(session_id, []))
-                return session_info
-            return None
+            session_info = await self.repository.get_session(session_id)
+            if session_info is not None:
+                session_info["current_message_count"] = session_info["message_count"]
+            return session_info
         except Exception as e:
             logger.error("Failed to get session info", error=str(e))
             return None
@@ -138,27 +130,30 @@ class ConversationService(ConversationInterface):
     async def get_all_sessions(self) -> List[Dict[str, Any]]:
         """Get all session metadata"""
         try:
-            sessions = []
-            for session_id, metadata in self.session_metadata.items():
-                session_info = metadata.copy()
-                session_info["current_message_count"] = len(self.conversations.get(session_id, []))
-                sessions.append(session_info)
-
-            sessions.sort(key=lambda x: x["last_activity"], reverse=True)
+            sessions = await self.repository.list_sessions()
+            for session_info in sessions:
+                session_info["current_message_count"] = session_info["message_count"]
             return sessions
         except Exception as e:
             logger.error("Failed to get all sessions", error=str(e))
             return []
 
+    async def close(self) -> None:
+        """Flush and release the storage repository"""
+        await self.repository.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Storage backend name and its counters"""
+        return {"backend": type(self.repository).__name__, **self.repository.get_stats()}
+
     async def export_conversation(self, session_id: str, format: str = "json") -> Optional[Dict[str, Any]]:
         """Export conversation in specified format"""
         try:
-            if session_id not in self.conversations:
+            metadata = await self.repository.get_session(session_id)
+            conversation = await self.repository.load_conversation(session_id)
+            if metadata is None or conversation is None:
                 return None
 
-            conversation = self.conversations[session_id]
-            metadata = self.session_metadata[session_id]
-
             export_data = {
                 "export_info": {
                     "exported_at": datetime.now().isoformat(),
@@ -181,6 +176,35 @@ class ConversationService(ConversationInterface):
             logger.error("Failed to export conversation", error=str(e))
             return None
 
+    async def export_ndjson(
+        self,
+        session_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        chunk_bytes: int = 64 * 1024,
+    ) -> AsyncIterator[str]:
+        """
+        Stream messages as NDJSON (one message per line, tagged with session_id).
+
+        Reads the repository through iter_messages() and yields chunks of whole lines of
+        about chunk_bytes, so memory stays bounded however much is exported. Timezone-aware
+        bounds are converted to local time, the clock the timestamps are stored in.
+        """
+        start, end = _local_naive(start), _local_naive(end)
+        lines: List[str] = []
+        size = exported = 0
+        async for message in self.repository.iter_messages(session_id=session_id, start=start, end=end):
+            line = json.dumps(message, ensure_ascii=False) + "\n"
+            lines.append(line)
+            size += len(line)
+            exported += 1
+            if size >= chunk_bytes:
+                yield "".join(lines)
+                lines, size = [], 0
+        if lines:
+            yield "".join(lines)
+        logger.info("Conversations exported as NDJSON", session_id=session_id, messages=exported)
+
     def _calculate_session_duration(self, conversation: List[Dict[str, Any]]) -> str:
         """Calculate session duration from first to last message"""
         if len(conversation) < 2:
@@ -200,3 +224,9 @@ class ConversationService(ConversationInterface):
                 return f"{seconds} seconds"
         except Exception:
             return "Unknown"
+
+
+def _local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
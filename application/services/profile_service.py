@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional
 
 import structlog
 
+from business.domains.tourism.ranking import ProfileWeights, compile_profile_weights
+
 logger = structlog.get_logger(__name__)
 
 
@@ -17,11 +19,13 @@ class ProfileService:
     Loads profiles from the static JSON registry and resolves
     a profile_id to a full profile_context dict (or None).
 
-    Class-level cache ensures the JSON is loaded only once.
+    Class-level cache ensures the JSON is loaded only once, and each profile's
+    ranking_bias is compiled once into the ProfileWeights used by the ranking stage.
     """
 
     _registry_cache: Optional[Dict[str, Any]] = None
     _profiles_by_id: Optional[Dict[str, Dict[str, Any]]] = None
+    _weights_by_id: Dict[str, ProfileWeights] = {}
 
     def _load_registry(self) -> None:
         """Load profiles.json from the static config directory. Cache at class level."""
@@ -39,6 +43,10 @@ class ProfileService:
             ProfileService._registry_cache = data
             profiles = data.get("profiles", [])
             ProfileService._profiles_by_id = {p["id"]: p for p in profiles if "id" in p}
+            ProfileService._weights_by_id = {
+                profile_id: compile_profile_weights(profile.get("ranking_bias"), profile_id)
+                for profile_id, profile in ProfileService._profiles_by_id.items()
+            }
 
             logger.info(
                 "Profile registry loaded",
@@ -58,7 +66,7 @@ class ProfileService:
         """
         Resolve a profile_id to a profile_context dict.
 
-        Returns a dict with {id, label, prompt_directives, ranking_bias} or None.
+        Returns a dict with {id, label, prompt_directives, ranking_bias, ranking_weights} or None.
         If profile_id is unknown, logs a warning and returns None.
         """
         if profile_id is None:
@@ -79,6 +87,7 @@ class ProfileService:
             "label": profile["label"],
             "prompt_directives": profile.get("prompt_directives", []),
             "ranking_bias": profile.get("ranking_bias", {}),
+            "ranking_weights": ProfileService._weights_by_id[profile_id],
         }
 
     def list_profiles(self) -> List[Dict[str, Any]]:
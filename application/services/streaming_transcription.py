@@ -0,0 +1,241 @@
+"""
+Streaming transcription session behind the /api/v1/audio/stream WebSocket.
+
+Audio arrives in small chunks while the user is still speaking. A StreamingVAD splits
+it into utterances; while an utterance is open, a partial transcript of its last
+`window_seconds` is produced every `partial_interval` seconds, and as soon as the VAD
+detects the end of speech (or the utterance reaches `max_utterance_seconds`) the whole
+utterance is transcribed once more and pushed as final. Finals are produced in order and
+each one is prompted with the previous text (Whisper's initial_prompt) for continuity.
+Transcription goes through VoiceflowSTTAgent.transcribe_buffer, so no audio touches disk.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import numpy as np
+import structlog
+
+from integration.configuration.settings import Settings
+from integration.external_apis.audio_decoding import decode_pcm16
+from integration.external_apis.voice_activity import StreamingVAD, VADConfig
+from shared.exceptions.exceptions import AudioProcessingException
+from shared.interfaces.stt_interface import STT_SAMPLE_RATE
+
+logger = structlog.get_logger(__name__)
+
+_PROMPT_CHARS = 200
+
+
+class StreamingTranscriptionSession:
+    """Per-connection state: VAD segmentation, sliding-window partials and ordered finals."""
+
+    def __init__(
+        self,
+        stt_agent: Any,
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+        language: str = "es-ES",
+        partial_interval: float = 1.0,
+        window_seconds: float = 10.0,
+        max_utterance_seconds: float = 15.0,
+        max_session_seconds: float = 300.0,
+        vad_config: VADConfig = VADConfig(),
+        pre_roll_ms: int = 300,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self._agent = stt_agent
+        self._send = send
+        self.language = language
+        self._partial_samples = int(partial_interval * STT_SAMPLE_RATE)
+        self._window_samples = int(window_seconds * STT_SAMPLE_RATE)
+        self._max_utterance_samples = int(max_utterance_seconds * STT_SAMPLE_RATE)
+        self._max_session_samples = int(max_session_seconds * STT_SAMPLE_RATE)
+        self._pre_roll = pre_roll_ms * STT_SAMPLE_RATE // 1000
+        self._clock = clock
+        self._vad = StreamingVAD(vad_config)
+
+        # audio kept in memory: buffer[0] is sample number _buffer_start of the stream
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._buffer_start = 0
+        self._received = 0
+        self._pcm_remainder = b""
+
+        self._segment_id = 0
+        self._segment_start: Optional[int] = None
+        self._last_partial_at = 0
+        self._partial_task: Optional[asyncio.Task] = None
+        self._final_task: Optional[asyncio.Task] = None
+        self._previous_text = ""
+        self._stats: Dict[str, Any] = {"segments": 0, "partials": 0, "partials_dropped": 0, "finals": 0}
+        self._final_latencies_ms: list[float] = []
+
+    @classmethod
+    def create_from_settings(
+        cls, settings: Settings, stt_agent: Any, send: Callable[[Dict[str, Any]], Awaitable[None]], language: str
+    ) -> "StreamingTranscriptionSession":
+        return cls(
+            stt_agent,
+            send,
+            language=language,
+            partial_interval=settings.audio_stream_partial_interval,
+            window_seconds=settings.audio_stream_window_seconds,
+            max_utterance_seconds=settings.audio_stream_max_utterance_seconds,
+            max_session_seconds=settings.audio_stream_max_session_seconds,
+            vad_config=VADConfig(hangover_ms=settings.audio_stream_silence_ms),
+        )
+
+    @property
+    def received_seconds(self) -> float:
+        return self._received / STT_SAMPLE_RATE
+
+    async def feed_pcm16(self, data: bytes, sample_rate: int = STT_SAMPLE_RATE) -> None:
+        """Feed little-endian 16-bit mono PCM; an odd trailing byte is kept for the next chunk"""
+        data = self._pcm_remainder + data
+        usable = len(data) - len(data) % 2
+        self._pcm_remainder = data[usable:]
+        if usable:
+            await self.feed(decode_pcm16(data[:usable], sample_rate=sample_rate))
+
+    async def feed(self, samples: np.ndarray) -> None:
+        """Feed float32 mono 16 kHz samples"""
+        if self._received + samples.size > self._max_session_samples:
+            raise AudioProcessingException(
+                f"Stream too long (max: {self._max_session_samples / STT_SAMPLE_RATE:g}s)",
+                error_code="STREAM_TOO_LONG",
+            )
+
+        events = self._vad.process(samples)
+        self._buffer = np.concatenate((self._buffer, samples))
+        self._received += samples.size
+
+        for event in events:
+            if event.kind == "speech_start":
+                await self._open_segment(max(self._buffer_start, event.sample - self._pre_roll))
+            elif self._segment_start is not None:
+                self._close_segment(min(self._received, event.sample + self._pre_roll))
+
+        if self._segment_start is not None:
+            if self._received - self._segment_start >= self._max_utterance_samples:
+                # long monologue: commit what we have and keep listening in a new segment
+                self._close_segment(self._received)
+                await self._open_segment(self._received)
+            elif self._received - self._last_partial_at >= self._partial_samples:
+                self._start_partial()
+        else:
+            self._trim(self._received - self._pre_roll)
+
+    async def finish(self) -> None:
+        """End of stream: finalize the open utterance and wait for every final to be sent"""
+        if self._segment_start is not None and self._received > self._segment_start:
+            self._close_segment(self._received)
+        if self._partial_task is not None:
+            self._partial_task.cancel()
+        if self._final_task is not None:
+            await self._final_task
+
+    def cancel(self) -> None:
+        """Client went away: drop pending work"""
+        for task in (self._partial_task, self._final_task):
+            if task is not None:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._final_latencies_ms)
+        return {
+            **self._stats,
+            "audio_seconds": round(self.received_seconds, 2),
+            "final_latency_ms_max": round(latencies[-1], 1) if latencies else None,
+        }
+
+    async def _open_segment(self, start: int) -> None:
+        self._segment_id += 1
+        self._segment_start = start
+        self._last_partial_at = start
+        self._stats["segments"] += 1
+        await self._send(
+            {"type": "speech_start", "segment": self._segment_id, "start": round(start / STT_SAMPLE_RATE, 3)}
+        )
+
+    def _close_segment(self, end: int) -> None:
+        start, self._segment_start = self._segment_start, None
+        audio = self._slice(start, end)
+        self._trim(end - self._pre_roll)
+        previous = self._final_task
+        self._final_task = asyncio.create_task(
+            self._finalize(previous, self._segment_id, start, end, audio, self._clock())
+        )
+
+    def _start_partial(self) -> None:
+        if self._partial_task is not None and not self._partial_task.done():
+            self._stats["partials_dropped"] += 1  # the previous window is still being decoded
+            return
+        self._last_partial_at = self._received
+        audio = self._slice(max(self._segment_start, self._received - self._window_samples), self._received)
+        self._partial_task = asyncio.create_task(self._partial(self._segment_id, self._segment_start, audio))
+
+    async def _partial(self, segment_id: int, start: int, audio: np.ndarray) -> None:
+        try:
+            # Sliding windows never repeat: skip the transcription cache
+            text = await self._agent.transcribe_buffer(audio, language=self.language, use_cache=False)
+        except Exception as error:
+            logger.warning("Partial transcription failed", segment=segment_id, error=str(error))
+            return
+        if segment_id != self._segment_id or self._segment_start is None:
+            return  # the utterance was finalized meanwhile; the final supersedes this
+        self._stats["partials"] += 1
+        await self._send(
+            {
+                "type": "partial",
+                "segment": segment_id,
+                "text": text,
+                "start": round(start / STT_SAMPLE_RATE, 3),
+            }
+        )
+
+    async def _finalize(
+        self,
+        previous: Optional[asyncio.Task],
+        segment_id: int,
+        start: int,
+        end: int,
+        audio: np.ndarray,
+        ended_at: float,
+    ) -> None:
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        try:
+            text = await self._agent.transcribe_buffer(
+                audio, language=self.language, initial_prompt=self._previous_text[-_PROMPT_CHARS:]
+            )
+        except Exception as error:
+            logger.error("Final transcription failed", segment=segment_id, error=str(error))
+            await self._send({"type": "error", "segment": segment_id, "code": "STT_ERROR", "message": str(error)})
+            return
+
+        latency_ms = (self._clock() - ended_at) * 1000
+        self._previous_text = f"{self._previous_text} {text}".strip()
+        self._final_latencies_ms.append(latency_ms)
+        self._stats["finals"] += 1
+        await self._send(
+            {
+                "type": "final",
+                "segment": segment_id,
+                "text": text,
+                "start": round(start / STT_SAMPLE_RATE, 3),
+                "end": round(end / STT_SAMPLE_RATE, 3),
+                "latency_ms": round(latency_ms, 1),
+            }
+        )
+
+    def _slice(self, start: int, end: int) -> np.ndarray:
+        return self._buffer[start - self._buffer_start : end - self._buffer_start].copy()
+
+    def _trim(self, keep_from: int) -> None:
+        """Drop audio before keep_from (never inside an open utterance)"""
+        if self._segment_start is not None:
+            keep_from = min(keep_from, self._segment_start)
+        drop = keep_from - self._buffer_start
+        if drop > 0:
+            self._buffer = self._buffer[drop:]
+            self._buffer_start = keep_from
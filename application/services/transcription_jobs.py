@@ -0,0 +1,316 @@
+"""
+Asynchronous transcription jobs behind /api/v1/audio/transcribe-async.
+
+Jobs go into a bounded priority queue drained by a fixed number of STT workers:
+interactive jobs (a user waiting on the UI) are taken before batch jobs, and when the
+queue is full submit() raises QueueFullError (HTTP 429) instead of piling up work.
+Workers report real progress through AudioService.transcribe_audio stages. Finished
+jobs keep their result for `result_ttl` seconds and are then forgotten, so the job
+table stays bounded. Queue depth, wait and processing times feed get_stats().
+"""
+
+import asyncio
+import itertools
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional
+
+import structlog
+
+from integration.configuration.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+PRIORITIES = ("interactive", "batch")  # in service order
+_STATS_WINDOW = 256
+_MAX_FINISHED = 1000  # results retained even if the TTL has not expired yet
+_DEFAULT_JOB_SECONDS = 10.0  # estimate until real processing times are known
+
+
+class QueueFullError(Exception):
+    """The job queue is at capacity; retry after `retry_after` seconds."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class TranscriptionJob:
+    """State of one asynchronous transcription."""
+
+    job_id: str
+    format: str
+    language: str
+    priority: str
+    sequence: int = 0  # submission order, breaks ties within a priority
+    audio_data: Optional[bytes] = field(default=None, repr=False)  # released once processed
+    status: str = "queued"  # queued | processing | completed | error
+    stage: str = "queued"
+    progress: float = 0.0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    submitted_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.status in ("completed", "error")
+
+    def set_progress(self, stage: str, progress: float) -> None:
+        self.stage = stage
+        self.progress = max(self.progress, progress)
+
+
+class TranscriptionJobQueue:
+    """Bounded priority queue of transcription jobs with a fixed pool of workers."""
+
+    def __init__(
+        self,
+        audio_service: Any,
+        queue_size: int = 32,
+        workers: int = 2,
+        result_ttl: float = 600.0,
+        clock=time.monotonic,
+    ):
+        self._audio_service = audio_service
+        self._queue_size = max(1, queue_size)
+        self._worker_count = max(1, workers)
+        self._result_ttl = result_ttl
+        self._clock = clock
+
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: List[asyncio.Task] = []
+        self._sequence = itertools.count()
+
+        self._jobs: Dict[str, TranscriptionJob] = {}
+        self._finished: "OrderedDict[str, float]" = OrderedDict()  # job_id -> finished_at, oldest first
+        self._busy = 0
+        self._wait_seconds: Deque[float] = deque(maxlen=_STATS_WINDOW)
+        self._processing_seconds: Deque[float] = deque(maxlen=_STATS_WINDOW)
+        self._counters: Dict[str, int] = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "expired": 0,
+        }
+
+    @classmethod
+    def create_from_settings(cls, settings: Settings, audio_service: Any) -> "TranscriptionJobQueue":
+        return cls(
+            audio_service,
+            queue_size=settings.transcription_job_queue_size,
+            workers=settings.transcription_job_workers,
+            result_ttl=settings.transcription_job_result_ttl,
+        )
+
+    def submit(self, audio_data: bytes, format: str, language: str, priority: str = "interactive") -> TranscriptionJob:
+        """Enqueue a job without blocking; raises QueueFullError when the queue is at capacity"""
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority} (expected one of {', '.join(PRIORITIES)})")
+
+        self._expire()
+        queue = self._ensure_workers()
+        job = TranscriptionJob(
+            job_id=str(uuid.uuid4()),
+            format=format,
+            language=language,
+            priority=priority,
+            sequence=next(self._sequence),
+            audio_data=audio_data,
+            submitted_at=self._clock(),
+        )
+        try:
+            queue.put_nowait((PRIORITIES.index(priority), job.sequence, job.job_id))
+        except asyncio.QueueFull:
+            self._counters["rejected"] += 1
+            retry_after = self._estimate_seconds(self._queue_size)
+            logger.warning("transcription_queue_full", queue_size=self._queue_size, priority=priority)
+            raise QueueFullError(f"Transcription queue is full ({self._queue_size} jobs)", retry_after)
+
+        self._jobs[job.job_id] = job
+        self._counters["submitted"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[TranscriptionJob]:
+        """Job by id, or None if unknown or its result has expired"""
+        self._expire()
+        return self._jobs.get(job_id)
+
+    def queue_position(self, job: TranscriptionJob) -> Optional[int]:
+        """Jobs that will be started before this one (None once it has started)"""
+        if job.status != "queued":
+            return None
+        rank = PRIORITIES.index(job.priority)
+        return sum(
+            1
+            for other in self._jobs.values()
+            if other.status == "queued" and (PRIORITIES.index(other.priority), other.sequence) < (rank, job.sequence)
+        )
+
+    def estimated_time(self, job: TranscriptionJob) -> Optional[float]:
+        """Seconds until the job is expected to finish"""
+        if job.is_complete:
+            return 0.0
+        if job.status == "processing":
+            elapsed = self._clock() - job.started_at
+            return round(max(0.0, self._average_processing_seconds() - elapsed), 2)
+        return round(self._estimate_seconds(self.queue_position(job)), 2)
+
+    def expires_at(self, job: TranscriptionJob) -> Optional[datetime]:
+        if job.finished_at is None:
+            return None
+        return datetime.now() + timedelta(seconds=max(0.0, job.finished_at + self._result_ttl - self._clock()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, worker usage and wait/processing time distributions"""
+        self._expire()
+        queued = [job for job in self._jobs.values() if job.status == "queued"]
+        now = self._clock()
+        return {
+            **self._counters,
+            "queue_depth": len(queued),
+            "queue_depth_by_priority": {
+                priority: sum(job.priority == priority for job in queued) for priority in PRIORITIES
+            },
+            "oldest_queued_seconds": round(max((now - job.submitted_at for job in queued), default=0.0), 3),
+            "queue_size": self._queue_size,
+            "workers": self._worker_count,
+            "busy_workers": self._busy,
+            "retained_results": len(self._finished),
+            "result_ttl_seconds": self._result_ttl,
+            "wait_seconds": _distribution(self._wait_seconds),
+            "processing_seconds": _distribution(self._processing_seconds),
+        }
+
+    async def stop(self) -> None:
+        """Cancel workers; queued jobs are abandoned"""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+        self._loop = None
+
+    def _ensure_workers(self) -> asyncio.PriorityQueue:
+        """Create queue and workers on the running loop (recreated if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.PriorityQueue(maxsize=self._queue_size)
+            self._loop = loop
+            self._workers = [
+                loop.create_task(self._worker(self._queue), name=f"transcription-worker-{index}")
+                for index in range(self._worker_count)
+            ]
+        return self._queue
+
+    async def _worker(self, queue: asyncio.PriorityQueue) -> None:
+        while True:
+            _, _, job_id = await queue.get()
+            job = self._jobs.get(job_id)
+            if job is None:
+                queue.task_done()
+                continue
+            self._busy += 1
+            try:
+                await self._run(job)
+            finally:
+                self._busy -= 1
+                queue.task_done()
+
+    async def _run(self, job: TranscriptionJob) -> None:
+        job.status = "processing"
+        job.started_at = self._clock()
+        job.set_progress("started", 0.05)
+        self._wait_seconds.append(job.started_at - job.submitted_at)
+
+        try:
+            result = await self._audio_service.transcribe_audio(
+                audio_data=job.audio_data,
+                format=job.format,
+                language=job.language,
+                on_progress=job.set_progress,
+            )
+            error = getattr(result, "error", None)
+            if error:
+                raise RuntimeError(error)
+            job.result = {
+                "transcription": result.transcription,
+                "confidence": result.confidence,
+                "language": result.language,
+                "duration": result.duration,
+                "trimmed_duration": result.trimmed_duration,
+                "speech_detected": result.speech_detected,
+                "cache_hit": result.cache_hit,
+                "processing_time": result.processing_time,
+            }
+            job.status = "completed"
+            job.set_progress("completed", 1.0)
+            self._counters["completed"] += 1
+        except Exception as error:
+            job.status = "error"
+            job.stage = "error"
+            job.error = str(error)
+            self._counters["failed"] += 1
+            logger.warning("transcription_job_failed", job_id=job.job_id, error=str(error))
+        finally:
+            job.audio_data = None
+            job.finished_at = self._clock()
+            self._processing_seconds.append(job.finished_at - job.started_at)
+            self._finished[job.job_id] = job.finished_at
+
+    def _expire(self) -> None:
+        now = self._clock()
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            if now - finished_at < self._result_ttl and len(self._finished) <= _MAX_FINISHED:
+                break
+            self._finished.popitem(last=False)
+            self._jobs.pop(job_id, None)
+            self._counters["expired"] += 1
+
+    def _average_processing_seconds(self) -> float:
+        if not self._processing_seconds:
+            return _DEFAULT_JOB_SECONDS
+        return sum(self._processing_seconds) / len(self._processing_seconds)
+
+    def _estimate_seconds(self, jobs_ahead: int) -> float:
+        return (jobs_ahead // self._worker_count + 1) * self._average_processing_seconds()
+
+
+def _distribution(values: Deque[float]) -> Dict[str, Any]:
+    ordered = sorted(values)
+    if not ordered:
+        return {"samples": 0, "p50": None, "p95": None, "max": None}
+    return {
+        "samples": len(ordered),
+        "p50": round(ordered[len(ordered) // 2], 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+_job_queue: Optional[TranscriptionJobQueue] = None
+
+
+def get_transcription_job_queue(settings: Settings, audio_service: Any) -> TranscriptionJobQueue:
+    """Return the process-wide transcription job queue, creating it on first use."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = TranscriptionJobQueue.create_from_settings(settings, audio_service)
+    return _job_queue
+
+
+async def shutdown_transcription_job_queue() -> None:
+    """Stop the process-wide transcription workers (application shutdown)."""
+    global _job_queue
+    if _job_queue is not None:
+        await _job_queue.stop()
+        _job_queue = None
@@ -10,6 +10,8 @@ from __future__ import annotations
 
 import logging
 import unicodedata
+from collections import deque
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from application.models.responses import TourismData
@@ -17,19 +19,91 @@ from application.models.responses import TourismData
 logger = logging.getLogger(__name__)
 
 
+_NORMALIZE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _fold_accents(t: str) -> str:
+    # remove accents for simple matching
+    t = unicodedata.normalize("NFKD", t)
+    return "".join(ch for ch in t if not unicodedata.combining(ch))
+
+
 def _normalize_text(s: Any) -> Optional[str]:
     if s is None:
         return None
     try:
         t = str(s).strip()
-        # remove accents for simple matching
-        t = unicodedata.normalize("NFKD", t)
-        t = "".join(ch for ch in t if not unicodedata.combining(ch))
-        return t
+        # ASCII is already NFKD-normalized; only non-ASCII text goes through the memoized fold
+        return t if t.isascii() else _fold_accents(t)
     except Exception:
         return None
 
 
+class _KeywordMatcher:
+    """Aho-Corasick automaton: finds, in one pass over the text, the earliest-declared keyword it contains.
+
+    Equivalent to ``next(v for k, v in mapping.items() if k in text)`` but independent of
+    the number of keywords.
+    """
+
+    def __init__(self, mapping: Dict[str, str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._best: List[Optional[int]] = [None]  # lowest keyword priority ending at (or via fail links) this state
+        self._values: List[str] = []
+        for priority, (keyword, value) in enumerate(mapping.items()):
+            self._values.append(value)
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._best.append(None)
+                state = nxt
+            if self._best[state] is None:
+                self._best[state] = priority
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                inherited = self._best[self._fail[nxt]]
+                if inherited is not None and (self._best[nxt] is None or inherited < self._best[nxt]):
+                    self._best[nxt] = inherited
+
+    def first_match(self, text: str) -> Optional[str]:
+        goto, fail, best_at = self._goto, self._fail, self._best
+        state, best = 0, None
+        for ch in text:
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            found = best_at[state]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        return None if best is None else self._values[best]
+
+
+def _compile_exact(mapping: Dict[str, str]) -> Dict[str, str]:
+    compiled: Dict[str, str] = {}
+    for key, value in mapping.items():
+        compiled.setdefault(_normalize_text(key).lower(), value)
+    return compiled
+
+
 FACILITY_MAP = {
     # Spanish -> canonical
     "rampas": "wheelchair_ramps",
@@ -58,6 +132,29 @@ LEVEL_MAP = {
     "sin informacion": "partial_access",
 }
 
+# Token heuristics for levels not in LEVEL_MAP, in priority order.
+LEVEL_KEYWORDS = {
+    "completo": "full_wheelchair_access",
+    "total": "full_wheelchair_access",
+    "wheelchair": "full_wheelchair_access",
+    "parcial": "partial_wheelchair_access",
+    "partial": "partial_wheelchair_access",
+    "varia": "varies_by_location",
+    "vari": "varies_by_location",
+}
+
+# Maps are compiled once, at import, into accent-folded lookup tables.
+_FACILITY_EXACT = _compile_exact(FACILITY_MAP)
+_FACILITY_MATCHER = _KeywordMatcher(_FACILITY_EXACT)
+_LEVEL_EXACT = _compile_exact(LEVEL_MAP)
+_LEVEL_MATCHER = _KeywordMatcher(LEVEL_KEYWORDS)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _canonicalize_facility(tl: str) -> str:
+    # direct map, then first map key contained in the text, then a safe snake case token
+    return _FACILITY_EXACT.get(tl) or _FACILITY_MATCHER.first_match(tl) or tl.replace(" ", "_")[:60]
+
 
 def _canonicalize_facilities(raw: Any) -> Optional[List[str]]:
     if raw is None:
@@ -78,21 +175,8 @@ def _canonicalize_facilities(raw: Any) -> Optional[List[str]]:
     out: List[str] = []
     for it in items:
         t = _normalize_text(it)
-        if not t:
-            continue
-        tl = t.lower()
-        # try direct map
-        mapped = FACILITY_MAP.get(tl)
-        if not mapped:
-            # try token-based match
-            for k, v in FACILITY_MAP.items():
-                if k in tl:
-                    mapped = v
-                    break
-        if not mapped:
-            # fallback: make a safe snake case token
-            mapped = tl.replace(" ", "_")[:60]
-        out.append(mapped)
+        if t:
+            out.append(_canonicalize_facility(t.lower()))
     return out or None
 
 
@@ -103,26 +187,23 @@ def _canonicalize_level(raw: Any) -> Optional[str]:
     if not t:
         return None
     tl = t.lower()
-    # direct match
-    mapped = LEVEL_MAP.get(tl)
-    if mapped:
-        return mapped
-    # token heuristics
-    if "completo" in tl or "total" in tl or "wheelchair" in tl:
-        return "full_wheelchair_access"
-    if "parcial" in tl or "partial" in tl:
-        return "partial_wheelchair_access"
-    if "varia" in tl or "vari" in tl:
-        return "varies_by_location"
-    return tl[:60]
+    return _LEVEL_EXACT.get(tl) or _LEVEL_MATCHER.first_match(tl) or tl[:60]
 
 
 def canonicalize_tourism_data(raw: Any) -> Optional[Dict[str, Any]]:
-    """Return a canonicalized tourism_data dict or None.
+    """Return a canonicalized tourism_data dict or None (see `canonicalize_tourism_model`)."""
+    model = canonicalize_tourism_model(raw)
+    return model.model_dump() if model is not None else None
+
+
+def canonicalize_tourism_model(raw: Any) -> Optional[TourismData]:
+    """Return a validated `TourismData` instance or None.
 
     This function performs conservative normalization and then validates
     the result with the Pydantic `TourismData` model. If validation fails
     it returns None to avoid exposing hallucinated or invalid content.
+    This is the single validation point for tool and LLM data: the instance
+    is carried as-is up to the API response, which serializes it directly.
     """
     if not raw or not isinstance(raw, dict):
         return None
@@ -188,8 +269,7 @@ def canonicalize_tourism_data(raw: Any) -> Optional[Dict[str, Any]]:
         candidate = {"venue": venue, "routes": routes, "accessibility": accessibility}
 
         # Validate with Pydantic; if invalid, return None
-        td = TourismData.model_validate(candidate)
-        return td.model_dump()
+        return TourismData.model_validate(candidate)
     except Exception as e:
-        logger.warning("Canonicalization failed", error=str(e))
+        logger.warning("Canonicalization failed: %s", e)
         return None
@@ -1,6 +1,7 @@
 """Tourism domain orchestrator - wires core framework with tourism-specific tools and prompts."""
 
 import asyncio
+import dataclasses
 import json
 import re
 from typing import Optional
@@ -8,11 +9,12 @@ from typing import Optional
 import structlog
 from langchain_openai import ChatOpenAI
 
-from business.core.canonicalizer import canonicalize_tourism_data
+from business.core.canonicalizer import canonicalize_tourism_model
 from business.core.orchestrator import MultiAgentOrchestrator
 from business.domains.tourism.entity_resolver import EntityResolver
 from business.domains.tourism.prompts.response_prompt import build_response_prompt
 from business.domains.tourism.prompts.system_prompt import SYSTEM_PROMPT
+from business.domains.tourism.ranking import ProfileRanker, ProfileWeights, compile_profile_weights
 from business.domains.tourism.tools.accessibility_tool import AccessibilityAnalysisTool
 from business.domains.tourism.tools.location_ner_tool import LocationNERTool
 from business.domains.tourism.tools.nlu_tool import TourismNLUTool
@@ -31,7 +33,7 @@ class TourismMultiAgent(MultiAgentOrchestrator):
     Orchestrator for the accessible tourism domain (Madrid).
 
     Coordinates 4 specialized tools through a fixed pipeline:
-    NLU -> Accessibility -> Route Planning + Tourism Info -> LLM synthesis.
+    NLU -> Accessibility -> Route Planning + Tourism Info -> Profile ranking -> LLM synthesis.
     """
 
     def __init__(
@@ -61,6 +63,7 @@ class TourismMultiAgent(MultiAgentOrchestrator):
         self.route = RoutePlanningTool()
         self.tourism_info = TourismInfoTool()
         self.entity_resolver = EntityResolver()
+        self.ranker = ProfileRanker()
 
         logger.info("Tourism Multi-Agent System initialized successfully")
 
@@ -81,32 +84,15 @@ class TourismMultiAgent(MultiAgentOrchestrator):
         tool_results: dict[str, str] = {}
         parsed_tools: dict[str, object] = {}
 
-        # helper to run a tool and capture timing + parsed output
-        def run_tool(name: str, tool, input_data: str):
+        # helper to run a typed pipeline stage: the result object feeds later stages directly
+        # and is serialized exactly once here (JSON for the prompt, dict for the API metadata)
+        def run_stage(name: str, tool, stage, *args, publish: bool = True):
             start = time.perf_counter()
-            raw = tool._run(input_data)
-            end = time.perf_counter()
-            duration_ms = int((end - start) * 1000)
-
-            # try to parse JSON result
-            parsed = None
-            try:
-                parsed = json.loads(raw)
-            except Exception:
-                parsed = None
-
-            # build summary heuristics
-            summary = None
-            if isinstance(parsed, dict):
-                # prefer concise known keys
-                summary = parsed.get("intent") or parsed.get("accessibility_level") or parsed.get("venue")
-                if summary is None:
-                    # fallback to presence of keys
-                    keys = list(parsed.keys())[:3]
-                    summary = ",".join(keys)
-            else:
-                summary = (raw or "").strip()[:120]
+            result = stage(*args)
+            duration_ms = int((time.perf_counter() - start) * 1000)
 
+            payload = result.to_dict()
+            summary = payload.get("accessibility_level") or payload.get("venue") or ",".join(list(payload)[:3])
             pipeline_steps.append(
                 {
                     "name": name,
@@ -117,35 +103,11 @@ class TourismMultiAgent(MultiAgentOrchestrator):
                 }
             )
 
-            if name == "LocationNER":
-                location_count = 0
-                provider = None
-                model = None
-                parsed_language = None
-                parsed_status = None
-                if isinstance(parsed, dict):
-                    locations = parsed.get("locations")
-                    location_count = len(locations) if isinstance(locations, list) else 0
-                    provider = parsed.get("provider")
-                    model = parsed.get("model")
-                    parsed_language = parsed.get("language")
-                    parsed_status = parsed.get("status")
-
-                logger.info(
-                    "location_ner_observability",
-                    provider=provider,
-                    model=model,
-                    language=parsed_language,
-                    latency_ms=duration_ms,
-                    location_count=location_count,
-                    status=parsed_status,
-                )
-
-            tool_results[name.lower()] = raw
-            parsed_tools[name.lower()] = parsed
+            if publish:
+                tool_results[name.lower()] = json.dumps(payload, indent=2, ensure_ascii=False)
+                parsed_tools[name.lower()] = payload
             logger.info(f"{name} completed", duration_ms=duration_ms)
-
-            return raw, parsed
+            return result
 
         def record_tool(name: str, tool_name: str, raw: str, duration_ms: int):
             parsed = None
@@ -259,44 +221,61 @@ class TourismMultiAgent(MultiAgentOrchestrator):
         if nlu_result is not None:
             resolved_entities = self.entity_resolver.resolve(nlu_result, ner_locations, ner_top_location)
 
-        # Accessibility (input: NLU raw)
-        nlu_raw = tool_results.get("nlu") or ""
-        run_tool("Accessibility", self.accessibility, nlu_raw)
-
-        # Routes (input: accessibility raw)
-        accessibility_raw = tool_results.get("accessibility") or ""
-        run_tool("Routes", self.route, accessibility_raw)
-
-        # Tourism info (input: NLU raw)
-        run_tool("Venue Info", self.tourism_info, nlu_raw)
-
-        # Build tourism_data from parsed tools where possible
-        tourism_data = None
-        try:
-            tourism_info = (
-                parsed_tools.get("venue info") or parsed_tools.get("tourism_info") or parsed_tools.get("venue")
-            )
-            routes = parsed_tools.get("routes") or parsed_tools.get("route")
-            accessibility = parsed_tools.get("accessibility")
-
-            # normalize names
-            if isinstance(tourism_info, dict) or isinstance(routes, dict) or isinstance(accessibility, dict):
-                routes_val = None
-                if isinstance(routes, dict) and routes.get("routes"):
-                    routes_val = routes.get("routes")
-                elif isinstance(routes, list):
-                    routes_val = routes
-                tourism_data = {
-                    "venue": (tourism_info if isinstance(tourism_info, dict) else None),
-                    "routes": routes_val,
-                    "accessibility": (accessibility if isinstance(accessibility, dict) else None),
-                }
-        except Exception:
-            tourism_data = None
+        destination = resolved_entities.destination if resolved_entities is not None else None
+        if destination is None and isinstance(nlu_parsed, dict):
+            nlu_entities = nlu_parsed.get("entities")
+            destination = nlu_entities.get("destination") if isinstance(nlu_entities, dict) else None
+        accessibility_need = resolved_entities.accessibility if resolved_entities is not None else None
+        nlu_intent = nlu_result.intent if nlu_result is not None else None
+
+        accessibility = run_stage("Accessibility", self.accessibility, self.accessibility.analyze, destination)
+        # Routes and venue info are published after ranking trims them to the profile's top-k
+        routes = run_stage(
+            "Routes", self.route, self.route.plan, destination, user_input, accessibility_need, publish=False
+        )
+        venue_info = run_stage(
+            "Venue Info",
+            self.tourism_info,
+            self.tourism_info.lookup,
+            destination,
+            user_input,
+            nlu_intent,
+            publish=False,
+        )
+        ranking = run_stage(
+            "Ranking",
+            self.ranker,
+            self.ranker.rank,
+            destination,
+            user_input,
+            routes,
+            venue_info,
+            self._profile_weights(profile_context),
+        )
+        routes = dataclasses.replace(routes, routes=list(ranking.routes))
+        venue_info = dataclasses.replace(venue_info, nearby_venues=ranking.venues)
+        for name, result in (("routes", routes), ("venue info", venue_info)):
+            payload = result.to_dict()
+            tool_results[name] = json.dumps(payload, indent=2, ensure_ascii=False)
+            parsed_tools[name] = payload
+
+        tourism_data = {
+            "venue": {
+                "name": venue_info.venue_name,
+                "type": venue_info.venue_type,
+                "accessibility_score": accessibility.accessibility_score,
+                "certification": accessibility.certification,
+                "facilities": accessibility.facilities,
+                "opening_hours": venue_info.opening_hours,
+                "pricing": venue_info.pricing,
+            },
+            "routes": routes.routes or None,
+            "accessibility": parsed_tools["accessibility"],
+        }
 
         # Canonicalize tourism_data into the SSOT used by the API/UI.
         try:
-            tourism_data = canonicalize_tourism_data(tourism_data) if tourism_data else None
+            tourism_data = canonicalize_tourism_model(tourism_data) if tourism_data else None
         except Exception:
             tourism_data = None
 
@@ -317,10 +296,22 @@ class TourismMultiAgent(MultiAgentOrchestrator):
             "intent": intent,
             "entities": entities,
             "tool_results_parsed": parsed_tools,
+            # Validated primary NLU result, reused by shadow comparison (not serialized to the API)
+            "nlu_result": nlu_result,
         }
 
         return tool_results, metadata
 
+    @staticmethod
+    def _profile_weights(profile_context: Optional[dict]) -> Optional[ProfileWeights]:
+        """Weights compiled by ProfileService, compiled here only for contexts built elsewhere."""
+        if not profile_context:
+            return None
+        weights = profile_context.get("ranking_weights")
+        if isinstance(weights, ProfileWeights):
+            return weights
+        return compile_profile_weights(profile_context.get("ranking_bias"), profile_context.get("id"))
+
     def _build_response_prompt(
         self,
         user_input: str,
@@ -349,7 +340,7 @@ class TourismMultiAgent(MultiAgentOrchestrator):
             logger.warning("LLM returned invalid JSON block", error=str(e))
             return clean_text, metadata
 
-        llm_tourism_data = canonicalize_tourism_data(raw_data)
+        llm_tourism_data = canonicalize_tourism_model(raw_data)
         if not llm_tourism_data:
             logger.warning("LLM tourism_data failed canonicalization")
             return clean_text, metadata
@@ -362,11 +353,12 @@ class TourismMultiAgent(MultiAgentOrchestrator):
         else:
             # If existing tool data looks like a generic default (score 6.0, name contains "Guía"),
             # prefer the LLM-generated data which has contextual information
-            existing_venue = existing.get("venue") or {}
+            existing_venue = existing.venue
             is_default = (
-                existing_venue.get("accessibility_score") == 6.0
-                or existing_venue.get("name", "").startswith("Gu")
-                or not existing_venue.get("name")
+                existing_venue is None
+                or existing_venue.accessibility_score == 6.0
+                or existing_venue.name.startswith("Gu")
+                or not existing_venue.name
             )
             if is_default:
                 metadata["tourism_data"] = llm_tourism_data
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import structlog
 
+from business.domains.tourism.venue_index import VenueIndex, fold_name, get_venue_index
 from shared.models.nlu_models import NLUResult, ResolvedEntities
 
 logger = structlog.get_logger(__name__)
@@ -21,6 +22,9 @@ class EntityResolver:
         "",
     }
 
+    def __init__(self, venue_index: VenueIndex | None = None):
+        self._venue_index = venue_index or get_venue_index()
+
     def resolve(
         self,
         nlu_result: NLUResult,
@@ -46,7 +50,7 @@ class EntityResolver:
         elif nlu_destination and ner_top_location and nlu_normalized == ner_normalized:
             resolved_destination = nlu_destination
             resolution_source["destination"] = "both_agree"
-        elif nlu_destination and ner_top_location and self._contains_either(nlu_destination, ner_top_location):
+        elif nlu_destination and ner_top_location and self._same_venue(nlu_destination, ner_top_location):
             resolved_destination = nlu_destination
             resolution_source["destination"] = "nlu_normalized"
         elif self._is_generic(nlu_destination) and ner_top_location:
@@ -89,8 +93,12 @@ class EntityResolver:
         normalized = cls._normalize_name(name)
         return normalized in cls.GENERIC_DESTINATIONS
 
-    @staticmethod
-    def _contains_either(left: str, right: str) -> bool:
-        left_n = left.lower().strip()
-        right_n = right.lower().strip()
-        return left_n in right_n or right_n in left_n
+    def _same_venue(self, left: str, right: str) -> bool:
+        """Substring match on folded names, or both names resolving to the same indexed venue."""
+        left_n = fold_name(left)
+        right_n = fold_name(right)
+        if left_n in right_n or right_n in left_n:
+            return True
+        left_match = self._venue_index.resolve(left)
+        right_match = self._venue_index.resolve(right)
+        return left_match is not None and right_match is not None and left_match.name == right_match.name
@@ -0,0 +1,248 @@
+"""In-memory spatial index over located venues and transit stations.
+
+Points are projected to a local plane (equirectangular, km) and bucketed into a
+uniform grid: NumPy arrays sorted by cell plus a dict of cell -> slice. Radius
+queries scan the covering cells; k-nearest queries expand square rings of cells
+until the k-th candidate is closer than any unvisited cell. Both filter by
+kind (venue/station), category (venue type, metro_station, bus_stop) and
+minimum accessibility level before ranking.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+# Reference point for queries about a venue without coordinates (Puerta del Sol)
+CITY_CENTER = (40.4169, -3.7035)
+
+# Ordinal scale used by min_accessibility filters; unknown levels rank 0.
+ACCESSIBILITY_RANK = {
+    "full_wheelchair_access": 3,
+    "step_free": 3,
+    "partial_wheelchair_access": 2,
+    "partial_access": 1,
+    "varies_by_location": 1,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GeoPoint:
+    id: str
+    name: str
+    kind: str
+    category: str
+    lat: float
+    lon: float
+    accessibility_level: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class GeoMatch:
+    point: GeoPoint
+    distance_km: float
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.point.id,
+            "name": self.point.name,
+            "type": self.point.category,
+            "accessibility_level": self.point.accessibility_level,
+            "distance_km": round(self.distance_km, 2),
+        }
+
+
+class GeoIndex:
+    """Grid-bucketed nearest-neighbour and radius search with attribute filters."""
+
+    def __init__(self, points: Iterable[GeoPoint], cell_km: float = 0.5):
+        self._points = list(points)
+        self._cell_km = cell_km
+        count = len(self._points)
+        lat = np.fromiter((point.lat for point in self._points), dtype=np.float64, count=count)
+        lon = np.fromiter((point.lon for point in self._points), dtype=np.float64, count=count)
+        self._scale = math.cos(math.radians(float(lat.mean()))) if count else 1.0
+        x, y = self._project(lat, lon)
+
+        self._kinds: dict[str, int] = {}
+        self._categories: dict[str, int] = {}
+        kind_codes = np.fromiter(
+            (self._kinds.setdefault(point.kind, len(self._kinds)) for point in self._points),
+            dtype=np.int16,
+            count=count,
+        )
+        category_codes = np.fromiter(
+            (self._categories.setdefault(point.category, len(self._categories)) for point in self._points),
+            dtype=np.int16,
+            count=count,
+        )
+        ranks = np.fromiter(
+            (ACCESSIBILITY_RANK.get(point.accessibility_level, 0) for point in self._points), dtype=np.int8, count=count
+        )
+
+        cx = np.floor(x / cell_km).astype(np.int64)
+        cy = np.floor(y / cell_km).astype(np.int64)
+        order = np.lexsort((cy, cx))
+        self._order = order
+        self._x, self._y = x[order], y[order]
+        self._kind_codes, self._category_codes, self._ranks = kind_codes[order], category_codes[order], ranks[order]
+
+        self._cells: dict[tuple[int, int], tuple[int, int]] = {}
+        if count:
+            sorted_cx, sorted_cy = cx[order], cy[order]
+            boundaries = np.flatnonzero((np.diff(sorted_cx) != 0) | (np.diff(sorted_cy) != 0)) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [count]))
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self._cells[(int(sorted_cx[start]), int(sorted_cy[start]))] = (start, end)
+            self._cell_bounds = (int(cx.min()), int(cx.max()), int(cy.min()), int(cy.max()))
+        logger.info("geo_index_built", points=count, cells=len(self._cells), cell_km=cell_km)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 5,
+        kind: Optional[str] = None,
+        category: Optional[str] = None,
+        min_accessibility: Optional[str] = None,
+        exclude: Iterable[str] = (),
+    ) -> list[GeoMatch]:
+        """The k closest points matching the filters, nearest first."""
+        if not self._cells or k <= 0:
+            return []
+        x, y = self._project(np.float64(lat), np.float64(lon))
+        qx, qy = int(math.floor(x / self._cell_km)), int(math.floor(y / self._cell_km))
+        excluded = set(exclude)
+        min_x, max_x, min_y, max_y = self._cell_bounds
+        max_ring = max(qx - min_x, max_x - qx, qy - min_y, max_y - qy, 0)
+
+        found_idx: list[np.ndarray] = []
+        found_dist: list[np.ndarray] = []
+        total = 0
+        for ring in range(max_ring + 1):
+            slices = [self._cells.get(cell) for cell in _ring_cells(qx, qy, ring)]
+            idx, dist = self._candidates([s for s in slices if s], x, y, kind, category, min_accessibility)
+            if excluded and idx.size:
+                keep = np.fromiter((self._points[self._order[i]].id not in excluded for i in idx), bool, idx.size)
+                idx, dist = idx[keep], dist[keep]
+            if idx.size:
+                found_idx.append(idx)
+                found_dist.append(dist)
+                total += idx.size
+            # Every unvisited cell is at least ring * cell_km away from the query point.
+            if total >= k and np.partition(np.concatenate(found_dist), k - 1)[k - 1] <= ring * self._cell_km:
+                break
+        if not total:
+            return []
+        idx, dist = np.concatenate(found_idx), np.concatenate(found_dist)
+        best = np.argsort(dist, kind="stable")[:k]
+        return [GeoMatch(self._points[self._order[idx[i]]], float(dist[i])) for i in best]
+
+    def within(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        kind: Optional[str] = None,
+        category: Optional[str] = None,
+        min_accessibility: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[GeoMatch]:
+        """Points within radius_km matching the filters, nearest first."""
+        if not self._cells or radius_km < 0:
+            return []
+        x, y = self._project(np.float64(lat), np.float64(lon))
+        reach = int(math.ceil(radius_km / self._cell_km))
+        qx, qy = int(math.floor(x / self._cell_km)), int(math.floor(y / self._cell_km))
+        slices = [
+            self._cells[cell]
+            for cell in (
+                (cx, cy) for cx in range(qx - reach, qx + reach + 1) for cy in range(qy - reach, qy + reach + 1)
+            )
+            if cell in self._cells
+        ]
+        idx, dist = self._candidates(slices, x, y, kind, category, min_accessibility)
+        inside = dist <= radius_km
+        idx, dist = idx[inside], dist[inside]
+        ranked = np.argsort(dist, kind="stable")[:limit]
+        return [GeoMatch(self._points[self._order[idx[i]]], float(dist[i])) for i in ranked]
+
+    def _project(self, lat, lon):
+        return EARTH_RADIUS_KM * np.radians(lon) * self._scale, EARTH_RADIUS_KM * np.radians(lat)
+
+    def _candidates(
+        self,
+        slices: list[tuple[int, int]],
+        x: float,
+        y: float,
+        kind: Optional[str],
+        category: Optional[str],
+        min_accessibility: Optional[str],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if not slices:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        idx = np.concatenate([np.arange(start, end) for start, end in slices])
+        mask = np.ones(idx.size, dtype=bool)
+        if kind is not None:
+            mask &= self._kind_codes[idx] == self._kinds.get(kind, -1)
+        if category is not None:
+            mask &= self._category_codes[idx] == self._categories.get(category, -1)
+        if min_accessibility is not None:
+            mask &= self._ranks[idx] >= ACCESSIBILITY_RANK.get(min_accessibility, 0)
+        idx = idx[mask]
+        return idx, np.hypot(self._x[idx] - x, self._y[idx] - y)
+
+
+def _ring_cells(qx: int, qy: int, ring: int) -> Iterable[tuple[int, int]]:
+    if ring == 0:
+        yield qx, qy
+        return
+    for cx in range(qx - ring, qx + ring + 1):
+        yield cx, qy - ring
+        yield cx, qy + ring
+    for cy in range(qy - ring + 1, qy + ring):
+        yield qx - ring, cy
+        yield qx + ring, cy
+
+
+_geo_index: Optional[GeoIndex] = None
+_geo_index_generation = -1
+
+
+def get_geo_index() -> GeoIndex:
+    """Return the process-wide index over located venues and transit stops, rebuilt when the store reloads."""
+    global _geo_index, _geo_index_generation
+    from business.domains.tourism.route_planner import get_route_planner
+    from business.domains.tourism.venue_store import get_venue_store
+
+    store = get_venue_store()
+    generation = store.generation
+    if _geo_index is None or generation != _geo_index_generation:
+        points = [
+            GeoPoint(venue_id, name, "venue", venue_type, lat, lon, level)
+            for venue_id, name, venue_type, lat, lon, level in store.geo_entries()
+        ]
+        try:
+            stations = list(get_route_planner().stations())
+        except (OSError, KeyError, ValueError) as exc:
+            logger.warning("geo_index_without_stations", error=str(exc))
+            stations = []
+        points.extend(
+            GeoPoint(stop_id, name, "station", category, lat, lon, "step_free" if step_free else None)
+            for stop_id, name, lat, lon, step_free, category in stations
+        )
+        _geo_index = GeoIndex(points)
+        _geo_index_generation = generation
+    return _geo_index
@@ -22,21 +22,12 @@ TOURISM_DATA_SCHEMA = """{
 
 
 def _build_profile_section(profile_context: dict) -> str:
-    """Build the profile directives + ranking bias section for prompt injection."""
-    directives = "\n".join(f"- {d}" for d in profile_context.get("prompt_directives", []))
-
-    # Summarize ranking bias for the LLM
-    bias = profile_context.get("ranking_bias", {})
-    venue_types = bias.get("venue_types", {})
-    sorted_types = sorted(venue_types.items(), key=lambda x: x[1], reverse=True)
-    boosted = [f"{t} (x{w})" for t, w in sorted_types if w > 1.0][:3]
-    penalized = [f"{t} (x{w})" for t, w in sorted_types if w < 1.0][:2]
+    """Build the profile directives section for prompt injection.
 
-    ranking_lines = ""
-    if boosted:
-        ranking_lines += f"  Preferidos: {', '.join(boosted)}\n"
-    if penalized:
-        ranking_lines += f"  Menos relevantes: {', '.join(penalized)}\n"
+    Ranking by ranking_bias is done by the pipeline (ProfileRanker): routes and nearby
+    venues arrive already ordered and trimmed to the top-k, so the LLM only keeps the order.
+    """
+    directives = "\n".join(f"- {d}" for d in profile_context.get("prompt_directives", []))
 
     return f"""
 PERFIL DE USUARIO ACTIVO: {profile_context.get("label", "Desconocido")}
@@ -44,10 +35,9 @@ Directivas de perfil:
 {directives}
 
 Política de ranking:
-{ranking_lines}
-IMPORTANTE: El perfil solo afecta la PRIORIZACIÓN de resultados.\
- No filtres ni excluyas opciones válidas. Presenta todas las opciones relevantes\
- pero ordénalas y enfatízalas según las preferencias del perfil."""
+  Las rutas y los lugares cercanos (nearby_venues) ya vienen ordenados para este perfil (rank_score).
+IMPORTANTE: Respeta ese orden al presentarlos y enfatiza los primeros.\
+ No filtres ni excluyas opciones válidas."""
 
 
 def build_response_prompt(
@@ -59,7 +49,8 @@ def build_response_prompt(
 
     Args:
         user_input: Original user query text.
-        tool_results: Dict with keys 'nlu', 'accessibility', 'route', 'tourism_info'.
+        tool_results: Dict of tool JSON strings keyed by pipeline stage: 'nlu', 'accessibility',
+            'routes', 'venue info'.
         profile_context: Optional profile context with prompt_directives and ranking_bias.
 
     Returns:
@@ -80,10 +71,10 @@ ANÁLISIS DE ACCESIBILIDAD:
 {tool_results.get("accessibility", "{}")}
 
 PLANIFICACIÓN DE RUTAS:
-{tool_results.get("route", "{}")}
+{tool_results.get("routes", "{}")}
 
 INFORMACIÓN TURÍSTICA:
-{tool_results.get("tourism_info", "{}")}
+{tool_results.get("venue info", "{}")}
 {profile_section}
 Tu respuesta debe tener DOS partes:
 
@@ -0,0 +1,166 @@
+"""Profile-aware ranking of candidate venues and routes.
+
+User profiles are compiled once into weight vectors over venue types
+(``ProfileWeights``). A ranking pass then scores every candidate with array
+arithmetic instead of asking the LLM to prioritise:
+
+    venue score = accessibility_score / 10 * venue_type_weight * exp(-distance_km / VENUE_DECAY_KM)
+    route score = route accessibility * exp(-minutes / ROUTE_DECAY_MINUTES)
+
+Only the top-k of each list reaches the response prompt.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import structlog
+
+from business.domains.tourism.geo_index import CITY_CENTER, get_geo_index
+from business.domains.tourism.tools.results import RankingResult, RouteResult, VenueInfoResult
+from business.domains.tourism.venue_index import resolve_venue
+from business.domains.tourism.venue_store import get_venue_store
+
+logger = structlog.get_logger(__name__)
+
+CANDIDATE_POOL = 20
+VENUE_TOP_K = 5
+ROUTE_TOP_K = 2
+VENUE_DECAY_KM = 1.5
+ROUTE_DECAY_MINUTES = 30.0
+DEFAULT_ACCESSIBILITY_SCORE = 6.0
+# Route "accessibility" values as a 0-1 base score; unknown values count as partial.
+ROUTE_ACCESSIBILITY = {"full": 1.0, "partial": 0.6}
+_MINUTES = re.compile(r"(\d+(?:[.,]\d+)?)\s*(h|min)", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ProfileWeights:
+    """Venue-type weight vector for one profile; the last slot is the neutral weight for unlisted types."""
+
+    profile_id: Optional[str]
+    type_codes: dict[str, int]
+    weights: np.ndarray
+
+    def for_types(self, venue_types: Sequence[str]) -> np.ndarray:
+        neutral = len(self.type_codes)
+        codes = np.fromiter(
+            (self.type_codes.get(venue_type, neutral) for venue_type in venue_types),
+            dtype=np.intp,
+            count=len(venue_types),
+        )
+        return self.weights[codes]
+
+
+def compile_profile_weights(ranking_bias: Optional[dict], profile_id: Optional[str] = None) -> ProfileWeights:
+    """Compile a profile's ``ranking_bias.venue_types`` into a ProfileWeights vector."""
+    venue_types = (ranking_bias or {}).get("venue_types") or {}
+    type_codes: dict[str, int] = {}
+    weights: list[float] = []
+    for venue_type, weight in venue_types.items():
+        try:
+            weights.append(float(weight))
+        except (TypeError, ValueError):
+            logger.warning("Ignoring invalid ranking weight", profile_id=profile_id, venue_type=venue_type)
+            continue
+        type_codes[venue_type] = len(type_codes)
+    weights.append(1.0)
+    return ProfileWeights(profile_id, type_codes, np.asarray(weights, dtype=np.float64))
+
+
+NEUTRAL_WEIGHTS = compile_profile_weights(None)
+
+
+def rank_venues(candidates: Sequence[dict], weights: ProfileWeights, k: int = VENUE_TOP_K) -> list[dict]:
+    """Top-k candidates by score; each needs ``type``, ``accessibility_score`` and ``distance_km``."""
+    if not candidates or k <= 0:
+        return []
+    count = len(candidates)
+    base = np.fromiter((item["accessibility_score"] for item in candidates), dtype=np.float64, count=count)
+    distance = np.fromiter((item["distance_km"] for item in candidates), dtype=np.float64, count=count)
+    scores = base / 10.0 * weights.for_types([item["type"] for item in candidates])
+    scores *= np.exp(-distance / VENUE_DECAY_KM)
+    best = np.argsort(-scores, kind="stable")[:k]
+    return [{**candidates[i], "rank_score": round(float(scores[i]), 3)} for i in best]
+
+
+def rank_routes(routes: Sequence[dict], k: int = ROUTE_TOP_K) -> tuple[list[dict], list[float]]:
+    """Top-k routes (unchanged dicts) and their scores, best first."""
+    if not routes or k <= 0:
+        return [], []
+    count = len(routes)
+    base = np.fromiter(
+        (ROUTE_ACCESSIBILITY.get(route.get("accessibility"), 0.6) for route in routes), dtype=np.float64, count=count
+    )
+    minutes = np.fromiter((_route_minutes(route.get("duration")) for route in routes), dtype=np.float64, count=count)
+    scores = base * np.exp(-minutes / ROUTE_DECAY_MINUTES)
+    best = np.argsort(-scores, kind="stable")[:k]
+    return [routes[i] for i in best], [round(float(scores[i]), 3) for i in best]
+
+
+def _route_minutes(duration) -> float:
+    if isinstance(duration, (int, float)):
+        return float(duration)
+    total = 0.0
+    for value, unit in _MINUTES.findall(duration or ""):
+        total += float(value.replace(",", ".")) * (60.0 if unit.lower() == "h" else 1.0)
+    return total
+
+
+class ProfileRanker:
+    """Pipeline stage ranking nearby venues and routes for the active profile."""
+
+    name = "profile_ranking"
+
+    def __init__(self, venue_top_k: int = VENUE_TOP_K, route_top_k: int = ROUTE_TOP_K):
+        self.venue_top_k = venue_top_k
+        self.route_top_k = route_top_k
+
+    def rank(
+        self,
+        destination: Optional[str],
+        text: Optional[str],
+        routes: RouteResult,
+        venue_info: VenueInfoResult,
+        weights: Optional[ProfileWeights] = None,
+    ) -> RankingResult:
+        """Rank the routes and the venues around the destination.
+
+        Venues already listed by the info stage (type searches) are re-ranked; otherwise
+        the candidates are the located venues of any type nearest to the destination.
+        """
+        weights = weights or NEUTRAL_WEIGHTS
+        ranked_routes, route_scores = rank_routes(routes.routes, self.route_top_k)
+        venues = rank_venues(self._candidates(destination, text, venue_info), weights, self.venue_top_k)
+        logger.info(
+            "Profile ranking completed", profile_id=weights.profile_id, venues=len(venues), routes=len(ranked_routes)
+        )
+        return RankingResult(
+            profile_id=weights.profile_id,
+            venues=tuple(venues),
+            routes=tuple(ranked_routes),
+            route_scores=tuple(route_scores),
+        )
+
+    @staticmethod
+    def _candidates(destination: Optional[str], text: Optional[str], venue_info: VenueInfoResult) -> list[dict]:
+        if venue_info.nearby_venues:
+            candidates = [dict(item) for item in venue_info.nearby_venues]
+        else:
+            _, record = resolve_venue(destination, text)
+            located = record is not None and record.lat is not None
+            lat, lon = (record.lat, record.lon) if located else CITY_CENTER
+            matches = get_geo_index().nearest(
+                lat, lon, k=CANDIDATE_POOL, kind="venue", exclude=(record.id,) if record else ()
+            )
+            candidates = [match.to_dict() for match in matches]
+
+        store = get_venue_store()
+        for item in candidates:
+            record = store.get(item["id"])
+            score = record.accessibility.get("accessibility_score") if record else None
+            item["accessibility_score"] = score if score is not None else DEFAULT_ACCESSIBILITY_SCORE
+        return candidates
@@ -0,0 +1,510 @@
+"""Accessible route planner over a local GTFS-style transit feed.
+
+The feed directory holds CSV files modelled on GTFS:
+
+- ``stops.txt``: stop_id, stop_name, stop_lat, stop_lon, wheelchair_boarding, elevator
+- ``routes.txt``: route_id, route_short_name, route_type (1 metro, 3 bus), low_floor, headway_minutes, fare
+- ``segments.txt``: route_id, from_stop_id, to_stop_id, travel_minutes (consecutive stops, both directions)
+- ``pathways.txt``: from_stop_id, to_stop_id, walk_minutes, step_free (walking links, both directions)
+- ``venue_access.txt``: venue_id, stop_id, walk_minutes, step_free (last-mile links to venue store ids)
+
+The network is compiled into CSR arrays: one station node per stop plus one platform
+node per (stop, route), so boarding waits and transfers are explicit edges. Queries
+run A* (projected distance over the fastest ride or pathway speed as heuristic) with
+accessibility-dependent edge costs, and results are cached per origin/venue/profile.
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import math
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import structlog
+
+from business.domains.tourism.venue_index import fold_name
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_TRANSIT_FEED_PATH = Path(__file__).resolve().parent / "data" / "transit_feed"
+
+ROUTE_TYPE_METRO = 1
+ROUTE_TYPE_BUS = 3
+
+WALK, BOARD, RIDE, ALIGHT = 0, 1, 2, 3
+
+# Step-free access is required by default (accessible tourism); "reduced_steps" allows
+# steps at a cost and "any" ignores accessibility flags.
+PROFILES = ("step_free", "reduced_steps", "any")
+STEP_PENALTY_MINUTES = 8.0
+WALK_SPEED_KM_PER_MIN = 0.08
+EARTH_RADIUS_KM = 6371.0
+
+_MODES = {
+    "metro": frozenset({ROUTE_TYPE_METRO}),
+    "bus": frozenset({ROUTE_TYPE_BUS}),
+    "any": frozenset({ROUTE_TYPE_METRO, ROUTE_TYPE_BUS}),
+}
+_REDUCED_MOBILITY_TERMS = ("reduced", "reducida", "movilidad", "mobility", "elderly", "mayor", "carrito", "stroller")
+_NO_NEED_TERMS = ("none", "ninguna", "ninguno", "no")
+
+
+def profile_for_accessibility(need: Optional[str]) -> str:
+    """Map an NLU accessibility entity to a routing profile."""
+    folded = fold_name(need) if isinstance(need, str) else ""
+    if folded in _NO_NEED_TERMS:
+        return "any"
+    if any(term in folded for term in _REDUCED_MOBILITY_TERMS):
+        return "reduced_steps"
+    return "step_free"
+
+
+@dataclass(frozen=True, slots=True)
+class _Route:
+    route_id: str
+    short_name: str
+    route_type: int
+    low_floor: bool
+    wait_minutes: float
+    fare: float
+
+
+def _read_csv(path: Path) -> list[dict[str, str]]:
+    with path.open(encoding="utf-8", newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+def _flag(value: str) -> bool:
+    return value.strip() in {"1", "true", "True"}
+
+
+class AccessibleRoutePlanner:
+    """Accessibility-weighted shortest paths from an origin stop to a venue."""
+
+    def __init__(self, feed_path: str | Path, default_origin: str = "sol", cache_size: int = 1024):
+        self._feed_path = Path(feed_path)
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple, tuple[dict, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._load()
+        origin = self.find_stop(default_origin)
+        if origin is None:
+            raise ValueError(f"Unknown default origin stop: {default_origin}")
+        self._default_origin = origin
+
+    def find_stop(self, name_or_id: str) -> Optional[int]:
+        """Stop index by stop_id or (accent/case-insensitive) stop name."""
+        if name_or_id in self._stop_index:
+            return self._stop_index[name_or_id]
+        return self._stop_names_folded.get(fold_name(name_or_id))
+
+    def stations(self) -> Iterator[tuple[str, str, float, float, bool, str]]:
+        """(stop_id, name, lat, lon, step_free, kind) per stop; kind is "metro_station" or "bus_stop"."""
+        for index, stop_id in enumerate(self._stop_ids):
+            kind = "metro_station" if index in self._metro_stops else "bus_stop"
+            yield (
+                stop_id,
+                self._stop_names[index],
+                self._lat[index],
+                self._lon[index],
+                bool(self._step_free[index]),
+                kind,
+            )
+
+    def has_venue(self, venue_id: str) -> bool:
+        return venue_id in self._venue_access
+
+    def plan_to_venue(
+        self,
+        venue_id: str,
+        venue_name: Optional[str] = None,
+        origin: Optional[str] = None,
+        profile: str = "step_free",
+        max_routes: int = 2,
+    ) -> list[dict[str, Any]]:
+        """Up to max_routes itineraries (metro-based, bus-based) in the canonical routes schema."""
+        if venue_id not in self._venue_access:
+            return []
+        origin_index = self._default_origin if origin is None else self.find_stop(origin)
+        if origin_index is None:
+            return []
+
+        key = (origin_index, venue_id, venue_name, profile, max_routes)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return list(cached)
+            self._cache_misses += 1
+
+        routes = self._plan_uncached(origin_index, venue_id, venue_name or venue_id, profile, max_routes)
+        with self._lock:
+            self._cache[key] = tuple(routes)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return routes
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "feed_path": str(self._feed_path),
+            "stops": len(self._stop_ids),
+            "nodes": len(self._offsets) - 1,
+            "edges": len(self._targets),
+            "venues": len(self._venue_access),
+            "cache_size": len(self._cache),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+        }
+
+    # -- loading -----------------------------------------------------------------
+
+    def _load(self) -> None:
+        stops = _read_csv(self._feed_path / "stops.txt")
+        self._stop_ids = [row["stop_id"] for row in stops]
+        self._stop_names = [row["stop_name"] for row in stops]
+        self._stop_index = {stop_id: index for index, stop_id in enumerate(self._stop_ids)}
+        self._stop_names_folded: dict[str, int] = {}
+        for index, name in enumerate(self._stop_names):
+            self._stop_names_folded.setdefault(fold_name(name), index)
+        self._step_free = array("B", (_flag(row.get("wheelchair_boarding", "0")) for row in stops))
+        self._elevator = array("B", (_flag(row.get("elevator", "0")) for row in stops))
+        # Equirectangular projection around the feed's mean latitude (well under 1% error at city scale).
+        lat = [float(row["stop_lat"]) for row in stops]
+        lon = [float(row["stop_lon"]) for row in stops]
+        scale = math.cos(math.radians(sum(lat) / len(lat))) if lat else 1.0
+        xs = array("d", (EARTH_RADIUS_KM * math.radians(value) * scale for value in lon))
+        ys = array("d", (EARTH_RADIUS_KM * math.radians(value) for value in lat))
+
+        self._routes = [
+            _Route(
+                route_id=row["route_id"],
+                short_name=row["route_short_name"],
+                route_type=int(row["route_type"]),
+                low_floor=_flag(row.get("low_floor", "0")),
+                wait_minutes=float(row.get("headway_minutes") or 0) / 2,
+                fare=float(row.get("fare") or 0),
+            )
+            for row in _read_csv(self._feed_path / "routes.txt")
+        ]
+        route_index = {route.route_id: index for index, route in enumerate(self._routes)}
+
+        # Platform nodes come after the station nodes; they inherit the stop coordinates.
+        platform_of: dict[tuple[int, int], int] = {}
+        node_stop = list(range(len(stops)))
+        edges: list[tuple[int, int, int, float, int, int]] = []
+
+        def platform(stop: int, route: int) -> int:
+            node = platform_of.get((stop, route))
+            if node is None:
+                node = len(node_stop)
+                platform_of[(stop, route)] = node
+                node_stop.append(stop)
+                wait = self._routes[route].wait_minutes
+                edges.append((stop, node, BOARD, wait, self._step_free[stop], route))
+                edges.append((node, stop, ALIGHT, 0.0, self._step_free[stop], route))
+            return node
+
+        # the A* heuristic divides straight-line distance by the fastest edge of any kind (rides and
+        # walking pathways alike), so it never overestimates; a zero-minute hop disables it
+        fastest_km_per_min = WALK_SPEED_KM_PER_MIN
+
+        def note_speed(start: int, end: int, minutes: float) -> None:
+            nonlocal fastest_km_per_min
+            distance = math.hypot(xs[start] - xs[end], ys[start] - ys[end])
+            if distance > 0:
+                fastest_km_per_min = max(fastest_km_per_min, distance / minutes if minutes > 0 else math.inf)
+
+        for row in _read_csv(self._feed_path / "segments.txt"):
+            route = route_index[row["route_id"]]
+            start, end = self._stop_index[row["from_stop_id"]], self._stop_index[row["to_stop_id"]]
+            minutes = float(row["travel_minutes"])
+            left, right = platform(start, route), platform(end, route)
+            edges.append((left, right, RIDE, minutes, 1, route))
+            edges.append((right, left, RIDE, minutes, 1, route))
+            note_speed(start, end, minutes)
+
+        for row in _read_csv(self._feed_path / "pathways.txt"):
+            start, end = self._stop_index[row["from_stop_id"]], self._stop_index[row["to_stop_id"]]
+            minutes, step_free = float(row["walk_minutes"]), int(_flag(row.get("step_free", "0")))
+            edges.append((start, end, WALK, minutes, step_free, -1))
+            edges.append((end, start, WALK, minutes, step_free, -1))
+            note_speed(start, end, minutes)
+
+        self._venue_access: dict[str, list[tuple[int, float, bool]]] = {}
+        for row in _read_csv(self._feed_path / "venue_access.txt"):
+            self._venue_access.setdefault(row["venue_id"], []).append(
+                (self._stop_index[row["stop_id"]], float(row["walk_minutes"]), _flag(row.get("step_free", "0")))
+            )
+
+        edges.sort(key=lambda edge: edge[0])
+        node_count = len(node_stop)
+        self._offsets = array("I", [0] * (node_count + 1))
+        for source, *_ in edges:
+            self._offsets[source + 1] += 1
+        for node in range(node_count):
+            self._offsets[node + 1] += self._offsets[node]
+        self._targets = array("I", (edge[1] for edge in edges))
+        self._kinds = array("B", (edge[2] for edge in edges))
+        self._minutes = array("f", (edge[3] for edge in edges))
+        self._edge_step_free = array("B", (edge[4] for edge in edges))
+        self._edge_route = array("h", (edge[5] for edge in edges))
+        self._node_stop = array("I", node_stop)
+        self._x, self._y = xs, ys
+        self._lat, self._lon = lat, lon
+        self._metro_stops = {stop for stop, route in platform_of if self._routes[route].route_type == ROUTE_TYPE_METRO}
+        self._fastest_km_per_min = fastest_km_per_min
+        self._cost_tables: dict[tuple[str, frozenset[int]], list[float]] = {}
+        self._cache.clear()
+
+        logger.info(
+            "transit_feed_loaded",
+            path=str(self._feed_path),
+            stops=len(stops),
+            nodes=node_count,
+            edges=len(edges),
+            venues=len(self._venue_access),
+        )
+
+    # -- search ------------------------------------------------------------------
+
+    def _plan_uncached(
+        self, origin: int, venue_id: str, venue_name: str, profile: str, max_routes: int
+    ) -> list[dict[str, Any]]:
+        profiles = (profile, "reduced_steps") if profile == "step_free" else (profile,)
+        for current_profile in profiles:
+            found: dict[tuple, dict[str, Any]] = {}
+            for mode in ("metro", "bus"):
+                path = self._search(origin, venue_id, current_profile, _MODES[mode])
+                if path is not None:
+                    route = self._describe(path, venue_name)
+                    found.setdefault(tuple(route["steps"]), route)
+            if not found:
+                path = self._search(origin, venue_id, current_profile, _MODES["any"])
+                if path is not None:
+                    route = self._describe(path, venue_name)
+                    found[tuple(route["steps"])] = route
+            if found:
+                routes = sorted(found.values(), key=lambda item: item["duration_minutes"])[:max_routes]
+                for position, route in enumerate(routes, start=1):
+                    route["id"] = f"route_{position}"
+                return routes
+        return []
+
+    def _edge_costs(self, profile: str, modes: frozenset[int]) -> list[float]:
+        """Per-edge costs for a profile/mode combination (inf = not traversable), built once."""
+        key = (profile, modes)
+        costs = self._cost_tables.get(key)
+        if costs is not None:
+            return costs
+        costs = []
+        for kind, minutes, step_free, route_index in zip(
+            self._kinds, self._minutes, self._edge_step_free, self._edge_route
+        ):
+            accessible = bool(step_free)
+            if kind == RIDE:
+                costs.append(minutes)
+                continue
+            if kind == BOARD:
+                route = self._routes[route_index]
+                if route.route_type not in modes:
+                    costs.append(math.inf)
+                    continue
+                accessible = accessible and (route.route_type != ROUTE_TYPE_BUS or route.low_floor)
+            if accessible or profile == "any":
+                costs.append(minutes)
+            elif profile == "step_free":
+                costs.append(math.inf)
+            else:
+                costs.append(minutes + STEP_PENALTY_MINUTES)
+        self._cost_tables[key] = costs
+        return costs
+
+    def _search(self, origin: int, venue_id: str, profile: str, modes: frozenset[int]) -> Optional[list]:
+        egress: dict[int, tuple[float, float]] = {}
+        for stop, minutes, step_free in self._venue_access[venue_id]:
+            if step_free or profile == "any":
+                cost = minutes
+            elif profile == "step_free":
+                continue
+            else:
+                cost = minutes + STEP_PENALTY_MINUTES
+            if stop not in egress or cost < egress[stop][0]:
+                egress[stop] = (cost, minutes)
+        if not egress:
+            return None
+
+        xs, ys, node_stop = self._x, self._y, self._node_stop
+        speed = self._fastest_km_per_min
+        target_points = [(xs[stop], ys[stop]) for stop in egress]
+        stop_estimates: dict[int, float] = {}
+
+        def heuristic(node: int) -> float:
+            stop = node_stop[node]
+            estimate = stop_estimates.get(stop)
+            if estimate is None:
+                x, y = xs[stop], ys[stop]
+                estimate = min(math.hypot(x - tx, y - ty) for tx, ty in target_points) / speed
+                stop_estimates[stop] = estimate
+            return estimate
+
+        costs = self._edge_costs(profile, modes)
+        offsets, targets = self._offsets, self._targets
+        best_total, best_stop = math.inf, -1
+        dist = [math.inf] * len(node_stop)
+        dist[origin] = 0.0
+        previous: dict[int, int] = {}
+        heap = [(heuristic(origin), 0.0, origin)]
+        while heap:
+            estimate, cost, node = heapq.heappop(heap)
+            if estimate >= best_total:
+                break
+            if cost > dist[node]:
+                continue
+            if node in egress and cost + egress[node][0] < best_total:
+                best_total, best_stop = cost + egress[node][0], node
+            for edge in range(offsets[node], offsets[node + 1]):
+                candidate = cost + costs[edge]
+                target = targets[edge]
+                if candidate < dist[target]:
+                    dist[target] = candidate
+                    previous[target] = edge
+                    heapq.heappush(heap, (candidate + heuristic(target), candidate, target))
+
+        if best_stop < 0:
+            return None
+        edges = []
+        node = best_stop
+        while node != origin:
+            edge = previous[node]
+            edges.append(edge)
+            node = self._edge_source(edge)
+        edges.reverse()
+        return [edges, best_stop, egress[best_stop][1], self._egress_step_free(venue_id, best_stop)]
+
+    def _edge_source(self, edge: int) -> int:
+        # Binary search over CSR offsets: the source is the last node whose offset is <= edge.
+        low, high = 0, len(self._offsets) - 2
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._offsets[middle] <= edge:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def _egress_step_free(self, venue_id: str, stop: int) -> bool:
+        return any(access_stop == stop and step_free for access_stop, _, step_free in self._venue_access[venue_id])
+
+    # -- output ------------------------------------------------------------------
+
+    def _describe(self, path: list, venue_name: str) -> dict[str, Any]:
+        edges, last_stop, egress_minutes, egress_step_free = path
+        steps: list[str] = []
+        features: list[str] = []
+        lines: list[str] = []
+        fares: list[float] = []
+        total = 0.0
+        fully_accessible = egress_step_free
+        metro_fare_paid = False
+        ride: Optional[dict] = None
+
+        def add_feature(name: str) -> None:
+            if name not in features:
+                features.append(name)
+
+        for edge in edges:
+            kind, minutes = self._kinds[edge], float(self._minutes[edge])
+            total += minutes
+            stop = self._node_stop[self._targets[edge]]
+            if kind == WALK:
+                fully_accessible &= bool(self._edge_step_free[edge])
+                steps.append(f"Walk to {self._stop_names[stop]} ({_format_minutes(minutes)} min)")
+            elif kind == BOARD:
+                route = self._routes[self._edge_route[edge]]
+                fully_accessible &= bool(self._step_free[stop])
+                ride = {"route": route, "from": stop, "minutes": 0.0, "stops": 0}
+                if route.route_type == ROUTE_TYPE_METRO:
+                    if self._elevator[stop]:
+                        add_feature("elevator_access")
+                    if not metro_fare_paid:
+                        fares.append(route.fare)
+                        metro_fare_paid = True
+                else:
+                    fully_accessible &= route.low_floor
+                    if route.low_floor:
+                        add_feature("low_floor_bus")
+                        add_feature("wheelchair_space")
+                    fares.append(route.fare)
+            elif kind == RIDE and ride is not None:
+                ride["minutes"] += minutes
+                ride["stops"] += 1
+            elif kind == ALIGHT and ride is not None:
+                route = ride["route"]
+                fully_accessible &= bool(self._step_free[stop])
+                if route.route_type == ROUTE_TYPE_METRO and self._elevator[stop]:
+                    add_feature("elevator_access")
+                label = (
+                    f"Line {route.short_name}" if route.route_type == ROUTE_TYPE_METRO else f"Bus {route.short_name}"
+                )
+                lines.append(f"L{route.short_name}" if route.route_type == ROUTE_TYPE_METRO else route.short_name)
+                stops_label = "stop" if ride["stops"] == 1 else "stops"
+                steps.append(
+                    f"Take {label} from {self._stop_names[ride['from']]} to {self._stop_names[stop]}"
+                    f" ({ride['stops']} {stops_label}, {_format_minutes(ride['minutes'])} min)"
+                )
+                ride = None
+
+        total += egress_minutes
+        steps.append(f"Walk to {venue_name} ({_format_minutes(egress_minutes)} min)")
+        if fully_accessible:
+            add_feature("step_free_route")
+
+        if metro_fare_paid:
+            transport = "metro"
+        elif lines:
+            transport = "bus"
+        else:
+            transport = "walking"
+        return {
+            "id": "route_1",
+            "transport": transport,
+            "line": " + ".join(lines) or None,
+            "duration": f"{math.ceil(total)} min",
+            "duration_minutes": round(total, 1),
+            "accessibility": "full" if fully_accessible else "partial",
+            "cost": f"{sum(fares):.2f}€" if fares else None,
+            "steps": steps,
+            "accessibility_features": features,
+        }
+
+
+def _format_minutes(minutes: float) -> str:
+    return f"{minutes:g}" if minutes == int(minutes) else f"{minutes:.1f}"
+
+
+_route_planner: Optional[AccessibleRoutePlanner] = None
+
+
+def get_route_planner(settings=None) -> AccessibleRoutePlanner:
+    """Return the process-wide route planner, loading the transit feed on first use."""
+    global _route_planner
+    if _route_planner is None:
+        if settings is None:
+            from integration.configuration.settings import get_settings
+
+            settings = get_settings()
+        _route_planner = AccessibleRoutePlanner(
+            settings.transit_feed_path or DEFAULT_TRANSIT_FEED_PATH,
+            default_origin=settings.route_planner_origin,
+            cache_size=settings.route_planner_cache_size,
+        )
+    return _route_planner
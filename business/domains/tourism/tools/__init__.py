@@ -3,6 +3,7 @@
 from business.domains.tourism.tools.accessibility_tool import AccessibilityAnalysisTool
 from business.domains.tourism.tools.location_ner_tool import LocationNERTool
 from business.domains.tourism.tools.nlu_tool import TourismNLUTool
+from business.domains.tourism.tools.results import AccessibilityResult, RouteResult, VenueInfoResult
 from business.domains.tourism.tools.route_planning_tool import RoutePlanningTool
 from business.domains.tourism.tools.tourism_info_tool import TourismInfoTool
 
@@ -12,4 +13,7 @@ __all__ = [
     "AccessibilityAnalysisTool",
     "RoutePlanningTool",
     "TourismInfoTool",
+    "AccessibilityResult",
+    "RouteResult",
+    "VenueInfoResult",
 ]
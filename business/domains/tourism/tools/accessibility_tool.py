@@ -1,15 +1,14 @@
 """Accessibility analysis tool for tourism venues."""
 
-import json
 from datetime import datetime
+from typing import Optional
 
 import structlog
 from langchain.tools import BaseTool
 
-from business.domains.tourism.data.accessibility_data import (
-    ACCESSIBILITY_DB,
-    DEFAULT_ACCESSIBILITY,
-)
+from business.domains.tourism.tools.results import AccessibilityResult
+from business.domains.tourism.venue_index import extract_destination, resolve_venue
+from business.domains.tourism.venue_store import get_venue_store
 
 logger = structlog.get_logger(__name__)
 
@@ -20,30 +19,32 @@ class AccessibilityAnalysisTool(BaseTool):
     name: str = "accessibility_analysis"
     description: str = "Analyze accessibility needs and provide detailed venue accessibility information"
 
+    def analyze(self, destination: Optional[str]) -> AccessibilityResult:
+        """Accessibility information for a destination name (defaults when unknown)."""
+        match, record = resolve_venue(destination)
+        venue_data = record.accessibility if record else get_venue_store().defaults["accessibility"]
+
+        result = AccessibilityResult(
+            venue_name=match.name if match else None,
+            accessibility_level=venue_data["accessibility_level"],
+            venue_rating=venue_data["venue_rating"],
+            facilities=venue_data["facilities"],
+            accessibility_score=venue_data["accessibility_score"],
+            certification=venue_data["certification"],
+            last_updated=datetime.now().isoformat(),
+        )
+
+        logger.info(
+            "Accessibility Tool: Analysis complete",
+            venue=result.venue_name,
+            accessibility_score=result.accessibility_score,
+        )
+        return result
+
     def _run(self, nlu_result: str) -> str:
-        """Analyze accessibility requirements based on NLU results."""
+        """Analyze accessibility requirements based on NLU results (JSON in, JSON out)."""
         logger.info("Accessibility Tool: Processing requirements", nlu_input=nlu_result)
-
-        try:
-            nlu_data = json.loads(nlu_result)
-            destination = nlu_data.get("entities", {}).get("destination", "general")
-        except Exception:
-            destination = "general"
-
-        venue_data = ACCESSIBILITY_DB.get(destination, DEFAULT_ACCESSIBILITY)
-
-        result = {
-            "accessibility_level": venue_data["accessibility_level"],
-            "venue_rating": venue_data["venue_rating"],
-            "facilities": venue_data["facilities"],
-            "warnings": [],
-            "accessibility_score": venue_data["accessibility_score"],
-            "certification": venue_data["certification"],
-            "last_updated": datetime.now().isoformat(),
-        }
-
-        logger.info("Accessibility Tool: Analysis complete", result=result)
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return self.analyze(extract_destination(nlu_result)).to_json()
 
     async def _arun(self, nlu_result: str) -> str:
         """Async version of accessibility analysis."""
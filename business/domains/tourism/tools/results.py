@@ -0,0 +1,124 @@
+"""Typed results passed between tourism pipeline stages.
+
+Tools hand these objects to the next stage directly; they are serialized once,
+at the prompt/API boundary, via ``to_dict()`` / ``to_json()``. Nested sections
+come from the shared venue store and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+class _ToolResult(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict view of the result for the API metadata."""
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+
+
+@dataclass(frozen=True, slots=True)
+class AccessibilityResult(_ToolResult):
+    """Accessibility analysis for the resolved destination."""
+
+    venue_name: Optional[str]
+    accessibility_level: str
+    venue_rating: float
+    facilities: list[str]
+    accessibility_score: float
+    certification: str
+    last_updated: str
+    warnings: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "accessibility_level": self.accessibility_level,
+            "venue_rating": self.venue_rating,
+            "facilities": self.facilities,
+            "warnings": list(self.warnings),
+            "accessibility_score": self.accessibility_score,
+            "certification": self.certification,
+            "last_updated": self.last_updated,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class RouteResult(_ToolResult):
+    """Accessible routes to the resolved destination."""
+
+    destination: Optional[str]
+    routes: list[dict]
+    alternatives: tuple[str, ...]
+    accessibility_score: float
+    weather_considerations: str
+    estimated_cost: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "routes": self.routes,
+            "alternatives": list(self.alternatives),
+            "accessibility_score": self.accessibility_score,
+            "weather_considerations": self.weather_considerations,
+            "estimated_cost": self.estimated_cost,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class VenueInfoResult(_ToolResult):
+    """Visitor information (hours, pricing, services) for the resolved venue."""
+
+    venue_name: str
+    venue_type: str
+    opening_hours: dict
+    pricing: dict
+    accessibility_reviews: list[str]
+    special_exhibitions: list[str]
+    accessibility_services: dict
+    contact: dict
+    last_updated: str
+    current_crowds: str = "moderate"
+    nearby_venues: tuple[dict, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "venue": {
+                "name": self.venue_name,
+                "type": self.venue_type,
+            },
+            "opening_hours": self.opening_hours,
+            "pricing": self.pricing,
+            "accessibility_reviews": self.accessibility_reviews,
+            "current_crowds": self.current_crowds,
+            "special_exhibitions": self.special_exhibitions,
+            "accessibility_services": self.accessibility_services,
+            "contact": self.contact,
+            "nearby_venues": list(self.nearby_venues),
+            "last_updated": self.last_updated,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class RankingResult(_ToolResult):
+    """Profile-ranked top-k venues near the destination and routes to it."""
+
+    profile_id: Optional[str]
+    venues: tuple[dict, ...]
+    routes: tuple[dict, ...]
+    route_scores: tuple[float, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "profile_id": self.profile_id,
+            "venues": list(self.venues),
+            "routes": [
+                {"transport": route.get("transport"), "line": route.get("line"), "rank_score": score}
+                for route, score in zip(self.routes, self.route_scores)
+            ],
+        }
@@ -1,14 +1,23 @@
 """Route planning tool for accessible transport in Madrid."""
 
-import json
+from typing import Optional
 
 import structlog
 from langchain.tools import BaseTool
 
-from business.domains.tourism.data.route_data import DEFAULT_ROUTE, ROUTE_DB
+from business.domains.tourism.route_planner import get_route_planner, profile_for_accessibility
+from business.domains.tourism.tools.results import RouteResult
+from business.domains.tourism.venue_index import extract_destination, resolve_venue
+from business.domains.tourism.venue_store import get_venue_store
 
 logger = structlog.get_logger(__name__)
 
+ROUTE_ALTERNATIVES = (
+    "accessible_taxi",
+    "uber_wam",
+    "accessible_private_transport",
+)
+
 
 class RoutePlanningTool(BaseTool):
     """Plan optimal accessible routes using Maps APIs."""
@@ -16,45 +25,55 @@ class RoutePlanningTool(BaseTool):
     name: str = "route_planning"
     description: str = "Generate accessible routes with multiple transport options and timing"
 
+    def plan(
+        self, destination: Optional[str], text: Optional[str] = None, accessibility: Optional[str] = None
+    ) -> RouteResult:
+        """Accessible routes to a destination name, falling back to venues mentioned in text.
+
+        Venues linked to the transit feed are routed by the planner using the profile derived
+        from the accessibility need; other venues use the routes stored in the venue record.
+        """
+        match, record = resolve_venue(destination, text)
+        routes = self._plan_transit(record, accessibility) if record else []
+        if routes:
+            costs = [route["cost"] for route in routes if route.get("cost")]
+            estimated_cost = " / ".join(dict.fromkeys(costs)) or "0.00€"
+            accessibility_score = 9.0 if routes[0]["accessibility"] == "full" else 6.5
+        else:
+            route_data = record.route if record else get_venue_store().defaults["route"]
+            routes, estimated_cost, accessibility_score = route_data["routes"], route_data["cost"], 8.5
+
+        result = RouteResult(
+            destination=match.name if match else None,
+            routes=routes,
+            alternatives=ROUTE_ALTERNATIVES,
+            accessibility_score=accessibility_score,
+            weather_considerations="Check weather for walking portions",
+            estimated_cost=estimated_cost,
+        )
+
+        logger.info("Route Planning Tool: Routes generated", destination=result.destination, routes=len(result.routes))
+        return result
+
+    @staticmethod
+    def _plan_transit(record, accessibility: Optional[str]) -> list[dict]:
+        try:
+            planner = get_route_planner()
+        except (OSError, KeyError, ValueError) as exc:
+            logger.warning("Route Planning Tool: Transit feed unavailable", error=str(exc))
+            return []
+        if not planner.has_venue(record.id):
+            return []
+        return planner.plan_to_venue(record.id, record.name, profile=profile_for_accessibility(accessibility))
+
     def _run(self, accessibility_info: str) -> str:
-        """Plan accessible routes based on accessibility requirements."""
+        """Plan accessible routes based on a previous tool's JSON output."""
         logger.info(
             "Route Planning Tool: Generating routes",
             accessibility_input=accessibility_info,
         )
-
-        destination = self._extract_destination(accessibility_info)
-        route_data = ROUTE_DB.get(destination, DEFAULT_ROUTE)
-
-        result = {
-            "routes": route_data["routes"],
-            "alternatives": [
-                "accessible_taxi",
-                "uber_wam",
-                "accessible_private_transport",
-            ],
-            "accessibility_score": 8.5,
-            "weather_considerations": "Check weather for walking portions",
-            "estimated_cost": route_data["cost"],
-        }
-
-        logger.info("Route Planning Tool: Routes generated", result=result)
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return self.plan(extract_destination(accessibility_info), accessibility_info).to_json()
 
     async def _arun(self, accessibility_info: str) -> str:
         """Async version of route planning."""
         return self._run(accessibility_info)
-
-    @staticmethod
-    def _extract_destination(accessibility_info: str) -> str:
-        """Extract destination from previous tool output."""
-        destination = "Madrid centro"
-        if "Prado" in accessibility_info:
-            destination = "Museo del Prado"
-        elif "Reina" in accessibility_info:
-            destination = "Museo Reina Sofía"
-        elif "musical" in accessibility_info or "concierto" in accessibility_info:
-            destination = "Espacios musicales"
-        elif "restaurante" in accessibility_info:
-            destination = "Zona restaurantes"
-        return destination
@@ -1,15 +1,27 @@
 """Tourism information tool for venue details, schedules, and pricing."""
 
-import json
 from datetime import datetime
+from typing import Optional
 
 import structlog
 from langchain.tools import BaseTool
 
-from business.domains.tourism.data.venue_data import DEFAULT_VENUE, VENUE_DB
+from business.domains.tourism.geo_index import CITY_CENTER, get_geo_index
+from business.domains.tourism.tools.results import VenueInfoResult
+from business.domains.tourism.venue_index import extract_destination, resolve_venue
+from business.domains.tourism.venue_store import get_venue_store
 
 logger = structlog.get_logger(__name__)
 
+# Search intents answered with nearby venues of a type instead of a single venue.
+SEARCH_INTENT_TYPES = {
+    "restaurant_search": "restaurant",
+    "event_search": "entertainment",
+    "accommodation_search": "hotel",
+}
+NEARBY_LIMIT = 5
+NEARBY_MIN_ACCESSIBILITY = "partial_wheelchair_access"
+
 
 class TourismInfoTool(BaseTool):
     """Get real-time tourism information and reviews."""
@@ -17,55 +29,73 @@ class TourismInfoTool(BaseTool):
     name: str = "tourism_info"
     description: str = "Fetch current tourism information, schedules, prices, and accessibility reviews"
 
+    def lookup(
+        self, destination: Optional[str], text: Optional[str] = None, intent: Optional[str] = None
+    ) -> VenueInfoResult:
+        """Visitor information for a destination name, falling back to venues mentioned in text.
+
+        For restaurant/event/accommodation searches that do not name a specific venue of that
+        type, also lists the nearest accessible venues of the type around the destination
+        (or the city centre).
+        """
+        match, record = resolve_venue(destination, text)
+        venue_name = match.name if match else "General Madrid"
+        venue_data = record.visitor_info if record else get_venue_store().defaults["visitor_info"]
+
+        result = VenueInfoResult(
+            venue_name=venue_name,
+            venue_type=match.venue_type if match else self._infer_venue_type(venue_name),
+            opening_hours=venue_data["opening_hours"],
+            pricing=venue_data["pricing"],
+            accessibility_reviews=venue_data["accessibility_reviews"],
+            special_exhibitions=venue_data["special_exhibitions"],
+            accessibility_services=venue_data["accessibility_services"],
+            contact=venue_data["contact"],
+            last_updated=datetime.now().isoformat(),
+            nearby_venues=self._nearby_venues(intent, record),
+        )
+
+        logger.info(
+            "Tourism Info Tool: Information retrieved",
+            venue=result.venue_name,
+            type=result.venue_type,
+            nearby=len(result.nearby_venues),
+        )
+        return result
+
     def _run(self, venue_info: str) -> str:
-        """Get comprehensive tourism information."""
+        """Get comprehensive tourism information from an NLU JSON payload or free text."""
         logger.info("Tourism Info Tool: Fetching venue information", venue_input=venue_info)
-
-        venue_name = self._extract_venue_name(venue_info)
-        venue_data = VENUE_DB.get(venue_name, DEFAULT_VENUE)
-        venue_type = self._infer_venue_type(venue_name)
-
-        result = {
-            "venue": {
-                "name": venue_name,
-                "type": venue_type,
-            },
-            "opening_hours": venue_data["opening_hours"],
-            "pricing": venue_data["pricing"],
-            "accessibility_reviews": venue_data["accessibility_reviews"],
-            "current_crowds": "moderate",
-            "special_exhibitions": venue_data["special_exhibitions"],
-            "accessibility_services": venue_data["accessibility_services"],
-            "contact": venue_data["contact"],
-            "last_updated": datetime.now().isoformat(),
-        }
-
-        logger.info("Tourism Info Tool: Information retrieved", result=result)
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return self.lookup(extract_destination(venue_info), venue_info).to_json()
 
     async def _arun(self, venue_info: str) -> str:
         """Async version of tourism info retrieval."""
         return self._run(venue_info)
 
     @staticmethod
-    def _extract_venue_name(venue_info: str) -> str:
-        """Extract venue name from input text."""
-        venue_lower = venue_info.lower()
-
-        if "prado" in venue_lower:
-            return "Museo del Prado"
-        elif "reina" in venue_lower:
-            return "Museo Reina Sofía"
-        elif "thyssen" in venue_lower:
-            return "Museo Thyssen"
-        elif "musical" in venue_lower or "concierto" in venue_lower:
-            return "Espacios musicales Madrid"
-        elif "restaurante" in venue_lower:
-            return "Restaurantes accesibles Madrid"
-        elif "parque" in venue_lower or "retiro" in venue_lower:
-            return "Parques Madrid"
-
-        return "General Madrid"
+    def _nearby_venues(intent: Optional[str], record) -> tuple[dict, ...]:
+        venue_type = SEARCH_INTENT_TYPES.get(intent)
+        located = record is not None and record.lat is not None
+        if venue_type is None or (located and record.venue_type == venue_type):
+            return ()
+        lat, lon = (record.lat, record.lon) if located else CITY_CENTER
+        index = get_geo_index()
+        nearby = []
+        for match in index.nearest(
+            lat,
+            lon,
+            k=NEARBY_LIMIT,
+            kind="venue",
+            category=venue_type,
+            min_accessibility=NEARBY_MIN_ACCESSIBILITY,
+        ):
+            item = match.to_dict()
+            stations = index.nearest(
+                match.point.lat, match.point.lon, k=1, category="metro_station", min_accessibility="step_free"
+            )
+            item["nearest_step_free_metro"] = stations[0].point.name if stations else None
+            nearby.append(item)
+        return tuple(nearby)
 
     @staticmethod
     def _infer_venue_type(venue_name: str) -> str:
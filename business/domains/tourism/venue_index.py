@@ -0,0 +1,290 @@
+"""Fuzzy venue name index shared by the tourism tools and EntityResolver.
+
+Names and aliases are folded (case, accents, punctuation, articles) into keys.
+Resolution tries an exact key hit first, then scores candidates (aliases sharing
+the rarest query token, else the rarest trigrams) by Dice overlap and normalized
+edit distance, and finally looks for a known alias contained in the query.
+Results are memoized in an LRU.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+if TYPE_CHECKING:
+    from business.domains.tourism.venue_store import VenueRecord
+
+STOPWORDS = frozenset({"a", "al", "de", "del", "el", "en", "la", "las", "los", "y", "the", "of"})
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+@dataclass(frozen=True)
+class VenueMatch:
+    """Resolved venue: canonical name, type, confidence (0-1) and how it matched."""
+
+    name: str
+    venue_type: str
+    score: float
+    method: str
+    matched: str
+
+
+def fold_name(text: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char)).lower()
+    return _NON_ALNUM.sub(" ", stripped).strip()
+
+
+def _key_tokens(text: str) -> list[str]:
+    tokens = fold_name(text).split()
+    content = [token for token in tokens if token not in STOPWORDS]
+    return content or tokens
+
+
+def venue_key(text: str) -> str:
+    """Folded lookup key without articles/prepositions ("el Prado" -> "prado")."""
+    return " ".join(_key_tokens(text))
+
+
+def _trigrams(key: str) -> frozenset[str]:
+    padded = f" {key} "
+    return frozenset(padded[index : index + 3] for index in range(len(padded) - 2))
+
+
+def _levenshtein_ratio(left: str, right: str, floor: float = 0.0) -> float:
+    """1 - normalized Levenshtein distance; returns 0.0 early once the ratio cannot reach floor."""
+    if left == right:
+        return 1.0
+    if not left or not right:
+        return 0.0
+    if len(left) < len(right):
+        left, right = right, left
+    max_distance = int((1.0 - floor) * len(left))
+    if len(left) - len(right) > max_distance:
+        return 0.0
+    previous = list(range(len(right) + 1))
+    for row, left_char in enumerate(left, start=1):
+        current = [row]
+        for column, right_char in enumerate(right, start=1):
+            current.append(
+                min(
+                    previous[column] + 1,
+                    current[column - 1] + 1,
+                    previous[column - 1] + (left_char != right_char),
+                )
+            )
+        if min(current) > max_distance:
+            return 0.0
+        previous = current
+    return 1.0 - previous[-1] / len(left)
+
+
+def extract_destination(payload: str) -> Optional[str]:
+    """Read the destination/venue name from a tool JSON payload, if any."""
+    try:
+        data = json.loads(payload)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    entities = data.get("entities")
+    venue = data.get("venue")
+    for candidate in (
+        entities.get("destination") if isinstance(entities, dict) else None,
+        data.get("destination"),
+        venue.get("name") if isinstance(venue, dict) else venue,
+    ):
+        if isinstance(candidate, str) and candidate.strip():
+            return candidate
+    return None
+
+
+class VenueIndex:
+    """Alias index resolving free-form venue names to canonical venues."""
+
+    def __init__(
+        self,
+        venues: Iterable[tuple[str, str, Iterable[str]]],
+        min_score: float = 0.7,
+        cache_size: int = 4096,
+        candidate_limit: int = 16,
+        probe_grams: int = 6,
+    ):
+        self._min_score = min_score
+        self._candidate_limit = candidate_limit
+        self._probe_grams = probe_grams
+
+        self._names: list[str] = []
+        self._types: list[str] = []
+        self._alias_keys: list[str] = []
+        self._alias_venue: list[int] = []
+        self._alias_grams: list[frozenset[str]] = []
+        self._exact: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = {}
+        self._token_postings: dict[str, list[int]] = {}
+        self._max_alias_tokens = 1
+
+        for name, venue_type, aliases in venues:
+            venue_id = len(self._names)
+            self._names.append(name)
+            self._types.append(venue_type)
+            for alias in (name, *aliases):
+                self._add_alias(venue_id, alias)
+
+        self._resolve_cached = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def resolve(self, query: str) -> Optional[VenueMatch]:
+        """Best venue for a name/alias (memoized), or None below the confidence threshold."""
+        return self._resolve_cached(query)
+
+    def find_in_text(self, text: str) -> Optional[VenueMatch]:
+        """Longest alias (in tokens) appearing anywhere in free text."""
+        tokens = [token for token in fold_name(text).split() if token not in STOPWORDS]
+        for size in range(min(self._max_alias_tokens, len(tokens)), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                key = " ".join(tokens[start : start + size])
+                alias_id = self._exact.get(key)
+                if alias_id is not None:
+                    coverage = size / len(tokens)
+                    return self._match(alias_id, round(0.6 + 0.4 * coverage, 4), "contains")
+        return None
+
+    def get_stats(self) -> dict[str, Any]:
+        cache = self._resolve_cached.cache_info()
+        return {
+            "venues": len(self._names),
+            "aliases": len(self._alias_keys),
+            "trigrams": len(self._postings),
+            "cache_hits": cache.hits,
+            "cache_misses": cache.misses,
+            "cache_size": cache.currsize,
+        }
+
+    def _add_alias(self, venue_id: int, alias: str) -> None:
+        key = venue_key(alias)
+        if not key:
+            return
+        if key in self._exact:
+            return
+
+        alias_id = len(self._alias_keys)
+        grams = _trigrams(key)
+        self._alias_keys.append(key)
+        self._alias_venue.append(venue_id)
+        self._alias_grams.append(grams)
+        self._exact[key] = alias_id
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(alias_id)
+        for token in set(key.split()):
+            self._token_postings.setdefault(token, []).append(alias_id)
+        self._max_alias_tokens = max(self._max_alias_tokens, key.count(" ") + 1)
+
+    def _match(self, alias_id: int, score: float, method: str) -> VenueMatch:
+        venue_id = self._alias_venue[alias_id]
+        return VenueMatch(
+            name=self._names[venue_id],
+            venue_type=self._types[venue_id],
+            score=score,
+            method=method,
+            matched=self._alias_keys[alias_id],
+        )
+
+    def _resolve(self, query: str) -> Optional[VenueMatch]:
+        if not isinstance(query, str):
+            return None
+        key = venue_key(query)
+        if not key:
+            return None
+
+        alias_id = self._exact.get(key)
+        if alias_id is not None:
+            return self._match(alias_id, 1.0, "exact")
+
+        best = self._best_fuzzy(key)
+        contained = self.find_in_text(query)
+        if contained is not None and (best is None or contained.score > best.score):
+            best = contained
+        return best if best is not None and best.score >= self._min_score else None
+
+    def _best_fuzzy(self, key: str) -> Optional[VenueMatch]:
+        grams = _trigrams(key)
+        # A typo usually leaves some token intact, and aliases sharing the rarest exact
+        # token are a small candidate set; trigram probing is the fallback.
+        token_postings = [self._token_postings[token] for token in key.split() if token in self._token_postings]
+        if token_postings:
+            rarest = min(token_postings, key=len)
+            if len(rarest) <= self._candidate_limit * 4:
+                match = self._score_candidates(key, grams, rarest)
+                if match is not None:
+                    return match
+
+        probes = sorted((gram for gram in grams if gram in self._postings), key=lambda gram: len(self._postings[gram]))
+        hits = Counter(chain.from_iterable(self._postings[gram] for gram in probes[: self._probe_grams]))
+        return self._score_candidates(key, grams, [alias_id for alias_id, _ in hits.most_common(self._candidate_limit)])
+
+    def _score_candidates(self, key: str, grams: frozenset[str], candidates: Iterable[int]) -> Optional[VenueMatch]:
+        scored = []
+        for alias_id in candidates:
+            alias_grams = self._alias_grams[alias_id]
+            scored.append((2 * len(grams & alias_grams) / (len(grams) + len(alias_grams)), alias_id))
+        scored.sort(reverse=True)
+
+        # score = (dice + edit ratio) / 2, so a candidate can only win if its edit ratio
+        # clears 2 * target - dice; the Levenshtein pass stops as soon as it cannot.
+        best_id, best_score = -1, self._min_score
+        for dice, alias_id in scored:
+            floor = 2 * best_score - dice
+            if floor > 1.0:
+                break
+            ratio = _levenshtein_ratio(key, self._alias_keys[alias_id], floor)
+            score = 0.5 * dice + 0.5 * ratio
+            if score >= best_score and ratio >= floor:
+                best_id, best_score = alias_id, score
+        return self._match(best_id, round(best_score, 4), "fuzzy") if best_id >= 0 else None
+
+
+_venue_index: Optional[VenueIndex] = None
+_venue_index_generation = -1
+
+
+def get_venue_index() -> VenueIndex:
+    """Return the process-wide index over the venue store, rebuilt when the store reloads."""
+    global _venue_index, _venue_index_generation
+    from business.domains.tourism.venue_store import get_venue_store
+
+    store = get_venue_store()
+    generation = store.generation
+    if _venue_index is None or generation != _venue_index_generation:
+        _venue_index = VenueIndex(store.index_entries())
+        _venue_index_generation = generation
+    return _venue_index
+
+
+def resolve_venue(
+    destination: Optional[str], text: Optional[str] = None
+) -> tuple[Optional[VenueMatch], Optional[VenueRecord]]:
+    """Resolve a destination (or, failing that, free text) to its venue store record.
+
+    Returns (match, record); record is None when nothing matched.
+    """
+    from business.domains.tourism.venue_store import get_venue_store
+
+    index = get_venue_index()
+    match = index.resolve(destination) if destination else None
+    if match is None and text:
+        match = index.find_in_text(text)
+    if match is None:
+        return None, None
+    return match, get_venue_store().find(match.name)
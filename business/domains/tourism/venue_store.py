@@ -0,0 +1,355 @@
+"""Unified venue knowledge store: one record per venue with accessibility, route and visitor info.
+
+Records live in a read-only SQLite database indexed by id, alias, type and district.
+The source may be a prebuilt ``.sqlite``/``.db`` file (e.g. the full Madrid open-data
+catalogue compiled with ``build_venue_store``) or a JSON catalogue, which is compiled
+into an in-memory database. The store opens lazily on first use and reloads when the
+source file changes.
+
+Usage:
+    python -m business.domains.tourism.venue_store catalogue.json venues.sqlite
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import structlog
+
+from business.domains.tourism.venue_index import venue_key
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_VENUE_CATALOG_PATH = Path(__file__).resolve().parent / "data" / "venue_catalog.json"
+SECTIONS = ("accessibility", "route", "visitor_info")
+# Bump whenever _SCHEMA changes; stores without the row predate the lat/lon columns (version 1)
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE venues (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    district TEXT,
+    lat REAL,
+    lon REAL,
+    record TEXT NOT NULL
+);
+CREATE TABLE venue_aliases (
+    alias_key TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    venue_id TEXT NOT NULL REFERENCES venues(id)
+);
+CREATE TABLE store_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE INDEX idx_venue_aliases_key ON venue_aliases(alias_key);
+CREATE INDEX idx_venue_aliases_venue ON venue_aliases(venue_id);
+CREATE INDEX idx_venues_type ON venues(type);
+CREATE INDEX idx_venues_district ON venues(district);
+"""
+
+
+class VenueStoreSchemaError(ValueError):
+    """A prebuilt store was compiled with a different schema and must be rebuilt."""
+
+
+@dataclass(frozen=True)
+class VenueRecord:
+    """Everything the tourism tools know about one venue (missing sections hold the defaults)."""
+
+    id: str
+    name: str
+    venue_type: str
+    district: Optional[str]
+    aliases: tuple[str, ...]
+    accessibility: dict
+    route: dict
+    visitor_info: dict
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+
+def _write_catalog(connection: sqlite3.Connection, catalog: dict[str, Any]) -> int:
+    connection.executescript(_SCHEMA)
+    defaults = {section: catalog.get("defaults", {}).get(section) or {} for section in SECTIONS}
+    connection.execute("INSERT INTO store_meta VALUES ('defaults', ?)", (json.dumps(defaults, ensure_ascii=False),))
+    connection.execute("INSERT INTO store_meta VALUES ('version', ?)", (str(catalog.get("version", 1)),))
+    connection.execute("INSERT INTO store_meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+
+    venues = catalog.get("venues", [])
+    for venue in venues:
+        aliases = [alias for alias in venue.get("aliases", []) if isinstance(alias, str)]
+        record = {section: venue.get(section) for section in SECTIONS}
+        record["aliases"] = aliases
+        location = venue.get("location") or {}
+        connection.execute(
+            "INSERT INTO venues VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                venue["id"],
+                venue["name"],
+                venue.get("type", "tourism"),
+                venue.get("district"),
+                location.get("lat"),
+                location.get("lon"),
+                json.dumps(record, ensure_ascii=False),
+            ),
+        )
+        seen: set[str] = set()
+        for alias in (venue["name"], *aliases):
+            key = venue_key(alias)
+            if key and key not in seen:
+                seen.add(key)
+                connection.execute("INSERT INTO venue_aliases VALUES (?, ?, ?)", (key, alias, venue["id"]))
+    connection.commit()
+    return len(venues)
+
+
+def build_venue_store(catalog_path: str | Path, db_path: str | Path) -> int:
+    """Compile a JSON venue catalogue into an indexed SQLite file; returns the venue count."""
+    catalog = json.loads(Path(catalog_path).read_text(encoding="utf-8"))
+    target = Path(db_path)
+    target.unlink(missing_ok=True)
+    connection = sqlite3.connect(target)
+    try:
+        return _write_catalog(connection, catalog)
+    finally:
+        connection.close()
+
+
+class VenueStore:
+    """Lazily opened, hot-reloaded, read-only venue store."""
+
+    def __init__(self, path: str | Path, reload_interval: float = 5.0, cache_size: int = 1024):
+        self._path = Path(path)
+        self._reload_interval = reload_interval
+        self._cache_size = cache_size
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._mtime_ns: Optional[int] = None
+        self._checked_at = 0.0
+        self._defaults: dict[str, dict] = {section: {} for section in SECTIONS}
+        self._records: OrderedDict[str, VenueRecord] = OrderedDict()
+        self._generation = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every (re)load; consumers rebuild derived indexes when it changes."""
+        self._ensure_loaded()
+        return self._generation
+
+    @property
+    def defaults(self) -> dict[str, dict]:
+        self._ensure_loaded()
+        return self._defaults
+
+    def get(self, venue_id: str) -> Optional[VenueRecord]:
+        """Record by venue id."""
+        self._ensure_loaded()
+        with self._lock:
+            record = self._records.get(venue_id)
+            if record is not None:
+                self._records.move_to_end(venue_id)
+                self._cache_hits += 1
+                return record
+            self._cache_misses += 1
+            row = self._connection.execute(
+                "SELECT id, name, type, district, lat, lon, record FROM venues WHERE id = ?", (venue_id,)
+            ).fetchone()
+            return self._remember(row) if row else None
+
+    def find(self, name: str) -> Optional[VenueRecord]:
+        """Record whose name or alias folds to the same key as name."""
+        key = venue_key(name) if isinstance(name, str) else ""
+        if not key:
+            return None
+        self._ensure_loaded()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT venue_id FROM venue_aliases WHERE alias_key = ? LIMIT 1", (key,)
+            ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def by_type(self, venue_type: str, limit: int = 50) -> list[VenueRecord]:
+        return self._select("SELECT id FROM venues WHERE type = ? ORDER BY name LIMIT ?", (venue_type, limit))
+
+    def by_district(self, district: str, limit: int = 50) -> list[VenueRecord]:
+        return self._select("SELECT id FROM venues WHERE district = ? ORDER BY name LIMIT ?", (district, limit))
+
+    def index_entries(self) -> Iterator[tuple[str, str, list[str]]]:
+        """(name, type, aliases) for every venue, as consumed by VenueIndex."""
+        self._ensure_loaded()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT v.id, v.name, v.type, a.alias FROM venues v JOIN venue_aliases a ON a.venue_id = v.id "
+                "ORDER BY v.rowid, a.rowid"
+            ).fetchall()
+        current_id, current = None, None
+        for venue_id, name, venue_type, alias in rows:
+            if venue_id != current_id:
+                if current is not None:
+                    yield current
+                current_id, current = venue_id, (name, venue_type, [])
+            if alias != name:
+                current[2].append(alias)
+        if current is not None:
+            yield current
+
+    def geo_entries(self) -> Iterator[tuple[str, str, str, float, float, str]]:
+        """(id, name, type, lat, lon, accessibility_level) for every venue with a location."""
+        self._ensure_loaded()
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, name, type, lat, lon, record FROM venues WHERE lat IS NOT NULL AND lon IS NOT NULL"
+            ).fetchall()
+        default_level = self._defaults["accessibility"].get("accessibility_level")
+        for venue_id, name, venue_type, lat, lon, payload in rows:
+            accessibility = json.loads(payload).get("accessibility") or {}
+            yield venue_id, name, venue_type, lat, lon, accessibility.get("accessibility_level", default_level)
+
+    def get_stats(self) -> dict[str, Any]:
+        self._ensure_loaded()
+        with self._lock:
+            venues = self._connection.execute("SELECT COUNT(*) FROM venues").fetchone()[0]
+        return {
+            "path": str(self._path),
+            "venues": venues,
+            "generation": self._generation,
+            "cached_records": len(self._records),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = None
+            self._mtime_ns = None
+            self._records.clear()
+
+    def _select(self, query: str, params: tuple) -> list[VenueRecord]:
+        self._ensure_loaded()
+        with self._lock:
+            ids = [row[0] for row in self._connection.execute(query, params).fetchall()]
+        return [record for record in map(self.get, ids) if record is not None]
+
+    def _remember(self, row: tuple) -> VenueRecord:
+        venue_id, name, venue_type, district, lat, lon, payload = row
+        data = json.loads(payload)
+        record = VenueRecord(
+            id=venue_id,
+            name=name,
+            venue_type=venue_type,
+            district=district,
+            aliases=tuple(data.get("aliases", [])),
+            lat=lat,
+            lon=lon,
+            **{section: data.get(section) or self._defaults[section] for section in SECTIONS},
+        )
+        self._records[venue_id] = record
+        if len(self._records) > self._cache_size:
+            self._records.popitem(last=False)
+        return record
+
+    def _ensure_loaded(self) -> None:
+        now = time.monotonic()
+        if self._connection is not None and now - self._checked_at < self._reload_interval:
+            return
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime_ns = self._path.stat().st_mtime_ns
+                if self._connection is not None and mtime_ns == self._mtime_ns:
+                    return
+                self._load(mtime_ns)
+            except (OSError, ValueError, KeyError, TypeError, sqlite3.Error) as error:
+                if self._connection is None:
+                    raise
+                # Catalogue being rewritten or removed: keep serving the last good generation
+                logger.warning(
+                    "venue_store_reload_failed", path=str(self._path), generation=self._generation, error=repr(error)
+                )
+
+    def _load(self, mtime_ns: int) -> None:
+        connection = None
+        try:
+            if self._path.suffix == ".json":
+                connection = sqlite3.connect(":memory:", check_same_thread=False)
+                _write_catalog(connection, json.loads(self._path.read_text(encoding="utf-8")))
+            else:
+                connection = sqlite3.connect(
+                    f"{self._path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+                )
+            _check_schema_version(connection, self._path)
+            row = connection.execute("SELECT value FROM store_meta WHERE key = 'defaults'").fetchone()
+            defaults = json.loads(row[0])
+        except BaseException:
+            if connection is not None:
+                connection.close()
+            raise
+
+        previous = self._connection
+        self._connection = connection
+        self._mtime_ns = mtime_ns
+        self._defaults = {section: defaults.get(section) or {} for section in SECTIONS}
+        self._records.clear()
+        self._generation += 1
+        if previous is not None:
+            previous.close()
+        logger.info("venue_store_loaded", path=str(self._path), generation=self._generation)
+
+
+def _check_schema_version(connection: sqlite3.Connection, path: Path) -> None:
+    row = connection.execute("SELECT value FROM store_meta WHERE key = 'schema_version'").fetchone()
+    version = int(row[0]) if row else 1
+    if version != SCHEMA_VERSION:
+        raise VenueStoreSchemaError(
+            f"Venue store {path} has schema version {version}, expected {SCHEMA_VERSION}; rebuild it with "
+            f"python -m business.domains.tourism.venue_store <catalogue.json> {path}"
+        )
+
+
+_venue_store: Optional[VenueStore] = None
+
+
+def get_venue_store(settings=None) -> VenueStore:
+    """Return the process-wide venue store configured from settings."""
+    global _venue_store
+    if _venue_store is None:
+        if settings is None:
+            from integration.configuration.settings import get_settings
+
+            settings = get_settings()
+        _venue_store = VenueStore(
+            settings.venue_store_path or DEFAULT_VENUE_CATALOG_PATH,
+            reload_interval=settings.venue_store_reload_interval,
+        )
+    return _venue_store
+
+
+def shutdown_venue_store() -> None:
+    """Close the process-wide venue store (called on application shutdown)."""
+    global _venue_store
+    if _venue_store is not None:
+        _venue_store.close()
+        _venue_store = None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        raise SystemExit(__doc__)
+    count = build_venue_store(sys.argv[1], sys.argv[2])
+    print(f"Wrote {count} venues to {sys.argv[2]}")
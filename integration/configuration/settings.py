@@ -53,13 +53,59 @@ class Settings(BaseSettings):
     default_sample_rate: int = Field(default=16000, description="Default audio sample rate")
     default_channels: int = Field(default=1, description="Default audio channels")
     whisper_model: str = Field(default="base", description="Whisper model to use for STT")
+    ffmpeg_path: str = Field(default="ffmpeg", description="ffmpeg executable used to decode compressed audio")
+    ffmpeg_pool_size: int = Field(default=2, description="Pre-spawned ffmpeg processes (max concurrent decodes)")
+    ffmpeg_decode_timeout: float = Field(default=15.0, description="Seconds before an ffmpeg decode is killed")
+    transcription_job_workers: int = Field(default=2, description="Concurrent STT workers for /audio/transcribe-async")
+    transcription_job_queue_size: int = Field(
+        default=32, description="Queued async transcription jobs; beyond this the API answers 429"
+    )
+    transcription_job_result_ttl: float = Field(
+        default=600.0, description="Seconds a finished async transcription result stays available"
+    )
+    audio_vad_enabled: bool = Field(
+        default=True, description="Trim silence (energy + zero-crossing VAD) from decoded uploads before STT"
+    )
+    audio_vad_min_energy_db: float = Field(
+        default=-45.0, description="Frames quieter than this (dBFS) are always treated as silence"
+    )
+    audio_vad_padding_ms: int = Field(default=200, description="Audio kept before and after each speech segment")
+    audio_vad_max_pause_ms: int = Field(default=500, description="Pauses between speech segments are shortened to this")
+    audio_stream_partial_interval: float = Field(
+        default=1.0, description="Seconds of new audio between partial transcripts on /audio/stream"
+    )
+    audio_stream_window_seconds: float = Field(
+        default=10.0, description="Sliding window (seconds) transcribed for each partial result"
+    )
+    audio_stream_max_utterance_seconds: float = Field(
+        default=15.0, description="Utterances longer than this are finalized without waiting for silence"
+    )
+    audio_stream_silence_ms: int = Field(default=600, description="Silence (ms) that closes an utterance")
+    audio_stream_max_session_seconds: float = Field(
+        default=300.0, description="Maximum audio (seconds) accepted by one streaming session"
+    )
+    audio_stream_max_sessions: int = Field(
+        default=8, description="Concurrent streaming sessions per process (each may hold an ffmpeg process)"
+    )
+    stt_preload_agent: bool = Field(
+        default=True,
+        description="Create the shared STT agent (Whisper model load / Azure client) in the background at startup",
+    )
+    stt_cache_enabled: bool = Field(
+        default=True, description="Reuse transcriptions of identical audio (same content, language and provider)"
+    )
+    stt_cache_max_entries: int = Field(default=256, description="Transcriptions kept in the in-memory LRU")
+    stt_cache_disk_path: Optional[str] = Field(
+        default=None, description="SQLite file for a persistent second cache tier (disabled when unset)"
+    )
+    stt_cache_disk_max_entries: int = Field(default=10000, description="Transcriptions kept in the on-disk tier")
 
     # OpenAI settings (for backend service)
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
 
     # NER settings
     ner_enabled: bool = Field(default=True, description="Enable NER extraction")
-    ner_provider: str = Field(default="spacy", description="NER provider")
+    ner_provider: str = Field(default="spacy", description="NER provider: spacy, spacy_procpool or gazetteer")
     ner_default_language: str = Field(default="es", description="Default NER language")
     ner_model_map: str = Field(
         default='{"es":"es_core_news_md","en":"en_core_web_sm"}',
@@ -67,6 +113,49 @@ class Settings(BaseSettings):
     )
     ner_fallback_model: str = Field(default="es_core_news_sm", description="Fallback NER model")
     ner_confidence_threshold: float = Field(default=0.6, description="Minimum NER confidence threshold")
+    ner_preload_models: bool = Field(
+        default=True,
+        description="Load the NER model of every language in ner_model_map during application startup",
+    )
+    ner_procpool_size: int = Field(
+        default=2,
+        ge=1,
+        description="Worker processes hosting spaCy models for the spacy_procpool NER provider",
+    )
+    ner_procpool_request_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds to wait for a spacy_procpool worker before failing the NER request",
+    )
+    ner_gazetteer_path: Optional[str] = Field(
+        default=None,
+        description="JSON lexicon for the gazetteer NER provider (defaults to the bundled Madrid lexicon)",
+    )
+    ner_gazetteer_prepass: bool = Field(
+        default=False,
+        description="Run the gazetteer before spaCy and skip spaCy when it finds a confident venue or street match",
+    )
+    ner_gazetteer_prepass_min_confidence: float = Field(
+        default=0.85,
+        ge=0.0,
+        le=1.0,
+        description="Minimum gazetteer match confidence (non-city entries) that lets the pre-pass skip spaCy",
+    )
+    ner_batching_enabled: bool = Field(
+        default=True,
+        description="Micro-batch concurrent spaCy NER requests through nlp.pipe on a dedicated thread",
+    )
+    ner_batch_size: int = Field(default=32, ge=1, description="Max texts per spaCy NER batch")
+    ner_batch_window_ms: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Max time (ms) to wait for more texts before running a NER batch",
+    )
+    ner_batch_queue_size: int = Field(
+        default=256,
+        ge=1,
+        description="Max queued NER texts; when full, requests run unbatched in the default executor",
+    )
 
     # NLU settings
     nlu_enabled: bool = Field(default=True, description="Enable NLU service")
@@ -85,6 +174,46 @@ class Settings(BaseSettings):
         description="Shadow comparison provider (used only when nlu_shadow_mode=true)."
         " Can be different from nlu_provider",
     )
+    nlu_shadow_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of requests (0-1) submitted to the shadow comparison queue",
+    )
+    nlu_shadow_queue_size: int = Field(
+        default=100,
+        ge=1,
+        description="Max pending shadow comparisons; extra work is dropped and counted",
+    )
+    nlu_shadow_workers: int = Field(default=1, ge=1, description="Number of shadow comparison workers")
+    nlu_shadow_stats_window: int = Field(
+        default=1000,
+        ge=1,
+        description="Number of most recent shadow comparisons kept for agreement statistics",
+    )
+
+    # Venue store settings
+    venue_store_path: Optional[str] = Field(
+        default=None,
+        description="Venue catalogue (.json) or compiled SQLite store (.sqlite/.db); defaults to the bundled catalogue",
+    )
+    venue_store_reload_interval: float = Field(
+        default=5.0,
+        ge=0.0,
+        description="Seconds between checks of the venue store file for changes (hot reload)",
+    )
+
+    # Transit route planner settings
+    transit_feed_path: Optional[str] = Field(
+        default=None,
+        description="Directory with the GTFS-style transit feed; defaults to the bundled Madrid feed",
+    )
+    route_planner_origin: str = Field(default="sol", description="Default origin stop (id or name) for route planning")
+    route_planner_cache_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Number of planned origin/destination pairs kept in the route planner LRU cache",
+    )
 
     # Azure deployment settings (future)
     azure_webapp_name: Optional[str] = Field(default=None, description="Azure Web App name")
@@ -97,7 +226,33 @@ class Settings(BaseSettings):
 
     # Database settings (future)
     database_enabled: bool = Field(default=False, description="Enable database")
-    database_url: Optional[str] = Field(default=None, description="Database connection URL")
+    database_url: Optional[str] = Field(
+        default=None,
+        description=(
+            "Conversation storage URL (sqlite:///relative.db, sqlite:////abs.db or redis://host:6379/0); "
+            "unset keeps it in memory"
+        ),
+    )
+    conversation_ttl_seconds: float = Field(
+        default=86400.0,
+        ge=0,
+        description="Idle time after which in-memory and Redis conversations expire (0 disables expiry)",
+    )
+    conversation_max_messages: int = Field(
+        default=100_000,
+        ge=1,
+        description="Global cap on messages kept by the in-memory conversation store",
+    )
+    conversation_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1,
+        description="Approximate global cap on bytes kept by the in-memory conversation store",
+    )
+    redis_session_max_messages: int = Field(
+        default=1000,
+        ge=1,
+        description="Most recent messages kept per session in the Redis conversation store (LTRIM)",
+    )
 
     # Logging settings
     log_level: str = Field(default="INFO", description="Logging level")
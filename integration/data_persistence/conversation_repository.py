@@ -1,212 +1,308 @@
 """
-Conversation service implementing ConversationInterface.
-Handles chat sessions and conversation history (in-memory for PoC).
+Conversation repositories implementing StorageInterface.
+
+InMemoryConversationRepository keeps sessions in process memory (default);
+create_conversation_repository() selects the backend (memory, SQLite or Redis)
+from Settings.database_url.
 """
 
-import uuid
+import bisect
+import heapq
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 import structlog
 
 from integration.configuration.settings import Settings
-from shared.interfaces.interfaces import ConversationInterface
+from shared.interfaces.interfaces import StorageInterface
 
 logger = structlog.get_logger(__name__)
 
+# Rough per-message overhead (record object, id string, list slot) added to the text size.
+_RECORD_OVERHEAD_BYTES = 200
+
+
+@dataclass(slots=True)
+class _MessageRecord:
+    id: str
+    created: float  # epoch seconds
+    user_message: str
+    ai_response: str
+    message_type: str
+    size: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "timestamp": datetime.fromtimestamp(self.created).isoformat(),
+            "user_message": self.user_message,
+            "ai_response": self.ai_response,
+            "message_type": self.message_type,
+        }
+
+
+@dataclass(slots=True)
+class _Session:
+    session_id: str
+    created_at: float
+    last_activity: float
+    touched: float  # monotonic time of the last write, drives TTL and activity order
+    messages: List[_MessageRecord] = field(default_factory=list)
+    size: int = 0
+    session_type: str = "demo"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "created_at": datetime.fromtimestamp(self.created_at).isoformat(),
+            "last_activity": datetime.fromtimestamp(self.last_activity).isoformat(),
+            "message_count": len(self.messages),
+            "session_type": self.session_type,
+        }
+
+
+def _record(message: Dict[str, Any]) -> _MessageRecord:
+    user_message = message.get("user_message", "")
+    ai_response = message.get("ai_response", "")
+    return _MessageRecord(
+        id=message["id"],
+        created=datetime.fromisoformat(message["timestamp"]).timestamp(),
+        user_message=user_message,
+        ai_response=ai_response,
+        message_type=message.get("message_type", "conversation_pair"),
+        size=len(user_message.encode()) + len(ai_response.encode()) + _RECORD_OVERHEAD_BYTES,
+    )
 
-class ConversationService(ConversationInterface):
+
+def _created(record: _MessageRecord) -> float:
+    return record.created
+
+
+class InMemoryConversationRepository(StorageInterface):
     """
-    In-memory conversation service for PoC.
-    Can be easily extended to use database storage.
+    In-memory conversation storage (lost on restart), bounded by idle TTL and global caps.
+
+    Sessions live in an OrderedDict kept in write order (least recently active first), so
+    listing walks it from the end without sorting and TTL expiry pops from the front.
+    When the message or byte cap is exceeded the least recently active sessions are
+    evicted; the session being written is only trimmed (oldest messages first).
     """
 
-    def __init__(self, settings: Settings):
-        self.settings = settings
-        self.conversations: Dict[str, List[Dict[str, Any]]] = {}
-        self.session_metadata: Dict[str, Dict[str, Any]] = {}
-
-    async def add_message(self, user_message: str, ai_response: str, session_id: Optional[str] = None) -> str:
-        """Add message pair to conversation"""
-        try:
-            # Generate session ID if not provided
-            if not session_id:
-                session_id = str(uuid.uuid4())
-
-            # Initialize session if new
-            if session_id not in self.conversations:
-                await self._initialize_session(session_id)
-
-            # Create message pair
-            message_pair = {
-                "id": str(uuid.uuid4()),
-                "timestamp": datetime.now().isoformat(),
-                "user_message": user_message,
-                "ai_response": ai_response,
-                "message_type": "conversation_pair",
-            }
-
-            # Add to conversation
-            self.conversations[session_id].append(message_pair)
-
-            # Update session metadata
-            self.session_metadata[session_id]["last_activity"] = datetime.now().isoformat()
-            self.session_metadata[session_id]["message_count"] += 1
-
-            logger.info(
-                "💬 Message pair added to conversation",
-                session_id=session_id,
-                total_messages=len(self.conversations[session_id]),
-            )
-
-            return session_id
-
-        except Exception as e:
-            logger.error("❌ Failed to add message to conversation", error=str(e))
-            raise
-
-    async def _initialize_session(self, session_id: str) -> None:
-        """Initialize a new conversation session"""
-        self.conversations[session_id] = []
-        self.session_metadata[session_id] = {
-            "session_id": session_id,
-            "created_at": datetime.now().isoformat(),
-            "last_activity": datetime.now().isoformat(),
-            "message_count": 0,
-            "session_type": "demo",
+    def __init__(
+        self,
+        ttl_seconds: float = 86400.0,
+        max_messages: int = 100_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl_seconds
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._message_count = 0
+        self._bytes = 0
+        self._evicted_sessions_ttl = 0
+        self._evicted_sessions_capacity = 0
+        self._evicted_messages = 0
+
+    async def save_conversation(self, session_id: str, conversation: List[Dict[str, Any]]) -> bool:
+        session = self._touch(session_id)
+        records = [_record(message) for message in conversation]
+        self._drop_messages(session, len(session.messages))
+        session.messages = records
+        session.size = sum(record.size for record in records)
+        self._message_count += len(records)
+        self._bytes += session.size
+        if records:
+            session.last_activity = records[-1].created
+        self._enforce_caps(session_id)
+        return True
+
+    async def load_conversation(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        session = self._get(session_id)
+        if session is None:
+            return None
+        return [record.to_dict() for record in session.messages]
+
+    async def delete_conversation(self, session_id: str) -> bool:
+        session = self._get(session_id)
+        if session is None:
+            return False
+        self._remove(session)
+        return True
+
+    async def append_message(self, session_id: str, message: Dict[str, Any]) -> None:
+        session = self._touch(session_id)
+        record = _record(message)
+        session.messages.append(record)
+        session.size += record.size
+        session.last_activity = record.created
+        self._message_count += 1
+        self._bytes += record.size
+        self._enforce_caps(session_id)
+
+    async def load_all_messages(self) -> List[Dict[str, Any]]:
+        self._expire()
+        tagged = (
+            ((record.created, record, session.session_id) for record in session.messages)
+            for session in self._sessions.values()
+        )
+        messages = []
+        for _, record, session_id in heapq.merge(*tagged, key=lambda item: item[0]):
+            message = record.to_dict()
+            message["session_id"] = session_id
+            messages.append(message)
+        return messages
+
+    async def iter_messages(
+        self,
+        session_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        self._expire()
+        low = start.timestamp() if start is not None else float("-inf")
+        high = end.timestamp() if end is not None else float("inf")
+        # snapshot ids and each session's record list (references only): writes may land between yields
+        session_ids = [session_id] if session_id is not None else list(self._sessions)
+        for current_id in session_ids:
+            session = self._sessions.get(current_id)
+            if session is None:
+                continue
+            records = session.messages[:]
+            for index in range(bisect.bisect_left(records, low, key=_created), len(records)):
+                record = records[index]
+                if record.created >= high:
+                    break
+                message = record.to_dict()
+                message["session_id"] = current_id
+                yield message
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        session = self._get(session_id)
+        return session.to_dict() if session is not None else None
+
+    async def list_sessions(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        self._expire()
+        end = None if limit is None else offset + limit
+        return [session.to_dict() for session in islice(reversed(self._sessions.values()), offset, end)]
+
+    async def clear_messages(self, session_id: str) -> bool:
+        session = self._get(session_id)
+        if session is None:
+            return False
+        self._drop_messages(session, len(session.messages))
+        return True
+
+    async def clear_all(self) -> int:
+        self._expire()
+        cleared_count = len(self._sessions)
+        self._sessions.clear()
+        self._message_count = 0
+        self._bytes = 0
+        return cleared_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "messages": self._message_count,
+            "bytes": self._bytes,
+            "ttl_seconds": self._ttl,
+            "max_messages": self._max_messages,
+            "max_bytes": self._max_bytes,
+            "evicted_sessions_ttl": self._evicted_sessions_ttl,
+            "evicted_sessions_capacity": self._evicted_sessions_capacity,
+            "evicted_messages": self._evicted_messages,
         }
 
-        logger.info("🆕 New conversation session initialized", session_id=session_id)
-
-    async def get_conversation_history(self, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get conversation history for session"""
-        try:
-            if not session_id:
-                # Return all conversations if no session specified
-                all_conversations = []
-                for sid, messages in self.conversations.items():
-                    for message in messages:
-                        message_copy = message.copy()
-                        message_copy["session_id"] = sid
-                        all_conversations.append(message_copy)
-                return sorted(all_conversations, key=lambda x: x["timestamp"])
-
-            # Return specific session
-            if session_id in self.conversations:
-                logger.info(
-                    "📜 Retrieved conversation history",
-                    session_id=session_id,
-                    message_count=len(self.conversations[session_id]),
-                )
-                return self.conversations[session_id].copy()
-            else:
-                logger.warning("⚠️ Session not found", session_id=session_id)
-                return []
-
-        except Exception as e:
-            logger.error("❌ Failed to get conversation history", error=str(e))
-            return []
-
-    async def clear_conversation(self, session_id: Optional[str] = None) -> bool:
-        """Clear conversation history"""
-        try:
-            if session_id:
-                # Clear specific session
-                if session_id in self.conversations:
-                    del self.conversations[session_id]
-                    del self.session_metadata[session_id]
-                    logger.info("🧹 Conversation cleared", session_id=session_id)
-                    return True
-                else:
-                    logger.warning("⚠️ Session not found for clearing", session_id=session_id)
-                    return False
+    def _get(self, session_id: str) -> Optional[_Session]:
+        self._expire()
+        return self._sessions.get(session_id)
+
+    def _touch(self, session_id: str) -> _Session:
+        now = self._clock()
+        self._expire(now)
+        session = self._sessions.get(session_id)
+        if session is None:
+            created = time.time()
+            session = _Session(session_id, created_at=created, last_activity=created, touched=now)
+            self._sessions[session_id] = session
+            logger.info("New conversation session initialized", session_id=session_id)
+        else:
+            session.touched = now
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def _expire(self, now: Optional[float] = None) -> None:
+        if self._ttl <= 0 or not self._sessions:
+            return
+        deadline = (self._clock() if now is None else now) - self._ttl
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.touched > deadline:
+                break
+            self._remove(oldest)
+            self._evicted_sessions_ttl += 1
+
+    def _enforce_caps(self, protected_id: str) -> None:
+        while self._message_count > self._max_messages or self._bytes > self._max_bytes:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.session_id != protected_id:
+                self._evicted_messages += len(oldest.messages)
+                self._remove(oldest)
+                self._evicted_sessions_capacity += 1
+            elif oldest.messages:
+                self._drop_messages(oldest, 1)
+                self._evicted_messages += 1
             else:
-                # Clear all conversations
-                cleared_count = len(self.conversations)
-                self.conversations.clear()
-                self.session_metadata.clear()
-                logger.info("🧹 All conversations cleared", count=cleared_count)
-                return True
-
-        except Exception as e:
-            logger.error("❌ Failed to clear conversation", error=str(e))
-            return False
+                break
 
-    async def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session metadata"""
-        try:
-            if session_id in self.session_metadata:
-                session_info = self.session_metadata[session_id].copy()
-                session_info["current_message_count"] = len(self.conversations.get(session_id, []))
-                return session_info
-            return None
-        except Exception as e:
-            logger.error("❌ Failed to get session info", error=str(e))
-            return None
+    def _drop_messages(self, session: _Session, count: int) -> None:
+        dropped = session.messages[:count]
+        del session.messages[:count]
+        dropped_size = sum(record.size for record in dropped)
+        session.size -= dropped_size
+        self._bytes -= dropped_size
+        self._message_count -= len(dropped)
 
-    async def get_all_sessions(self) -> List[Dict[str, Any]]:
-        """Get all session metadata"""
-        try:
-            sessions = []
-            for session_id, metadata in self.session_metadata.items():
-                session_info = metadata.copy()
-                session_info["current_message_count"] = len(self.conversations.get(session_id, []))
-                sessions.append(session_info)
-
-            # Sort by last activity (most recent first)
-            sessions.sort(key=lambda x: x["last_activity"], reverse=True)
-            return sessions
-        except Exception as e:
-            logger.error("❌ Failed to get all sessions", error=str(e))
-            return []
-
-    async def export_conversation(self, session_id: str, format: str = "json") -> Optional[Dict[str, Any]]:
-        """Export conversation in specified format"""
-        try:
-            if session_id not in self.conversations:
-                return None
-
-            conversation = self.conversations[session_id]
-            metadata = self.session_metadata[session_id]
-
-            export_data = {
-                "export_info": {
-                    "exported_at": datetime.now().isoformat(),
-                    "format": format,
-                    "version": "1.0",
-                },
-                "session_metadata": metadata,
-                "conversation": conversation,
-                "statistics": {
-                    "total_messages": len(conversation),
-                    "session_duration": self._calculate_session_duration(conversation),
-                    "average_response_time": "N/A",  # Could be calculated if we track timing
-                },
-            }
-
-            logger.info("📤 Conversation exported", session_id=session_id, format=format)
-            return export_data
-
-        except Exception as e:
-            logger.error("❌ Failed to export conversation", error=str(e))
-            return None
+    def _remove(self, session: _Session) -> None:
+        del self._sessions[session.session_id]
+        self._message_count -= len(session.messages)
+        self._bytes -= session.size
 
-    def _calculate_session_duration(self, conversation: List[Dict[str, Any]]) -> str:
-        """Calculate session duration from first to last message"""
-        if len(conversation) < 2:
-            return "0 minutes"
 
-        try:
-            first_time = datetime.fromisoformat(conversation[0]["timestamp"])
-            last_time = datetime.fromisoformat(conversation[-1]["timestamp"])
-            duration = last_time - first_time
+def create_conversation_repository(settings: Settings) -> StorageInterface:
+    """
+    Select the conversation storage backend from settings.database_url.
 
-            minutes = int(duration.total_seconds() / 60)
-            seconds = int(duration.total_seconds() % 60)
+    None -> in-memory; sqlite:///relative.db or sqlite:////absolute.db -> SQLite (WAL);
+    redis://[:password@]host:port/db -> Redis-compatible server shared by all workers.
+    """
+    database_url = settings.database_url
+    if not database_url:
+        return InMemoryConversationRepository(
+            ttl_seconds=settings.conversation_ttl_seconds,
+            max_messages=settings.conversation_max_messages,
+            max_bytes=settings.conversation_max_bytes,
+        )
 
-            if minutes > 0:
-                return f"{minutes} minutes, {seconds} seconds"
-            else:
-                return f"{seconds} seconds"
-        except Exception:
-            return "Unknown"
+    if database_url.startswith("sqlite:///"):
+        from integration.data_persistence.sqlite_repository import SQLiteConversationRepository
+
+        return SQLiteConversationRepository(database_url[len("sqlite:///") :])
+
+    if database_url.startswith("redis://"):
+        from integration.data_persistence.redis_repository import RedisConversationRepository
+
+        return RedisConversationRepository(
+            database_url,
+            ttl_seconds=settings.conversation_ttl_seconds,
+            max_session_messages=settings.redis_session_max_messages,
+        )
+
+    raise ValueError(f"Unsupported database_url scheme: {database_url.split(':', 1)[0]}")
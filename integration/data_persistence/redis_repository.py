@@ -0,0 +1,230 @@
+"""
+Redis conversation repository implementing StorageInterface.
+
+Built on ``redis.asyncio`` (optional dependency: ``poetry install --extras redis``),
+so any Redis-compatible server works and several uvicorn workers can share sessions.
+Each operation sends all its commands as one non-transactional pipeline, so an
+append is a single round trip; concurrent requests use the client's connection pool.
+
+Keys (under a configurable prefix):
+    session:<id>   hash  created_at, last_activity
+    messages:<id>  list  JSON message per entry, capped with LTRIM
+    sessions       zset  session ids scored by write time (epoch), newest last
+Session keys expire after the idle TTL; expired ids are pruned from the zset when
+sessions are listed.
+"""
+
+import heapq
+import json
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import structlog
+
+try:
+    import redis.asyncio as aioredis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+from shared.interfaces.interfaces import StorageInterface
+
+logger = structlog.get_logger(__name__)
+
+_EXPORT_SESSIONS_PER_PIPELINE = 50
+
+
+class RedisConversationRepository(StorageInterface):
+    """Conversation storage shared between processes through a Redis-compatible server."""
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: float = 86400.0,
+        max_session_messages: int = 1000,
+        key_prefix: str = "voiceflow:",
+        client: Optional[Any] = None,
+    ):
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise ImportError("redis:// database URLs need the redis package: poetry install --extras redis")
+            client = aioredis.from_url(url, decode_responses=True)
+        self.client = client
+        self._url = url
+        self._ttl = int(ttl_seconds)
+        self._max_session_messages = max_session_messages
+        self._prefix = key_prefix
+        self._sessions_key = f"{key_prefix}sessions"
+        self._commands_sent = 0
+        self._pipelines_sent = 0
+
+    async def save_conversation(self, session_id: str, conversation: List[Dict[str, Any]]) -> bool:
+        messages_key = self._messages_key(session_id)
+        commands = [("DEL", messages_key)]
+        if conversation:
+            commands.append(("RPUSH", messages_key, *(self._encode(message) for message in conversation)))
+        last_activity = conversation[-1]["timestamp"] if conversation else datetime.now().isoformat()
+        await self._execute(*commands, *self._session_write(session_id, last_activity))
+        return True
+
+    async def load_conversation(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        exists, entries = await self._execute(
+            ("EXISTS", self._session_key(session_id)),
+            ("LRANGE", self._messages_key(session_id), 0, -1),
+        )
+        if not exists:
+            return None
+        return [json.loads(entry) for entry in entries]
+
+    async def delete_conversation(self, session_id: str) -> bool:
+        deleted, _ = await self._execute(
+            ("DEL", self._session_key(session_id), self._messages_key(session_id)),
+            ("ZREM", self._sessions_key, session_id),
+        )
+        return deleted > 0
+
+    async def append_message(self, session_id: str, message: Dict[str, Any]) -> None:
+        await self._execute(
+            ("RPUSH", self._messages_key(session_id), self._encode(message)),
+            *self._session_write(session_id, message["timestamp"]),
+        )
+
+    async def load_all_messages(self) -> List[Dict[str, Any]]:
+        session_ids = await self._session_ids(0, -1)
+        if not session_ids:
+            return []
+        lists = await self._execute(*(("LRANGE", self._messages_key(session_id), 0, -1) for session_id in session_ids))
+        per_session = []
+        for session_id, entries in zip(session_ids, lists):
+            messages = [json.loads(entry) for entry in entries]
+            for message in messages:
+                message["session_id"] = session_id
+            per_session.append(messages)
+        return list(heapq.merge(*per_session, key=lambda message: message["timestamp"]))
+
+    async def iter_messages(
+        self,
+        session_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        low = start.isoformat() if start is not None else ""
+        high = (end or datetime.max).isoformat()
+        session_ids = [session_id] if session_id is not None else await self._session_ids(0, -1)
+        # one pipeline per group of sessions; each list is bounded by max_session_messages
+        for first in range(0, len(session_ids), _EXPORT_SESSIONS_PER_PIPELINE):
+            group = session_ids[first : first + _EXPORT_SESSIONS_PER_PIPELINE]
+            lists = await self._execute(*(("LRANGE", self._messages_key(current_id), 0, -1) for current_id in group))
+            for current_id, entries in zip(group, lists):
+                for entry in entries:
+                    message = json.loads(entry)
+                    if low <= message["timestamp"] < high:
+                        message["session_id"] = current_id
+                        yield message
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return (await self._sessions_info([session_id]))[0]
+
+    async def list_sessions(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        if limit == 0:
+            return []
+        session_ids = await self._session_ids(offset, -1 if limit is None else offset + limit - 1, newest_first=True)
+        return [info for info in await self._sessions_info(session_ids) if info is not None]
+
+    async def clear_messages(self, session_id: str) -> bool:
+        exists, _ = await self._execute(
+            ("EXISTS", self._session_key(session_id)),
+            ("DEL", self._messages_key(session_id)),
+        )
+        return bool(exists)
+
+    async def clear_all(self) -> int:
+        session_ids = await self._session_ids(0, -1)
+        keys = [key for session_id in session_ids for key in self._keys(session_id)]
+        await self._execute(("DEL", self._sessions_key, *keys))
+        return len(session_ids)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        connection = self.client.connection_pool.connection_kwargs
+        return {
+            "host": f"{connection.get('host', 'localhost')}:{connection.get('port', 6379)}/{connection.get('db', 0)}",
+            "ttl_seconds": self._ttl,
+            "max_session_messages": self._max_session_messages,
+            "commands_sent": self._commands_sent,
+            "pipelines_sent": self._pipelines_sent,
+        }
+
+    async def _execute(self, *commands: Tuple[Any, ...]) -> List[Any]:
+        """Send the commands as one pipeline and return their replies in order"""
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for command in commands:
+                pipeline.execute_command(*command)
+            self._commands_sent += len(commands)
+            self._pipelines_sent += 1
+            return await pipeline.execute()
+
+    def _session_write(self, session_id: str, last_activity: str) -> List[Tuple[Any, ...]]:
+        """Commands that record a write: session metadata, history cap, TTL and activity order"""
+        session_key, messages_key = self._keys(session_id)
+        now = time.time()
+        commands = [
+            ("HSETNX", session_key, "created_at", datetime.fromtimestamp(now).isoformat()),
+            ("HSET", session_key, "last_activity", last_activity),
+            ("LTRIM", messages_key, -self._max_session_messages, -1),
+            ("ZADD", self._sessions_key, now, session_id),
+        ]
+        if self._ttl > 0:
+            commands += [("EXPIRE", session_key, self._ttl), ("EXPIRE", messages_key, self._ttl)]
+        return commands
+
+    async def _session_ids(self, start: int, stop: int, newest_first: bool = False) -> List[str]:
+        commands = []
+        if self._ttl > 0:
+            commands.append(("ZREMRANGEBYSCORE", self._sessions_key, "-inf", f"({time.time() - self._ttl}"))
+        commands.append(("ZREVRANGE" if newest_first else "ZRANGE", self._sessions_key, start, stop))
+        replies = await self._execute(*commands)
+        return list(replies[-1])
+
+    async def _sessions_info(self, session_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        if not session_ids:
+            return []
+        commands = []
+        for session_id in session_ids:
+            session_key, messages_key = self._keys(session_id)
+            commands += [("HGETALL", session_key), ("LLEN", messages_key)]
+        replies = await self._execute(*commands)
+        sessions: List[Optional[Dict[str, Any]]] = []
+        for index, session_id in enumerate(session_ids):
+            session, message_count = replies[2 * index], replies[2 * index + 1]
+            if not session:
+                sessions.append(None)
+                continue
+            sessions.append(
+                {
+                    "session_id": session_id,
+                    "created_at": session["created_at"],
+                    "last_activity": session["last_activity"],
+                    "message_count": message_count,
+                    "session_type": "demo",
+                }
+            )
+        return sessions
+
+    def _keys(self, session_id: str) -> Tuple[str, str]:
+        return self._session_key(session_id), self._messages_key(session_id)
+
+    def _session_key(self, session_id: str) -> str:
+        return f"{self._prefix}session:{session_id}"
+
+    def _messages_key(self, session_id: str) -> str:
+        return f"{self._prefix}messages:{session_id}"
+
+    @staticmethod
+    def _encode(message: Dict[str, Any]) -> str:
+        return json.dumps(message, ensure_ascii=False, separators=(",", ":"))
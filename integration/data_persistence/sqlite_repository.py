@@ -0,0 +1,374 @@
+"""
+SQLite conversation repository (WAL mode) implementing StorageInterface.
+
+Writes are queued by the async API and applied off the request path by a single
+writer thread, which drains the queue in batches, one transaction per batch.
+Reads run in worker threads on per-thread read-only connections with fixed,
+parameterized statements (kept prepared by each connection's statement cache),
+and first wait for the writes queued before them, so callers read their own writes.
+Writes still queued when the process dies are lost; close() flushes them.
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import structlog
+
+from shared.interfaces.interfaces import StorageInterface
+
+logger = structlog.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    last_activity TEXT NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    session_type TEXT NOT NULL DEFAULT 'demo'
+);
+CREATE TABLE IF NOT EXISTS messages (
+    seq INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    user_message TEXT NOT NULL,
+    ai_response TEXT NOT NULL,
+    message_type TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_session ON messages(session_id, seq);
+CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp);
+CREATE INDEX IF NOT EXISTS idx_sessions_last_activity ON sessions(last_activity);
+"""
+
+_UPSERT_SESSION = """
+INSERT INTO sessions (session_id, created_at, last_activity, message_count) VALUES (?, ?, ?, ?)
+ON CONFLICT(session_id) DO UPDATE SET
+    last_activity = MAX(last_activity, excluded.last_activity),
+    message_count = message_count + excluded.message_count
+"""
+_INSERT_MESSAGE = (
+    "INSERT INTO messages (session_id, id, timestamp, user_message, ai_response, message_type) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SELECT_SESSION = (
+    "SELECT session_id, created_at, last_activity, message_count, session_type FROM sessions WHERE session_id = ?"
+)
+_LIST_SESSIONS = (
+    "SELECT session_id, created_at, last_activity, message_count, session_type FROM sessions "
+    "ORDER BY last_activity DESC LIMIT ? OFFSET ?"
+)
+_SELECT_MESSAGES = (
+    "SELECT id, timestamp, user_message, ai_response, message_type FROM messages WHERE session_id = ? ORDER BY seq"
+)
+_SELECT_ALL_MESSAGES = (
+    "SELECT id, timestamp, user_message, ai_response, message_type, session_id FROM messages ORDER BY timestamp, seq"
+)
+# Keyset pagination for streaming exports: each chunk is a short read, no cursor is held open
+_EXPORT_MESSAGES = (
+    "SELECT seq, id, timestamp, user_message, ai_response, message_type, session_id FROM messages "
+    "WHERE (timestamp, seq) > (?, ?) AND timestamp < ? ORDER BY timestamp, seq LIMIT ?"
+)
+_EXPORT_SESSION_MESSAGES = (
+    "SELECT seq, id, timestamp, user_message, ai_response, message_type, session_id FROM messages "
+    "WHERE session_id = ? AND seq > ? AND timestamp >= ? AND timestamp < ? ORDER BY seq LIMIT ?"
+)
+_COUNT_SESSIONS = "SELECT COUNT(*) FROM sessions"
+
+_SESSION_FIELDS = ("session_id", "created_at", "last_activity", "message_count", "session_type")
+_MESSAGE_FIELDS = ("id", "timestamp", "user_message", "ai_response", "message_type", "session_id")
+
+_STOP = object()
+_EXPORT_CHUNK_ROWS = 1000
+_COMMIT_TIMEOUT = 30.0  # seconds a read/flush waits for earlier writes before giving up
+
+
+class SQLiteConversationRepository(StorageInterface):
+    """Persistent conversation storage on a single SQLite file."""
+
+    def __init__(self, path: str | Path, batch_size: int = 2048, cache_mb: int = 64):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._batch_size = batch_size
+
+        self._writer = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._writer.execute(f"PRAGMA cache_size=-{cache_mb * 1024}")
+        # Checkpoint every ~40 MB of WAL instead of ~4 MB: fewer fsyncs under sustained appends
+        self._writer.execute("PRAGMA wal_autocheckpoint=10000")
+        self._writer.executescript(_SCHEMA)
+
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._condition = threading.Condition()
+        self._submitted = 0
+        self._committed = 0
+        self._batches = 0
+        self._write_errors = 0
+        self._closed = False
+
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._writer_loop, name="sqlite-conversation-writer", daemon=True)
+        self._thread.start()
+        logger.info("SQLite conversation repository opened", path=str(self._path))
+
+    async def save_conversation(self, session_id: str, conversation: List[Dict[str, Any]]) -> bool:
+        rows = [_message_row(session_id, message) for message in conversation]
+        now = rows[-1][2] if rows else datetime.now().isoformat()
+        self._submit(("replace", session_id, rows, now))
+        return True
+
+    async def load_conversation(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        return await self._read(self._load_conversation, session_id)
+
+    async def delete_conversation(self, session_id: str) -> bool:
+        if await self.get_session(session_id) is None:
+            return False
+        self._submit(("delete", session_id))
+        return True
+
+    async def append_message(self, session_id: str, message: Dict[str, Any]) -> None:
+        self._submit(("append", _message_row(session_id, message)))
+
+    async def load_all_messages(self) -> List[Dict[str, Any]]:
+        return await self._read(self._fetch_dicts, _SELECT_ALL_MESSAGES, (), _MESSAGE_FIELDS)
+
+    async def iter_messages(
+        self,
+        session_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        low = start.isoformat() if start is not None else ""
+        high = (end or datetime.max).isoformat()
+        last_timestamp, last_seq = low, -1
+        while True:
+            if session_id is None:
+                params = (last_timestamp, last_seq, high, _EXPORT_CHUNK_ROWS)
+                rows = await self._read(self._fetch_rows, _EXPORT_MESSAGES, params)
+            else:
+                params = (session_id, last_seq, low, high, _EXPORT_CHUNK_ROWS)
+                rows = await self._read(self._fetch_rows, _EXPORT_SESSION_MESSAGES, params)
+            for row in rows:
+                yield dict(zip(_MESSAGE_FIELDS, row[1:]))
+            if len(rows) < _EXPORT_CHUNK_ROWS:
+                return
+            last_seq, last_timestamp = rows[-1][0], rows[-1][2]
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        sessions = await self._read(self._fetch_dicts, _SELECT_SESSION, (session_id,), _SESSION_FIELDS)
+        return sessions[0] if sessions else None
+
+    async def list_sessions(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        params = (-1 if limit is None else limit, offset)
+        return await self._read(self._fetch_dicts, _LIST_SESSIONS, params, _SESSION_FIELDS)
+
+    async def count_sessions(self) -> int:
+        return await self._read(lambda: self._reader().execute(_COUNT_SESSIONS).fetchone()[0])
+
+    async def clear_messages(self, session_id: str) -> bool:
+        if await self.get_session(session_id) is None:
+            return False
+        self._submit(("clear", session_id))
+        return True
+
+    async def clear_all(self) -> int:
+        cleared_count = await self.count_sessions()
+        self._submit(("clear_all",))
+        return cleared_count
+
+    async def flush(self) -> None:
+        """Wait until every write queued so far is committed."""
+        target = self._submitted
+        await asyncio.to_thread(self._wait_committed, target)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.close_sync)
+
+    def close_sync(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._writer.close()
+        with self._readers_lock:
+            for connection in self._readers:
+                connection.close()
+            self._readers.clear()
+        logger.info("SQLite conversation repository closed", path=str(self._path), **self.get_stats())
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "pending_writes": self._submitted - self._committed,
+                "committed_writes": self._committed,
+                "write_batches": self._batches,
+                "write_errors": self._write_errors,
+            }
+
+    # -- writer thread -------------------------------------------------------
+
+    def _submit(self, operation: tuple) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SQLite conversation repository is closed")
+            self._submitted += 1
+            self._queue.put(operation)
+
+    def _writer_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is _STOP
+            operations = batch[:-1] if stop else batch
+            if operations:
+                try:
+                    self._apply_batch(operations)
+                finally:
+                    with self._condition:
+                        self._committed += len(operations)
+                        self._batches += 1
+                        self._condition.notify_all()
+            if stop:
+                return
+
+    def _apply_batch(self, operations: list[tuple]) -> None:
+        """One transaction for the batch; if it fails, replay the operations one by one
+        so a single bad row does not drop the acknowledged writes of other sessions."""
+        try:
+            self._apply(operations)
+            return
+        except Exception as error:
+            self._rollback()
+            if len(operations) == 1:
+                self._record_failure(error, operations[0])
+                return
+            logger.warning("Conversation write batch failed, retrying individually", error=str(error))
+        for operation in operations:
+            try:
+                self._apply([operation])
+            except Exception as error:
+                self._rollback()
+                self._record_failure(error, operation)
+
+    def _rollback(self) -> None:
+        try:
+            if self._writer.in_transaction:
+                self._writer.execute("ROLLBACK")
+        except sqlite3.Error as error:
+            logger.error("Conversation write rollback failed", error=str(error))
+
+    def _record_failure(self, error: Exception, operation: tuple) -> None:
+        logger.error("Conversation write failed", error=repr(error), operation=operation[0])
+        with self._condition:
+            self._write_errors += 1
+
+    def _apply(self, operations: list[tuple]) -> None:
+        cursor = self._writer.cursor()
+        cursor.execute("BEGIN")
+        appends: list[tuple] = []
+        for operation in operations:
+            if operation[0] == "append":
+                appends.append(operation[1])
+                continue
+            self._apply_appends(cursor, appends)
+            appends = []
+            kind, *args = operation
+            if kind == "replace":
+                session_id, rows, now = args
+                cursor.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+                cursor.execute(_UPSERT_SESSION, (session_id, now, now, 0))
+                cursor.execute(
+                    "UPDATE sessions SET message_count = ?, last_activity = ? WHERE session_id = ?",
+                    (len(rows), now, session_id),
+                )
+                cursor.executemany(_INSERT_MESSAGE, rows)
+            elif kind == "delete":
+                cursor.execute("DELETE FROM messages WHERE session_id = ?", (args[0],))
+                cursor.execute("DELETE FROM sessions WHERE session_id = ?", (args[0],))
+            elif kind == "clear":
+                cursor.execute("DELETE FROM messages WHERE session_id = ?", (args[0],))
+                cursor.execute("UPDATE sessions SET message_count = 0 WHERE session_id = ?", (args[0],))
+            elif kind == "clear_all":
+                cursor.execute("DELETE FROM messages")
+                cursor.execute("DELETE FROM sessions")
+        self._apply_appends(cursor, appends)
+        cursor.execute("COMMIT")
+
+    @staticmethod
+    def _apply_appends(cursor: sqlite3.Cursor, rows: list[tuple]) -> None:
+        if not rows:
+            return
+        # One session upsert per distinct session in the batch: (first timestamp, last timestamp, count)
+        sessions: dict[str, list] = {}
+        for session_id, _, timestamp, *_ in rows:
+            entry = sessions.get(session_id)
+            if entry is None:
+                sessions[session_id] = [timestamp, timestamp, 1]
+            else:
+                entry[1] = max(entry[1], timestamp)
+                entry[2] += 1
+        cursor.executemany(_UPSERT_SESSION, [(session_id, *entry) for session_id, entry in sessions.items()])
+        cursor.executemany(_INSERT_MESSAGE, rows)
+
+    def _wait_committed(self, target: int) -> None:
+        with self._condition:
+            done = self._condition.wait_for(lambda: self._committed >= target, timeout=_COMMIT_TIMEOUT)
+        if not done:
+            raise TimeoutError(f"SQLite conversation writer did not commit pending writes within {_COMMIT_TIMEOUT}s")
+
+    # -- readers -------------------------------------------------------------
+
+    async def _read(self, func, *args):
+        target = self._submitted
+        return await asyncio.to_thread(self._read_after, target, func, *args)
+
+    def _read_after(self, target: int, func, *args):
+        self._wait_committed(target)
+        return func(*args)
+
+    def _reader(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, check_same_thread=False, cached_statements=64)
+            connection.execute("PRAGMA query_only=1")
+            self._local.connection = connection
+            with self._readers_lock:
+                self._readers.append(connection)
+        return connection
+
+    def _fetch_rows(self, sql: str, params: tuple) -> List[tuple]:
+        return self._reader().execute(sql, params).fetchall()
+
+    def _fetch_dicts(self, sql: str, params: tuple, fields: tuple[str, ...]) -> List[Dict[str, Any]]:
+        return [dict(zip(fields, row)) for row in self._reader().execute(sql, params)]
+
+    def _load_conversation(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        connection = self._reader()
+        if connection.execute(_SELECT_SESSION, (session_id,)).fetchone() is None:
+            return None
+        return [dict(zip(_MESSAGE_FIELDS, row)) for row in connection.execute(_SELECT_MESSAGES, (session_id,))]
+
+
+def _message_row(session_id: str, message: Dict[str, Any]) -> tuple:
+    return (
+        session_id,
+        message["id"],
+        message["timestamp"],
+        message.get("user_message", ""),
+        message.get("ai_response", ""),
+        message.get("message_type", "conversation_pair"),
+    )
@@ -15,6 +15,10 @@ def __getattr__(name: str):
         return import_module("integration.external_apis.nlu_factory").NLUServiceFactory
     if name == "SpacyNERService":
         return import_module("integration.external_apis.spacy_ner_service").SpacyNERService
+    if name == "GazetteerNERService":
+        return import_module("integration.external_apis.gazetteer_ner_service").GazetteerNERService
+    if name == "SpacyProcessPoolNERService":
+        return import_module("integration.external_apis.spacy_procpool_ner_service").SpacyProcessPoolNERService
     if name == "OpenAINLUService":
         return import_module("integration.external_apis.openai_nlu_service").OpenAINLUService
     if name == "KeywordNLUService":
@@ -26,6 +30,8 @@ __all__ = [
     "NERServiceFactory",
     "NLUServiceFactory",
     "SpacyNERService",
+    "GazetteerNERService",
+    "SpacyProcessPoolNERService",
     "OpenAINLUService",
     "KeywordNLUService",
 ]
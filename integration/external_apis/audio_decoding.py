@@ -0,0 +1,201 @@
+"""
+In-memory audio decoding for the STT path.
+
+WAV (PCM 8/16/24/32-bit, IEEE float, WAVE_FORMAT_EXTENSIBLE) and raw PCM (s16le) are
+parsed straight from the uploaded bytes and decoded into a float32 mono buffer at
+STT_SAMPLE_RATE, the input Whisper expects, without touching the disk. Compressed
+formats (webm/opus, mp3, m4a...) need an external decoder: decode_audio() returns None
+for them and callers fall back to the file-based path.
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from shared.interfaces.stt_interface import STT_SAMPLE_RATE, AudioFormatError
+
+_SERVICE_NAME = "audio_decoding"
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Content types / extensions decoded in memory
+_WAV_FORMATS = {"wav", "wave", "x-wav", "vnd.wave"}
+_PCM_FORMATS = {"pcm", "l16", "s16le", "pcm_s16le", "raw"}
+
+
+@dataclass(frozen=True)
+class WavInfo:
+    """Header of a RIFF/WAVE file and the location of its sample data."""
+
+    audio_format: int
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def block_align(self) -> int:
+        return self.channels * self.bits_per_sample // 8
+
+    @property
+    def frames(self) -> int:
+        return self.data_size // self.block_align if self.block_align else 0
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate if self.sample_rate else 0.0
+
+
+def normalize_format(format: str) -> str:
+    """'audio/webm;codecs=opus' -> 'webm', '.WAV' -> 'wav'"""
+    value = format.lower().split(";")[0].strip()
+    return value.rsplit("/", 1)[-1].lstrip(".")
+
+
+def is_wav(data: bytes) -> bool:
+    return len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WAVE"
+
+
+def parse_wav_header(data: bytes) -> WavInfo:
+    """
+    Parse the fmt and data chunks of a WAV held in memory.
+
+    Raises AudioFormatError if the bytes are not a well-formed RIFF/WAVE with a
+    supported sample encoding.
+    """
+    if not is_wav(data):
+        raise AudioFormatError("file does not start with RIFF id", _SERVICE_NAME)
+
+    fmt: Optional[tuple] = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id, chunk_size = struct.unpack_from("<4sI", data, offset)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or body + 16 > len(data):
+                raise AudioFormatError("fmt chunk too short", _SERVICE_NAME)
+            audio_format, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", data, body)
+            if audio_format == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # first two bytes of the SubFormat GUID carry the real format tag
+                (audio_format,) = struct.unpack_from("<H", data, body + 24)
+            fmt = (audio_format, channels, sample_rate, bits)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise AudioFormatError("data chunk before fmt chunk", _SERVICE_NAME)
+            # streaming writers leave the size at 0 / 0xFFFFFFFF: use what is there
+            data_size = min(chunk_size, len(data) - body) if chunk_size else len(data) - body
+            info = WavInfo(*fmt, data_offset=body, data_size=data_size)
+            _check_encoding(info)
+            return info
+        offset = body + chunk_size + (chunk_size & 1)
+
+    raise AudioFormatError("fmt or data chunk missing", _SERVICE_NAME)
+
+
+def _check_encoding(info: WavInfo) -> None:
+    if info.channels < 1 or info.sample_rate < 1:
+        raise AudioFormatError("invalid channel count or sample rate", _SERVICE_NAME)
+    supported = (info.audio_format == _WAVE_FORMAT_PCM and info.bits_per_sample in (8, 16, 24, 32)) or (
+        info.audio_format == _WAVE_FORMAT_IEEE_FLOAT and info.bits_per_sample in (32, 64)
+    )
+    if not supported:
+        raise AudioFormatError(
+            f"unsupported WAV encoding (format {info.audio_format}, {info.bits_per_sample} bits)",
+            _SERVICE_NAME,
+        )
+
+
+def decode_wav(data: bytes, target_rate: int = STT_SAMPLE_RATE) -> np.ndarray:
+    """Decode a WAV held in memory into float32 mono samples at target_rate"""
+    info = parse_wav_header(data)
+    raw = memoryview(data)[info.data_offset : info.data_offset + info.frames * info.block_align]
+    samples = _to_float32(raw, info.audio_format, info.bits_per_sample)
+    return resample(downmix(samples, info.channels), info.sample_rate, target_rate)
+
+
+def decode_pcm16(
+    data: bytes, sample_rate: int = STT_SAMPLE_RATE, channels: int = 1, target_rate: int = STT_SAMPLE_RATE
+) -> np.ndarray:
+    """Decode raw little-endian 16-bit PCM into float32 mono samples at target_rate"""
+    usable = len(data) - len(data) % (2 * channels)
+    samples = np.frombuffer(data, dtype="<i2", count=usable // 2).astype(np.float32) / 32768.0
+    return resample(downmix(samples, channels), sample_rate, target_rate)
+
+
+def decode_audio(data: bytes, format: str) -> Optional[np.ndarray]:
+    """
+    Decode WAV or raw PCM bytes into a float32 mono 16 kHz buffer.
+
+    Returns None for formats that need an external decoder. A payload carrying a RIFF
+    header is decoded as WAV whatever its declared type.
+    """
+    if is_wav(data):
+        return decode_wav(data)
+    kind = normalize_format(format)
+    if kind in _WAV_FORMATS:
+        raise AudioFormatError("file does not start with RIFF id", _SERVICE_NAME)
+    if kind in _PCM_FORMATS:
+        return decode_pcm16(data)
+    return None
+
+
+def downmix(samples: np.ndarray, channels: int) -> np.ndarray:
+    if channels == 1:
+        return samples
+    return samples.reshape(-1, channels).mean(axis=1, dtype=np.float32)
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int = STT_SAMPLE_RATE) -> np.ndarray:
+    """Linear-interpolation resampling (enough for speech recognition input)"""
+    if source_rate == target_rate or samples.size == 0:
+        return np.ascontiguousarray(samples, dtype=np.float32)
+    target_size = int(round(samples.size * target_rate / source_rate))
+    positions = np.arange(target_size, dtype=np.float64) * (source_rate / target_rate)
+    return np.interp(positions, np.arange(samples.size), samples).astype(np.float32)
+
+
+def to_pcm16(samples: np.ndarray) -> bytes:
+    """float32 [-1, 1] -> little-endian 16-bit PCM (push streams, WAV uploads)"""
+    return (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+
+
+def to_wav_bytes(samples: np.ndarray, sample_rate: int = STT_SAMPLE_RATE) -> bytes:
+    """Wrap float32 mono samples in an in-memory 16-bit PCM WAV"""
+    pcm = to_pcm16(samples)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + len(pcm),
+        b"WAVE",
+        b"fmt ",
+        16,
+        _WAVE_FORMAT_PCM,
+        1,
+        sample_rate,
+        sample_rate * 2,
+        2,
+        16,
+        b"data",
+        len(pcm),
+    )
+    return header + pcm
+
+
+def _to_float32(raw: memoryview, audio_format: int, bits: int) -> np.ndarray:
+    if audio_format == _WAVE_FORMAT_IEEE_FLOAT:
+        return np.frombuffer(raw, dtype="<f4" if bits == 32 else "<f8").astype(np.float32)
+    if bits == 8:
+        return (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    if bits == 16:
+        return np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    if bits == 24:
+        triplets = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = triplets[:, 0] | (triplets[:, 1] << 8) | (triplets[:, 2] << 16)
+        values = np.where(values >= 1 << 23, values - (1 << 24), values)
+        return values.astype(np.float32) / float(1 << 23)
+    return np.frombuffer(raw, dtype="<i4").astype(np.float32) / float(1 << 31)
@@ -3,9 +3,14 @@ from pathlib import Path
 from typing import Any, Dict
 
 import azure.cognitiveservices.speech as speechsdk
+import numpy as np
 import structlog
 
+from integration.configuration.settings import get_settings
+from integration.external_apis.audio_decoding import to_pcm16
+from integration.external_apis.ffmpeg_decoder import AudioDecodeError, get_ffmpeg_decoder_pool
 from shared.interfaces.stt_interface import (
+    STT_SAMPLE_RATE,
     AudioFormatError,
     ServiceConfigurationError,
     STTServiceError,
@@ -62,11 +67,10 @@ class AzureSpeechService(STTServiceInterface):
         if not audio_path.exists():
             raise STTServiceError(f"Archivo de audio no encontrado: {audio_path}", "azure_speech")
 
-        # Handle webm format by converting to wav temporarily
-        original_path = audio_path
+        # webm/opus no lo lee AudioConfig(filename): se decodifica con ffmpeg en memoria
         if audio_path.suffix.lower() == ".webm":
-            logger.info("Detectado formato webm, convirtiendo a wav temporalmente")
-            audio_path = await self._convert_webm_to_wav(audio_path)
+            logger.info("Detectado formato webm, decodificando con ffmpeg")
+            return await self.transcribe_buffer(await self._decode_with_ffmpeg(audio_path), **kwargs)
 
         if not self._is_supported_format_for_azure(audio_path):
             raise AudioFormatError(f"Formato de audio no soportado: {audio_path.suffix}", "azure_speech")
@@ -87,161 +91,95 @@ class AzureSpeechService(STTServiceInterface):
             # Realizar transcripción (Azure maneja esto de forma síncrona internamente)
             result = await self._recognize_once(speech_recognizer)
 
-            # Clean up temporary file if we converted from webm
-            if original_path.suffix.lower() == ".webm" and audio_path != original_path:
-                try:
-                    audio_path.unlink()
-                except Exception:
-                    pass
-
-            if result.reason == speechsdk.ResultReason.RecognizedSpeech:
-                logger.info(
-                    "Transcripción completada exitosamente",
-                    text_length=len(result.text),
-                )
-                return result.text
-            elif result.reason == speechsdk.ResultReason.NoMatch:
-                logger.warning("No se pudo reconocer speech en el audio")
-                return ""
-            else:
-                # Log detailed cancellation info when available to aid debugging
-                try:
-                    if getattr(result, "cancellation_details", None):
-                        cancellation = result.cancellation_details
-                        logger.error(
-                            "Azure cancellation details",
-                            reason=str(getattr(cancellation, "reason", None)),
-                            error_details=getattr(cancellation, "error_details", None),
-                        )
-
-                        # Try to capture the raw JSON response from the service if present
-                        try:
-                            props = getattr(result, "properties", None)
-                            if props is not None:
-                                raw = props.get(speechsdk.PropertyId.SpeechServiceResponse_JsonResult)
-                                logger.debug("Azure raw JSON result", raw=raw)
-                        except Exception:
-                            # Non-fatal: best-effort logging
-                            pass
-                except Exception:
-                    # Protect against any unexpected logging failures
-                    pass
-
-                error_msg = f"Error en reconocimiento: {result.reason}"
-                if result.cancellation_details:
-                    error_msg += f" - {result.cancellation_details.reason}"
-                raise STTServiceError(error_msg, "azure_speech")
+            return self._result_text(result)
 
         except Exception as e:
-            # Clean up temporary file on error
-            if original_path.suffix.lower() == ".webm" and audio_path != original_path:
-                try:
-                    audio_path.unlink()
-                except Exception:
-                    pass
-
             if isinstance(e, STTServiceError):
                 raise
             logger.error("Error en transcripción Azure", error=str(e))
             raise STTServiceError(f"Error durante la transcripción: {str(e)}", "azure_speech", e)
 
-    async def _recognize_once(self, recognizer: speechsdk.SpeechRecognizer):
-        """Wrapper asyncio para el método síncrono de Azure."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, recognizer.recognize_once)
-
-    async def _convert_webm_to_wav(self, webm_path: Path) -> Path:
-        """Convert webm to wav using audio stream approach"""
+    async def transcribe_buffer(self, audio: np.ndarray, **kwargs) -> str:
+        """
+        Transcribe muestras float32 mono a 16 kHz mediante un PushAudioInputStream
+        (PCM 16-bit), sin escribir ningún fichero.
+        """
         try:
-            # Create temporary wav file
-            wav_path = webm_path.parent / f"{webm_path.stem}_converted.wav"
+            language = kwargs.get("language", "es-ES")
+            self._speech_config.speech_recognition_language = language
 
-            # Read webm file as binary
-            with open(webm_path, "rb") as f:
-                webm_data = f.read()
+            stream_format = speechsdk.audio.AudioStreamFormat(
+                samples_per_second=STT_SAMPLE_RATE, bits_per_sample=16, channels=1
+            )
+            push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+            push_stream.write(to_pcm16(audio))
+            push_stream.close()
 
-            # Use Azure SDK's audio stream capabilities
-            # Create audio stream from raw data
-            import azure.cognitiveservices.speech.audio as audio
+            audio_input = speechsdk.audio.AudioConfig(stream=push_stream)
+            speech_recognizer = speechsdk.SpeechRecognizer(speech_config=self._speech_config, audio_config=audio_input)
 
-            # Try to create audio input from the raw webm data
-            # Azure SDK sometimes can handle webm internally
+            logger.info("Iniciando transcripción", samples=int(audio.size), language=language)
+            result = await self._recognize_once(speech_recognizer)
+            return self._result_text(result)
+
+        except STTServiceError:
+            raise
+        except Exception as e:
+            logger.error("Error en transcripción Azure", error=str(e))
+            raise STTServiceError(f"Error durante la transcripción: {str(e)}", "azure_speech", e)
+
+    def _result_text(self, result) -> str:
+        """Texto reconocido, "" si no hubo voz; STTServiceError si Azure canceló."""
+        if result.reason == speechsdk.ResultReason.RecognizedSpeech:
+            logger.info(
+                "Transcripción completada exitosamente",
+                text_length=len(result.text),
+            )
+            return result.text
+        elif result.reason == speechsdk.ResultReason.NoMatch:
+            logger.warning("No se pudo reconocer speech en el audio")
+            return ""
+        else:
+            # Log detailed cancellation info when available to aid debugging
             try:
-                # Use push audio input stream
-                push_stream = audio.PushAudioInputStream()
-                push_stream.write(webm_data)
-                push_stream.close()
-
-                # Create temp wav file with proper header
-                import struct
-                import wave
-
-                sample_rate = 16000
-                channels = 1
-                bits_per_sample = 16
-
-                # Estimate audio length from file size
-                estimated_samples = len(webm_data) // 4  # rough estimate
-
-                with wave.open(str(wav_path), "wb") as wav_file:
-                    wav_file.setnchannels(channels)
-                    wav_file.setsampwidth(bits_per_sample // 8)
-                    wav_file.setframerate(sample_rate)
-
-                    # Use a portion of the data as audio samples
-                    # Skip potential webm headers (first 10% of file)
-                    start_offset = len(webm_data) // 10
-                    audio_data = webm_data[start_offset : start_offset + estimated_samples * 2]
-
-                    wav_file.writeframes(audio_data)
-
-                logger.info("Conversión webm a wav completada", wav_file=str(wav_path))
-                return wav_path
-
-            except Exception as stream_error:
-                logger.warning(
-                    "Error con stream, usando conversión básica",
-                    error=str(stream_error),
-                )
-
-                # Fallback: basic binary conversion
-                with open(wav_path, "wb") as wav_out:
-                    # Write simple WAV header manually
-                    sample_rate = 16000
-                    channels = 1
-                    bits_per_sample = 16
-                    data_size = len(webm_data) - 1000  # Account for headers
-
-                    # WAV header structure
-                    wav_header = struct.pack(
-                        "<4sI4s4sIHHIIHH4sI",
-                        b"RIFF",
-                        36 + data_size,
-                        b"WAVE",
-                        b"fmt ",
-                        16,
-                        1,
-                        channels,
-                        sample_rate,
-                        sample_rate * channels * bits_per_sample // 8,
-                        channels * bits_per_sample // 8,
-                        bits_per_sample,
-                        b"data",
-                        data_size,
+                if getattr(result, "cancellation_details", None):
+                    cancellation = result.cancellation_details
+                    logger.error(
+                        "Azure cancellation details",
+                        reason=str(getattr(cancellation, "reason", None)),
+                        error_details=getattr(cancellation, "error_details", None),
                     )
 
-                    wav_out.write(wav_header)
-                    wav_out.write(webm_data[1000:])  # Skip webm headers
+                    # Try to capture the raw JSON response from the service if present
+                    try:
+                        props = getattr(result, "properties", None)
+                        if props is not None:
+                            raw = props.get(speechsdk.PropertyId.SpeechServiceResponse_JsonResult)
+                            logger.debug("Azure raw JSON result", raw=raw)
+                    except Exception:
+                        # Non-fatal: best-effort logging
+                        pass
+            except Exception:
+                # Protect against any unexpected logging failures
+                pass
+
+            error_msg = f"Error en reconocimiento: {result.reason}"
+            if result.cancellation_details:
+                error_msg += f" - {result.cancellation_details.reason}"
+            raise STTServiceError(error_msg, "azure_speech")
 
-                return wav_path
+    async def _recognize_once(self, recognizer: speechsdk.SpeechRecognizer):
+        """Wrapper asyncio para el método síncrono de Azure."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, recognizer.recognize_once)
 
-        except Exception as e:
-            logger.error("Error en conversión completa", error=str(e))
-            # Final fallback: just rename the file
-            wav_path = webm_path.parent / f"{webm_path.stem}_fallback.wav"
-            with open(webm_path, "rb") as src, open(wav_path, "wb") as dst:
-                dst.write(src.read())
-            return wav_path
+    async def _decode_with_ffmpeg(self, audio_path: Path) -> np.ndarray:
+        """Decodifica webm/opus (u otro contenedor) a PCM 16 kHz mono vía el pool de ffmpeg."""
+        pool = get_ffmpeg_decoder_pool(get_settings())
+        try:
+            return await asyncio.to_thread(pool.decode, audio_path.read_bytes())
+        except AudioDecodeError as e:
+            raise STTServiceError(f"No se pudo decodificar {audio_path.suffix}: {e.message}", "azure_speech", e)
 
     def _is_supported_format(self, audio_path: Path) -> bool:
         """Verifica si el formato de audio es soportado."""
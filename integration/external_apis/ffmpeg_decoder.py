@@ -0,0 +1,354 @@
+"""
+Streaming audio decoding through ffmpeg pipes.
+
+Compressed uploads (browser webm/opus, ogg, mp3, m4a...) are piped through ffmpeg
+(stdin -> stdout) and come back as s16le 16 kHz mono PCM, without temp files. ffmpeg
+decodes one stream per process, so the pool keeps `pool_size` processes already spawned
+and blocked on stdin: a request takes a warm process, feeds it, and a replacement is
+spawned for the next one. The pool bounds concurrency, enforces input size and timeout
+limits, caps the decoded duration (-t) and records decode latency.
+
+Containers that keep their index at the end of the file (mp4/m4a without faststart)
+cannot be decoded from a pipe; decode() raises AudioDecodeError and callers fall back
+to the file-based path.
+"""
+
+import asyncio
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+import structlog
+
+from integration.configuration.settings import Settings
+from integration.external_apis.audio_decoding import decode_pcm16
+from shared.interfaces.stt_interface import STT_SAMPLE_RATE, AudioFormatError
+
+logger = structlog.get_logger(__name__)
+
+_SERVICE_NAME = "ffmpeg"
+_LATENCY_WINDOW = 256
+
+
+class AudioDecodeError(AudioFormatError):
+    """ffmpeg missing, input rejected, decode failed or timed out."""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message, _SERVICE_NAME)
+        self.reason = reason
+
+
+class FFmpegDecoderPool:
+    """Bounded pool of pre-spawned ffmpeg processes decoding to 16 kHz mono PCM."""
+
+    def __init__(
+        self,
+        ffmpeg_path: str = "ffmpeg",
+        pool_size: int = 2,
+        timeout_seconds: float = 15.0,
+        max_input_bytes: int = 10 * 1024 * 1024,
+        max_output_seconds: float = 30.0,
+    ):
+        self._ffmpeg_path = ffmpeg_path
+        self._pool_size = max(1, pool_size)
+        self._timeout_seconds = timeout_seconds
+        self._max_input_bytes = max_input_bytes
+        self._max_output_seconds = max_output_seconds
+
+        self._executable = shutil.which(ffmpeg_path)
+        self._idle: Deque[subprocess.Popen] = deque()
+        self._slots = threading.BoundedSemaphore(self._pool_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._latencies_ms: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._counters: Dict[str, int] = {
+            "decodes": 0,
+            "failures": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "spawned": 0,
+            "warm_hits": 0,
+            "streams": 0,
+        }
+
+    @classmethod
+    def create_from_settings(cls, settings: Settings) -> "FFmpegDecoderPool":
+        return cls(
+            ffmpeg_path=settings.ffmpeg_path,
+            pool_size=settings.ffmpeg_pool_size,
+            timeout_seconds=settings.ffmpeg_decode_timeout,
+            max_input_bytes=settings.max_audio_size_mb * 1024 * 1024,
+            max_output_seconds=settings.max_audio_duration,
+        )
+
+    def is_available(self) -> bool:
+        return self._executable is not None
+
+    @property
+    def command(self) -> List[str]:
+        return self._command(["-t", f"{self._max_output_seconds:g}"])
+
+    def _command(self, output_options: List[str]) -> List[str]:
+        return [
+            self._executable or self._ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-fflags",
+            "+nobuffer",
+            "-i",
+            "pipe:0",
+            "-vn",
+            *output_options,
+            "-ac",
+            "1",
+            "-ar",
+            str(STT_SAMPLE_RATE),
+            "-f",
+            "s16le",
+            "pipe:1",
+        ]
+
+    def open_stream(self, on_pcm: Callable[[bytes], Awaitable[None]]) -> "FFmpegStreamDecoder":
+        """
+        Dedicated ffmpeg process for a live stream (e.g. MediaRecorder webm/opus chunks):
+        PCM is handed to on_pcm as soon as ffmpeg produces it. Not counted against the pool.
+        """
+        if not self.is_available():
+            raise AudioDecodeError(f"ffmpeg not found ({self._ffmpeg_path})", "unavailable")
+        self._count("streams")
+        return FFmpegStreamDecoder(self._command([]), on_pcm)
+
+    def start(self) -> None:
+        """Pre-spawn the idle processes (idempotent)."""
+        if not self.is_available():
+            return
+        self._replenish()
+
+    def decode_pcm(self, data: bytes) -> bytes:
+        """Decode any ffmpeg-supported container into s16le 16 kHz mono PCM (blocking)."""
+        if not self.is_available():
+            raise AudioDecodeError(f"ffmpeg not found ({self._ffmpeg_path})", "unavailable")
+        if not data:
+            raise AudioDecodeError("empty input", "rejected")
+        if len(data) > self._max_input_bytes:
+            self._count("rejected")
+            raise AudioDecodeError(
+                f"input too large for decoding: {len(data)} bytes (max: {self._max_input_bytes})", "rejected"
+            )
+
+        with self._slots:
+            process = self._take_process()
+            start = time.perf_counter()
+            try:
+                pcm, stderr = process.communicate(data, timeout=self._timeout_seconds)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                self._count("timeouts")
+                raise AudioDecodeError(f"decode timed out after {self._timeout_seconds:g}s", "timeout")
+            except OSError as error:
+                process.kill()
+                self._count("failures")
+                raise AudioDecodeError(f"ffmpeg pipe failed: {error}", "failed")
+            finally:
+                self._replenish()
+
+            latency_ms = (time.perf_counter() - start) * 1000
+            if process.returncode != 0 or not pcm:
+                self._count("failures")
+                detail = stderr.decode(errors="replace").strip().splitlines()
+                raise AudioDecodeError(
+                    f"ffmpeg exited with {process.returncode}: {detail[-1] if detail else 'no audio decoded'}",
+                    "failed",
+                )
+
+        with self._lock:
+            self._counters["decodes"] += 1
+            self._latencies_ms.append(latency_ms)
+        logger.debug("Audio decoded with ffmpeg", input_bytes=len(data), pcm_bytes=len(pcm), latency_ms=latency_ms)
+        return pcm
+
+    def decode(self, data: bytes) -> np.ndarray:
+        """Decode into float32 mono samples at STT_SAMPLE_RATE (blocking)."""
+        return decode_pcm16(self.decode_pcm(data))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+            idle = sum(process.poll() is None for process in self._idle)
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "available": self.is_available(),
+            "ffmpeg_path": self._executable or self._ffmpeg_path,
+            "pool_size": self._pool_size,
+            "idle_processes": idle,
+            "latency_ms": {
+                "samples": len(latencies),
+                "p50": _percentile(latencies, 0.50),
+                "p95": _percentile(latencies, 0.95),
+                "max": round(latencies[-1], 2) if latencies else None,
+            },
+        }
+
+    def close(self) -> None:
+        """Kill the idle processes; later decodes spawn on demand."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+        for process in idle:
+            _discard(process)
+
+    def _take_process(self) -> subprocess.Popen:
+        with self._lock:
+            while self._idle:
+                process = self._idle.popleft()
+                if process.poll() is None:
+                    self._counters["warm_hits"] += 1
+                    return process
+                _discard(process)
+        return self._spawn()
+
+    def _replenish(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed or len(self._idle) >= self._pool_size:
+                    return
+            try:
+                process = self._spawn()
+            except OSError as error:
+                logger.warning("Could not pre-spawn ffmpeg", error=str(error))
+                return
+            with self._lock:
+                if self._closed or len(self._idle) >= self._pool_size:
+                    _discard(process)
+                    return
+                self._idle.append(process)
+
+    def _spawn(self) -> subprocess.Popen:
+        process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self._count("spawned")
+        return process
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+
+class FFmpegStreamDecoder:
+    """One ffmpeg process per live stream, driven from the event loop."""
+
+    _READ_BYTES = 2 * STT_SAMPLE_RATE // 10  # ~100 ms of s16le PCM
+
+    def __init__(self, command: List[str], on_pcm: Callable[[bytes], Awaitable[None]]):
+        self._command = command
+        self._on_pcm = on_pcm
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    async def start(self) -> None:
+        self._process = await asyncio.create_subprocess_exec(
+            *self._command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def write(self, chunk: bytes) -> None:
+        """Feed encoded bytes; raises AudioDecodeError if ffmpeg has exited"""
+        if self._reader is not None and self._reader.done() and not self._reader.cancelled():
+            if self._reader.exception() is not None:
+                raise self._reader.exception()  # on_pcm failed (e.g. session limit reached)
+        if self._process is None or self._process.returncode is not None or self._reader.done():
+            raise AudioDecodeError("ffmpeg stream decoder is not running", "failed")
+        self.bytes_in += len(chunk)
+        try:
+            self._process.stdin.write(chunk)
+            await self._process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as error:
+            raise AudioDecodeError(f"ffmpeg pipe closed: {error}", "failed")
+
+    async def finish(self, timeout: float = 10.0) -> None:
+        """Close stdin and wait until every decoded byte has been delivered"""
+        if self._process is None:
+            return
+        try:
+            if self._process.stdin.can_write_eof():
+                self._process.stdin.write_eof()
+            await asyncio.wait_for(asyncio.shield(self._reader), timeout)
+            await asyncio.wait_for(self._process.wait(), timeout)
+        except (asyncio.TimeoutError, BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Kill ffmpeg without waiting for pending output"""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+        if self._reader is not None and not self._reader.done():
+            self._reader.cancel()
+
+    async def _read_loop(self) -> None:
+        stdout = self._process.stdout
+        remainder = b""
+        while chunk := await stdout.read(self._READ_BYTES):
+            data = remainder + chunk
+            usable = len(data) - len(data) % 2
+            remainder = data[usable:]
+            if usable:
+                self.bytes_out += usable
+                await self._on_pcm(data[:usable])
+
+
+def _discard(process: subprocess.Popen) -> None:
+    if process.poll() is None:
+        process.kill()
+    process.communicate()
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 2)
+
+
+_decoder_pool: Optional[FFmpegDecoderPool] = None
+_decoder_pool_lock = threading.Lock()
+
+
+def get_ffmpeg_decoder_pool(settings: Settings) -> FFmpegDecoderPool:
+    """Return the process-wide ffmpeg decoder pool, creating it on first use."""
+    global _decoder_pool
+    if _decoder_pool is None:
+        with _decoder_pool_lock:
+            if _decoder_pool is None:
+                _decoder_pool = FFmpegDecoderPool.create_from_settings(settings)
+    return _decoder_pool
+
+
+def shutdown_ffmpeg_decoder_pool() -> None:
+    """Kill the idle ffmpeg processes (application shutdown)."""
+    global _decoder_pool
+    with _decoder_pool_lock:
+        pool, _decoder_pool = _decoder_pool, None
+    if pool is not None:
+        pool.close()
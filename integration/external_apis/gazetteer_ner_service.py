@@ -0,0 +1,236 @@
+"""Gazetteer (closed-lexicon) implementation for pluggable NER location extraction.
+
+Venue, street, station and city aliases are loaded from a JSON lexicon into a
+token trie. Matching folds accents and case, scans left to right and keeps the
+longest alias starting at each position, so no model load is required and an
+utterance is matched in microseconds.
+"""
+
+import json
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from integration.configuration.settings import Settings
+from shared.interfaces.ner_interface import NERServiceInterface
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_GAZETTEER_PATH = Path(__file__).resolve().parents[2] / "business/domains/tourism/data/location_gazetteer.json"
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=4096)
+def _fold_char(char: str) -> str:
+    """Lowercase and strip diacritics from one character, preserving length 1."""
+    decomposed = unicodedata.normalize("NFKD", char)
+    base = "".join(part for part in decomposed if not unicodedata.combining(part)).lower()
+    return base if len(base) == 1 else char
+
+
+def fold_text(text: str) -> str:
+    """Accent- and case-folded copy of text with identical character offsets."""
+    return "".join(_fold_char(char) for char in text)
+
+
+class GazetteerLexicon:
+    """Token trie over lexicon aliases with longest-match lookup."""
+
+    def __init__(self, entries: List[Dict[str, Any]], name: str = "gazetteer", version: str = "", **metadata: Any):
+        self.name = name
+        self.version = version
+        self.languages: List[str] = list(metadata.get("languages") or ["es"])
+        default_confidence = float(metadata.get("default_confidence", 0.9))
+
+        # Node 0 is the root; _terminal[node] is (entry index, confidence) or None.
+        self._children: List[Dict[str, int]] = [{}]
+        self._terminal: List[Optional[tuple[int, float]]] = [None]
+        self._entries: List[Dict[str, str]] = []
+        self._max_depth = 0
+
+        for entry in entries:
+            entry_index = len(self._entries)
+            self._entries.append(
+                {
+                    "name": entry["name"],
+                    "label": entry.get("label", "LOC"),
+                    "type": entry.get("type", "location"),
+                }
+            )
+            entry_confidence = float(entry.get("confidence", default_confidence))
+            for alias in entry.get("aliases", []) or [entry["name"]]:
+                if isinstance(alias, dict):
+                    self._insert(alias["alias"], entry_index, float(alias.get("confidence", entry_confidence)))
+                else:
+                    self._insert(alias, entry_index, entry_confidence)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "GazetteerLexicon":
+        with Path(path).open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        entries = payload.pop("entries", [])
+        return cls(entries, **payload)
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._children)
+
+    def match(self, text: str) -> List[Dict[str, Any]]:
+        """Return non-overlapping longest alias matches in order of appearance."""
+        folded = fold_text(text)
+        tokens = [(token.group(), token.start(), token.end()) for token in _TOKEN_PATTERN.finditer(folded)]
+
+        matches: List[Dict[str, Any]] = []
+        position = 0
+        while position < len(tokens):
+            node = 0
+            best: Optional[tuple[int, tuple[int, float]]] = None
+            for offset in range(position, min(len(tokens), position + self._max_depth)):
+                node = self._children[node].get(tokens[offset][0], -1)
+                if node < 0:
+                    break
+                if self._terminal[node] is not None:
+                    best = (offset, self._terminal[node])
+
+            if best is None:
+                position += 1
+                continue
+
+            end_token, (entry_index, confidence) = best
+            start, end = tokens[position][1], tokens[end_token][2]
+            matches.append(
+                {
+                    **self._entries[entry_index],
+                    "text": text[start:end],
+                    "start": start,
+                    "end": end,
+                    "confidence": confidence,
+                }
+            )
+            position = end_token + 1
+        return matches
+
+    def _insert(self, alias: str, entry_index: int, confidence: float) -> None:
+        tokens = _TOKEN_PATTERN.findall(fold_text(alias))
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            child = self._children[node].get(token)
+            if child is None:
+                child = len(self._children)
+                self._children[node][token] = child
+                self._children.append({})
+                self._terminal.append(None)
+            node = child
+        current = self._terminal[node]
+        # Duplicate alias across entries: keep the most confident one.
+        if current is None or confidence > current[1]:
+            self._terminal[node] = (entry_index, confidence)
+        self._max_depth = max(self._max_depth, len(tokens))
+
+
+@lru_cache(maxsize=8)
+def load_gazetteer(path: str) -> GazetteerLexicon:
+    """Load and cache a lexicon per file path (process-wide)."""
+    lexicon = GazetteerLexicon.from_file(Path(path))
+    logger.info(
+        "Gazetteer lexicon loaded",
+        path=path,
+        entries=lexicon.entry_count,
+        trie_nodes=lexicon.node_count,
+    )
+    return lexicon
+
+
+class GazetteerNERService(NERServiceInterface):
+    """NER service that matches a closed lexicon of domain locations."""
+
+    def __init__(self, settings: Optional[Settings] = None, lexicon: Optional[GazetteerLexicon] = None):
+        self._settings = settings or Settings()
+        self._provider_name = "gazetteer"
+        self._default_language = self._settings.ner_default_language.lower()
+        self._lexicon_path = self._settings.ner_gazetteer_path or str(DEFAULT_GAZETTEER_PATH)
+        self._lexicon = lexicon
+        self._load_error: Optional[str] = None
+
+    async def extract_locations(self, text: str, language: Optional[str] = None) -> Dict[str, Any]:
+        """Extract lexicon locations; same payload shape as SpacyNERService plus ``matches``."""
+        return self.match_locations(text, language)
+
+    def match_locations(self, text: str, language: Optional[str] = None) -> Dict[str, Any]:
+        """Synchronous matching (cheap enough to run on the event loop)."""
+        selected_language = (language or self._default_language).lower()
+        if not text or not text.strip():
+            return self._payload([], selected_language, None, "empty_input")
+
+        if not self.is_service_available():
+            return self._payload([], selected_language, None, "provider_unavailable")
+
+        lexicon = self._get_lexicon()
+        if lexicon is None:
+            return self._payload([], selected_language, None, "model_unavailable")
+
+        return self._payload(lexicon.match(text), selected_language, lexicon, "ok")
+
+    def is_service_available(self) -> bool:
+        return self._settings.ner_enabled
+
+    def get_supported_languages(self) -> list[str]:
+        lexicon = self._get_lexicon()
+        return sorted(lexicon.languages) if lexicon is not None else [self._default_language]
+
+    def get_service_info(self) -> Dict[str, Any]:
+        lexicon = self._get_lexicon()
+        return {
+            "provider": self._provider_name,
+            "available": self.is_service_available() and lexicon is not None,
+            "default_language": self._default_language,
+            "lexicon_path": self._lexicon_path,
+            "lexicon": f"{lexicon.name}@{lexicon.version}" if lexicon is not None else None,
+            "entries": lexicon.entry_count if lexicon is not None else 0,
+            "error": self._load_error,
+        }
+
+    def _get_lexicon(self) -> Optional[GazetteerLexicon]:
+        if self._lexicon is None and self._load_error is None:
+            try:
+                self._lexicon = load_gazetteer(self._lexicon_path)
+            except (OSError, ValueError, KeyError, TypeError) as error:
+                self._load_error = str(error)
+                logger.error("Failed to load gazetteer lexicon", path=self._lexicon_path, error=str(error))
+        return self._lexicon
+
+    def _payload(
+        self,
+        matches: List[Dict[str, Any]],
+        language: str,
+        lexicon: Optional[GazetteerLexicon],
+        status: str,
+    ) -> Dict[str, Any]:
+        locations: list[str] = []
+        for match in matches:
+            if match["name"] not in locations:
+                locations.append(match["name"])
+
+        payload: Dict[str, Any] = {
+            "locations": locations,
+            "top_location": locations[0] if locations else None,
+            "language": language,
+            "provider": self._provider_name,
+            "model": f"{lexicon.name}@{lexicon.version}" if lexicon is not None else None,
+            "status": status,
+        }
+        if status == "ok":
+            payload["count"] = len(locations)
+            payload["matches"] = matches
+        return payload
@@ -6,7 +6,9 @@ from typing import Dict, Optional, Type
 import structlog
 
 from integration.configuration.settings import Settings
+from integration.external_apis.gazetteer_ner_service import GazetteerNERService
 from integration.external_apis.spacy_ner_service import SpacyNERService
+from integration.external_apis.spacy_procpool_ner_service import SpacyProcessPoolNERService
 from shared.interfaces.ner_interface import NERServiceInterface
 
 logger = structlog.get_logger(__name__)
@@ -17,6 +19,8 @@ class NERServiceFactory:
 
     _service_registry: Dict[str, Type[NERServiceInterface]] = {
         "spacy": SpacyNERService,
+        "gazetteer": GazetteerNERService,
+        "spacy_procpool": SpacyProcessPoolNERService,
     }
 
     @classmethod
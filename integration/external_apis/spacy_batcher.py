@@ -0,0 +1,197 @@
+"""Micro-batching front end for spaCy inference.
+
+Concurrent ``extract_locations`` calls are gathered for a short window and run
+through ``nlp.pipe()`` on a single dedicated worker thread. Each caller awaits an
+asyncio future that the worker resolves back on the caller's event loop.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import structlog
+
+from integration.configuration.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+_STOP = object()
+
+
+class SpacyBatcher:
+    """Gathers texts for up to ``window_ms`` (or ``batch_size`` items) and runs them with nlp.pipe()."""
+
+    def __init__(self, batch_size: int = 32, window_ms: float = 5.0, queue_size: int = 256):
+        self._batch_size = max(1, batch_size)
+        self._window_seconds = max(0.0, window_ms) / 1000
+        self._queue_size = max(1, queue_size)
+        self._queue: queue.Queue = queue.Queue(maxsize=self._queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._counters: Dict[str, int] = {
+            "submitted": 0,
+            "rejected": 0,
+            "batches": 0,
+            "processed": 0,
+            "failed": 0,
+            "max_batch": 0,
+        }
+
+    @classmethod
+    def create_from_settings(cls, settings: Settings) -> "SpacyBatcher":
+        return cls(
+            batch_size=settings.ner_batch_size,
+            window_ms=settings.ner_batch_window_ms,
+            queue_size=settings.ner_batch_queue_size,
+        )
+
+    def submit(self, nlp: Any, text: str) -> Optional[asyncio.Future]:
+        """Queue one text for ``nlp``; returns a future for the Doc, or None when the queue is full."""
+        self._ensure_thread()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            self._queue.put_nowait((nlp, text, loop, future))
+        except queue.Full:
+            self._counters["rejected"] += 1
+            return None
+        self._counters["submitted"] += 1
+        return future
+
+    def get_stats(self) -> Dict[str, Any]:
+        processed, batches = self._counters["processed"], self._counters["batches"]
+        return {
+            **self._counters,
+            "avg_batch": round(processed / batches, 2) if batches else 0.0,
+            "pending": self._queue.qsize(),
+            "batch_size": self._batch_size,
+            "window_ms": self._window_seconds * 1000,
+            "queue_size": self._queue_size,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker thread; texts still queued are failed."""
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("spacy_batcher_stop_queue_full")
+        thread.join(timeout)
+
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                _resolve(item[2], item[3], None, RuntimeError("spaCy batcher stopped"))
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="spacy-batcher", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        previous_batch_size = 1
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stopping = False
+            # Only hold the window open under concurrency; an idle single request runs immediately.
+            concurrent = previous_batch_size > 1 or not self._queue.empty()
+            deadline = time.monotonic() + (self._window_seconds if concurrent else 0.0)
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    next_item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_item is _STOP:
+                    stopping = True
+                    break
+                batch.append(next_item)
+
+            self._process_batch(batch)
+            previous_batch_size = len(batch)
+            if stopping:
+                return
+
+    def _process_batch(self, batch: list) -> None:
+        # Requests for different models (languages) can share a window; pipe each group separately.
+        groups: Dict[int, tuple[Any, list]] = {}
+        for item in batch:
+            groups.setdefault(id(item[0]), (item[0], []))[1].append(item)
+
+        for nlp, items in groups.values():
+            texts = [item[1] for item in items]
+            try:
+                pipe = getattr(nlp, "pipe", None)
+                docs = list(pipe(texts, batch_size=self._batch_size)) if pipe else [nlp(text) for text in texts]
+            except Exception as error:
+                self._counters["failed"] += len(items)
+                logger.warning("spacy_batch_failed", size=len(items), error=str(error))
+                for _, _, loop, future in items:
+                    _resolve(loop, future, None, error)
+                continue
+
+            self._counters["batches"] += 1
+            self._counters["processed"] += len(items)
+            self._counters["max_batch"] = max(self._counters["max_batch"], len(items))
+            for (_, _, loop, future), doc in zip(items, docs):
+                _resolve(loop, future, doc, None)
+
+
+def _resolve(
+    loop: asyncio.AbstractEventLoop,
+    future: asyncio.Future,
+    result: Any,
+    error: Optional[BaseException],
+) -> None:
+    def _set() -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    try:
+        loop.call_soon_threadsafe(_set)
+    except RuntimeError:
+        # Caller's loop already closed; nobody is waiting for this result.
+        pass
+
+
+_spacy_batcher: Optional[SpacyBatcher] = None
+_spacy_batcher_lock = threading.Lock()
+
+
+def get_spacy_batcher(settings: Settings) -> SpacyBatcher:
+    """Return the process-wide batcher, creating it on first use."""
+    global _spacy_batcher
+    if _spacy_batcher is None:
+        with _spacy_batcher_lock:
+            if _spacy_batcher is None:
+                _spacy_batcher = SpacyBatcher.create_from_settings(settings)
+    return _spacy_batcher
+
+
+def shutdown_spacy_batcher() -> None:
+    """Stop the process-wide batcher worker thread (application shutdown)."""
+    global _spacy_batcher
+    with _spacy_batcher_lock:
+        batcher, _spacy_batcher = _spacy_batcher, None
+    if batcher is not None:
+        batcher.stop()
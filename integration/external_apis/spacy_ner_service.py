@@ -1,11 +1,16 @@
 """spaCy implementation for pluggable NER location extraction."""
 
 import asyncio
-from typing import Any, Dict, Optional
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
 
 import structlog
 
 from integration.configuration.settings import Settings, get_ner_model_map
+from integration.external_apis.gazetteer_ner_service import GazetteerNERService
+from integration.external_apis.spacy_batcher import SpacyBatcher, get_spacy_batcher
 from shared.interfaces.ner_interface import NERServiceInterface
 
 logger = structlog.get_logger(__name__)
@@ -18,15 +23,142 @@ except ImportError:
     spacy = None
     SPACY_AVAILABLE = False
 
+# Pipeline components location extraction does not use; excluded at load time to save memory.
+NER_EXCLUDED_COMPONENTS: tuple[str, ...] = (
+    "parser",
+    "tagger",
+    "morphologizer",
+    "attribute_ruler",
+    "lemmatizer",
+    "senter",
+)
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """Resident memory of the current process (Linux /proc), or None if unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class SpacyModelRegistry:
+    """Process-wide, thread-safe cache of loaded spaCy pipelines shared by all services."""
+
+    def __init__(self):
+        self._models: dict[str, Any] = {}
+        self._model_status: dict[str, Dict[str, Any]] = {}
+        self._languages: dict[str, Optional[str]] = {}
+        self._preload_state = "not_started"
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str) -> Any:
+        """Return a loaded pipeline, loading it once if needed. Raises if the load fails."""
+        model = self._models.get(model_name)
+        if model is not None:
+            return model
+
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is None:
+                model = self._load_locked(model_name)
+            return model
+
+    def is_loaded(self, model_name: str) -> bool:
+        return model_name in self._models
+
+    def loaded_models(self) -> list[str]:
+        return sorted(self._models.keys())
+
+    def begin_preload(self, languages: Iterable[str]) -> None:
+        with self._lock:
+            self._preload_state = "loading"
+            self._languages = {language: None for language in languages}
+
+    def record_language(self, language: str, model_name: Optional[str]) -> None:
+        """Record which model (if any) serves a preloaded language."""
+        with self._lock:
+            self._languages[language] = model_name
+
+    def finish_preload(self) -> None:
+        with self._lock:
+            all_loaded = all(model_name is not None for model_name in self._languages.values())
+            self._preload_state = "ready" if all_loaded else "degraded"
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return readiness, per-language model and per-model load time / memory."""
+        with self._lock:
+            return {
+                "ready": self._preload_state == "ready",
+                "preload_state": self._preload_state,
+                "languages": dict(self._languages),
+                "models": {name: dict(status) for name, status in self._model_status.items()},
+            }
+
+    def clear(self) -> None:
+        """Drop every loaded pipeline and reset readiness (tests and reloads)."""
+        with self._lock:
+            self._models.clear()
+            self._model_status.clear()
+            self._languages.clear()
+            self._preload_state = "not_started"
+
+    def _load_locked(self, model_name: str) -> Any:
+        self._model_status[model_name] = {"status": "loading"}
+        rss_before = _current_rss_bytes()
+        start = time.perf_counter()
+        try:
+            model = spacy.load(model_name, exclude=list(NER_EXCLUDED_COMPONENTS))
+        except Exception as error:
+            self._model_status[model_name] = {"status": "failed", "error": str(error)}
+            raise
+
+        load_time_ms = int((time.perf_counter() - start) * 1000)
+        rss_after = _current_rss_bytes()
+        status: Dict[str, Any] = {
+            "status": "loaded",
+            "load_time_ms": load_time_ms,
+            "components": list(getattr(model, "pipe_names", [])),
+            "rss_after_mb": round(rss_after / 1_048_576, 1) if rss_after is not None else None,
+            "rss_delta_mb": (
+                round((rss_after - rss_before) / 1_048_576, 1)
+                if rss_after is not None and rss_before is not None
+                else None
+            ),
+        }
+        self._models[model_name] = model
+        self._model_status[model_name] = status
+        logger.info("spaCy model loaded", model=model_name, **status)
+        return model
+
+
+_model_registry = SpacyModelRegistry()
+
+
+def get_spacy_model_registry() -> SpacyModelRegistry:
+    """Return the process-wide spaCy model registry."""
+    return _model_registry
+
 
 class SpacyNERService(NERServiceInterface):
     """NER service backed by spaCy models configured by language."""
 
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        model_registry: Optional[SpacyModelRegistry] = None,
+        batcher: Optional[SpacyBatcher] = None,
+    ):
         self._settings = settings or Settings()
         self._provider_name = "spacy"
         self._model_map = get_ner_model_map(self._settings.ner_model_map)
-        self._model_cache: dict[str, Any] = {}
+        self._model_registry = model_registry or get_spacy_model_registry()
+        if batcher is None and self._settings.ner_batching_enabled:
+            batcher = get_spacy_batcher(self._settings)
+        self._batcher = batcher
+        self._gazetteer = GazetteerNERService(self._settings) if self._settings.ner_gazetteer_prepass else None
         self._default_language = self._settings.ner_default_language.lower()
         self._fallback_model = self._settings.ner_fallback_model
 
@@ -47,6 +179,10 @@ class SpacyNERService(NERServiceInterface):
 
         selected_language = (language or self._default_language).lower()
 
+        prepass_result = self._run_gazetteer_prepass(text, selected_language)
+        if prepass_result is not None:
+            return prepass_result
+
         if not self.is_service_available():
             return {
                 "locations": [],
@@ -70,8 +206,7 @@ class SpacyNERService(NERServiceInterface):
                 "status": "model_unavailable",
             }
 
-        loop = asyncio.get_running_loop()
-        doc = await loop.run_in_executor(None, nlp, text)
+        doc = await self._run_pipeline(nlp, text)
 
         allowed_labels = {"LOC", "GPE", "FAC"}
         extracted_locations: list[str] = []
@@ -111,23 +246,65 @@ class SpacyNERService(NERServiceInterface):
             "default_language": self._default_language,
             "model_map": self._model_map,
             "fallback_model": self._fallback_model,
-            "cached_models": sorted(self._model_cache.keys()),
+            "cached_models": self._model_registry.loaded_models(),
+            "models": self._model_registry.get_status(),
+            "batching": self._batcher.get_stats() if self._batcher is not None else None,
         }
 
+    def preload_models(self) -> Dict[str, Optional[str]]:
+        """Eagerly load the model of every configured language (blocking; run off the event loop)."""
+        languages = self.get_supported_languages()
+        self._model_registry.begin_preload(languages)
+        for language in languages:
+            model_name = self._resolve_model_for_language(language)
+            if self._load_model(model_name, language) is None:
+                loaded_name = None
+            elif self._model_registry.is_loaded(model_name):
+                loaded_name = model_name
+            else:
+                loaded_name = self._fallback_model
+            self._model_registry.record_language(language, loaded_name)
+        self._model_registry.finish_preload()
+
+        status = self._model_registry.get_status()
+        logger.info("spaCy models preloaded", languages=status["languages"], ready=status["ready"])
+        return status["languages"]
+
+    def _run_gazetteer_prepass(self, text: str, language: str) -> Optional[Dict[str, Any]]:
+        """Return the gazetteer result when it has a confident venue/street match, so spaCy can be skipped.
+
+        City names (GPE) never decide the skip: "Madrid" appears in most utterances and says
+        nothing about venues or streets elsewhere in the sentence that the lexicon lacks.
+        """
+        if self._gazetteer is None:
+            return None
+
+        result = self._gazetteer.match_locations(text, language)
+        threshold = self._settings.ner_gazetteer_prepass_min_confidence
+        if result["status"] == "ok" and any(
+            match["label"] != "GPE" and match["confidence"] >= threshold for match in result["matches"]
+        ):
+            return {**result, "prepass": True}
+        return None
+
+    async def _run_pipeline(self, nlp: Any, text: str) -> Any:
+        """Run nlp on text, micro-batched when enabled; falls back to the default executor."""
+        if self._batcher is not None:
+            future = self._batcher.submit(nlp, text)
+            if future is not None:
+                return await future
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, nlp, text)
+
     def _resolve_model_for_language(self, language: str) -> str:
         """Resolve model name for language, fallback to default language mapping."""
         return self._model_map.get(language) or self._model_map.get(self._default_language) or self._fallback_model
 
     def _load_model(self, model_name: str, language: str) -> Any:
-        """Load and cache spaCy model; fallback to configured fallback model if needed."""
-        cache_key = f"{language}:{model_name}"
-        if cache_key in self._model_cache:
-            return self._model_cache[cache_key]
-
+        """Load model through the shared registry; fallback to configured fallback model if needed."""
         try:
-            model = spacy.load(model_name)
-            self._model_cache[cache_key] = model
-            return model
+            return self._model_registry.get(model_name)
         except Exception as error:
             logger.warning(
                 "Failed to load configured spaCy model",
@@ -140,13 +317,7 @@ class SpacyNERService(NERServiceInterface):
                 return None
 
             try:
-                fallback_key = f"{language}:{self._fallback_model}"
-                if fallback_key in self._model_cache:
-                    return self._model_cache[fallback_key]
-
-                fallback_model = spacy.load(self._fallback_model)
-                self._model_cache[fallback_key] = fallback_model
-                return fallback_model
+                return self._model_registry.get(self._fallback_model)
             except Exception as fallback_error:
                 logger.error(
                     "Failed to load fallback spaCy model",
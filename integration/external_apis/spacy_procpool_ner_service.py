@@ -0,0 +1,560 @@
+"""Out-of-process spaCy NER: models hosted in a pool of worker processes.
+
+Each worker loads the configured models once and answers requests over a
+compact protocol: ``(kind, request_id, language, text)`` in, and
+``(request_id, model_name, [(start_char, end_char, label), ...], error)`` out.
+Only location spans cross the process boundary; the parent slices the text.
+A single monitor thread reads every worker's response pipe and watches process
+sentinels, so a worker that crashes has its in-flight requests failed and is
+respawned in place: at once the first time, then with exponential backoff, and
+not at all after ``max_restarts`` consecutive crashes or if it could not load
+its model loader (reported in the READY message), since respawning cannot help.
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from integration.configuration.settings import Settings, get_ner_model_map
+from shared.interfaces.ner_interface import NERServiceInterface
+
+logger = structlog.get_logger(__name__)
+
+LOCATION_LABELS = frozenset({"LOC", "GPE", "FAC"})
+DEFAULT_MODEL_LOADER = "integration.external_apis.spacy_procpool_ner_service:load_ner_pipeline"
+
+_READY_ID = 0
+_RESTART_BACKOFF_INITIAL = 0.5  # seconds before the second consecutive respawn, doubled after each crash
+_RESTART_BACKOFF_MAX = 30.0
+_STABLE_SECONDS = 60.0  # a worker that lived this long resets its slot's crash count
+_KIND_NER = "ner"
+_KIND_PING = "ping"
+
+Span = Tuple[int, int, str]
+
+
+class NERWorkerError(RuntimeError):
+    """A pooled NER worker failed, crashed or timed out while serving a request."""
+
+
+def load_ner_pipeline(model_name: str) -> Any:
+    """Default worker loader: spaCy pipeline with NER-only components."""
+    import spacy
+
+    from integration.external_apis.spacy_ner_service import NER_EXCLUDED_COMPONENTS
+
+    return spacy.load(model_name, exclude=list(NER_EXCLUDED_COMPONENTS))
+
+
+def _import_loader(path: str) -> Callable[[str], Any]:
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _worker_main(
+    requests: Any,
+    responses: Any,
+    model_map: Dict[str, str],
+    default_language: str,
+    fallback_model: str,
+    loader_path: str,
+) -> None:
+    """Worker process entry point: load models once, then serve requests until stopped."""
+    try:
+        try:
+            loader = _import_loader(loader_path)
+        except Exception as error:
+            responses.send((_READY_ID, None, None, f"cannot import NER model loader {loader_path}: {error!r}"))
+            return
+        pipelines: Dict[str, Tuple[str, Any]] = {}
+        for language, model_name in model_map.items():
+            for candidate in (model_name, fallback_model):
+                try:
+                    pipelines[language] = (candidate, loader(candidate))
+                    break
+                except Exception:
+                    continue
+        responses.send((_READY_ID, None, {lang: name for lang, (name, _) in pipelines.items()}, None))
+
+        while True:
+            message = requests.get()
+            if message is None:
+                return
+            kind, request_id, language, text = message
+            if kind == _KIND_PING:
+                responses.send((request_id, None, [], None))
+                continue
+
+            selected = pipelines.get(language) or pipelines.get(default_language)
+            if selected is None:
+                responses.send((request_id, None, [], None))
+                continue
+            model_name, nlp = selected
+            try:
+                doc = nlp(text)
+                spans = [
+                    (entity.start_char, entity.end_char, entity.label_)
+                    for entity in doc.ents
+                    if entity.label_ in LOCATION_LABELS
+                ]
+                responses.send((request_id, model_name, spans, None))
+            except Exception as error:
+                responses.send((request_id, model_name, [], str(error)))
+    except (KeyboardInterrupt, EOFError, BrokenPipeError):
+        return
+
+
+class _WorkerHandle:
+    """Parent-side state for one worker process."""
+
+    def __init__(self, slot: int, process: Any, requests: Any, responses: Any):
+        self.slot = slot
+        self.process = process
+        self.requests = requests
+        self.responses = responses
+        self.pending: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self.languages: Optional[Dict[str, str]] = None
+        self.load_error: Optional[str] = None
+        self.exited = False  # crash handled by the monitor; the slot awaits respawn (or was abandoned)
+        self.processed = 0
+        self.errors = 0
+        self.started_at = time.time()
+
+    @property
+    def ready(self) -> bool:
+        return self.languages is not None and self.process.is_alive()
+
+
+class SpacyProcessPool:
+    """Fixed-size pool of spaCy worker processes with crash detection and respawn."""
+
+    def __init__(
+        self,
+        pool_size: int,
+        model_map: Dict[str, str],
+        default_language: str = "es",
+        fallback_model: str = "es_core_news_sm",
+        request_timeout: float = 10.0,
+        model_loader: str = DEFAULT_MODEL_LOADER,
+        max_restarts: int = 5,
+    ):
+        self._pool_size = max(1, pool_size)
+        self._model_map = dict(model_map)
+        self._default_language = default_language
+        self._fallback_model = fallback_model
+        self._request_timeout = request_timeout
+        self._model_loader = model_loader
+        self._max_restarts = max_restarts
+        self._context = multiprocessing.get_context("spawn")
+
+        self._workers: List[_WorkerHandle] = []
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._monitor: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._counters: Dict[str, int] = {
+            "requests": 0,
+            "timeouts": 0,
+            "worker_errors": 0,
+            "restarts": 0,
+            "abandoned_slots": 0,
+        }
+        # Monitor-thread state: consecutive crashes per slot and when each pending respawn is due
+        self._crashes: Dict[int, int] = {}
+        self._respawn_due: Dict[int, float] = {}
+
+    @classmethod
+    def create_from_settings(cls, settings: Settings) -> "SpacyProcessPool":
+        return cls(
+            pool_size=settings.ner_procpool_size,
+            model_map=get_ner_model_map(settings.ner_model_map),
+            default_language=settings.ner_default_language.lower(),
+            fallback_model=settings.ner_fallback_model,
+            request_timeout=settings.ner_procpool_request_timeout,
+        )
+
+    def is_available(self) -> bool:
+        """True when the worker loader can run (spaCy importable for the default loader)."""
+        if self._model_loader != DEFAULT_MODEL_LOADER:
+            return True
+        return importlib.util.find_spec("spacy") is not None
+
+    @property
+    def started(self) -> bool:
+        return self._monitor is not None
+
+    def start(self) -> None:
+        """Spawn the workers and the monitor thread (idempotent)."""
+        with self._lock:
+            if self._monitor is not None:
+                return
+            self._stopping.clear()
+            self._crashes.clear()
+            self._respawn_due.clear()
+            self._workers = [self._spawn(slot) for slot in range(self._pool_size)]
+            self._monitor = threading.Thread(target=self._monitor_loop, name="ner-procpool-monitor", daemon=True)
+            self._monitor.start()
+        logger.info("NER process pool started", pool_size=self._pool_size, models=self._model_map)
+
+    async def extract(self, text: str, language: str) -> Tuple[Optional[str], List[Span]]:
+        """Run NER for text in the least-loaded worker. Raises NERWorkerError on failure/timeout."""
+        self.start()
+        model_name, spans, error = await self._request(_KIND_NER, language, text)
+        if error is not None:
+            raise NERWorkerError(error)
+        return model_name, spans
+
+    async def health_check(self, timeout: float = 2.0) -> Dict[str, Any]:
+        """Ping every worker; a worker is healthy if it answers within timeout."""
+        with self._lock:
+            workers = list(self._workers)
+
+        results = []
+        for worker in workers:
+            start = time.perf_counter()
+            try:
+                await self._request(_KIND_PING, None, "", worker=worker, timeout=timeout)
+                healthy, latency_ms = True, round((time.perf_counter() - start) * 1000, 2)
+            except NERWorkerError:
+                healthy, latency_ms = False, None
+            results.append({"slot": worker.slot, "pid": worker.process.pid, "healthy": healthy, "ping_ms": latency_ms})
+
+        return {"healthy": bool(results) and all(result["healthy"] for result in results), "workers": results}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            workers = [
+                {
+                    "slot": worker.slot,
+                    "pid": worker.process.pid,
+                    "alive": worker.process.is_alive(),
+                    "ready": worker.ready,
+                    "pending": len(worker.pending),
+                    "processed": worker.processed,
+                    "errors": worker.errors,
+                    "languages": worker.languages,
+                    "load_error": worker.load_error,
+                }
+                for worker in self._workers
+            ]
+        return {
+            **self._counters,
+            "pool_size": self._pool_size,
+            "started": self.started,
+            "ready": bool(workers) and all(worker["ready"] for worker in workers),
+            "workers": workers,
+        }
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop workers and the monitor; in-flight requests fail."""
+        with self._lock:
+            monitor, self._monitor = self._monitor, None
+            workers, self._workers = self._workers, []
+        if monitor is None:
+            return
+        self._stopping.set()
+        for worker in workers:
+            try:
+                worker.requests.put(None)
+            except (OSError, ValueError):
+                pass
+        for worker in workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            self._fail_pending(worker, "NER process pool stopped")
+        monitor.join(timeout)
+        logger.info("NER process pool stopped")
+
+    async def _request(
+        self,
+        kind: str,
+        language: Optional[str],
+        text: str,
+        worker: Optional[_WorkerHandle] = None,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Optional[str], List[Span], Optional[str]]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request_id = next(self._request_ids)
+
+        with self._lock:
+            if worker is None:
+                alive = [candidate for candidate in self._workers if candidate.process.is_alive()]
+                if not alive:
+                    raise NERWorkerError("no NER worker process available")
+                worker = min(alive, key=lambda candidate: len(candidate.pending))
+            worker.pending[request_id] = (loop, future)
+        if kind == _KIND_NER:
+            self._counters["requests"] += 1
+
+        try:
+            worker.requests.put((kind, request_id, language, text))
+            return await asyncio.wait_for(future, timeout or self._request_timeout)
+        except asyncio.TimeoutError as error:
+            self._counters["timeouts"] += 1
+            raise NERWorkerError(f"NER worker {worker.slot} timed out") from error
+        finally:
+            with self._lock:
+                worker.pending.pop(request_id, None)
+
+    def _spawn(self, slot: int) -> _WorkerHandle:
+        requests = self._context.Queue()
+        parent_conn, child_conn = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(
+                requests,
+                child_conn,
+                self._model_map,
+                self._default_language,
+                self._fallback_model,
+                self._model_loader,
+            ),
+            name=f"ner-worker-{slot}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _WorkerHandle(slot, process, requests, parent_conn)
+
+    def _monitor_loop(self) -> None:
+        while not self._stopping.is_set():
+            self._respawn_due_workers()
+            with self._lock:
+                workers = [worker for worker in self._workers if not worker.exited]
+            timeout = 0.5
+            if self._respawn_due:
+                timeout = min(timeout, max(0.0, min(self._respawn_due.values()) - time.monotonic()))
+            if not workers:
+                self._stopping.wait(timeout)
+                continue
+
+            by_object: Dict[Any, _WorkerHandle] = {}
+            for worker in workers:
+                by_object[worker.responses] = worker
+                by_object[worker.process.sentinel] = worker
+
+            for ready in wait(list(by_object), timeout=timeout):
+                worker = by_object[ready]
+                if ready is worker.responses:
+                    self._drain_responses(worker)
+                elif not self._stopping.is_set():
+                    self._drain_responses(worker)
+                    self._restart(worker)
+
+    def _drain_responses(self, worker: _WorkerHandle) -> None:
+        try:
+            while worker.responses.poll():
+                request_id, model_name, payload, error = worker.responses.recv()
+                if request_id == _READY_ID:
+                    if error is not None:
+                        worker.load_error = error
+                        logger.error("NER worker failed to start", slot=worker.slot, error=error)
+                        continue
+                    worker.languages = payload
+                    logger.info("NER worker ready", slot=worker.slot, pid=worker.process.pid, languages=payload)
+                    continue
+                with self._lock:
+                    waiter = worker.pending.pop(request_id, None)
+                worker.processed += 1
+                if error is not None:
+                    worker.errors += 1
+                if waiter is not None:
+                    _resolve(waiter[0], waiter[1], (model_name, payload, error), None)
+        except (EOFError, OSError):
+            pass
+
+    def _restart(self, worker: _WorkerHandle) -> None:
+        """Handle a dead worker (monitor thread): fail its requests and schedule the respawn."""
+        worker.process.join(1.0)
+        exit_code = worker.process.exitcode
+        worker.exited = True  # _request skips it (not alive) and the monitor stops watching it
+        self._counters["worker_errors"] += 1
+        self._fail_pending(worker, f"NER worker {worker.slot} exited with code {exit_code}")
+        worker.responses.close()
+        worker.requests.close()
+
+        if worker.load_error is not None:
+            self._counters["abandoned_slots"] += 1
+            logger.error("NER worker cannot load its models; not restarting", slot=worker.slot, error=worker.load_error)
+            return
+
+        stable = time.time() - worker.started_at >= _STABLE_SECONDS
+        crashes = 1 if stable else self._crashes.get(worker.slot, 0) + 1
+        self._crashes[worker.slot] = crashes
+        if crashes > self._max_restarts:
+            self._counters["abandoned_slots"] += 1
+            logger.error(
+                "NER worker keeps crashing; not restarting", slot=worker.slot, crashes=crashes, exit_code=exit_code
+            )
+            return
+
+        delay = 0.0 if crashes == 1 else min(_RESTART_BACKOFF_MAX, _RESTART_BACKOFF_INITIAL * 2 ** (crashes - 2))
+        self._respawn_due[worker.slot] = time.monotonic() + delay
+        logger.warning(
+            "NER worker crashed; restarting",
+            slot=worker.slot,
+            pid=worker.process.pid,
+            exit_code=exit_code,
+            crashes=crashes,
+            delay_seconds=delay,
+        )
+
+    def _respawn_due_workers(self) -> None:
+        """Spawn replacements whose backoff has elapsed; the lock is only held for the swap."""
+        now = time.monotonic()
+        for slot in [slot for slot, due in self._respawn_due.items() if due <= now]:
+            del self._respawn_due[slot]
+            if self._stopping.is_set():
+                return
+            replacement = self._spawn(slot)
+            with self._lock:
+                index = next((i for i, worker in enumerate(self._workers) if worker.slot == slot), None)
+                if index is not None and not self._stopping.is_set():
+                    self._workers[index] = replacement
+                    self._counters["restarts"] += 1
+                    replacement = None
+            if replacement is not None:  # the pool was stopped while spawning
+                replacement.process.terminate()
+
+    def _fail_pending(self, worker: _WorkerHandle, reason: str) -> None:
+        with self._lock:
+            pending, worker.pending = worker.pending, {}
+        for loop, future in pending.values():
+            _resolve(loop, future, None, NERWorkerError(reason))
+
+
+def _resolve(
+    loop: asyncio.AbstractEventLoop,
+    future: asyncio.Future,
+    result: Any,
+    error: Optional[BaseException],
+) -> None:
+    def _set() -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    try:
+        loop.call_soon_threadsafe(_set)
+    except RuntimeError:
+        pass
+
+
+_process_pool: Optional[SpacyProcessPool] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_spacy_process_pool(settings: Settings) -> SpacyProcessPool:
+    """Return the process-wide NER worker pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = SpacyProcessPool.create_from_settings(settings)
+    return _process_pool
+
+
+def shutdown_spacy_process_pool() -> None:
+    """Stop the process-wide NER worker pool (application shutdown)."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.stop()
+
+
+class SpacyProcessPoolNERService(NERServiceInterface):
+    """spaCy NER served by worker processes so inference does not contend for the web worker's GIL."""
+
+    def __init__(self, settings: Optional[Settings] = None, pool: Optional[SpacyProcessPool] = None):
+        self._settings = settings or Settings()
+        self._provider_name = "spacy_procpool"
+        self._model_map = get_ner_model_map(self._settings.ner_model_map)
+        self._default_language = self._settings.ner_default_language.lower()
+        self._pool = pool or get_spacy_process_pool(self._settings)
+
+    async def extract_locations(self, text: str, language: Optional[str] = None) -> Dict[str, Any]:
+        """Extract location entities (GPE/LOC/FAC) from input text in a worker process."""
+        selected_language = (language or self._default_language).lower()
+        if not text or not text.strip():
+            return self._payload([], selected_language, None, "empty_input")
+
+        if not self.is_service_available():
+            return self._payload([], selected_language, None, "provider_unavailable")
+
+        try:
+            model_name, spans = await self._pool.extract(text, selected_language)
+        except NERWorkerError as error:
+            logger.warning("NER worker request failed", error=str(error))
+            return {**self._payload([], selected_language, None, "worker_error"), "error": str(error)}
+
+        if model_name is None:
+            return self._payload([], selected_language, None, "model_unavailable")
+
+        extracted_locations: list[str] = []
+        seen: set[str] = set()
+        for start, end, _label in spans:
+            value = text[start:end].strip()
+            key = value.lower()
+            if value and key not in seen:
+                seen.add(key)
+                extracted_locations.append(value)
+
+        return self._payload(extracted_locations, selected_language, model_name, "ok")
+
+    def is_service_available(self) -> bool:
+        return self._settings.ner_enabled and self._pool.is_available()
+
+    def get_supported_languages(self) -> list[str]:
+        return sorted(self._model_map.keys())
+
+    def get_service_info(self) -> Dict[str, Any]:
+        return {
+            "provider": self._provider_name,
+            "available": self.is_service_available(),
+            "default_language": self._default_language,
+            "model_map": self._model_map,
+            "cpu_count": os.cpu_count(),
+            "pool": self._pool.get_stats(),
+        }
+
+    def start(self) -> None:
+        """Spawn the worker processes ahead of the first request."""
+        if self.is_service_available():
+            self._pool.start()
+
+    async def health_check(self, timeout: float = 2.0) -> Dict[str, Any]:
+        return await self._pool.health_check(timeout)
+
+    def _payload(
+        self,
+        locations: list[str],
+        language: str,
+        model_name: Optional[str],
+        status: str,
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "locations": locations,
+            "top_location": locations[0] if locations else None,
+            "language": language,
+            "provider": self._provider_name,
+            "model": model_name,
+            "status": status,
+        }
+        if status == "ok":
+            payload["count"] = len(locations)
+        return payload
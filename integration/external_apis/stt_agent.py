@@ -1,14 +1,25 @@
 import asyncio
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
 
+import numpy as np
 import structlog
 
+from integration.configuration.settings import get_settings
 from integration.external_apis.stt_factory import STTServiceFactory
-from shared.interfaces.stt_interface import STTServiceError, STTServiceInterface
+from integration.external_apis.transcription_cache import (
+    CachedTranscription,
+    TranscriptionCache,
+    audio_fingerprint,
+    cache_key,
+)
+from shared.interfaces.stt_interface import STT_SAMPLE_RATE, STTServiceError, STTServiceInterface
 
 logger = structlog.get_logger(__name__)
 
+TRANSCRIPTION_HISTORY_SIZE = 100
+
 
 class VoiceflowSTTAgent:
     """
@@ -21,25 +32,119 @@ class VoiceflowSTTAgent:
     STTServiceInterface, no de implementaciones concretas.
     """
 
-    def __init__(self, stt_service: STTServiceInterface, agent_id: str = "stt_agent_001"):
+    def __init__(
+        self,
+        stt_service: STTServiceInterface,
+        agent_id: str = "stt_agent_001",
+        cache: Optional[TranscriptionCache] = None,
+    ):
         """
         Inicializa el agente STT.
 
         Args:
             stt_service: Servicio STT a utilizar
             agent_id: Identificador único del agente
+            cache: Caché de transcripciones por contenido de audio (None = sin caché)
         """
         self.stt_service = stt_service
         self.agent_id = agent_id
-        self._transcription_history: list[Dict[str, Any]] = []
+        self.cache = cache
+        # Acotado: el agente vive todo el proceso y lo comparten todas las peticiones
+        self._transcription_history: Deque[Dict[str, Any]] = deque(maxlen=TRANSCRIPTION_HISTORY_SIZE)
+        # Transcripciones en curso por clave: un reintento concurrente espera a la primera
+        self._inflight: Dict[str, asyncio.Future] = {}
+        service_info = stt_service.get_service_info()
+        self._provider_key = (
+            f"{service_info.get('service_name', type(stt_service).__name__)}/{service_info.get('model', '')}"
+        )
 
         logger.info(
             "VoiceflowSTTAgent inicializado",
             agent_id=self.agent_id,
-            service_info=self.stt_service.get_service_info(),
+            service_info=service_info,
         )
 
     async def transcribe_audio(self, audio_path: str | Path, **kwargs) -> str:
+        """Transcribe un archivo de audio a texto (ver transcribe_audio_cached)."""
+        return (await self.transcribe_audio_cached(audio_path, **kwargs)).text
+
+    async def transcribe_buffer(self, audio: np.ndarray, **kwargs) -> str:
+        """Transcribe audio ya decodificado en memoria (ver transcribe_buffer_cached)."""
+        return (await self.transcribe_buffer_cached(audio, **kwargs)).text
+
+    async def transcribe_audio_cached(
+        self, audio_path: str | Path, use_cache: bool = True, **kwargs
+    ) -> CachedTranscription:
+        """
+        Transcribe un archivo consultando antes la caché por el contenido del fichero.
+
+        Returns:
+            CachedTranscription: texto y si se sirvió desde la caché
+        """
+        if self.cache is None or not use_cache:
+            return CachedTranscription(await self._transcribe_file(audio_path, **kwargs), False)
+        fingerprint = await asyncio.to_thread(lambda: audio_fingerprint(Path(audio_path).read_bytes()))
+        return await self._cached(fingerprint, kwargs, lambda: self._transcribe_file(audio_path, **kwargs))
+
+    async def transcribe_buffer_cached(
+        self, audio: np.ndarray, use_cache: bool = True, **kwargs
+    ) -> CachedTranscription:
+        """
+        Transcribe un buffer consultando antes la caché por el hash de las muestras PCM.
+
+        Args:
+            audio: Muestras float32 mono a STT_SAMPLE_RATE
+            use_cache: False para audio que no se repetirá (p. ej. parciales de streaming)
+            **kwargs: Parámetros de la transcripción (language, initial_prompt...), parte de la clave
+
+        Returns:
+            CachedTranscription: texto y si se sirvió desde la caché
+        """
+        if self.cache is None or not use_cache:
+            return CachedTranscription(await self._transcribe_samples(audio, **kwargs), False)
+        return await self._cached(audio_fingerprint(audio), kwargs, lambda: self._transcribe_samples(audio, **kwargs))
+
+    async def _cached(
+        self, fingerprint: str, kwargs: Dict[str, Any], transcribe: Callable[[], Awaitable[str]]
+    ) -> CachedTranscription:
+        options = {name: value for name, value in kwargs.items() if name != "language"}
+        key = cache_key(fingerprint, self._provider_key, kwargs.get("language"), options)
+
+        text = await self.cache.get(key)
+        if text is not None:
+            logger.info("Transcripción servida desde caché", agent_id=self.agent_id, text_length=len(text))
+            return CachedTranscription(text, True)
+
+        while (pending := self._inflight.get(key)) is not None and pending.get_loop() is asyncio.get_running_loop():
+            try:
+                text = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # the first caller was cancelled, not this one: transcribe (or join a new attempt) ourselves
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                continue
+            self.cache.record_coalesced_hit()
+            return CachedTranscription(text, True)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            text = await transcribe()
+            await self.cache.put(key, text)
+            future.set_result(text)
+            return CachedTranscription(text, False)
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()  # retrieved: no "never retrieved" warning without waiters
+            raise
+        except BaseException:
+            # cancellation belongs to this caller only; waiters retry instead of inheriting it
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _transcribe_file(self, audio_path: str | Path, **kwargs) -> str:
         """
         Transcribe un archivo de audio a texto.
 
@@ -118,6 +223,56 @@ class VoiceflowSTTAgent:
             # Re-lanzar la excepción para que el sistema multiagente pueda manejarla
             raise
 
+    async def _transcribe_samples(self, audio: np.ndarray, **kwargs) -> str:
+        """
+        Transcribe audio ya decodificado en memoria (float32 mono a 16 kHz).
+
+        El servicio STT recibe el buffer directamente (Whisper acepta arrays, Azure un
+        push stream); solo los servicios sin soporte nativo recurren a un WAV temporal.
+
+        Args:
+            audio: Muestras float32 mono a STT_SAMPLE_RATE
+            **kwargs: Parámetros adicionales para la transcripción (language, etc.)
+
+        Returns:
+            str: Texto transcrito
+        """
+        if not self.stt_service.is_service_available():
+            raise STTServiceError("Servicio STT no está disponible", self.stt_service.__class__.__name__)
+
+        record = {
+            "audio_file": None,
+            "audio_seconds": round(audio.size / STT_SAMPLE_RATE, 3),
+            "service_used": self.stt_service.__class__.__name__,
+            "parameters": kwargs,
+        }
+        try:
+            transcribed_text = await self.stt_service.transcribe_buffer(audio, **kwargs)
+        except Exception as e:
+            self._transcription_history.append(
+                {**record, "error": str(e), "timestamp": asyncio.get_event_loop().time(), "success": False}
+            )
+            logger.error(
+                "Error en transcripción", agent_id=self.agent_id, error=str(e), audio_seconds=record["audio_seconds"]
+            )
+            raise
+
+        self._transcription_history.append(
+            {
+                **record,
+                "transcribed_text": transcribed_text,
+                "timestamp": asyncio.get_event_loop().time(),
+                "success": True,
+            }
+        )
+        logger.info(
+            "Transcripción completada exitosamente",
+            agent_id=self.agent_id,
+            audio_seconds=record["audio_seconds"],
+            text_length=len(transcribed_text),
+        )
+        return transcribed_text
+
     def get_supported_formats(self) -> list[str]:
         """
         Obtiene los formatos de audio soportados por el servicio actual.
@@ -142,6 +297,7 @@ class VoiceflowSTTAgent:
             "supported_formats": self.get_supported_formats(),
             "transcription_count": len(self._transcription_history),
             "is_service_available": self.stt_service.is_service_available(),
+            "cache": self.cache.get_stats() if self.cache is not None else None,
         }
 
     def get_transcription_history(self) -> list[Dict[str, Any]]:
@@ -153,7 +309,7 @@ class VoiceflowSTTAgent:
         Returns:
             list[Dict[str, Any]]: Lista de registros de transcripción
         """
-        return self._transcription_history.copy()
+        return list(self._transcription_history)
 
     def clear_history(self) -> None:
         """Limpia el historial de transcripciones."""
@@ -210,7 +366,7 @@ class VoiceflowSTTAgent:
             VoiceflowSTTAgent: Instancia configurada del agente
         """
         stt_service = STTServiceFactory.create_from_config(config_path)
-        return cls(stt_service, agent_id)
+        return cls(stt_service, agent_id, cache=TranscriptionCache.create_from_settings(get_settings()))
 
 
 def create_stt_agent(config_path: str = None, agent_id: str = "stt_agent_001") -> VoiceflowSTTAgent:
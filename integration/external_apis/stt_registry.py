@@ -0,0 +1,128 @@
+"""
+Registro del agente STT único por proceso.
+
+Vive en un módulo propio para que health y AudioService puedan consultar el estado sin
+importar los SDKs de STT (Azure, Whisper): el agente se importa y se crea solo al cargar.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+import structlog
+
+if TYPE_CHECKING:
+    from integration.external_apis.stt_agent import VoiceflowSTTAgent
+
+logger = structlog.get_logger(__name__)
+
+# Tras un fallo de creación, get() no reintenta hasta pasado este tiempo
+_RETRY_AFTER_SECONDS = 60.0
+
+
+class STTAgentRegistry:
+    """
+    Agente STT único por proceso, compartido por todas las peticiones.
+
+    Se crea una sola vez (en segundo plano durante el arranque, o en la primera petición
+    si no hubo precarga), de modo que whisper.load_model o la inicialización de Azure
+    nunca ocurren en el camino de una petición ya servida. get_status() devuelve el
+    estado cacheado, sin construir servicios. Un fallo se cachea durante retry_after
+    segundos; la siguiente llamada a get() pasado ese tiempo vuelve a intentar la carga.
+    """
+
+    def __init__(
+        self,
+        factory: Optional[Callable[[], "VoiceflowSTTAgent"]] = None,
+        retry_after: float = _RETRY_AFTER_SECONDS,
+    ):
+        self._factory = factory or _create_default_agent
+        self._retry_after = retry_after
+        self._agent: Optional["VoiceflowSTTAgent"] = None
+        self._state = "not_started"
+        self._status: Dict[str, Any] = {}
+        self._failed_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def agent(self) -> Optional["VoiceflowSTTAgent"]:
+        return self._agent
+
+    def get(self) -> Optional["VoiceflowSTTAgent"]:
+        """Devuelve el agente, creándolo (o esperando a la carga en curso) la primera vez; None si falló."""
+        if self._agent is not None or (self._state == "failed" and not self._retry_due()):
+            return self._agent
+
+        with self._lock:
+            if self._state in ("not_started", "loading") or (self._state == "failed" and self._retry_due()):
+                self._load_locked()
+            return self._agent
+
+    def get_status(self) -> Dict[str, Any]:
+        """Estado cacheado: ready, state, servicio, disponibilidad, tiempo de carga y error.
+
+        No toma el lock, para no bloquear la health mientras el modelo se está cargando.
+        """
+        state, status = self._state, self._status
+        return {"ready": state == "ready", "state": state, **status}
+
+    def mark_loading(self) -> None:
+        """Marca la carga como iniciada (la health la reporta hasta que termine)."""
+        if self._state == "not_started":
+            self._state = "loading"
+
+    def clear(self) -> None:
+        """Descarta el agente y reinicia el estado (tests y recargas)."""
+        with self._lock:
+            self._agent = None
+            self._state = "not_started"
+            self._status = {}
+
+    def _retry_due(self) -> bool:
+        return time.monotonic() - self._failed_at >= self._retry_after
+
+    def _load_locked(self) -> None:
+        self._state = "loading"
+        start = time.perf_counter()
+        try:
+            agent = self._factory()
+            service_info = agent.stt_service.get_service_info()
+            status = {
+                "service": service_info.get("service_name", type(agent.stt_service).__name__),
+                "service_available": agent.stt_service.is_service_available(),
+                "supported_formats": agent.get_supported_formats(),
+                "load_time_ms": int((time.perf_counter() - start) * 1000),
+                "checked_at": datetime.now().isoformat(),
+            }
+        except Exception as error:
+            self._status = {
+                "error": str(error),
+                "error_type": type(error).__name__,
+                "retry_after_seconds": self._retry_after,
+                "checked_at": datetime.now().isoformat(),
+            }
+            self._failed_at = time.monotonic()
+            self._state = "failed"
+            logger.warning("No se pudo crear el agente STT", error=str(error), retry_after=self._retry_after)
+            return
+
+        self._agent = agent
+        self._status = status
+        self._state = "ready"
+        logger.info("Agente STT listo", service=self._status["service"], load_time_ms=self._status["load_time_ms"])
+
+
+def _create_default_agent() -> "VoiceflowSTTAgent":
+    # Import diferido: el SDK de Azure / Whisper solo se carga al crear el agente
+    from integration.external_apis.stt_agent import create_stt_agent
+
+    return create_stt_agent()
+
+
+_stt_registry = STTAgentRegistry()
+
+
+def get_stt_agent_registry() -> STTAgentRegistry:
+    """Return the process-wide STT agent registry."""
+    return _stt_registry
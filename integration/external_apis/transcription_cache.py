@@ -0,0 +1,201 @@
+"""
+Content-addressed cache of STT results.
+
+Retries and replayed demo clips send exactly the same audio again; instead of paying a
+full Whisper/Azure transcription, the text is looked up by a hash of the audio content
+(decoded PCM samples, or the raw bytes of a file), the language, the provider/model and
+any other transcription options. An in-memory LRU holds the hot entries; an optional
+SQLite file keeps results across restarts and is shared by the workers of one host.
+Only successful, non-empty transcriptions are stored.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+import structlog
+
+from integration.configuration.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+
+class CachedTranscription(NamedTuple):
+    """Transcribed text and whether it came from the cache."""
+
+    text: str
+    cache_hit: bool
+
+
+def audio_fingerprint(audio: np.ndarray | bytes) -> str:
+    """BLAKE2b-128 of the samples (float32) or of the raw bytes"""
+    if isinstance(audio, np.ndarray):
+        audio = np.ascontiguousarray(audio, dtype=np.float32).data
+    return hashlib.blake2b(audio, digest_size=16).hexdigest()
+
+
+def cache_key(fingerprint: str, provider: str, language: Optional[str], options: Dict[str, Any]) -> str:
+    """Combine the audio fingerprint with everything that can change the transcription"""
+    extra = json.dumps(options, sort_keys=True, default=str) if options else ""
+    return hashlib.blake2b(f"{provider}|{language}|{extra}|{fingerprint}".encode(), digest_size=20).hexdigest()
+
+
+class TranscriptionCache:
+    """Bounded LRU of transcriptions with an optional on-disk (SQLite) second tier."""
+
+    def __init__(self, max_entries: int = 256, disk_path: Optional[str] = None, disk_max_entries: int = 10000):
+        self._max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = _DiskTier(Path(disk_path), disk_max_entries) if disk_path else None
+        self._counters: Dict[str, int] = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "coalesced_hits": 0,
+            "misses": 0,
+            "stores": 0,
+        }
+
+    @classmethod
+    def create_from_settings(cls, settings: Settings) -> Optional["TranscriptionCache"]:
+        if not settings.stt_cache_enabled:
+            return None
+        return cls(
+            max_entries=settings.stt_cache_max_entries,
+            disk_path=settings.stt_cache_disk_path,
+            disk_max_entries=settings.stt_cache_disk_max_entries,
+        )
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                self._counters["memory_hits"] += 1
+                return text
+
+        if self._disk is not None:
+            text = await asyncio.to_thread(self._disk.get, key)
+            if text is not None:
+                with self._lock:
+                    self._remember(key, text)
+                    self._counters["hits"] += 1
+                    self._counters["disk_hits"] += 1
+                return text
+
+        with self._lock:
+            self._counters["misses"] += 1
+        return None
+
+    def record_coalesced_hit(self) -> None:
+        """A lookup that missed was then served by an identical transcription already in flight"""
+        with self._lock:
+            self._counters["misses"] -= 1
+            self._counters["hits"] += 1
+            self._counters["coalesced_hits"] += 1
+
+    async def put(self, key: str, text: str) -> None:
+        if not text or not text.strip():
+            return
+        with self._lock:
+            self._remember(key, text)
+            self._counters["stores"] += 1
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.put, key, text)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            entries = len(self._entries)
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            **counters,
+            "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None,
+            "entries": entries,
+            "max_entries": self._max_entries,
+            "disk_tier": self._disk.get_stats() if self._disk is not None else None,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._disk is not None:
+            self._disk.clear()
+
+    def close(self) -> None:
+        if self._disk is not None:
+            self._disk.close()
+
+    def _remember(self, key: str, text: str) -> None:
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class _DiskTier:
+    """SQLite table of key -> text, trimmed to the most recently used `max_entries`."""
+
+    _TRIM_EVERY = 64  # writes between trims
+
+    def __init__(self, path: Path, max_entries: int):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS transcriptions "
+            "(key TEXT PRIMARY KEY, text TEXT NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS transcriptions_used_at ON transcriptions (used_at)")
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute("SELECT text FROM transcriptions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE transcriptions SET used_at = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def put(self, key: str, text: str) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO transcriptions (key, text, used_at) VALUES (?, ?, ?)", (key, text, time.time())
+            )
+            self._writes += 1
+            if self._writes % self._TRIM_EVERY == 0:
+                self._trim()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (entries,) = self._connection.execute("SELECT COUNT(*) FROM transcriptions").fetchone()
+        return {"path": str(self._path), "entries": entries, "max_entries": self._max_entries}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM transcriptions")
+
+    def close(self) -> None:
+        with self._lock:
+            self._trim()
+            self._connection.close()
+
+    def _trim(self) -> None:
+        self._connection.execute(
+            "DELETE FROM transcriptions WHERE key IN "
+            "(SELECT key FROM transcriptions ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
@@ -0,0 +1,242 @@
+"""
+Energy-based voice activity detection over float32 mono audio.
+
+Audio is split into fixed frames whose energy (dBFS) is compared against an adaptive
+noise floor. The floor is seeded from the quietest frame of the first calibration_ms
+(decisions for those frames wait until it is known) and then tracked over every frame:
+it follows quieter frames quickly and rises only slowly, so steady room noise of any
+level settles under the threshold while speech does not drag the floor up. Frames a
+little below the threshold still count as voiced when their zero-crossing rate is
+high (unvoiced fricatives such as /s/ or /f/ at word edges).
+Speech starts after a few consecutive loud frames and ends after a "hangover" of
+consecutive silent frames, so short pauses inside a sentence do not cut an utterance.
+StreamingVAD keeps its state across chunks and reports events as absolute sample
+offsets in the stream; trim_silence() applies it to a whole clip before STT.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from shared.interfaces.stt_interface import STT_SAMPLE_RATE
+
+_EPSILON = 1e-10
+
+
+@dataclass(frozen=True)
+class VADConfig:
+    """Frame size and decision thresholds (defaults tuned for close-talk microphones)."""
+
+    frame_ms: int = 30
+    min_energy_db: float = -45.0  # frames quieter than this are always silence
+    noise_margin_db: float = 12.0  # speech must exceed the tracked noise floor by this
+    start_ms: int = 90  # consecutive voiced audio needed to open a segment
+    hangover_ms: int = 600  # consecutive silence needed to close it
+    zcr_threshold: float = 0.25  # crossings per sample above which a quiet frame looks like a fricative
+    zcr_margin_db: float = 8.0  # how far below the energy threshold such frames are still accepted
+    calibration_ms: int = 300  # leading audio whose quietest frame seeds the noise floor
+    max_seed_floor_db: float = -35.0  # seed cap, so an utterance at the very start is not taken for noise
+    noise_rise_db_per_s: float = 2.0  # how fast the floor may climb towards louder frames
+    noise_fall: float = 0.1  # smoothing factor towards frames quieter than the floor
+
+    def frames(self, milliseconds: int) -> int:
+        return max(1, round(milliseconds / self.frame_ms))
+
+    def frame_size(self, sample_rate: int = STT_SAMPLE_RATE) -> int:
+        return sample_rate * self.frame_ms // 1000
+
+
+@dataclass(frozen=True)
+class VADEvent:
+    """speech_start / speech_end at an absolute sample offset of the stream."""
+
+    kind: str
+    sample: int
+
+
+@dataclass(frozen=True)
+class TrimResult:
+    """Speech kept by trim_silence() and where it came from in the original clip."""
+
+    samples: np.ndarray
+    segments: Tuple[Tuple[int, int], ...]  # padded (start, end) offsets kept from the original clip
+    original_samples: int
+    sample_rate: int = STT_SAMPLE_RATE
+
+    @property
+    def has_speech(self) -> bool:
+        return bool(self.segments)
+
+    @property
+    def original_seconds(self) -> float:
+        return self.original_samples / self.sample_rate
+
+    @property
+    def trimmed_seconds(self) -> float:
+        return self.samples.size / self.sample_rate
+
+
+def frame_energy_db(frames: np.ndarray) -> np.ndarray:
+    """Mean power of each row of a (n_frames, frame_size) array in dBFS"""
+    power = np.mean(np.square(frames, dtype=np.float64), axis=1)
+    return 10.0 * np.log10(power + _EPSILON)
+
+
+def frame_zero_crossing_rate(frames: np.ndarray) -> np.ndarray:
+    """Fraction of adjacent sample pairs that change sign, per row"""
+    signs = np.signbit(frames)
+    return np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+
+class StreamingVAD:
+    """Incremental speech segmenter; feed it chunks of any size with process()."""
+
+    def __init__(self, config: VADConfig = VADConfig(), sample_rate: int = STT_SAMPLE_RATE):
+        self.config = config
+        self.sample_rate = sample_rate
+        self._frame_size = config.frame_size(sample_rate)
+        self._start_frames = config.frames(config.start_ms)
+        self._hangover_frames = config.frames(config.hangover_ms)
+        self._calibration_frames = config.frames(config.calibration_ms)
+        self._noise_rise_db = config.noise_rise_db_per_s * config.frame_ms / 1000
+        # below this the threshold is min_energy_db anyway; keeps dropouts from sinking the floor
+        self._lowest_floor_db = config.min_energy_db - config.noise_margin_db
+
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._calibration: Optional[List[Tuple[float, float]]] = []  # (energy, zcr) until the floor is seeded
+        self._frame_index = 0  # frames decided so far
+        self._noise_floor_db = self._lowest_floor_db
+        self._in_speech = False
+        self._voiced_run = 0  # loud or fricative frames in a row
+        self._loud_run = 0  # frames above the energy threshold in a row
+        self._silent_run = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._in_speech
+
+    def process(self, samples: np.ndarray) -> List[VADEvent]:
+        """Consume samples and return the segment boundaries they complete"""
+        audio = np.concatenate((self._pending, samples)) if self._pending.size else samples
+        n_frames = audio.size // self._frame_size
+        self._pending = audio[n_frames * self._frame_size :].copy()
+        if n_frames == 0:
+            return []
+
+        frames = audio[: n_frames * self._frame_size].reshape(n_frames, self._frame_size)
+        events: List[VADEvent] = []
+        for energy, zcr in zip(frame_energy_db(frames).tolist(), frame_zero_crossing_rate(frames).tolist()):
+            if self._calibration is not None:
+                self._calibration.append((energy, zcr))
+                if len(self._calibration) >= self._calibration_frames:
+                    self._finish_calibration(events)
+                continue
+            self._step(energy, zcr, events)
+        return events
+
+    def flush(self) -> List[VADEvent]:
+        """End of input: close an open segment at the last sample consumed"""
+        events: List[VADEvent] = []
+        if self._calibration is not None:
+            self._finish_calibration(events)
+        if not self._in_speech:
+            return events
+        if self._silent_run:
+            end = (self._frame_index - self._silent_run) * self._frame_size
+        else:
+            end = self._frame_index * self._frame_size + self._pending.size
+        self._in_speech = False
+        self._voiced_run = self._loud_run = self._silent_run = 0
+        return events + [VADEvent("speech_end", end)]
+
+    def _finish_calibration(self, events: List[VADEvent]) -> None:
+        """Seed the floor from the buffered leading frames, then decide them in order"""
+        frames, self._calibration = self._calibration, None
+        if frames:
+            quietest = min(energy for energy, _ in frames)
+            self._noise_floor_db = max(self._lowest_floor_db, min(quietest, self.config.max_seed_floor_db))
+        for energy, zcr in frames:
+            self._step(energy, zcr, events)
+
+    def _step(self, energy_db: float, zcr: float, events: List[VADEvent]) -> None:
+        config = self.config
+        threshold = max(config.min_energy_db, self._noise_floor_db + config.noise_margin_db)
+        loud = energy_db > threshold
+        # a fricative alone never opens a segment (broadband noise also crosses zero a lot),
+        # but it extends one and is kept at its start
+        fricative = not loud and zcr > config.zcr_threshold and energy_db > threshold - config.zcr_margin_db
+
+        # slow-rising minimum over every frame: quieter frames pull the floor down quickly,
+        # louder ones (speech or a noise source that just started) raise it a little per frame
+        if energy_db < self._noise_floor_db:
+            self._noise_floor_db += config.noise_fall * (energy_db - self._noise_floor_db)
+            self._noise_floor_db = max(self._noise_floor_db, self._lowest_floor_db)
+        else:
+            self._noise_floor_db = min(energy_db, self._noise_floor_db + self._noise_rise_db)
+
+        if self._in_speech:
+            self._silent_run = 0 if loud or fricative else self._silent_run + 1
+            if self._silent_run >= self._hangover_frames:
+                self._in_speech = False
+                self._voiced_run = self._loud_run = 0
+                last_voiced = self._frame_index - self._silent_run + 1
+                events.append(VADEvent("speech_end", last_voiced * self._frame_size))
+        else:
+            self._voiced_run = self._voiced_run + 1 if loud or fricative else 0
+            self._loud_run = self._loud_run + 1 if loud else 0
+            if self._loud_run >= self._start_frames:
+                self._in_speech = True
+                self._silent_run = 0
+                first_voiced = self._frame_index - self._voiced_run + 1
+                events.append(VADEvent("speech_start", first_voiced * self._frame_size))
+        self._frame_index += 1
+
+
+def speech_segments(samples: np.ndarray, config: VADConfig = VADConfig()) -> List[Tuple[int, int]]:
+    """(start, end) sample offsets of the speech found in a whole clip"""
+    vad = StreamingVAD(config)
+    events = vad.process(samples) + vad.flush()
+    starts = [event.sample for event in events if event.kind == "speech_start"]
+    ends = [event.sample for event in events if event.kind == "speech_end"]
+    return list(zip(starts, ends))
+
+
+def trim_silence(
+    samples: np.ndarray,
+    config: VADConfig = VADConfig(),
+    padding_ms: int = 200,
+    max_pause_ms: int = 500,
+) -> TrimResult:
+    """
+    Cut leading/trailing silence and shorten pauses to at most max_pause_ms.
+
+    Each speech segment keeps padding_ms of context on both sides so soft onsets and
+    word endings are not clipped; what remains of a longer pause is taken half from
+    its start and half from its end, keeping the original background noise.
+    """
+    padding = padding_ms * STT_SAMPLE_RATE // 1000
+    max_pause = max_pause_ms * STT_SAMPLE_RATE // 1000
+
+    padded: List[Tuple[int, int]] = []
+    for start, end in speech_segments(samples, config):
+        start, end = max(0, start - padding), min(samples.size, end + padding)
+        if padded and start <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], max(padded[-1][1], end))
+        else:
+            padded.append((start, end))
+
+    if not padded:
+        return TrimResult(np.zeros(0, dtype=np.float32), (), samples.size)
+
+    pieces = [samples[padded[0][0] : padded[0][1]]]
+    for (_, previous_end), (start, end) in zip(padded, padded[1:]):
+        if start - previous_end > max_pause:
+            head = max_pause // 2
+            pieces.append(samples[previous_end : previous_end + head])
+            pieces.append(samples[start - (max_pause - head) : start])
+        else:
+            pieces.append(samples[previous_end:start])
+        pieces.append(samples[start:end])
+
+    return TrimResult(np.concatenate(pieces).astype(np.float32, copy=False), tuple(padded), samples.size)
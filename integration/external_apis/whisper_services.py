@@ -2,6 +2,7 @@ import asyncio
 from pathlib import Path
 from typing import Any, Dict
 
+import numpy as np
 import structlog
 
 try:
@@ -18,6 +19,7 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+from integration.external_apis.audio_decoding import to_wav_bytes
 from shared.interfaces.stt_interface import (
     AudioFormatError,
     ServiceConfigurationError,
@@ -28,6 +30,11 @@ from shared.interfaces.stt_interface import (
 logger = structlog.get_logger(__name__)
 
 
+def _whisper_language(language: str) -> str:
+    """Whisper espera códigos ISO 639-1: 'es-ES' -> 'es'"""
+    return language.split("-")[0].lower()
+
+
 class WhisperLocalService(STTServiceInterface):
     """
     Implementación del servicio STT usando OpenAI Whisper en local.
@@ -97,23 +104,32 @@ class WhisperLocalService(STTServiceInterface):
         if not self._is_supported_format(audio_path):
             raise AudioFormatError(f"Formato de audio no soportado: {audio_path.suffix}", "whisper_local")
 
+        logger.info("Iniciando transcripción con Whisper local", audio_file=str(audio_path))
+        return await self._transcribe(str(audio_path), kwargs)
+
+    async def transcribe_buffer(self, audio: np.ndarray, **kwargs) -> str:
+        """
+        Transcribe muestras float32 mono a 16 kHz: Whisper acepta el array directamente,
+        sin fichero temporal ni ffmpeg.
+        """
+        logger.info("Iniciando transcripción con Whisper local", samples=int(audio.size))
+        return await self._transcribe(np.ascontiguousarray(audio, dtype=np.float32), kwargs)
+
+    async def _transcribe(self, audio: str | np.ndarray, kwargs: Dict[str, Any]) -> str:
         try:
             # Configurar opciones de transcripción
             options = {
-                "language": kwargs.get("language", "es"),  # español por defecto
+                "language": _whisper_language(kwargs.get("language", "es")),  # español por defecto
                 "task": kwargs.get("task", "transcribe"),  # transcribe o translate
                 "verbose": kwargs.get("verbose", False),
             }
-
-            logger.info(
-                "Iniciando transcripción con Whisper local",
-                audio_file=str(audio_path),
-                options=options,
-            )
+            if kwargs.get("initial_prompt"):
+                # contexto del segmento anterior (transcripción en streaming)
+                options["initial_prompt"] = kwargs["initial_prompt"]
 
             # Ejecutar transcripción en un executor para no bloquear el loop
             loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, lambda: self._model.transcribe(str(audio_path), **options))
+            result = await loop.run_in_executor(None, lambda: self._model.transcribe(audio, **options))
 
             transcribed_text = result.get("text", "").strip()
 
@@ -213,12 +229,26 @@ class WhisperAPIService(STTServiceInterface):
                 "whisper_api",
             )
 
-        try:
-            logger.info("Iniciando transcripción con Whisper API", audio_file=str(audio_path))
+        logger.info("Iniciando transcripción con Whisper API", audio_file=str(audio_path))
+        return await self._transcribe(audio_path.name, audio_path.read_bytes(), kwargs)
+
+    async def transcribe_buffer(self, audio: np.ndarray, **kwargs) -> str:
+        """Sube las muestras como un WAV construido en memoria, sin fichero temporal."""
+        wav_bytes = to_wav_bytes(audio)
+        if len(wav_bytes) > self.MAX_FILE_SIZE:
+            raise STTServiceError(
+                f"Audio demasiado grande: {len(wav_bytes) / (1024 * 1024):.1f}MB. Máximo: 25MB",
+                "whisper_api",
+            )
+
+        logger.info("Iniciando transcripción con Whisper API", samples=int(audio.size))
+        return await self._transcribe("audio.wav", wav_bytes, kwargs)
 
+    async def _transcribe(self, filename: str, content: bytes, kwargs: Dict[str, Any]) -> str:
+        try:
             # Ejecutar llamada API en un executor
             loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, self._transcribe_sync, audio_path, kwargs)
+            result = await loop.run_in_executor(None, self._transcribe_sync, filename, content, kwargs)
 
             transcribed_text = result.text.strip()
 
@@ -233,15 +263,14 @@ class WhisperAPIService(STTServiceInterface):
             logger.error("Error en transcripción Whisper API", error=str(e))
             raise STTServiceError(f"Error durante la transcripción: {str(e)}", "whisper_api", e)
 
-    def _transcribe_sync(self, audio_path: Path, kwargs: Dict[str, Any]):
+    def _transcribe_sync(self, filename: str, content: bytes, kwargs: Dict[str, Any]):
         """Método síncrono para la transcripción API."""
-        with open(audio_path, "rb") as audio_file:
-            return self._client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language=kwargs.get("language", "es"),
-                response_format="text",
-            )
+        return self._client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(filename, content),
+            language=_whisper_language(kwargs.get("language", "es")),
+            response_format="text",
+        )
 
     def _is_supported_format(self, audio_path: Path) -> bool:
         """Verifica si el formato de audio es soportado."""
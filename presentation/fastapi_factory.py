@@ -17,11 +17,11 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from application.api.v1 import audio, chat, health
+from application.api.v1 import audio, chat, health, metrics
 from application.models.responses import ErrorResponse, StatusEnum
 from integration.configuration.settings import get_cors_config, get_settings
 from shared.exceptions.exceptions import EXCEPTION_STATUS_CODES, VoiceFlowException
-from shared.utils.dependencies import initialize_services
+from shared.utils.dependencies import cleanup_services, initialize_services
 
 # Configure structured logging
 logging.basicConfig(
@@ -74,6 +74,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down VoiceFlow PoC Web UI")
+    await cleanup_services()
 
 
 def create_application() -> FastAPI:
@@ -102,6 +103,7 @@ def create_application() -> FastAPI:
     app.include_router(health.router, prefix="/api/v1", tags=["health"])
     app.include_router(audio.router, prefix="/api/v1", tags=["audio"])
     app.include_router(chat.router, prefix="/api/v1", tags=["chat"])
+    app.include_router(metrics.router, prefix="/api/v1", tags=["metrics"])
 
     # Setup static files and templates
     static_path = Path(__file__).parent / "static"
@@ -4,8 +4,9 @@ These abstractions allow for easy testing, mocking, and future implementations.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional  # noqa: F401
+from typing import Any, AsyncIterator, Dict, List, Optional  # noqa: F401
 
 
 class AudioProcessorInterface(ABC):
@@ -93,21 +94,85 @@ class AuthInterface(ABC):
 
 class StorageInterface(ABC):
     """
-    Interface for data persistence (future implementation).
+    Interface for conversation persistence.
     Allows easy switching between local storage, database, or cloud storage.
+
+    Messages are dicts with id, timestamp (ISO), user_message, ai_response and
+    message_type; sessions are dicts with session_id, created_at, last_activity,
+    message_count and session_type.
     """
 
     @abstractmethod
     async def save_conversation(self, session_id: str, conversation: List[Dict[str, Any]]) -> bool:
-        """Save conversation to storage"""
+        """Save (replace) a whole conversation"""
         pass
 
     @abstractmethod
     async def load_conversation(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
-        """Load conversation from storage"""
+        """Load conversation messages in order, or None if the session does not exist"""
         pass
 
     @abstractmethod
     async def delete_conversation(self, session_id: str) -> bool:
-        """Delete conversation from storage"""
+        """Delete conversation and its session"""
+        pass
+
+    @abstractmethod
+    async def append_message(self, session_id: str, message: Dict[str, Any]) -> None:
+        """Append one message, creating the session if needed"""
+        pass
+
+    @abstractmethod
+    async def load_all_messages(self) -> List[Dict[str, Any]]:
+        """All messages of all sessions in timestamp order, each tagged with session_id"""
+        pass
+
+    @abstractmethod
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get session metadata"""
+        pass
+
+    @abstractmethod
+    async def list_sessions(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """List sessions, most recent activity first"""
+        pass
+
+    @abstractmethod
+    async def clear_messages(self, session_id: str) -> bool:
+        """Remove the messages of a session but keep the session"""
         pass
+
+    @abstractmethod
+    async def clear_all(self) -> int:
+        """Delete every session; returns how many were deleted"""
+        pass
+
+    async def iter_messages(
+        self,
+        session_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream messages tagged with session_id, optionally for one session and within
+        [start, end); each session's messages come in order. Implementations read in
+        bounded chunks; this fallback loads everything.
+        """
+        if session_id is None:
+            messages = await self.load_all_messages()
+        else:
+            messages = [
+                {**message, "session_id": session_id} for message in await self.load_conversation(session_id) or []
+            ]
+        for message in messages:
+            timestamp = datetime.fromisoformat(message["timestamp"])
+            if (start is None or timestamp >= start) and (end is None or timestamp < end):
+                yield message
+
+    async def close(self) -> None:
+        """Release connections and flush pending writes"""
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend counters (sizes, evictions, pending writes); empty when not tracked"""
+        return {}
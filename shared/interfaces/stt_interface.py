@@ -1,7 +1,14 @@
+import tempfile
+import wave
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import numpy as np
+
+# Frecuencia de los buffers en memoria (la que espera Whisper)
+STT_SAMPLE_RATE = 16000
+
 
 class STTServiceInterface(ABC):
     """
@@ -28,6 +35,34 @@ class STTServiceInterface(ABC):
         """
         pass
 
+    async def transcribe_buffer(self, audio: np.ndarray, **kwargs) -> str:
+        """
+        Transcribe audio ya decodificado en memoria.
+
+        Las implementaciones que aceptan arrays o push streams (Whisper local, Azure)
+        lo sobrescriben para no tocar disco; por defecto se escribe un WAV temporal y se
+        delega en transcribe_audio().
+
+        Args:
+            audio: Muestras float32 mono a STT_SAMPLE_RATE, en [-1, 1]
+            **kwargs: Parámetros adicionales específicos del servicio
+
+        Returns:
+            str: Texto transcrito
+        """
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
+        try:
+            with wave.open(str(temp_path), "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(STT_SAMPLE_RATE)
+                wav_file.writeframes(pcm)
+            return await self.transcribe_audio(temp_path, **kwargs)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
     @abstractmethod
     def is_service_available(self) -> bool:
         """
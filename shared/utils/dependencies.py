@@ -3,14 +3,29 @@ Dependency injection setup for FastAPI.
 Implements SOLID DIP principle for loose coupling.
 """
 
+import asyncio
+from typing import Optional
+
+import structlog
 from fastapi import Depends
 
 from application.orchestration.backend_adapter import LocalBackendAdapter
+from application.orchestration.nlu_shadow import shutdown_shadow_comparator
 from application.services.audio_service import AudioService
 from application.services.conversation_service import ConversationService
+from application.services.transcription_jobs import shutdown_transcription_job_queue
+from business.domains.tourism.venue_store import shutdown_venue_store
 from integration.configuration.settings import Settings, get_settings
+from integration.external_apis.ffmpeg_decoder import get_ffmpeg_decoder_pool, shutdown_ffmpeg_decoder_pool
 from integration.external_apis.ner_factory import NERServiceFactory
 from integration.external_apis.nlu_factory import NLUServiceFactory
+from integration.external_apis.spacy_batcher import shutdown_spacy_batcher
+from integration.external_apis.spacy_ner_service import SpacyNERService
+from integration.external_apis.spacy_procpool_ner_service import (
+    SpacyProcessPoolNERService,
+    shutdown_spacy_process_pool,
+)
+from integration.external_apis.stt_registry import get_stt_agent_registry
 from shared.interfaces.interfaces import (
     AudioProcessorInterface,
     BackendInterface,
@@ -19,15 +34,24 @@ from shared.interfaces.interfaces import (
 from shared.interfaces.ner_interface import NERServiceInterface
 from shared.interfaces.nlu_interface import NLUServiceInterface
 
+logger = structlog.get_logger(__name__)
+
+
+_audio_service: Optional[AudioService] = None
+_stt_preload_task: Optional[asyncio.Task] = None
+
 
 def get_audio_processor(
     settings: Settings = Depends(get_settings),
 ) -> AudioProcessorInterface:
     """
     Dependency injection for audio processor.
-    Returns appropriate implementation based on configuration.
+    One process-wide instance; the STT agent behind it is shared too (see stt_registry).
     """
-    return AudioService(settings)
+    global _audio_service
+    if _audio_service is None:
+        _audio_service = AudioService(settings)
+    return _audio_service
 
 
 def get_backend_adapter(settings: Settings = Depends(get_settings)) -> BackendInterface:
@@ -61,14 +85,21 @@ def get_nlu_service(
     return NLUServiceFactory.create_from_settings(settings)
 
 
+_conversation_service: Optional[ConversationService] = None
+
+
 def get_conversation_service(
     settings: Settings = Depends(get_settings),
 ) -> ConversationInterface:
     """
     Dependency injection for conversation service.
-    Can be easily switched to database-backed implementation.
+    One process-wide instance, so history survives across requests; the storage
+    backend (in-memory, SQLite or Redis) is selected by settings.database_url.
     """
-    return ConversationService(settings)
+    global _conversation_service
+    if _conversation_service is None:
+        _conversation_service = ConversationService(settings)
+    return _conversation_service
 
 
 # Service initialization
@@ -84,11 +115,17 @@ async def initialize_services():
         settings = get_settings()
         _backend_service = LocalBackendAdapter(settings)
 
-        # Initialize audio service
-        _audio_service = AudioService(settings)
+        # Initialize audio service; the STT agent warms up in the background
+        get_audio_processor(settings)
+        preload_stt_agent(settings)
+        # Pre-spawn the ffmpeg processes that decode compressed uploads (webm/opus)
+        get_ffmpeg_decoder_pool(settings).start()
 
-        # Initialize conversation service
-        _conversation_service = ConversationService(settings)
+        # Initialize conversation service (shared by every request)
+        get_conversation_service(settings)
+
+        # Load NER models once per process so requests never pay spacy.load()
+        await preload_ner_models(settings)
 
         # Initialize auth service (stub for future)
         _auth_service = None
@@ -103,22 +140,67 @@ async def initialize_services():
         raise
 
 
+async def preload_ner_models(settings: Settings) -> None:
+    """
+    Eagerly load spaCy NER models (process-wide registry, or the worker pool for spacy_procpool).
+    Failures are logged and reported through health readiness, never raised.
+    """
+    if not (settings.ner_enabled and settings.ner_preload_models):
+        return
+
+    try:
+        ner_service = NERServiceFactory.create_from_settings(settings)
+        if isinstance(ner_service, SpacyNERService) and ner_service.is_service_available():
+            await asyncio.to_thread(ner_service.preload_models)
+        elif isinstance(ner_service, SpacyProcessPoolNERService):
+            # Workers load their models in parallel; readiness is reported on /health/ner
+            ner_service.start()
+    except Exception as error:
+        logger.warning("NER model preload failed", error=str(error))
+
+
+def preload_stt_agent(settings: Settings) -> None:
+    """
+    Create the shared STT agent in a background thread, so startup is not blocked by
+    whisper.load_model or the Azure client; /health/audio reports "loading" until it is ready.
+    """
+    global _stt_preload_task
+    if not settings.stt_preload_agent:
+        return
+
+    registry = get_stt_agent_registry()
+    registry.mark_loading()
+    _stt_preload_task = asyncio.create_task(asyncio.to_thread(registry.get))
+
+
 # Cleanup function
 async def cleanup_services():
     """
     Clean up services during application shutdown.
     """
-    global _backend_service, _audio_service, _conversation_service
+    global _backend_service, _audio_service, _conversation_service, _stt_preload_task
 
     try:
+        await shutdown_shadow_comparator()
+        await shutdown_transcription_job_queue()
+        await asyncio.to_thread(shutdown_spacy_batcher)
+        await asyncio.to_thread(shutdown_spacy_process_pool)
+        await asyncio.to_thread(shutdown_ffmpeg_decoder_pool)
+        shutdown_venue_store()
+
         if _backend_service:
             pass
 
-        if _audio_service:
-            pass
+        if _stt_preload_task is not None:
+            # the load runs in a thread and cannot be interrupted; let it finish
+            await asyncio.gather(_stt_preload_task, return_exceptions=True)
+            _stt_preload_task = None
+
+        _audio_service = None
 
         if _conversation_service:
-            pass
+            await _conversation_service.close()
+            _conversation_service = None
 
         print("Services cleaned up successfully")
 
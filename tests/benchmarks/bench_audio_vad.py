@@ -0,0 +1,137 @@
+"""STT audio and latency saved by trimming silence (energy + ZCR VAD) before transcription.
+
+Usage:
+    poetry run python tests/benchmarks/bench_audio_vad.py --clips 40
+    poetry run python tests/benchmarks/bench_audio_vad.py --recordings grabaciones/*.wav --real-stt
+
+Without --recordings, synthetic clips shaped like the app's voice notes are used:
+1-3 s of room noise before and after, syllable-like harmonic bursts with fricatives
+and 0.2-2.5 s pauses. Without --real-stt, STT is simulated with a cost proportional
+to the audio it receives (--rtf seconds per audio second), which is how the Whisper
+API and Azure bill and roughly how they answer; --real-stt uses the configured agent.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import structlog
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from integration.configuration.settings import Settings  # noqa: E402
+from integration.external_apis.audio_decoding import decode_wav  # noqa: E402
+from integration.external_apis.voice_activity import VADConfig, trim_silence  # noqa: E402
+from shared.interfaces.stt_interface import STT_SAMPLE_RATE  # noqa: E402
+
+
+def synthetic_clip(rng: np.random.Generator) -> np.ndarray:
+    def noise(seconds: float, level: float = 0.002) -> np.ndarray:
+        return (level * rng.standard_normal(int(seconds * STT_SAMPLE_RATE))).astype(np.float32)
+
+    def syllable() -> np.ndarray:
+        seconds = rng.uniform(0.12, 0.35)
+        t = np.arange(int(seconds * STT_SAMPLE_RATE)) / STT_SAMPLE_RATE
+        pitch = rng.uniform(100, 220)
+        voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 6))
+        envelope = np.sin(np.pi * t / seconds) * rng.uniform(0.1, 0.4)
+        parts = [(voiced * envelope).astype(np.float32)]
+        if rng.random() < 0.3:  # /s/-like onset
+            parts.insert(0, noise(rng.uniform(0.05, 0.12), level=0.02))
+        return np.concatenate(parts)
+
+    pieces = [noise(rng.uniform(1.0, 3.0))]
+    for _ in range(rng.integers(2, 5)):  # phrases
+        pieces.extend(syllable() for _ in range(rng.integers(4, 12)))
+        pieces.append(noise(rng.uniform(0.2, 2.5)))
+    pieces.append(noise(rng.uniform(1.0, 3.0)))
+    return np.concatenate(pieces)
+
+
+def load_clips(args) -> list:
+    if args.recordings:
+        return [decode_wav(Path(path).read_bytes()) for path in args.recordings]
+    rng = np.random.default_rng(args.seed)
+    return [synthetic_clip(rng) for _ in range(args.clips)]
+
+
+def make_transcriber(args):
+    if args.real_stt:
+        from integration.external_apis.stt_agent import create_stt_agent
+
+        agent = create_stt_agent()
+        return lambda samples: agent.transcribe_buffer(samples, language=args.language)
+
+    async def simulated(samples: np.ndarray) -> str:
+        await asyncio.sleep(args.rtf * samples.size / STT_SAMPLE_RATE)
+        return "..."
+
+    return simulated
+
+
+async def run(args) -> None:
+    settings = Settings()
+    config = VADConfig(min_energy_db=settings.audio_vad_min_energy_db)
+    clips = load_clips(args)
+    transcribe = make_transcriber(args)
+
+    original_seconds = trimmed_seconds = 0.0
+    vad_ms, full_ms, trimmed_ms = [], [], []
+    silent = 0
+    for clip in clips:
+        start = time.perf_counter()
+        trimmed = trim_silence(
+            clip, config, padding_ms=settings.audio_vad_padding_ms, max_pause_ms=settings.audio_vad_max_pause_ms
+        )
+        vad_ms.append((time.perf_counter() - start) * 1000)
+        original_seconds += trimmed.original_seconds
+        trimmed_seconds += trimmed.trimmed_seconds
+
+        start = time.perf_counter()
+        await transcribe(clip)
+        full_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        if trimmed.has_speech:
+            await transcribe(trimmed.samples)
+        else:
+            silent += 1
+        trimmed_ms.append((time.perf_counter() - start) * 1000 + vad_ms[-1])
+
+    print(f"clips={len(clips)} silent={silent} stt={'real' if args.real_stt else f'simulated rtf={args.rtf}'}")
+    print(
+        f"audio sent to STT: {original_seconds:.1f}s -> {trimmed_seconds:.1f}s "
+        f"({100 * (1 - trimmed_seconds / original_seconds):.1f}% less)"
+    )
+    print(f"VAD cost: p50={statistics.median(vad_ms):.2f} ms/clip max={max(vad_ms):.2f} ms/clip")
+    for label, values in (("full clip", full_ms), ("trimmed", trimmed_ms)):
+        print(
+            f"{label:>9}: stt latency p50={statistics.median(values):.0f} ms "
+            f"mean={statistics.fmean(values):.0f} ms max={max(values):.0f} ms"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recordings", nargs="*", help="WAV files to use instead of synthetic clips")
+    parser.add_argument("--clips", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--rtf", type=float, default=0.1, help="simulated STT seconds per audio second")
+    parser.add_argument("--real-stt", action="store_true", help="transcribe with the configured STT agent")
+    parser.add_argument("--language", default="es-ES")
+    args = parser.parse_args()
+
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
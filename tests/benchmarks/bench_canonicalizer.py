@@ -0,0 +1,113 @@
+"""Microbenchmark for tourism data canonicalization.
+
+Measures a full canonicalize_tourism_data() call on a typical tool payload and
+compares facility matching with a linear scan of the map keys (previous
+implementation) against the compiled keyword matcher as the vocabulary grows.
+
+Usage:
+    poetry run python tests/benchmarks/bench_canonicalizer.py --iterations 20000
+"""
+
+import argparse
+import functools
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from business.core.canonicalizer import (  # noqa: E402
+    FACILITY_MAP,
+    _compile_exact,
+    _KeywordMatcher,
+    _normalize_text,
+    canonicalize_tourism_data,
+)
+
+PAYLOAD = {
+    "venue": {
+        "name": "Museo Reina Sofía",
+        "type": "museum",
+        "accessibility_score": 8.8,
+        "certification": "ONCE_certified",
+        "facilities": ["Rampas de acceso", "Baños adaptados", "audioguía en español", "ascensor", "cafetería"],
+    },
+    "routes": [
+        {"transport": "metro", "line": "L1", "duration": "10 min", "accessibility": "full", "cost": "1.50€"},
+        {"transport": "bus", "line": "27", "duration": "22 min", "accessibility": "acceso parcial", "cost": "1.50€"},
+    ],
+    "accessibility": {"accessibility_level": "Acceso completo", "accessibility_score": 8.8, "facilities": "rampas"},
+}
+FACILITIES = ["servicio de rampas de acceso", "zona de descanso", "bucle auditivo en taquilla", "plazas reservadas"]
+
+
+def _linear(items, mapping):
+    out = []
+    for item in items:
+        tl = _normalize_text(item).lower()
+        mapped = mapping.get(tl)
+        if not mapped:
+            for key, value in mapping.items():
+                if key in tl:
+                    mapped = value
+                    break
+        out.append(mapped or tl.replace(" ", "_")[:60])
+    return out
+
+
+def _compiled(items, exact, matcher):
+    out = []
+    for item in items:
+        tl = _normalize_text(item).lower()
+        out.append(exact.get(tl) or matcher.first_match(tl) or tl.replace(" ", "_")[:60])
+    return out
+
+
+def _vocabulary(size: int, rng: random.Random) -> dict[str, str]:
+    # Synthetic keys that never match, followed by the real map so matches sit at the end of a scan.
+    mapping = {}
+    while len(mapping) < size - len(FACILITY_MAP):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(6, 14)))
+        mapping[f"{word} adaptado"] = f"facility_{len(mapping)}"
+    mapping.update(FACILITY_MAP)
+    return mapping
+
+
+def _time_us(iterations: int, func, *args) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(*args)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[12, 100, 1000, 10000])
+    args = parser.parse_args()
+    rng = random.Random(5)
+
+    print(f"canonicalize_tourism_data: {_time_us(args.iterations, canonicalize_tourism_data, PAYLOAD):.1f} us/call")
+    print(f"{'keys':>6} {'linear scan':>14} {'compiled':>12} {'compiled+memo':>15}")
+    for size in args.sizes:
+        mapping = _vocabulary(max(size, len(FACILITY_MAP)), rng)
+        exact = _compile_exact(mapping)
+        matcher = _KeywordMatcher(exact)
+        assert _linear(FACILITIES, exact) == _compiled(FACILITIES, exact, matcher)
+        iterations = max(args.iterations // max(size // 100, 1), 50)
+        linear = _time_us(iterations, _linear, FACILITIES, exact)
+        compiled = _time_us(args.iterations, _compiled, FACILITIES, exact, matcher)
+        canonical = functools.lru_cache(maxsize=4096)(
+            lambda tl: exact.get(tl) or matcher.first_match(tl) or tl.replace(" ", "_")[:60]
+        )
+        memo = _time_us(args.iterations, lambda: [canonical(_normalize_text(item).lower()) for item in FACILITIES])
+        print(f"{len(mapping):>6} {linear:>11.1f} us {compiled:>9.1f} us {memo:>12.1f} us")
+
+
+if __name__ == "__main__":
+    main()
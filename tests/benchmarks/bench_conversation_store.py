@@ -0,0 +1,168 @@
+"""Throughput/latency benchmark for the conversation repositories at millions of messages.
+
+Appends --messages conversation pairs spread over --sessions sessions through the async
+API, reporting the enqueue rate seen by request handlers and the committed rate (SQLite
+writes are queued and batched by the writer thread). Then times paginated session listing
+at several offsets and single-conversation loads. With --backend memory the in-memory
+store is used and its size/eviction counters are printed. With --backend redis the
+Redis repository runs against an in-process fakeredis server (or --redis-url); use
+--concurrency to keep several pipelines in flight at once. --export then
+streams everything as NDJSON and compares its traced peak memory with materializing
+all messages through load_all_messages().
+
+Usage:
+    poetry run python tests/benchmarks/bench_conversation_store.py --messages 2000000 --sessions 200000
+    poetry run python tests/benchmarks/bench_conversation_store.py --backend memory --max-messages 500000
+    poetry run python tests/benchmarks/bench_conversation_store.py --backend redis --messages 200000 --concurrency 32
+    poetry run python tests/benchmarks/bench_conversation_store.py --messages 500000 --sessions 50000 --export
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from application.services.conversation_service import ConversationService  # noqa: E402
+from integration.configuration.settings import Settings  # noqa: E402
+from integration.data_persistence.conversation_repository import InMemoryConversationRepository  # noqa: E402
+from integration.data_persistence.redis_repository import RedisConversationRepository  # noqa: E402
+from integration.data_persistence.sqlite_repository import SQLiteConversationRepository  # noqa: E402
+
+
+def _percentiles(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[max(int(len(ordered) * 0.95) - 1, 0)]
+    return f"mean={statistics.mean(ordered):.2f}ms p50={statistics.median(ordered):.2f}ms p95={p95:.2f}ms"
+
+
+async def run(args: argparse.Namespace, path: Path) -> None:
+    rng = random.Random(args.seed)
+    if args.backend == "memory":
+        repo = InMemoryConversationRepository(max_messages=args.max_messages, max_bytes=args.max_bytes)
+    elif args.backend == "redis":
+        if args.redis_url is None:
+            import fakeredis
+
+            client = fakeredis.FakeAsyncRedis(decode_responses=True)
+            repo = RedisConversationRepository("redis://fake", max_session_messages=args.max_messages, client=client)
+        else:
+            repo = RedisConversationRepository(args.redis_url, max_session_messages=args.max_messages)
+        await repo.clear_all()
+    else:
+        repo = SQLiteConversationRepository(path, batch_size=args.batch_size)
+    start_time = datetime(2026, 1, 1)
+    sessions = [f"session-{index}" for index in range(args.sessions)]
+
+    async def append_worker(first: int) -> None:
+        for index in range(first, args.messages, args.concurrency):
+            timestamp = (start_time + timedelta(milliseconds=index * 50)).isoformat()
+            await repo.append_message(
+                rng.choice(sessions),
+                {
+                    "id": f"m{index}",
+                    "timestamp": timestamp,
+                    "user_message": "¿Cómo llego al Museo del Prado en silla de ruedas?",
+                    "ai_response": "Toma la línea 2 hasta Banco de España; la estación es accesible.",
+                    "message_type": "conversation_pair",
+                },
+            )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(append_worker(first) for first in range(args.concurrency)))
+    enqueued = time.perf_counter() - started
+    if args.backend == "sqlite":
+        await repo.flush()
+    committed = time.perf_counter() - started
+    stats = repo.get_stats()
+    if args.backend == "memory":
+        print(f"Appended {args.messages:,} messages: {args.messages / committed:,.0f}/s")
+        print(
+            f"Kept {stats['sessions']:,} sessions / {stats['messages']:,} messages / {stats['bytes'] / 2**20:.1f} MiB; "
+            f"evicted {stats['evicted_sessions_capacity']:,} sessions, {stats['evicted_messages']:,} messages"
+        )
+    elif args.backend == "redis":
+        print(
+            f"Appended {args.messages:,} messages: {args.messages / committed:,.0f}/s "
+            f"({stats['commands_sent']:,} commands in {stats['pipelines_sent']:,} pipelines)"
+        )
+    else:
+        print(
+            f"Appended {args.messages:,} messages: enqueue {args.messages / enqueued:,.0f}/s, "
+            f"committed {args.messages / committed:,.0f}/s in {stats['write_batches']:,} batches"
+        )
+
+    for offset in (0, args.sessions // 2, max(args.sessions - args.page_size, 0)):
+        samples = []
+        for _ in range(args.queries):
+            began = time.perf_counter()
+            page = await repo.list_sessions(limit=args.page_size, offset=offset)
+            samples.append((time.perf_counter() - began) * 1000)
+        print(f"list_sessions(limit={args.page_size}, offset={offset:,}): {_percentiles(samples)} ({len(page)} rows)")
+
+    samples = []
+    for _ in range(args.queries):
+        session_id = rng.choice(sessions)
+        began = time.perf_counter()
+        await repo.load_conversation(session_id)
+        samples.append((time.perf_counter() - began) * 1000)
+    print(f"load_conversation: {_percentiles(samples)}")
+
+    if args.export:
+        service = ConversationService(Settings(), repository=repo)
+        tracemalloc.start()
+        began = time.perf_counter()
+        exported = 0
+        async for chunk in service.export_ndjson():
+            exported += len(chunk)
+        elapsed = time.perf_counter() - began
+        _, streaming_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        materialized = len(await repo.load_all_messages())
+        _, materialized_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"export_ndjson: {exported / 2**20:.1f} MiB in {elapsed:.2f}s, peak {streaming_peak / 2**20:.1f} MiB "
+            f"(load_all_messages of {materialized:,} messages: peak {materialized_peak / 2**20:.1f} MiB)"
+        )
+    await repo.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["sqlite", "memory", "redis"], default="sqlite")
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=2048)
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent appending tasks")
+    parser.add_argument(
+        "--max-messages", type=int, default=100_000_000, help="In-memory message cap / Redis per-session cap"
+    )
+    parser.add_argument("--max-bytes", type=int, default=2**40, help="In-memory byte cap")
+    parser.add_argument("--export", action="store_true", help="Also time a full NDJSON export")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--redis-url", default=None, help="Real server for --backend redis (default: fake)")
+    parser.add_argument("--db", type=Path, default=None, help="Database file (default: temporary directory)")
+    args = parser.parse_args()
+
+    if args.db is not None:
+        asyncio.run(run(args, args.db))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(args, Path(tmp) / "conversations.db"))
+
+
+if __name__ == "__main__":
+    main()
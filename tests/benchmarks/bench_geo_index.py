@@ -0,0 +1,107 @@
+"""Latency benchmark for the grid geospatial index against a NumPy brute-force scan.
+
+Usage:
+    poetry run python tests/benchmarks/bench_geo_index.py --points 100000 --queries 2000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from business.domains.tourism.geo_index import ACCESSIBILITY_RANK, GeoIndex, GeoPoint  # noqa: E402
+
+CATEGORIES = ("restaurant", "hotel", "museum", "entertainment", "metro_station", "bus_stop")
+LEVELS = ("full_wheelchair_access", "partial_wheelchair_access", "partial_access", None)
+
+
+def _points(count: int, rng: random.Random) -> list[GeoPoint]:
+    # Madrid bounding box (~25 x 20 km)
+    return [
+        GeoPoint(
+            f"p{index}",
+            f"Point {index}",
+            "station" if index % 5 == 0 else "venue",
+            rng.choice(CATEGORIES),
+            40.33 + rng.random() * 0.18,
+            -3.83 + rng.random() * 0.30,
+            rng.choice(LEVELS),
+        )
+        for index in range(count)
+    ]
+
+
+def _timed(queries, run) -> list[float]:
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        run(*query)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    return f"mean={statistics.mean(ordered):.3f}ms p50={statistics.median(ordered):.3f}ms p95={p95:.3f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--radius-km", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    points = _points(args.points, rng)
+    started = time.perf_counter()
+    index = GeoIndex(points)
+    print(f"Built index over {len(index)} points in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    lat = np.array([point.lat for point in points])
+    lon = np.array([point.lon for point in points])
+    category = np.array([point.category for point in points])
+    rank = np.array([ACCESSIBILITY_RANK.get(point.accessibility_level, 0) for point in points])
+    scale = np.cos(np.radians(lat.mean()))
+
+    def brute_force(q_lat, q_lon, q_category):
+        mask = (category == q_category) & (rank >= 2)
+        dist = 6371.0 * np.hypot(np.radians(lon[mask] - q_lon) * scale, np.radians(lat[mask] - q_lat))
+        return np.argsort(dist)[: args.k]
+
+    queries = [
+        (40.36 + rng.random() * 0.12, -3.80 + rng.random() * 0.24, rng.choice(CATEGORIES[:4]))
+        for _ in range(args.queries)
+    ]
+    knn = _timed(
+        queries,
+        lambda q_lat, q_lon, q_cat: index.nearest(
+            q_lat, q_lon, k=args.k, category=q_cat, min_accessibility="partial_wheelchair_access"
+        ),
+    )
+    radius = _timed(
+        queries,
+        lambda q_lat, q_lon, q_cat: index.within(
+            q_lat, q_lon, args.radius_km, category=q_cat, min_accessibility="partial_wheelchair_access"
+        ),
+    )
+    brute = _timed(queries, brute_force)
+    print(f"kNN (k={args.k}):          {_summary(knn)}")
+    print(f"radius ({args.radius_km} km):     {_summary(radius)}")
+    print(f"brute-force kNN scan: {_summary(brute)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Per-turn Pydantic validation cost: legacy dict round-trips vs. validated models carried to the API edge.
+
+Legacy flow: canonicalize tool data and LLM data (validate + dump each), backend adapter
+validates + dumps tourism_data and every pipeline step again, ChatResponse validates the
+whole payload and FastAPI re-validates it against response_model before serializing.
+Current flow: tool/LLM data validated once by the canonicalizer, pipeline steps once by
+the adapter, ChatResponse assembled with model_construct and serialized directly.
+
+Usage:
+    poetry run python tests/benchmarks/bench_response_validation.py --turns 2000 [--profile]
+"""
+
+import argparse
+import cProfile
+import pstats
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from application.models.responses import ChatResponse, PipelineStep, StatusEnum, TourismData  # noqa: E402
+from business.core.canonicalizer import canonicalize_tourism_data, canonicalize_tourism_model  # noqa: E402
+
+TOOL_DATA = {
+    "venue": {
+        "name": "Museo del Prado",
+        "type": "museum",
+        "accessibility_score": 9.2,
+        "certification": "ONCE_certified",
+        "facilities": ["wheelchair_ramps", "adapted_bathrooms", "audio_guides", "tactile_paths"],
+        "opening_hours": {"monday_saturday": "10:00-20:00", "sunday": "10:00-19:00"},
+        "pricing": {"general": "15€", "reduced": "7.50€", "disability": "Free"},
+    },
+    "routes": [
+        {
+            "transport": "metro",
+            "line": "L2",
+            "duration": "14 min",
+            "accessibility": "full",
+            "cost": "1.50€",
+            "steps": ["Take Line 2 from Sol to Banco de España (2 stops, 3 min)", "Walk to Museo del Prado (8 min)"],
+        },
+        {
+            "transport": "bus",
+            "line": "2",
+            "duration": "22 min",
+            "accessibility": "full",
+            "cost": "1.50€",
+            "steps": ["Walk to Gran Vía - Montera (4 min)", "Take Bus 2 to Cibeles", "Walk to Museo del Prado"],
+        },
+    ],
+    "accessibility": {"accessibility_level": "full_wheelchair_access", "accessibility_score": 9.2},
+}
+LLM_DATA = {**TOOL_DATA, "venue": {**TOOL_DATA["venue"], "accessibility_score": "9.2"}}
+STEPS = [
+    {"name": name, "tool": tool, "status": "completed", "duration_ms": 12, "summary": f"{name} ok"}
+    for name, tool in (
+        ("NLU", "tourism_nlu"),
+        ("LocationNER", "location_ner"),
+        ("Accessibility", "accessibility_analysis"),
+        ("Routes", "route_planning"),
+        ("Venue Info", "tourism_info"),
+        ("Response", "llm_synthesis"),
+    )
+]
+METADATA = {"timestamp": "2026-01-01T00:00:00", "tool_outputs": {"nlu": {"intent": "route_planning"}}}
+RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
+
+
+def legacy_turn() -> bytes:
+    tool = canonicalize_tourism_data(TOOL_DATA)
+    llm = canonicalize_tourism_data(LLM_DATA) or tool
+    tourism_data = TourismData.model_validate(llm).model_dump()
+    steps = [PipelineStep.model_validate(step).model_dump() for step in STEPS]
+    response = ChatResponse(
+        status="success",
+        message="Message processed successfully",
+        session_id="s",
+        ai_response="...",
+        processing_time=0.5,
+        intent="route_planning",
+        entities={"destination": "Museo del Prado"},
+        tourism_data=tourism_data,
+        pipeline_steps=steps,
+        metadata=METADATA,
+    )
+    # FastAPI (response_model) dumps the returned model and validates it again before serializing
+    validated = RESPONSE_ADAPTER.validate_python(response.model_dump())
+    return RESPONSE_ADAPTER.dump_json(validated)
+
+
+def current_turn() -> bytes:
+    tool = canonicalize_tourism_model(TOOL_DATA)
+    llm = canonicalize_tourism_model(LLM_DATA) or tool
+    steps = [PipelineStep.model_validate(step) for step in STEPS]
+    response = ChatResponse.model_construct(
+        status=StatusEnum.SUCCESS.value,
+        message="Message processed successfully",
+        session_id="s",
+        ai_response="...",
+        processing_time=0.5,
+        intent="route_planning",
+        entities={"destination": "Museo del Prado"},
+        tourism_data=llm,
+        pipeline_steps=steps,
+        metadata=METADATA,
+    )
+    return response.model_dump_json().encode()
+
+
+def _time_us(turns: int, func) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(turns):
+        func()
+    return (time.perf_counter() - started) / turns * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--profile", action="store_true", help="Print the top cProfile entries for each flow")
+    args = parser.parse_args()
+
+    for label, func in (("legacy", legacy_turn), ("current", current_turn)):
+        print(f"{label:>8}: {_time_us(args.turns, func):.1f} us/turn")
+        if args.profile:
+            profiler = cProfile.Profile()
+            profiler.runcall(lambda: [func() for _ in range(args.turns)])
+            pstats.Stats(profiler).sort_stats("tottime").print_stats(8)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Latency benchmark for the accessible route planner on a synthetic city-scale transit feed.
+
+Builds a grid of metro and bus lines (default 70x70 = 4,900 stops, the size of the
+EMT bus + Metro de Madrid network), writes it as a GTFS-style feed and times cold
+(uncached) and warm (cached) origin/venue queries.
+
+Usage:
+    poetry run python tests/benchmarks/bench_route_planner.py --grid 70 --queries 500
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from business.domains.tourism.route_planner import AccessibleRoutePlanner  # noqa: E402
+
+SPACING_DEG = 0.004
+
+
+def _write_feed(directory: Path, grid: int, venues: int, rng: random.Random) -> None:
+    def stop_id(row: int, col: int) -> str:
+        return f"s{row}_{col}"
+
+    with (directory / "stops.txt").open("w", encoding="utf-8") as handle:
+        handle.write("stop_id,stop_name,stop_lat,stop_lon,wheelchair_boarding,elevator\n")
+        for row in range(grid):
+            for col in range(grid):
+                step_free = int(rng.random() < 0.8)
+                handle.write(
+                    f"{stop_id(row, col)},Stop {row}-{col},{40.3 + row * SPACING_DEG:.5f},"
+                    f"{-3.8 + col * SPACING_DEG:.5f},{step_free},{step_free}\n"
+                )
+
+    routes, segments = [], []
+    for index in range(grid):
+        # Every 4th row/column is a metro line, the rest are bus lines.
+        for axis in ("row", "col"):
+            metro = index % 4 == 0
+            route_id = f"{axis}{index}"
+            routes.append(
+                f"{route_id},{route_id},{1 if metro else 3},{int(rng.random() < 0.7)},{4 if metro else 10},1.50"
+            )
+            minutes = 1.5 if metro else 3
+            for step in range(grid - 1):
+                start = stop_id(index, step) if axis == "row" else stop_id(step, index)
+                end = stop_id(index, step + 1) if axis == "row" else stop_id(step + 1, index)
+                segments.append(f"{route_id},{start},{end},{minutes}")
+    (directory / "routes.txt").write_text(
+        "route_id,route_short_name,route_type,low_floor,headway_minutes,fare\n" + "\n".join(routes) + "\n",
+        encoding="utf-8",
+    )
+    (directory / "segments.txt").write_text(
+        "route_id,from_stop_id,to_stop_id,travel_minutes\n" + "\n".join(segments) + "\n", encoding="utf-8"
+    )
+
+    pathways = [
+        f"{stop_id(row, col)},{stop_id(row, col + 1)},6,{int(rng.random() < 0.9)}"
+        for row in range(grid)
+        for col in range(grid - 1)
+    ]
+    (directory / "pathways.txt").write_text(
+        "from_stop_id,to_stop_id,walk_minutes,step_free\n" + "\n".join(pathways) + "\n", encoding="utf-8"
+    )
+
+    access = []
+    for venue in range(venues):
+        row, col = rng.randrange(grid), rng.randrange(grid)
+        access.append(f"venue{venue},{stop_id(row, col)},{rng.randint(2, 8)},1")
+    (directory / "venue_access.txt").write_text(
+        "venue_id,stop_id,walk_minutes,step_free\n" + "\n".join(access) + "\n", encoding="utf-8"
+    )
+
+
+def _percentiles(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    return f"mean={statistics.mean(ordered):.2f}ms p50={statistics.median(ordered):.2f}ms p95={p95:.2f}ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--grid", type=int, default=70, help="Stops per side of the synthetic grid")
+    parser.add_argument("--venues", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        feed = Path(tmp)
+        _write_feed(feed, args.grid, args.venues, rng)
+        started = time.perf_counter()
+        planner = AccessibleRoutePlanner(feed, default_origin="s0_0", cache_size=args.queries * 4)
+        load_ms = (time.perf_counter() - started) * 1000
+        stats = planner.get_stats()
+        print(f"Loaded {stats['stops']} stops, {stats['nodes']} nodes, {stats['edges']} edges in {load_ms:.0f}ms")
+
+        center = args.grid // 2
+        origins = [
+            f"s{rng.randrange(center - 10, center + 10)}_{rng.randrange(center - 10, center + 10)}" for _ in range(20)
+        ]
+        queries = [
+            (rng.choice(origins), f"venue{rng.randrange(args.venues)}", rng.choice(("step_free", "reduced_steps")))
+            for _ in range(args.queries)
+        ]
+        for label in ("cold", "warm"):
+            samples, found = [], 0
+            for origin, venue, profile in queries:
+                started = time.perf_counter()
+                routes = planner.plan_to_venue(venue, origin=origin, profile=profile)
+                samples.append((time.perf_counter() - started) * 1000)
+                found += bool(routes)
+            print(f"{label:>4}: {_percentiles(samples)} ({found}/{len(queries)} with routes)")
+        print(planner.get_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Throughput benchmark: micro-batched spaCy NER vs one-doc-per-executor-call.
+
+Usage:
+    poetry run python tests/benchmarks/bench_spacy_batching.py --model es_core_news_md
+
+Without spaCy (or with --synthetic) a synthetic pipeline with a fixed per-call
+overhead is used, so only the relative shape of the numbers is meaningful.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from integration.external_apis.spacy_batcher import SpacyBatcher  # noqa: E402
+
+SAMPLE_TEXTS = [
+    "Quiero visitar el Museo del Prado en Madrid con silla de ruedas",
+    "Cómo llego a la Sagrada Familia desde la estación de Sants",
+    "Restaurantes accesibles cerca de la Plaza Mayor de Salamanca",
+    "Conciertos este fin de semana en el Palau de la Música de Valencia",
+    "Hoteles adaptados en Sevilla cerca de la Giralda",
+]
+
+
+class SyntheticNLP:
+    """CPU-bound stand-in: fixed cost per call plus a cost per character."""
+
+    def __init__(self, call_overhead_iterations: int = 20_000, per_char_iterations: int = 200):
+        self._call_overhead = call_overhead_iterations
+        self._per_char = per_char_iterations
+
+    def _spin(self, iterations: int) -> None:
+        total = 0
+        for index in range(iterations):
+            total += index
+
+    def __call__(self, text: str):
+        self._spin(self._call_overhead + len(text) * self._per_char)
+        return text
+
+    def pipe(self, texts, batch_size: int = 32):
+        texts = list(texts)
+        self._spin(self._call_overhead + sum(len(text) for text in texts) * self._per_char)
+        return texts
+
+
+def _load_pipeline(model_name: str, synthetic: bool):
+    if not synthetic:
+        try:
+            import spacy
+
+            from integration.external_apis.spacy_ner_service import NER_EXCLUDED_COMPONENTS
+
+            return spacy.load(model_name, exclude=list(NER_EXCLUDED_COMPONENTS)), model_name
+        except Exception as error:
+            print(f"spaCy model unavailable ({error}); using synthetic pipeline")
+    return SyntheticNLP(), "synthetic"
+
+
+async def _run_unbatched(nlp, texts: list[str]) -> float:
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    await asyncio.gather(*(loop.run_in_executor(None, nlp, text) for text in texts))
+    return time.perf_counter() - start
+
+
+async def _run_batched(nlp, texts: list[str], batch_size: int, window_ms: float) -> tuple[float, dict]:
+    batcher = SpacyBatcher(batch_size=batch_size, window_ms=window_ms, queue_size=len(texts))
+    start = time.perf_counter()
+    await asyncio.gather(*(batcher.submit(nlp, text) for text in texts))
+    elapsed = time.perf_counter() - start
+    stats = batcher.get_stats()
+    batcher.stop()
+    return elapsed, stats
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="es_core_news_md")
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    nlp, label = _load_pipeline(args.model, args.synthetic)
+    print(f"pipeline={label} batch_size={args.batch_size} window_ms={args.window_ms}")
+    print(f"{'concurrency':>11} {'unbatched doc/s':>16} {'batched doc/s':>14} {'speedup':>8} {'avg batch':>10}")
+
+    for concurrency in args.concurrency:
+        texts = [SAMPLE_TEXTS[index % len(SAMPLE_TEXTS)] for index in range(concurrency)]
+        unbatched = await _run_unbatched(nlp, texts)
+        batched, stats = await _run_batched(nlp, texts, args.batch_size, args.window_ms)
+        print(
+            f"{concurrency:>11} {concurrency / unbatched:>16.1f} {concurrency / batched:>14.1f}"
+            f" {unbatched / batched:>7.2f}x {stats['avg_batch']:>10.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
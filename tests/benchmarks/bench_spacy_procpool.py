@@ -0,0 +1,90 @@
+"""Throughput benchmark: spacy_procpool worker processes vs the in-process thread executor.
+
+Usage:
+    poetry run python tests/benchmarks/bench_spacy_procpool.py --model es_core_news_md --pool-sizes 1 2 4
+
+Without spaCy (or with --synthetic) a CPU-bound synthetic pipeline that holds
+the GIL is used, which is the contention pattern the process pool removes.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from integration.external_apis.spacy_procpool_ner_service import (  # noqa: E402
+    DEFAULT_MODEL_LOADER,
+    SpacyProcessPool,
+    load_ner_pipeline,
+)
+
+SYNTHETIC_LOADER = "tests.benchmarks.bench_spacy_procpool:synthetic_load"
+TEXT = "Quiero visitar el Museo del Prado en Madrid con silla de ruedas"
+
+
+def synthetic_load(model_name: str):
+    """GIL-bound stand-in for a spaCy pipeline (importable by worker processes)."""
+    del model_name
+
+    def _nlp(text: str):
+        total = 0
+        for index in range(60_000 + len(text) * 200):
+            total += index
+        return SimpleNamespace(ents=[])
+
+    return _nlp
+
+
+async def _run_threads(nlp, requests: int) -> float:
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    await asyncio.gather(*(loop.run_in_executor(None, nlp, TEXT) for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+async def _run_pool(pool: SpacyProcessPool, requests: int) -> float:
+    await pool.extract(TEXT, "es")  # wait for model load
+    start = time.perf_counter()
+    await asyncio.gather(*(pool.extract(TEXT, "es") for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="es_core_news_md")
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    loader_path, nlp = SYNTHETIC_LOADER, synthetic_load(args.model)
+    if not args.synthetic:
+        try:
+            nlp, loader_path = load_ner_pipeline(args.model), DEFAULT_MODEL_LOADER
+        except Exception as error:
+            print(f"spaCy model unavailable ({error}); using synthetic pipeline")
+
+    print(f"loader={loader_path} requests={args.requests} cpu_count={os.cpu_count()}")
+    baseline = await _run_threads(nlp, args.requests)
+    print(f"{'thread executor':>16}: {args.requests / baseline:8.1f} doc/s")
+
+    for pool_size in args.pool_sizes:
+        pool = SpacyProcessPool(pool_size, {"es": args.model}, model_loader=loader_path, request_timeout=120)
+        try:
+            elapsed = await _run_pool(pool, args.requests)
+        finally:
+            pool.stop()
+        print(f"{f'procpool x{pool_size}':>16}: {args.requests / elapsed:8.1f} doc/s ({baseline / elapsed:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))
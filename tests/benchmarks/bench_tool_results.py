@@ -0,0 +1,94 @@
+"""Per-request CPU and allocation: typed tool results vs JSON string round-trips.
+
+Usage:
+    poetry run python tests/benchmarks/bench_tool_results.py --requests 2000
+
+"legacy" replays the previous pipeline shape: each tool returns JSON text, the
+pipeline parses it, and the next tool parses it again. "typed" passes result
+objects between stages and serializes each one once (dict + JSON for the prompt).
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import structlog
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from business.domains.tourism.tools import (  # noqa: E402
+    AccessibilityAnalysisTool,
+    RoutePlanningTool,
+    TourismInfoTool,
+)
+
+USER_INPUT = "¿Cómo llego al Museo del Prado en silla de ruedas?"
+NLU_RAW = json.dumps(
+    {"status": "ok", "intent": "route_planning", "entities": {"destination": "Museo del Prado", "language": "es"}}
+)
+
+ACCESSIBILITY = AccessibilityAnalysisTool()
+ROUTES = RoutePlanningTool()
+VENUE_INFO = TourismInfoTool()
+
+
+def legacy_request() -> dict:
+    accessibility_raw = ACCESSIBILITY._run(NLU_RAW)
+    parsed = {"accessibility": json.loads(accessibility_raw)}
+    routes_raw = ROUTES._run(accessibility_raw)
+    parsed["routes"] = json.loads(routes_raw)
+    venue_raw = VENUE_INFO._run(NLU_RAW)
+    parsed["venue info"] = json.loads(venue_raw)
+    return {"accessibility": accessibility_raw, "routes": routes_raw, "venue info": venue_raw, "parsed": parsed}
+
+
+def typed_request() -> dict:
+    destination = json.loads(NLU_RAW)["entities"]["destination"]
+    results = {
+        "accessibility": ACCESSIBILITY.analyze(destination),
+        "routes": ROUTES.plan(destination, USER_INPUT),
+        "venue info": VENUE_INFO.lookup(destination, USER_INPUT),
+    }
+    serialized = {name: result.to_json() for name, result in results.items()}
+    serialized["parsed"] = {name: result.to_dict() for name, result in results.items()}
+    return serialized
+
+
+def _measure(label: str, request, count: int) -> None:
+    request()  # warm caches (venue store, index memo)
+    cpu_start = time.process_time()
+    for _ in range(count):
+        request()
+    cpu_ms = (time.process_time() - cpu_start) * 1000 / count
+
+    tracemalloc.start()
+    peaks = []
+    for _ in range(min(count, 200)):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        request()
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+
+    print(f"{label:>8}: cpu={cpu_ms:.4f} ms/request peak_alloc={sum(peaks) / len(peaks) / 1024:.1f} KiB/request")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+    _measure("legacy", legacy_request, args.requests)
+    _measure("typed", typed_request, args.requests)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
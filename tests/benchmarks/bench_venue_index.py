@@ -0,0 +1,92 @@
+"""Latency benchmark for the fuzzy venue index at tens of thousands of venues.
+
+Usage:
+    poetry run python tests/benchmarks/bench_venue_index.py --venues 50000 --queries 5000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is importable when running this file directly
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from business.domains.tourism.venue_index import VenueIndex  # noqa: E402
+from business.domains.tourism.venue_store import DEFAULT_VENUE_CATALOG_PATH, VenueStore  # noqa: E402
+
+PREFIXES = ("Museo", "Parque", "Teatro", "Restaurante", "Galería", "Plaza", "Palacio", "Mercado")
+CONSONANTS = "bcdfghjlmnprstvz"
+VOWELS = "aeiou"
+
+
+def _synthetic_venues(count: int, rng: random.Random) -> list[tuple[str, str, list[str]]]:
+    venues = list(VenueStore(DEFAULT_VENUE_CATALOG_PATH).index_entries())
+    seen = {name for name, _, _ in venues}
+    while len(venues) < count:
+        core = " ".join(_word(rng) for _ in range(2))
+        name = f"{rng.choice(PREFIXES)} {core}"
+        if name not in seen:
+            seen.add(name)
+            venues.append((name, "tourism", [core]))
+    return venues
+
+
+def _word(rng: random.Random) -> str:
+    syllables = (rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(rng.randint(2, 4)))
+    return "".join(syllables).title()
+
+
+def _typo(text: str, rng: random.Random) -> str:
+    position = rng.randrange(1, len(text) - 1)
+    return text[:position] + text[position + 1] + text[position] + text[position + 2 :]
+
+
+def _measure(index: VenueIndex, queries: list[str]) -> list[float]:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        index.resolve(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:>14}: mean={statistics.fmean(ordered):.4f} ms p95={p95:.4f} ms max={ordered[-1]:.4f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--venues", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    venues = _synthetic_venues(args.venues, rng)
+    start = time.perf_counter()
+    index = VenueIndex(venues, cache_size=0)
+    print(f"built {len(index)} venues in {time.perf_counter() - start:.2f}s: {index.get_stats()}")
+
+    sample = rng.sample(venues, min(args.queries, len(venues)))
+    _report("exact alias", _measure(index, [aliases[0] if aliases else name for name, _, aliases in sample]))
+    _report("folded name", _measure(index, [name.upper().replace("a", "á") for name, _, _ in sample]))
+    typos = [(_typo(name, rng), name) for name, _, _ in sample]
+    _report("typo (fuzzy)", _measure(index, [query for query, _ in typos]))
+    recall = sum(getattr(index.resolve(query), "name", None) == name for query, name in typos) / len(typos)
+    print(f"{'typo recall':>14}: {recall:.2%}")
+
+    memoized = VenueIndex(venues)
+    queries = [_typo(name, rng) for name, _, _ in sample[:100]] * 50
+    _report("memoized", _measure(memoized, queries))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,30 @@
+"""Executable stand-in for ffmpeg, driven by a prefix in the piped input.
+
+PCM:<bytes>  -> writes <bytes> to stdout (the "decoded" s16le audio)
+SLEEP        -> hangs (exercises the decode timeout)
+anything else -> exits 1 with an ffmpeg-like error on stderr
+"""
+
+import stat
+import sys
+from pathlib import Path
+
+_SCRIPT = """#!{python}
+import sys, time
+data = sys.stdin.buffer.read()
+if data.startswith(b"PCM:"):
+    sys.stdout.buffer.write(data[4:])
+elif data.startswith(b"SLEEP"):
+    time.sleep(30)
+else:
+    sys.stderr.write("pipe:0: Invalid data found when processing input\\n")
+    sys.exit(1)
+"""
+
+
+def write_fake_ffmpeg(directory: Path) -> str:
+    """Write the fake ffmpeg into directory and return its path"""
+    path = directory / "ffmpeg"
+    path.write_text(_SCRIPT.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
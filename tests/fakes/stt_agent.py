@@ -0,0 +1,48 @@
+"""Minimal stand-in for VoiceflowSTTAgent (no Azure / Whisper dependencies)."""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from integration.external_apis.transcription_cache import CachedTranscription
+
+
+class FakeSTTService:
+    def get_service_info(self) -> Dict[str, Any]:
+        return {"service_name": "Fake STT"}
+
+    def is_service_available(self) -> bool:
+        return True
+
+    def get_supported_formats(self) -> List[str]:
+        return ["wav"]
+
+
+class FakeSTTAgent:
+    """Returns a fixed transcription and records every call."""
+
+    def __init__(self, text: str = "hola desde el audio"):
+        self.stt_service = FakeSTTService()
+        self.text = text
+        self.calls: List[Dict[str, Any]] = []
+
+    def get_supported_formats(self) -> List[str]:
+        return self.stt_service.get_supported_formats()
+
+    async def transcribe_audio(self, audio_path: str | Path, **kwargs) -> str:
+        self.calls.append({"audio_path": str(audio_path), "size": Path(audio_path).stat().st_size, **kwargs})
+        return self.text
+
+    async def transcribe_buffer(self, audio: np.ndarray, **kwargs) -> str:
+        self.calls.append({"samples": audio, **kwargs})
+        return self.text
+
+    async def transcribe_audio_cached(self, audio_path: str | Path, **kwargs) -> CachedTranscription:
+        return CachedTranscription(await self.transcribe_audio(audio_path, **kwargs), False)
+
+    async def transcribe_buffer_cached(self, audio: np.ndarray, **kwargs) -> CachedTranscription:
+        return CachedTranscription(await self.transcribe_buffer(audio, **kwargs), False)
+
+    async def health_check(self) -> Dict[str, Any]:
+        return {"status": "healthy"}
@@ -0,0 +1,73 @@
+"""Audio health reads the cached status of the shared STT agent and never builds it."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from application.services.audio_service import AudioService
+from integration.configuration import settings as settings_module
+from integration.configuration.settings import Settings
+from integration.external_apis import stt_registry
+from integration.external_apis.stt_registry import STTAgentRegistry
+from presentation.fastapi_factory import create_application
+from shared.utils import dependencies
+from tests.fakes.stt_agent import FakeSTTAgent
+
+
+async def _wait_for_preload():
+    await dependencies._stt_preload_task
+
+
+@pytest.fixture
+def created(monkeypatch):
+    created = []
+
+    def factory():
+        created.append(1)
+        return FakeSTTAgent()
+
+    monkeypatch.setattr(stt_registry, "_stt_registry", STTAgentRegistry(factory))
+    return created
+
+
+@pytest.mark.integration
+def test_startup_warms_the_agent_and_health_uses_the_cache(created, monkeypatch):
+    monkeypatch.setattr(dependencies, "_audio_service", None)
+    app = create_application()
+
+    with TestClient(app) as client:
+        client.portal.call(_wait_for_preload)
+        audio = client.get("/api/v1/health/audio").json()
+        overall = client.get("/api/v1/health/").json()
+        client.get("/api/v1/health/audio")
+
+    assert dependencies._stt_preload_task is None  # awaited on shutdown
+    assert created == [1]
+    assert audio["ready"] is True
+    assert audio["service_info"]["stt_service"] == "Fake STT"
+    assert audio["service_info"]["real_transcription_available"] is True
+    assert overall["components"]["audio_service"]["status"] == "healthy"
+
+
+@pytest.mark.integration
+def test_health_reports_not_ready_without_creating_the_agent(created, monkeypatch):
+    monkeypatch.setattr(dependencies, "_audio_service", None)
+    app = create_application()
+
+    monkeypatch.setattr(settings_module.settings, "stt_preload_agent", False)
+
+    with TestClient(app) as client:
+        audio = client.get("/api/v1/health/audio").json()
+        overall = client.get("/api/v1/health/").json()
+
+    assert created == []
+    assert audio["ready"] is False
+    assert audio["service_info"]["fallback_mode"] is True
+    assert overall["components"]["audio_service"]["status"] == "not_started"
+
+
+async def test_audio_services_share_one_agent(created):
+    first = await AudioService(Settings())._get_stt_agent()
+    second = await AudioService(Settings())._get_stt_agent()
+
+    assert first is second
+    assert created == [1]
@@ -0,0 +1,145 @@
+"""Uploads in WAV/PCM reach the STT agent as an in-memory buffer; disk is only a fallback."""
+
+import tempfile
+
+import numpy as np
+import pytest
+
+from application.services import audio_service
+from application.services.audio_service import AudioService
+from integration.configuration.settings import Settings
+from integration.external_apis import stt_registry
+from integration.external_apis.audio_decoding import to_pcm16, to_wav_bytes
+from integration.external_apis.ffmpeg_decoder import FFmpegDecoderPool
+from integration.external_apis.stt_registry import STTAgentRegistry
+from integration.external_apis.transcription_cache import CachedTranscription
+from shared.exceptions.exceptions import AudioProcessingException
+from tests.fakes.ffmpeg import write_fake_ffmpeg
+from tests.fakes.stt_agent import FakeSTTAgent
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    agent = FakeSTTAgent()
+    monkeypatch.setattr(stt_registry, "_stt_registry", STTAgentRegistry(lambda: agent))
+    return agent
+
+
+@pytest.fixture
+def no_temp_files(monkeypatch):
+    def forbidden(*args, **kwargs):
+        raise AssertionError("temp file created")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", forbidden)
+
+
+def _speech(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * 16000)) / 16000
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+async def test_wav_upload_is_transcribed_from_memory(agent, no_temp_files):
+    result = await AudioService(Settings()).transcribe_audio(to_wav_bytes(_speech(2.0)), "audio/wav")
+
+    assert result.transcription == agent.text
+    assert result.duration == pytest.approx(2.0)
+    assert agent.calls[0]["samples"].dtype == np.float32
+    assert agent.calls[0]["language"] == "es-ES"
+
+
+async def test_raw_pcm_upload_is_transcribed_from_memory(agent, no_temp_files):
+    result = await AudioService(Settings()).transcribe_audio(to_pcm16(_speech(1.0)), "audio/L16;rate=16000")
+
+    assert result.duration == pytest.approx(1.0)
+    assert agent.calls[0]["samples"].size == 16000
+
+
+async def test_base64_wav_is_transcribed_from_memory(agent, no_temp_files):
+    import base64
+
+    encoded = base64.b64encode(to_wav_bytes(_speech(1.0))).decode()
+
+    assert await AudioService(Settings()).process_base64_audio(encoded, "clip.wav") == agent.text
+    assert "samples" in agent.calls[0]
+
+
+async def test_compressed_upload_falls_back_to_a_temp_file(agent):
+    mp3_like = b"ID3" + b"\x00" * 4000
+
+    result = await AudioService(Settings()).transcribe_audio(mp3_like, "audio/mpeg")
+
+    assert result.transcription == agent.text
+    assert agent.calls[0]["audio_path"].endswith(".mp3")
+    assert agent.calls[0]["size"] == len(mp3_like)
+
+
+async def test_invalid_wav_header_is_rejected_without_disk(no_temp_files):
+    with pytest.raises(AudioProcessingException) as error:
+        await AudioService(Settings()).validate_audio(b"RIFF" + b"\x00" * 2000, "clip.wav")
+
+    assert error.value.error_code == "INVALID_WAV_STRUCTURE"
+
+
+async def test_webm_upload_is_decoded_through_the_ffmpeg_pipe(agent, no_temp_files, tmp_path, monkeypatch):
+    pool = FFmpegDecoderPool(ffmpeg_path=write_fake_ffmpeg(tmp_path), pool_size=1)
+    monkeypatch.setattr(audio_service, "get_ffmpeg_decoder_pool", lambda settings: pool)
+
+    result = await AudioService(Settings()).transcribe_audio(b"PCM:" + to_pcm16(_speech(1.5)), "audio/webm;codecs=opus")
+    pool.close()
+
+    assert result.transcription == agent.text
+    assert result.duration == pytest.approx(1.5)
+    assert agent.calls[0]["samples"].size == 24000
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * 16000), dtype=np.float32)
+
+
+async def test_silence_is_trimmed_before_stt(agent, no_temp_files):
+    clip = np.concatenate((_silence(2.0), _speech(1.0), _silence(4.0), _speech(1.0), _silence(2.0)))
+
+    result = await AudioService(Settings()).transcribe_audio(to_wav_bytes(clip), "audio/wav")
+
+    assert result.transcription == agent.text
+    assert result.speech_detected is True
+    assert result.duration == pytest.approx(10.0)
+    assert result.trimmed_duration < 4.0
+    assert agent.calls[0]["samples"].size == pytest.approx(result.trimmed_duration * 16000)
+
+
+async def test_silent_clip_skips_stt(agent, no_temp_files):
+    result = await AudioService(Settings()).transcribe_audio(to_wav_bytes(_silence(3.0)), "audio/wav")
+
+    assert agent.calls == []
+    assert result.transcription == ""
+    assert result.speech_detected is False
+    assert result.trimmed_duration == 0.0
+
+
+async def test_trimming_can_be_disabled(agent, no_temp_files, monkeypatch):
+    settings = Settings()
+    monkeypatch.setattr(settings, "audio_vad_enabled", False)
+    clip = np.concatenate((_silence(2.0), _speech(1.0)))
+
+    result = await AudioService(settings).transcribe_audio(to_wav_bytes(clip), "audio/wav")
+
+    assert result.trimmed_duration == pytest.approx(3.0)
+    assert agent.calls[0]["samples"].size == clip.size
+
+
+async def test_cache_hit_is_reported(monkeypatch, no_temp_files):
+    class CachingAgent(FakeSTTAgent):
+        async def transcribe_buffer_cached(self, audio, **kwargs):
+            await self.transcribe_buffer(audio, **kwargs)
+            return CachedTranscription(self.text, len(self.calls) > 1)
+
+    agent = CachingAgent()
+    monkeypatch.setattr(stt_registry, "_stt_registry", STTAgentRegistry(lambda: agent))
+    upload = to_wav_bytes(_speech(1.0))
+
+    first = await AudioService(Settings()).transcribe_audio(upload, "audio/wav")
+    retry = await AudioService(Settings()).transcribe_audio(upload, "audio/wav")
+
+    assert (first.cache_hit, retry.cache_hit) == (False, True)
+    assert retry.transcription == first.transcription
@@ -0,0 +1,198 @@
+"""WebSocket streaming transcription: VAD-driven partial and final results."""
+
+import asyncio
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from application.services.streaming_transcription import StreamingTranscriptionSession
+from integration.configuration import settings as settings_module
+from integration.external_apis import stt_registry
+from integration.external_apis.audio_decoding import to_pcm16
+from integration.external_apis.stt_registry import STTAgentRegistry
+from integration.external_apis.voice_activity import VADConfig
+from presentation.fastapi_factory import create_application
+from tests.fakes.stt_agent import FakeSTTAgent
+
+RATE = 16000
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * RATE), dtype=np.float32)
+
+
+class _SlowAgent(FakeSTTAgent):
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+
+    async def transcribe_buffer(self, audio, **kwargs):
+        await asyncio.sleep(self.delay)
+        return await super().transcribe_buffer(audio, **kwargs)
+
+
+async def _run(session, audio: np.ndarray, chunk_seconds: float = 0.1):
+    chunk = int(chunk_seconds * RATE)
+    for offset in range(0, audio.size, chunk):
+        await session.feed(audio[offset : offset + chunk])
+        await asyncio.sleep(0)
+    await session.finish()
+
+
+async def test_session_emits_partials_then_one_final_per_utterance():
+    messages = []
+    agent = FakeSTTAgent("hola")
+
+    async def send(message):
+        messages.append(message)
+
+    session = StreamingTranscriptionSession(agent, send, partial_interval=0.5, vad_config=VADConfig(hangover_ms=300))
+    audio = np.concatenate((_silence(0.5), _tone(2.0), _silence(1.0), _tone(1.0), _silence(1.0)))
+    await _run(session, audio)
+
+    finals = [m for m in messages if m["type"] == "final"]
+    partials = [m for m in messages if m["type"] == "partial"]
+    assert [f["segment"] for f in finals] == [1, 2]
+    assert partials and all(p["segment"] in (1, 2) for p in partials)
+    assert finals[0]["start"] < 0.5 and 2.4 <= finals[0]["end"] <= 3.0
+    # each partial of a segment precedes its final
+    for final in finals:
+        final_index = messages.index(final)
+        assert all(messages.index(p) < final_index for p in partials if p["segment"] == final["segment"])
+    # the second utterance is prompted with the text of the first one
+    assert agent.calls[-1]["initial_prompt"] == "hola"
+    assert session.get_stats()["finals"] == 2
+
+
+async def test_long_utterance_is_split_and_silence_is_not_transcribed():
+    messages = []
+    agent = FakeSTTAgent()
+
+    async def send(message):
+        messages.append(message)
+
+    session = StreamingTranscriptionSession(agent, send, partial_interval=100, max_utterance_seconds=2.0)
+    await _run(session, np.concatenate((_silence(3.0), _tone(5.0))))
+
+    finals = [m for m in messages if m["type"] == "final"]
+    assert len(finals) == 3  # 2 s + 2 s forced, remainder flushed by finish()
+    assert all(call.get("initial_prompt") is not None for call in agent.calls)
+    assert sum(call["samples"].size for call in agent.calls) < 5.5 * RATE
+
+
+async def test_slow_partials_are_skipped_not_queued():
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    session = StreamingTranscriptionSession(_SlowAgent(0.05), send, partial_interval=0.1)
+    await _run(session, np.concatenate((_tone(2.0), _silence(1.0))), chunk_seconds=0.1)
+
+    stats = session.get_stats()
+    assert stats["partials_dropped"] > 0
+    assert stats["finals"] == 1
+
+
+async def test_session_length_is_limited():
+    async def send(message):
+        pass
+
+    session = StreamingTranscriptionSession(FakeSTTAgent(), send, max_session_seconds=1.0)
+    await session.feed(_silence(0.9))
+    with pytest.raises(Exception) as error:
+        await session.feed(_silence(0.2))
+    assert error.value.error_code == "STREAM_TOO_LONG"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(stt_registry, "_stt_registry", STTAgentRegistry(lambda: FakeSTTAgent("buenos días")))
+    monkeypatch.setattr(settings_module.settings, "audio_stream_partial_interval", 0.5)
+    with TestClient(create_application()) as client:
+        yield client
+
+
+@pytest.mark.integration
+def test_websocket_streams_pcm_and_returns_final(client):
+    audio = to_pcm16(np.concatenate((_silence(0.3), _tone(1.5), _silence(1.0))))
+
+    with client.websocket_connect("/api/v1/audio/stream?language=es-ES&format=pcm_s16le") as websocket:
+        assert websocket.receive_json()["type"] == "ready"
+        for offset in range(0, len(audio), 3201):  # odd sizes: samples split across messages
+            websocket.send_bytes(audio[offset : offset + 3201])
+        websocket.send_json({"type": "stop"})
+
+        messages = []
+        while not messages or messages[-1]["type"] != "done":
+            messages.append(websocket.receive_json())
+
+    kinds = [m["type"] for m in messages]
+    assert kinds[0] == "speech_start"
+    assert "final" in kinds
+    final = next(m for m in messages if m["type"] == "final")
+    assert final["text"] == "buenos días"
+    assert messages[-1]["finals"] == 1
+
+
+@pytest.mark.integration
+def test_websocket_rejects_unknown_format(client):
+    with client.websocket_connect("/api/v1/audio/stream?format=flac") as websocket:
+        message = websocket.receive_json()
+
+    assert message["type"] == "error"
+    assert message["code"] == "UNSUPPORTED_FORMAT"
+
+
+@pytest.mark.integration
+def test_websocket_ignores_control_messages_that_are_not_objects(client):
+    with client.websocket_connect("/api/v1/audio/stream") as websocket:
+        assert websocket.receive_json()["type"] == "ready"
+        websocket.send_text('"stop"')
+        websocket.send_text("[1, 2]")
+        websocket.send_json({"type": "stop"})
+
+        assert websocket.receive_json()["type"] == "done"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("sample_rate", [0, -16000, 1_000_000])
+def test_websocket_rejects_invalid_sample_rate(client, sample_rate):
+    with pytest.raises(WebSocketDisconnect) as closed:
+        with client.websocket_connect(f"/api/v1/audio/stream?sample_rate={sample_rate}") as websocket:
+            websocket.receive_json()
+
+    assert closed.value.code == 1008
+
+
+@pytest.mark.integration
+def test_websocket_limits_concurrent_streams(client, monkeypatch):
+    monkeypatch.setattr(settings_module.settings, "audio_stream_max_sessions", 1)
+
+    with client.websocket_connect("/api/v1/audio/stream") as first:
+        assert first.receive_json()["type"] == "ready"
+        with client.websocket_connect("/api/v1/audio/stream") as second:
+            rejected = second.receive_json()
+            with pytest.raises(WebSocketDisconnect) as closed:
+                second.receive_json()
+        first.send_json({"type": "stop"})
+        assert first.receive_json()["type"] == "done"
+
+    assert rejected["code"] == "STREAM_LIMIT"
+    assert closed.value.code == 1013
+    with client.websocket_connect("/api/v1/audio/stream") as again:  # the slot was released
+        assert again.receive_json()["type"] == "ready"
+
+
+@pytest.mark.integration
+def test_stream_config_points_to_the_websocket(client):
+    config = client.post("/api/v1/audio/stream-config").json()["config"]
+
+    assert config["websocket_endpoint"] == "/api/v1/audio/stream"
@@ -0,0 +1,83 @@
+"""Conversation history persists across chat requests through the shared conversation service."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from application.services.conversation_service import ConversationService
+from integration.configuration.settings import Settings
+from presentation.fastapi_factory import create_application
+from shared.utils import dependencies
+from shared.utils.dependencies import get_backend_adapter
+
+
+class EchoBackendService:
+    async def process_query(self, transcription: str, active_profile_id=None):
+        del active_profile_id
+        return {"ai_response": f"Respuesta a: {transcription}", "intent": "general_query", "entities": {}}
+
+
+@pytest.mark.integration
+def test_messages_are_kept_across_requests_in_sqlite(tmp_path, monkeypatch):
+    service = ConversationService(Settings(database_url=f"sqlite:///{tmp_path / 'chat.db'}"))
+    monkeypatch.setattr(dependencies, "_conversation_service", service)
+    app = create_application()
+    app.dependency_overrides[get_backend_adapter] = lambda: EchoBackendService()
+
+    with TestClient(app) as client:
+        first = client.post("/api/v1/chat/message", json={"message": "¿Es accesible el Prado?"}).json()
+        session_id = first["session_id"]
+        client.post("/api/v1/chat/message", json={"message": "¿Y el Retiro?", "conversation_id": session_id})
+
+        conversation = client.get(f"/api/v1/chat/conversation/{session_id}")
+        listing = client.get("/api/v1/chat/conversations", params={"limit": 5}).json()
+        missing = client.get("/api/v1/chat/conversation/unknown")
+        metrics = client.get("/api/v1/metrics/conversations").json()
+
+    app.dependency_overrides.clear()
+
+    assert dependencies._conversation_service is None  # closed on shutdown
+    assert conversation.status_code == 200
+    assert conversation.json()["message_count"] == 2
+    assert conversation.json()["messages"][1]["user_message"] == "¿Y el Retiro?"
+    assert listing["conversations"][0]["session_id"] == session_id
+    assert missing.status_code == 404
+    assert metrics["store"]["backend"] == "SQLiteConversationRepository"
+    assert metrics["store"]["write_errors"] == 0
+
+
+@pytest.mark.integration
+def test_conversations_export_streams_ndjson(monkeypatch):
+    service = ConversationService(Settings())
+    monkeypatch.setattr(dependencies, "_conversation_service", service)
+    app = create_application()
+    app.dependency_overrides[get_backend_adapter] = lambda: EchoBackendService()
+
+    with TestClient(app) as client:
+        first = client.post("/api/v1/chat/message", json={"message": "¿Es accesible el Prado?"}).json()
+        client.post("/api/v1/chat/message", json={"message": "¿Y el Retiro?", "conversation_id": first["session_id"]})
+        client.post("/api/v1/chat/message", json={"message": "¿Hay baños adaptados en Atocha?"})
+
+        export = client.get("/api/v1/chat/conversations/export")
+        one_session = client.get("/api/v1/chat/conversations/export", params={"session_id": first["session_id"]})
+        future = client.get("/api/v1/chat/conversations/export", params={"start": "2999-01-01T00:00:00"})
+        inverted = client.get(
+            "/api/v1/chat/conversations/export", params={"start": "2026-02-01T00:00:00", "end": "2026-01-01T00:00:00"}
+        )
+        missing = client.get("/api/v1/chat/conversations/export", params={"session_id": "unknown"})
+
+    app.dependency_overrides.clear()
+
+    assert export.status_code == 200
+    assert export.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in export.text.splitlines()]
+    assert len(lines) == 3
+    assert {line["session_id"] for line in lines} == {first["session_id"], lines[-1]["session_id"]}
+    assert [line["user_message"] for line in (json.loads(row) for row in one_session.text.splitlines())] == [
+        "¿Es accesible el Prado?",
+        "¿Y el Retiro?",
+    ]
+    assert future.text == ""
+    assert inverted.status_code == 400
+    assert missing.status_code == 404
@@ -0,0 +1,69 @@
+"""Chat endpoint serializes validated backend models without re-validating them."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from application.models.responses import PipelineStep, TourismData
+from presentation.fastapi_factory import create_application
+from shared.utils.dependencies import get_backend_adapter, get_conversation_service
+
+TOURISM_DATA = {
+    "venue": {"name": "Museo del Prado", "type": "museum", "accessibility_score": 9.2},
+    "routes": [{"transport": "metro", "line": "L2", "duration": "14 min", "steps": ["Take Line 2 to Banco de España"]}],
+    "accessibility": {"level": "full_wheelchair_access", "score": 9.2},
+}
+
+
+class ModelBackendService:
+    """Returns TourismData/PipelineStep instances, as LocalBackendAdapter does."""
+
+    def __init__(self):
+        self.steps = [PipelineStep(name="NLU", tool="tourism_nlu", status="completed", duration_ms=5)]
+        self.tourism_data = TourismData.model_validate(TOURISM_DATA)
+
+    async def process_query(self, transcription: str, active_profile_id=None):
+        del transcription, active_profile_id
+        return {
+            "ai_response": "El Prado es totalmente accesible.",
+            "intent": "route_planning",
+            "entities": {"destination": "Museo del Prado"},
+            "pipeline_steps": self.steps,
+            "metadata": {"tool_outputs": {}},
+            "tourism_data": self.tourism_data,
+        }
+
+
+class FakeConversationService:
+    async def add_message(self, user_message: str, ai_response: str, session_id=None):
+        del user_message, ai_response
+        return session_id or "test-session"
+
+
+@pytest.mark.integration
+def test_chat_message_serializes_backend_models_without_revalidation(monkeypatch):
+    backend = ModelBackendService()
+    app = create_application()
+    app.dependency_overrides[get_backend_adapter] = lambda: backend
+    app.dependency_overrides[get_conversation_service] = lambda: FakeConversationService()
+    calls = []
+    original = TourismData.model_validate
+
+    def spy(cls, *args, **kwargs):
+        calls.append(cls.__name__)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(TourismData, "model_validate", classmethod(spy))
+
+    with TestClient(app) as client:
+        response = client.post("/api/v1/chat/message", json={"message": "¿Cómo llego al Prado?"})
+
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert calls == []
+    assert payload["status"] == "success"
+    assert payload["tourism_data"]["venue"]["name"] == "Museo del Prado"
+    assert payload["tourism_data"]["routes"][0]["line"] == "L2"
+    assert payload["pipeline_steps"][0]["duration_ms"] == 5
+    assert payload["timestamp"]
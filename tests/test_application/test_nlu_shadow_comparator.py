@@ -0,0 +1,161 @@
+"""Application tests for the bounded shadow NLU comparison queue."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from application.orchestration import nlu_shadow
+from application.orchestration.backend_adapter import LocalBackendAdapter
+from application.orchestration.nlu_shadow import ShadowNLUComparator
+from application.orchestration.nlu_shadow_metrics import ShadowAgreementStats
+from integration.configuration.settings import Settings, get_settings
+from presentation.fastapi_factory import create_application
+from shared.interfaces.nlu_interface import NLUServiceInterface
+from shared.models.nlu_models import NLUResult
+
+
+class RecordingNLUService(NLUServiceInterface):
+    def __init__(self, intent: str = "route_planning", delay: float = 0.0):
+        self.calls: list[str] = []
+        self._intent = intent
+        self._delay = delay
+
+    async def analyze_text(self, text: str, language: str | None = None, profile_context: dict | None = None):
+        del language, profile_context
+        self.calls.append(text)
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return NLUResult(intent=self._intent, confidence=0.7, provider="keyword")
+
+    def is_service_available(self) -> bool:
+        return True
+
+    def get_supported_languages(self) -> list[str]:
+        return ["es"]
+
+    def get_service_info(self) -> dict:
+        return {"provider": "keyword", "available": True}
+
+
+def _primary_result() -> NLUResult:
+    return NLUResult(intent="route_planning", confidence=0.9, provider="openai", model="gpt-4o-mini")
+
+
+@pytest.mark.unit
+async def test_shadow_comparator_only_calls_shadow_provider():
+    shadow = RecordingNLUService()
+    comparator = ShadowNLUComparator(shadow, queue_size=10, workers=2)
+
+    assert comparator.submit("Cómo llego al Prado", _primary_result()) is True
+    await asyncio.sleep(0.01)
+
+    stats = comparator.get_stats()
+    assert shadow.calls == ["Cómo llego al Prado"]
+    assert stats["submitted"] == 1
+    assert stats["completed"] == 1
+    await comparator.stop()
+
+
+@pytest.mark.unit
+async def test_shadow_comparator_drops_and_counts_when_queue_full():
+    shadow = RecordingNLUService(delay=0.05)
+    comparator = ShadowNLUComparator(shadow, queue_size=2, workers=1)
+
+    accepted = [comparator.submit(f"consulta {index}", _primary_result()) for index in range(5)]
+
+    assert accepted == [True, True, False, False, False]
+    assert comparator.get_stats()["dropped"] == 3
+    await comparator.stop()
+
+
+@pytest.mark.unit
+async def test_shadow_comparator_respects_sample_rate():
+    shadow = RecordingNLUService()
+    comparator = ShadowNLUComparator(shadow, sample_rate=0.0)
+
+    assert comparator.submit("Restaurantes en Madrid", _primary_result()) is False
+
+    stats = comparator.get_stats()
+    assert stats["sampled_out"] == 1
+    assert stats["submitted"] == 0
+    assert shadow.calls == []
+
+
+@pytest.mark.unit
+async def test_backend_adapter_submits_agent_nlu_result_without_rerunning_primary():
+    primary = RecordingNLUService()
+    adapter = LocalBackendAdapter(Settings(use_real_agents=True, nlu_provider="keyword"), nlu_service=primary)
+    comparator = ShadowNLUComparator(RecordingNLUService())
+    comparator.submit = MagicMock(return_value=True)
+    adapter._shadow_comparator = comparator
+
+    primary_result = _primary_result()
+    adapter._schedule_shadow_comparison(
+        "Cómo llego al Prado",
+        {"ai_response": "ok", "metadata": {"nlu_result": primary_result}},
+    )
+
+    assert primary.calls == []
+    comparator.submit.assert_called_once_with("Cómo llego al Prado", primary_result, profile_context=None)
+
+
+@pytest.mark.unit
+def test_agreement_stats_window_evicts_oldest_samples():
+    stats = ShadowAgreementStats(window_size=3)
+
+    stats.record("route_planning", "route_planning", 400, 5)
+    stats.record("event_search", "general_query", 300, 4)
+    stats.record("event_search", "event_search", 200, 3)
+    stats.record("event_search", "event_search", 100, 2)
+
+    snapshot = stats.snapshot()
+    assert snapshot["samples"] == 3
+    assert snapshot["total_recorded"] == 4
+    assert snapshot["agreement_rate"] == pytest.approx(2 / 3, abs=1e-4)
+    assert snapshot["per_intent"] == {"event_search": {"count": 3, "agreement_rate": pytest.approx(2 / 3, abs=1e-4)}}
+    assert snapshot["pairs"][0] == {
+        "primary_intent": "event_search",
+        "shadow_intent": "event_search",
+        "count": 2,
+        "share": pytest.approx(2 / 3, abs=1e-4),
+        "agreement": True,
+    }
+    assert snapshot["latency_ms"]["primary"]["max"] == 300.0
+    assert snapshot["latency_ms"]["shadow"]["histogram"]["<=10"] == 3
+
+
+@pytest.mark.unit
+def test_agreement_stats_bounds_intent_labels():
+    stats = ShadowAgreementStats(window_size=10, max_intents=3)
+
+    for intent in ("a", "b", "c", "d"):
+        stats.record(intent, intent, 1, 1)
+
+    labels = stats.snapshot()["confusion_matrix"]["labels"]
+    assert labels == ["a", "b", "__other__"]
+
+
+@pytest.mark.integration
+async def test_nlu_shadow_metrics_endpoint_reports_completed_comparisons(monkeypatch):
+    comparator = ShadowNLUComparator(RecordingNLUService(intent="general_query"), stats_window=10)
+    monkeypatch.setattr(nlu_shadow, "_shadow_comparator", comparator)
+    comparator.submit("Cómo llego al Prado", _primary_result())
+    await asyncio.sleep(0.01)
+
+    app = create_application()
+    app.dependency_overrides[get_settings] = lambda: Settings(nlu_shadow_mode=True, nlu_provider="keyword")
+    response = TestClient(app).get("/api/v1/metrics/nlu-shadow")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["enabled"] is True
+    assert payload["queue"]["completed"] == 1
+    assert payload["agreement"]["primary_provider"] == "openai"
+    assert payload["agreement"]["agreement_rate"] == 0.0
+    assert payload["agreement"]["confusion_matrix"] == {
+        "labels": ["route_planning", "general_query"],
+        "matrix": [[0, 1], [0, 0]],
+    }
+    await comparator.stop()
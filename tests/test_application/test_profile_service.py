@@ -0,0 +1,21 @@
+"""Profile registry resolution and ranking weight compilation."""
+
+import pytest
+
+from application.services.profile_service import ProfileService
+from business.domains.tourism.ranking import ProfileWeights
+
+
+@pytest.mark.unit
+def test_resolved_profiles_share_weights_compiled_once():
+    service = ProfileService()
+
+    first = service.resolve_profile("night_leisure")
+    second = ProfileService().resolve_profile("night_leisure")
+
+    weights = first["ranking_weights"]
+    assert isinstance(weights, ProfileWeights)
+    assert second["ranking_weights"] is weights
+    assert weights.for_types(["nightclub", "museum", "hotel"]).tolist() == [1.3, 0.8, 1.0]
+    assert service.resolve_profile("unknown") is None
+    assert service.resolve_profile(None) is None
@@ -0,0 +1,195 @@
+"""Async transcription jobs: bounded priority queue, fixed workers, progress and result TTL."""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from application.services import transcription_jobs
+from application.services.transcription_jobs import QueueFullError, TranscriptionJobQueue
+from integration.external_apis import stt_registry
+from integration.external_apis.audio_decoding import to_wav_bytes
+from integration.external_apis.stt_registry import STTAgentRegistry
+from presentation.fastapi_factory import create_application
+from tests.fakes.stt_agent import FakeSTTAgent
+
+
+class _Result:
+    def __init__(self, text: str, error=None):
+        self.transcription = text
+        self.confidence = 0.9
+        self.language = "es-ES"
+        self.duration = 1.0
+        self.trimmed_duration = 0.8
+        self.speech_detected = True
+        self.cache_hit = False
+        self.processing_time = 0.01
+        self.error = error
+
+
+class _GatedAudioService:
+    """Transcribes instantly once `gate` is set; records the order jobs ran in."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.order = []
+
+    async def transcribe_audio(self, audio_data, format, language, on_progress):
+        on_progress("validated", 0.1)
+        await self.gate.wait()
+        on_progress("transcribing", 0.5)
+        self.order.append(audio_data)
+        if audio_data == b"broken":
+            return _Result("Error en la transcripcion: boom", error="boom")
+        return _Result(audio_data.decode())
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+async def _drain(queue):
+    for _ in range(100):
+        await asyncio.sleep(0)
+        stats = queue.get_stats()
+        if stats["queue_depth"] == 0 and stats["busy_workers"] == 0:
+            return
+
+
+async def test_interactive_jobs_run_before_batch_jobs():
+    service = _GatedAudioService()
+    queue = TranscriptionJobQueue(service, queue_size=10, workers=1)
+
+    first = queue.submit(b"first", "audio/wav", "es-ES")
+    await asyncio.sleep(0)  # the only worker takes "first" and waits on the gate
+    batch = queue.submit(b"batch", "audio/wav", "es-ES", priority="batch")
+    interactive = queue.submit(b"interactive", "audio/wav", "es-ES")
+
+    assert first.status == "processing" and first.progress == pytest.approx(0.1)
+    assert queue.queue_position(interactive) == 0
+    assert queue.queue_position(batch) == 1
+    assert queue.get_stats()["queue_depth_by_priority"] == {"interactive": 1, "batch": 1}
+
+    service.gate.set()
+    await _drain(queue)
+    await queue.stop()
+
+    assert service.order == [b"first", b"interactive", b"batch"]
+    assert batch.status == "completed"
+    assert batch.progress == 1.0
+    assert batch.result["transcription"] == "batch"
+    assert batch.audio_data is None  # released after processing
+
+
+async def test_full_queue_rejects_new_jobs():
+    queue = TranscriptionJobQueue(_GatedAudioService(), queue_size=2, workers=1)
+
+    queue.submit(b"a", "audio/wav", "es-ES")
+    await asyncio.sleep(0)
+    queue.submit(b"b", "audio/wav", "es-ES")
+    queue.submit(b"c", "audio/wav", "es-ES")
+    with pytest.raises(QueueFullError) as error:
+        queue.submit(b"d", "audio/wav", "es-ES")
+    await queue.stop()
+
+    assert error.value.retry_after > 0
+    stats = queue.get_stats()
+    assert stats["rejected"] == 1
+    assert stats["submitted"] == 3
+
+
+async def test_failed_transcription_marks_the_job_as_error():
+    service = _GatedAudioService()
+    service.gate.set()
+    queue = TranscriptionJobQueue(service, workers=1)
+
+    job = queue.submit(b"broken", "audio/wav", "es-ES")
+    await _drain(queue)
+    await queue.stop()
+
+    assert job.status == "error"
+    assert job.error == "boom"
+    assert queue.get_stats()["failed"] == 1
+
+
+async def test_finished_results_expire_after_ttl():
+    service = _GatedAudioService()
+    service.gate.set()
+    clock = _Clock()
+    queue = TranscriptionJobQueue(service, workers=1, result_ttl=60.0, clock=clock)
+
+    job = queue.submit(b"done", "audio/wav", "es-ES")
+    await _drain(queue)
+    await queue.stop()
+
+    clock.now += 59
+    assert queue.get(job.job_id) is job
+    clock.now += 2
+    assert queue.get(job.job_id) is None
+    assert queue.get_stats()["expired"] == 1
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(stt_registry, "_stt_registry", STTAgentRegistry(lambda: FakeSTTAgent("hola")))
+    with TestClient(create_application()) as client:
+        yield client
+
+
+def _speech_wav() -> bytes:
+    t = np.arange(16000) / 16000
+    return to_wav_bytes((0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32))
+
+
+@pytest.mark.integration
+def test_async_transcription_reports_progress_until_completed(client):
+    response = client.post(
+        "/api/v1/audio/transcribe-async", files={"audio_file": ("clip.wav", _speech_wav(), "audio/wav")}
+    )
+    assert response.status_code == 200
+    job_id = response.json()["processing_id"]
+
+    for _ in range(50):
+        status = client.get(f"/api/v1/audio/transcribe-status/{job_id}").json()
+        if status["is_complete"]:
+            break
+        time.sleep(0.02)
+
+    assert status["job_status"] == "completed"
+    assert status["progress"] == 1.0
+    assert status["result"]["transcription"] == "hola"
+    assert status["expires_at"] is not None
+    metrics = client.get("/api/v1/metrics/transcription-jobs").json()["jobs"]
+    assert metrics["completed"] == 1
+    assert metrics["wait_seconds"]["samples"] == 1
+
+
+@pytest.mark.integration
+def test_async_transcription_answers_429_when_queue_is_full(client, monkeypatch):
+    class _Stuck:
+        async def transcribe_audio(self, **kwargs):
+            await asyncio.sleep(30)
+
+    monkeypatch.setattr(transcription_jobs, "_job_queue", TranscriptionJobQueue(_Stuck(), queue_size=1, workers=1))
+    files = {"audio_file": ("clip.wav", _speech_wav(), "audio/wav")}
+
+    codes = [client.post("/api/v1/audio/transcribe-async", files=files).status_code for _ in range(3)]
+    rejected = client.post("/api/v1/audio/transcribe-async", files=files)
+
+    assert codes[0] == 200
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.integration
+def test_unknown_priority_and_unknown_job(client):
+    files = {"audio_file": ("clip.wav", _speech_wav(), "audio/wav")}
+
+    assert client.post("/api/v1/audio/transcribe-async?priority=urgent", files=files).status_code == 400
+    assert client.get("/api/v1/audio/transcribe-status/missing").status_code == 404
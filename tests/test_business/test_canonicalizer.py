@@ -0,0 +1,65 @@
+"""Unit tests for tourism data canonicalization."""
+
+import pytest
+
+from business.core import canonicalizer
+from business.core.canonicalizer import (
+    _canonicalize_facilities,
+    _canonicalize_level,
+    _KeywordMatcher,
+    _normalize_text,
+    canonicalize_tourism_data,
+)
+
+
+@pytest.mark.unit
+def test_facilities_map_accented_free_text_and_fallback_tokens():
+    facilities = _canonicalize_facilities("Baños adaptados, Rampas de acceso al edificio, ascensor, Zona VIP")
+
+    assert facilities == ["adapted_bathrooms", "wheelchair_ramps", "elevator_access", "zona_vip"]
+    assert _canonicalize_facilities(["Audioguía en español", "bucle auditivo"]) == ["audio_guides", "hearing_loops"]
+
+
+@pytest.mark.unit
+def test_levels_use_exact_map_then_keyword_priority():
+    assert _canonicalize_level("Acceso parcial") == "partial_wheelchair_access"
+    assert _canonicalize_level("Acceso completo en planta baja") == "full_wheelchair_access"
+    assert _canonicalize_level("partial wheelchair") == "full_wheelchair_access"
+    assert _canonicalize_level("Varía según ubicación") == "varies_by_location"
+    assert _canonicalize_level("desconocido") == "desconocido"
+
+
+@pytest.mark.unit
+def test_keyword_matcher_returns_earliest_declared_keyword():
+    matcher = _KeywordMatcher({"rampa": "ramps", "rampas de acceso": "access", "acceso": "generic", "he": "he"})
+
+    assert matcher.first_match("rampas de acceso") == "ramps"
+    assert matcher.first_match("puerta de acceso") == "generic"
+    assert matcher.first_match("ushers") == "he"
+    assert matcher.first_match("nada") is None
+
+
+@pytest.mark.unit
+def test_normalization_is_memoized_for_non_ascii_text():
+    canonicalizer._fold_accents.cache_clear()
+
+    assert _normalize_text("  Estación  ") == "Estacion"
+    assert _normalize_text("Estación") == "Estacion"
+    assert _normalize_text("plain") == "plain"
+    assert _normalize_text(None) is None
+    assert canonicalizer._fold_accents.cache_info().hits == 1
+
+
+@pytest.mark.unit
+def test_canonicalize_tourism_data_maps_nested_fields():
+    assert canonicalize_tourism_data("not a dict") is None
+    data = canonicalize_tourism_data(
+        {
+            "venue": {"name": "Museo del Prado", "facilities": "rampas; ascensor"},
+            "accessibility": {"level": "Acceso total", "facilities": ["Plazas sillas de ruedas"]},
+        }
+    )
+
+    assert data["venue"]["facilities"] == ["wheelchair_ramps", "elevator_access"]
+    assert data["accessibility"]["level"] == "full_wheelchair_access"
+    assert data["accessibility"]["facilities"] == ["wheelchair_spaces"]
@@ -66,6 +66,19 @@ def test_entity_resolver_rule_5_nlu_normalized_wins_on_fuzzy_match():
     assert result.resolution_source["destination"] == "nlu_normalized"
 
 
+@pytest.mark.unit
+def test_entity_resolver_rule_5_matches_aliases_through_venue_index():
+    resolver = EntityResolver()
+
+    result = resolver.resolve(_nlu_result("Museo Reina Sofia"), ["Reina Sofía"], "Reina Sofía")
+    alias = resolver.resolve(_nlu_result("Parque del Retiro"), ["El Retiro"], "El Retiro")
+
+    assert result.destination == "Museo Reina Sofia"
+    assert result.resolution_source["destination"] == "nlu_normalized"
+    assert alias.resolution_source["destination"] == "nlu_normalized"
+    assert result.conflicts == []
+
+
 @pytest.mark.unit
 def test_entity_resolver_rule_6_real_conflict_prefers_nlu():
     resolver = EntityResolver()
@@ -0,0 +1,99 @@
+"""Unit tests for the grid-based geospatial index and nearby venue search."""
+
+import math
+import random
+
+import pytest
+
+from business.domains.tourism.geo_index import ACCESSIBILITY_RANK, GeoIndex, GeoPoint
+from business.domains.tourism.tools.tourism_info_tool import TourismInfoTool
+
+LEVELS = ("full_wheelchair_access", "partial_wheelchair_access", "partial_access", None)
+
+
+def _random_points(count: int, seed: int = 3) -> list[GeoPoint]:
+    rng = random.Random(seed)
+    return [
+        GeoPoint(
+            id=f"p{index}",
+            name=f"Point {index}",
+            kind=rng.choice(("venue", "station")),
+            category=rng.choice(("restaurant", "hotel", "metro_station")),
+            lat=40.38 + rng.random() * 0.08,
+            lon=-3.74 + rng.random() * 0.10,
+            accessibility_level=rng.choice(LEVELS),
+        )
+        for index in range(count)
+    ]
+
+
+def _brute_force(points, lat, lon, category=None, min_accessibility=None, kind=None):
+    scale = math.cos(math.radians(sum(point.lat for point in points) / len(points)))
+
+    def distance(point):
+        x = math.radians(point.lon - lon) * scale
+        y = math.radians(point.lat - lat)
+        return 6371.0 * math.hypot(x, y)
+
+    minimum = ACCESSIBILITY_RANK.get(min_accessibility, 0)
+    matching = [
+        point
+        for point in points
+        if (category is None or point.category == category)
+        and (kind is None or point.kind == kind)
+        and ACCESSIBILITY_RANK.get(point.accessibility_level, 0) >= minimum
+    ]
+    return sorted(((distance(point), point.id) for point in matching))
+
+
+@pytest.mark.unit
+def test_nearest_matches_brute_force_with_filters():
+    points = _random_points(2000)
+    index = GeoIndex(points, cell_km=0.4)
+
+    for lat, lon in ((40.42, -3.70), (40.381, -3.739), (40.50, -3.60)):
+        expected = _brute_force(points, lat, lon, "restaurant", "partial_wheelchair_access")[:7]
+        found = index.nearest(lat, lon, k=7, category="restaurant", min_accessibility="partial_wheelchair_access")
+
+        assert [match.point.id for match in found] == [point_id for _, point_id in expected]
+        assert found[0].distance_km == pytest.approx(expected[0][0], rel=1e-6)
+
+
+@pytest.mark.unit
+def test_within_returns_every_point_in_radius_sorted():
+    points = _random_points(1500, seed=9)
+    index = GeoIndex(points, cell_km=0.3)
+
+    found = index.within(40.42, -3.70, 1.2, kind="station")
+    expected = [
+        point_id for distance, point_id in _brute_force(points, 40.42, -3.70, kind="station") if distance <= 1.2
+    ]
+
+    assert [match.point.id for match in found] == expected
+    assert all(left.distance_km <= right.distance_km for left, right in zip(found, found[1:]))
+
+
+@pytest.mark.unit
+def test_empty_index_and_exclusions():
+    assert GeoIndex([]).nearest(40.4, -3.7) == []
+    points = _random_points(50)
+    index = GeoIndex(points)
+
+    nearest = index.nearest(40.42, -3.70, k=1)[0]
+    second = index.nearest(40.42, -3.70, k=1, exclude=[nearest.point.id])[0]
+
+    assert second.point.id != nearest.point.id
+    assert second.distance_km >= nearest.distance_km
+
+
+@pytest.mark.unit
+def test_restaurant_search_lists_accessible_restaurants_near_destination():
+    result = TourismInfoTool().lookup("Museo del Prado", "restaurantes accesibles cerca del Prado", "restaurant_search")
+    general = TourismInfoTool().lookup("Museo del Prado", None, "route_planning")
+
+    assert result.venue_name == "Museo del Prado"
+    assert result.nearby_venues[0]["name"] == "Murillo Café"
+    assert all(venue["type"] == "restaurant" for venue in result.nearby_venues)
+    assert result.nearby_venues[0]["nearest_step_free_metro"] == "Estación del Arte"
+    assert result.to_dict()["nearby_venues"] == list(result.nearby_venues)
+    assert general.nearby_venues == ()
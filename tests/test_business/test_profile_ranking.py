@@ -0,0 +1,89 @@
+"""Unit tests for the profile-aware venue and route ranking stage."""
+
+import json
+import math
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from business.domains.tourism.agent import TourismMultiAgent
+from business.domains.tourism.ranking import (
+    NEUTRAL_WEIGHTS,
+    VENUE_DECAY_KM,
+    compile_profile_weights,
+    rank_routes,
+    rank_venues,
+)
+
+NIGHT_BIAS = {"venue_types": {"nightclub": 1.3, "entertainment": 1.2, "museum": 0.8, "park": "n/a"}}
+CANDIDATES = [
+    {"id": "museum", "type": "museum", "accessibility_score": 9.0, "distance_km": 0.5},
+    {"id": "theatre", "type": "entertainment", "accessibility_score": 7.5, "distance_km": 0.6},
+    {"id": "hotel", "type": "hotel", "accessibility_score": 8.0, "distance_km": 2.0},
+]
+
+
+@pytest.mark.unit
+def test_compiled_weights_use_neutral_slot_for_unlisted_and_invalid_types():
+    weights = compile_profile_weights(NIGHT_BIAS, "night_leisure")
+
+    assert weights.profile_id == "night_leisure"
+    assert weights.for_types(["museum", "hotel", "park", "nightclub"]).tolist() == [0.8, 1.0, 1.0, 1.3]
+    assert NEUTRAL_WEIGHTS.for_types(["museum"]).tolist() == [1.0]
+
+
+@pytest.mark.unit
+def test_rank_venues_scores_accessibility_weight_and_distance():
+    neutral = rank_venues(CANDIDATES, NEUTRAL_WEIGHTS)
+    night = rank_venues(CANDIDATES, compile_profile_weights(NIGHT_BIAS), k=2)
+
+    assert [item["id"] for item in neutral] == ["museum", "theatre", "hotel"]
+    assert [item["id"] for item in night] == ["theatre", "museum"]
+    expected = 7.5 / 10 * 1.2 * math.exp(-0.6 / VENUE_DECAY_KM)
+    assert night[0]["rank_score"] == pytest.approx(expected, abs=1e-3)
+    assert "rank_score" not in CANDIDATES[0]
+
+
+@pytest.mark.unit
+def test_rank_routes_prefers_accessible_shorter_routes():
+    routes = [
+        {"transport": "bus", "duration": "20 min", "accessibility": "partial"},
+        {"transport": "metro", "duration": "1 h 5 min", "accessibility": "full"},
+        {"transport": "walking", "duration": "15 min", "accessibility": "full"},
+    ]
+
+    ranked, scores = rank_routes(routes, k=2)
+
+    assert [route["transport"] for route in ranked] == ["walking", "bus"]
+    assert ranked[0] is routes[2]
+    assert scores[0] > scores[1]
+    assert rank_routes([], k=2) == ([], [])
+
+
+@pytest.mark.integration
+def test_pipeline_passes_profile_ranked_top_k_to_prompt(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key-12345")
+    with patch("business.domains.tourism.agent.ChatOpenAI"):
+        agent = TourismMultiAgent(openai_api_key="test-key-12345")
+    nlu = {"status": "ok", "intent": "route_planning", "confidence": 0.9, "entities": {"destination": "Prado"}}
+    ner = {"status": "ok", "locations": ["Prado"], "top_location": "Prado"}
+
+    def run(profile_context):
+        with (
+            patch("business.domains.tourism.agent.TourismNLUTool._arun", new=AsyncMock(return_value=json.dumps(nlu))),
+            patch("business.domains.tourism.agent.LocationNERTool._arun", new=AsyncMock(return_value=json.dumps(ner))),
+        ):
+            return agent._execute_pipeline("¿Cómo llego al Prado?", profile_context=profile_context)
+
+    _, neutral = run(None)
+    tool_results, night = run({"id": "night_leisure", "label": "Ocio nocturno", "ranking_bias": NIGHT_BIAS})
+
+    venues = json.loads(tool_results["venue info"])["nearby_venues"]
+    ranking = night["tool_results_parsed"]["ranking"]
+    assert [venue["name"] for venue in venues] == [venue["name"] for venue in ranking["venues"]]
+    assert len(venues) == agent.ranker.venue_top_k
+    assert all(venue["rank_score"] >= nxt["rank_score"] for venue, nxt in zip(venues, venues[1:]))
+    assert "Teatro de la Zarzuela" in [venue["name"] for venue in venues]
+    assert "Teatro de la Zarzuela" not in [v["name"] for v in neutral["tool_results_parsed"]["ranking"]["venues"]]
+    assert len(json.loads(tool_results["routes"])["routes"]) <= agent.ranker.route_top_k
+    assert night["pipeline_steps"][-1]["tool"] == "profile_ranking"
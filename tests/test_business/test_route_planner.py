@@ -0,0 +1,124 @@
+"""Unit tests for the accessible route planner over the GTFS-style transit feed."""
+
+import pytest
+
+from business.core.canonicalizer import canonicalize_tourism_data
+from business.domains.tourism.route_planner import (
+    DEFAULT_TRANSIT_FEED_PATH,
+    AccessibleRoutePlanner,
+    profile_for_accessibility,
+)
+
+FEED = {
+    "stops.txt": (
+        "stop_id,stop_name,stop_lat,stop_lon,wheelchair_boarding,elevator\n"
+        "a,Alpha,40.4100,-3.7100,1,1\n"
+        "b,Bravo,40.4110,-3.7050,0,0\n"
+        "c,Charlie,40.4120,-3.7000,1,1\n"
+        "d,Delta,40.4090,-3.7050,1,1\n"
+        "bus_a,Alpha Bus,40.4101,-3.7101,1,0\n"
+        "bus_c,Charlie Bus,40.4121,-3.7001,1,0\n"
+    ),
+    "routes.txt": (
+        "route_id,route_short_name,route_type,low_floor,headway_minutes,fare\n"
+        "M1,1,1,0,4,1.50\n"
+        "M2,2,1,0,4,1.50\n"
+        "B9,9,3,1,10,1.50\n"
+    ),
+    "segments.txt": (
+        "route_id,from_stop_id,to_stop_id,travel_minutes\nM1,a,b,2\nM1,b,c,2\nM2,a,d,3\nM2,d,c,3\nB9,bus_a,bus_c,9\n"
+    ),
+    "pathways.txt": "from_stop_id,to_stop_id,walk_minutes,step_free\na,bus_a,1,1\nc,bus_c,1,1\n",
+    "venue_access.txt": "venue_id,stop_id,walk_minutes,step_free\nmuseo,c,4,1\nmuseo,b,1,1\n",
+}
+
+
+@pytest.fixture
+def planner(tmp_path):
+    for name, content in FEED.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    return AccessibleRoutePlanner(tmp_path, default_origin="Alpha")
+
+
+@pytest.mark.unit
+def test_step_free_profile_avoids_stations_without_step_free_access(planner):
+    step_free = planner.plan_to_venue("museo", "Museo", profile="step_free")
+    any_route = planner.plan_to_venue("museo", "Museo", profile="any")
+
+    assert any_route[0]["steps"][0] == "Take Line 1 from Alpha to Bravo (1 stop, 2 min)"
+    assert any_route[0]["accessibility"] == "partial"
+    assert step_free[0]["accessibility"] == "full"
+    assert "step_free_route" in step_free[0]["accessibility_features"]
+    assert all("to Bravo" not in step for route in step_free for step in route["steps"])
+    assert [route["id"] for route in step_free] == ["route_1", "route_2"]
+
+
+@pytest.mark.unit
+def test_routes_use_the_canonical_routes_schema(planner):
+    routes = planner.plan_to_venue("museo", "Museo")
+    bus = next(route for route in routes if route["transport"] == "bus")
+
+    assert bus["steps"][-1] == "Walk to Museo (4 min)"
+    assert bus["cost"] == "1.50€"
+    assert "low_floor_bus" in bus["accessibility_features"]
+    canonical = canonicalize_tourism_data({"venue": {"name": "Museo"}, "routes": routes})
+    assert canonical is not None
+    assert [route["transport"] for route in canonical["routes"]] == [route["transport"] for route in routes]
+
+
+@pytest.mark.unit
+def test_repeated_queries_are_served_from_the_cache(planner):
+    first = planner.plan_to_venue("museo", "Museo")
+    second = planner.plan_to_venue("museo", "Museo")
+
+    assert first == second
+    assert planner.get_stats()["cache_hits"] == 1
+    assert planner.plan_to_venue("unknown-venue") == []
+
+
+@pytest.mark.unit
+def test_fast_pathway_keeps_the_search_optimal(tmp_path):
+    # a 0.5 min pathway between stations 3 km apart is faster than any ride in the feed
+    feed = {
+        "stops.txt": (
+            "stop_id,stop_name,stop_lat,stop_lon,wheelchair_boarding,elevator\n"
+            "a,Alpha,40.4000,-3.7000,1,1\n"
+            "x,Xray,40.4027,-3.7000,1,1\n"
+            "y,Yankee,40.4027,-3.6646,1,1\n"
+            "c,Charlie,40.4000,-3.6646,1,1\n"
+        ),
+        "routes.txt": (
+            "route_id,route_short_name,route_type,low_floor,headway_minutes,fare\n"
+            "M1,1,1,0,4,1.50\n"
+            "M2,2,1,0,4,1.50\n"
+            "M3,3,1,0,4,1.50\n"
+        ),
+        "segments.txt": "route_id,from_stop_id,to_stop_id,travel_minutes\nM1,a,c,10\nM2,a,x,1\nM3,y,c,1\n",
+        "pathways.txt": "from_stop_id,to_stop_id,walk_minutes,step_free\nx,y,0.5,1\n",
+        "venue_access.txt": "venue_id,stop_id,walk_minutes,step_free\nmuseo,c,1,1\n",
+    }
+    for name, content in feed.items():
+        (tmp_path / name).write_text(content, encoding="utf-8")
+
+    (route,) = AccessibleRoutePlanner(tmp_path, default_origin="Alpha").plan_to_venue("museo", "Museo")
+
+    assert route["steps"][1] == "Walk to Yankee (0.5 min)"
+    assert route["duration"] == "8 min"
+
+
+@pytest.mark.unit
+def test_accessibility_need_maps_to_profile():
+    assert profile_for_accessibility("wheelchair") == "step_free"
+    assert profile_for_accessibility(None) == "step_free"
+    assert profile_for_accessibility("movilidad reducida") == "reduced_steps"
+    assert profile_for_accessibility("ninguna") == "any"
+
+
+@pytest.mark.unit
+def test_bundled_feed_routes_sol_to_prado_step_free():
+    planner = AccessibleRoutePlanner(DEFAULT_TRANSIT_FEED_PATH)
+
+    routes = planner.plan_to_venue("museo-del-prado", "Museo del Prado")
+
+    assert routes[0]["steps"][0] == "Take Line 2 from Sol to Banco de España (2 stops, 3 min)"
+    assert all(route["accessibility"] == "full" for route in routes)
@@ -0,0 +1,63 @@
+"""Unit tests for typed tourism tool results and the typed tool entry points."""
+
+import dataclasses
+import json
+
+import pytest
+
+from business.domains.tourism.tools import (
+    AccessibilityAnalysisTool,
+    AccessibilityResult,
+    RoutePlanningTool,
+    TourismInfoTool,
+    VenueInfoResult,
+)
+
+
+@pytest.mark.unit
+def test_tool_results_are_frozen_and_slotted():
+    result = AccessibilityAnalysisTool().analyze("Museo del Prado")
+
+    assert isinstance(result, AccessibilityResult)
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.accessibility_score = 0.0
+
+
+@pytest.mark.unit
+def test_tool_results_must_implement_to_dict():
+    from business.domains.tourism.tools.results import _ToolResult
+
+    @dataclasses.dataclass(frozen=True, slots=True)
+    class Incomplete(_ToolResult):
+        value: int
+
+    with pytest.raises(TypeError):
+        Incomplete(1)
+
+
+@pytest.mark.unit
+def test_typed_entry_points_match_legacy_json_contract():
+    nlu_raw = json.dumps({"entities": {"destination": "el Prado"}})
+
+    venue = TourismInfoTool().lookup("el Prado")
+    legacy = json.loads(TourismInfoTool()._run(nlu_raw))
+
+    assert isinstance(venue, VenueInfoResult)
+    assert {key: value for key, value in venue.to_dict().items() if key != "last_updated"} == {
+        key: value for key, value in legacy.items() if key != "last_updated"
+    }
+    assert json.loads(venue.to_json())["venue"] == {"name": "Museo del Prado", "type": "museum"}
+
+
+@pytest.mark.unit
+def test_route_planning_uses_text_fallback_and_defaults():
+    tool = RoutePlanningTool()
+
+    from_text = tool.plan(None, "quiero ir a un concierto accesible")
+    unknown = tool.plan("general")
+
+    assert from_text.destination == "Espacios musicales Madrid"
+    assert from_text.estimated_cost == "2.50€ + venue ticket"
+    assert unknown.destination is None
+    assert unknown.to_dict()["alternatives"] == ["accessible_taxi", "uber_wam", "accessible_private_transport"]
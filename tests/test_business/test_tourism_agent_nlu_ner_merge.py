@@ -110,3 +110,35 @@ def test_agent_merges_nlu_and_ner_using_ner_override_for_generic_destination(
     assert entities["destination"] == "Valencia"
     assert entities["resolution_source"]["destination"] == "ner_override"
     assert entities["top_location"] == "Valencia"
+
+
+@pytest.mark.integration
+def test_agent_passes_resolved_destination_to_typed_tool_stages(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key-12345")
+
+    with patch("business.domains.tourism.agent.ChatOpenAI"):
+        agent = TourismMultiAgent(openai_api_key="test-key-12345")
+
+    nlu_payload = {
+        "status": "ok",
+        "intent": "route_planning",
+        "confidence": 0.9,
+        "entities": {"destination": "Museo Reina Sofia", "language": "es"},
+    }
+    with (
+        patch(
+            "business.domains.tourism.agent.TourismNLUTool._arun",
+            new=AsyncMock(return_value=json.dumps(nlu_payload)),
+        ),
+        patch(
+            "business.domains.tourism.agent.LocationNERTool._arun",
+            new=AsyncMock(return_value=json.dumps({"status": "ok", "locations": [], "top_location": None})),
+        ),
+    ):
+        tool_results, metadata = agent._execute_pipeline("¿Cómo llego al Reina Sofía?")
+
+    parsed = metadata["tool_results_parsed"]
+    assert parsed["venue info"]["venue"]["name"] == "Museo Reina Sofía"
+    assert parsed["routes"]["routes"][0]["steps"][-1] == "Walk to Museo Reina Sofía (3 min)"
+    assert json.loads(tool_results["routes"]) == parsed["routes"]
+    assert metadata["tourism_data"].accessibility.score == 8.8
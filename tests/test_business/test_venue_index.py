@@ -0,0 +1,108 @@
+"""Unit tests for the shared fuzzy venue index and the tool lookups built on it."""
+
+import json
+
+import pytest
+
+from business.domains.tourism.tools.accessibility_tool import AccessibilityAnalysisTool
+from business.domains.tourism.tools.route_planning_tool import RoutePlanningTool
+from business.domains.tourism.tools.tourism_info_tool import TourismInfoTool
+from business.domains.tourism.venue_index import VenueIndex, fold_name, get_venue_index, resolve_venue, venue_key
+from business.domains.tourism.venue_store import get_venue_store
+
+
+@pytest.mark.unit
+def test_fold_name_strips_accents_case_and_articles():
+    assert fold_name("Museo Reina Sofía!") == "museo reina sofia"
+    assert venue_key("el Prado") == "prado"
+    assert venue_key("Museo del Prado") == "museo prado"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("query", "expected", "method"),
+    [
+        ("Museo Reina Sofia", "Museo Reina Sofía", "exact"),
+        ("el Prado", "Museo del Prado", "exact"),
+        ("Tyssen", "Museo Thyssen", "fuzzy"),
+        ("Museo del Pardo", "Museo del Prado", "fuzzy"),
+        ("hotel cerca del Prado", "Museo del Prado", "contains"),
+    ],
+)
+def test_venue_index_resolves_variants(query, expected, method):
+    match = get_venue_index().resolve(query)
+
+    assert match is not None
+    assert match.name == expected
+    assert match.method == method
+    assert 0.7 <= match.score <= 1.0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("alias", "expected"),
+    [
+        ("Prado Museum", "Museo del Prado"),
+        ("Museo Nacional Centro de Arte Reina Sofía", "Museo Reina Sofía"),
+        ("Thyssen-Bornemisza", "Museo Thyssen"),
+        ("Retiro Park", "Parque del Retiro"),
+        ("Royal Palace", "Palacio Real"),
+        ("Debod", "Templo de Debod"),
+        ("Sala de conciertos", "Espacios musicales Madrid"),
+        ("Zona restaurantes", "Restaurantes accesibles Madrid"),
+        ("Parques", "Parques Madrid"),
+        ("Teatros", "Teatros Madrid"),
+    ],
+)
+def test_catalog_aliases_resolve_exactly(alias, expected):
+    match = get_venue_index().resolve(alias)
+
+    assert (match.name, match.method) == (expected, "exact")
+    assert get_venue_store().find(alias).name == expected
+
+
+@pytest.mark.unit
+def test_venue_index_rejects_unrelated_names():
+    index = get_venue_index()
+
+    assert index.resolve("general") is None
+    assert index.resolve("Madrid") is None
+    assert index.resolve("") is None
+
+
+@pytest.mark.unit
+def test_resolve_venue_returns_store_record_for_aliases_and_free_text():
+    match, record = resolve_venue("concierto")
+    _, from_text = resolve_venue(None, "quiero ir a un restaurante accesible")
+    missing = resolve_venue("general")
+
+    assert match.name == "Espacios musicales Madrid"
+    assert record.id == "espacios-musicales-madrid"
+    assert record.route["cost"] == "2.50€ + venue ticket"
+    assert from_text.id == "restaurantes-accesibles-madrid"
+    assert missing == (None, None)
+
+
+@pytest.mark.unit
+def test_venue_index_memoizes_repeated_queries():
+    index = VenueIndex([("Museo del Prado", "museum", ["Prado"])])
+
+    first = index.resolve("Museo del Pardo")
+    second = index.resolve("Museo del Pardo")
+
+    assert first is second
+    assert index.get_stats()["cache_hits"] == 1
+
+
+@pytest.mark.unit
+def test_tools_resolve_accent_less_and_aliased_destinations():
+    nlu = json.dumps({"entities": {"destination": "Museo Reina Sofia"}})
+
+    accessibility = json.loads(AccessibilityAnalysisTool()._run(nlu))
+    venue = json.loads(TourismInfoTool()._run(json.dumps({"entities": {"destination": "el Prado"}})))
+    route = json.loads(RoutePlanningTool()._run(json.dumps({"destination": "conciertos"})))
+
+    store = get_venue_store()
+    assert accessibility["accessibility_score"] == store.get("museo-reina-sofia").accessibility["accessibility_score"]
+    assert venue["venue"] == {"name": "Museo del Prado", "type": "museum"}
+    assert route["routes"] == store.get("espacios-musicales-madrid").route["routes"]
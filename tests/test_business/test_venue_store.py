@@ -0,0 +1,132 @@
+"""Unit tests for the unified SQLite-backed venue store."""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+from business.domains.tourism.venue_store import (
+    DEFAULT_VENUE_CATALOG_PATH,
+    VenueStore,
+    VenueStoreSchemaError,
+    build_venue_store,
+)
+
+
+def _catalog(name: str = "Museo del Prado", score: float = 9.2) -> dict:
+    return {
+        "version": 1,
+        "defaults": {
+            "accessibility": {"accessibility_score": 6.0},
+            "route": {"routes": [], "cost": "2.50€"},
+            "visitor_info": {"pricing": {}},
+        },
+        "venues": [
+            {
+                "id": "museo-del-prado",
+                "name": name,
+                "type": "museum",
+                "district": "Retiro",
+                "aliases": ["El Prado"],
+                "accessibility": {"accessibility_score": score},
+            },
+            {"id": "parque-del-retiro", "name": "Parque del Retiro", "type": "park", "district": "Retiro"},
+        ],
+    }
+
+
+@pytest.mark.unit
+def test_bundled_catalog_holds_one_record_per_venue_for_all_tools():
+    store = VenueStore(DEFAULT_VENUE_CATALOG_PATH)
+
+    record = store.find("Museo Reina Sofia")
+    music = store.find("Espacios musicales")
+
+    assert record.id == "museo-reina-sofia"
+    assert record.accessibility["certification"] == "ONCE_certified"
+    assert record.route["routes"][0]["transport"] == "metro"
+    assert record.visitor_info["pricing"]["general"] == "12€"
+    assert music.accessibility["accessibility_score"] == 7.5
+    assert music.route["cost"] == "2.50€ + venue ticket"
+    assert store.find("Templo de Debod").route == store.defaults["route"]
+
+
+@pytest.mark.unit
+def test_compiled_sqlite_store_indexes_alias_type_and_district(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps(_catalog()), encoding="utf-8")
+    db_path = tmp_path / "venues.sqlite"
+
+    assert build_venue_store(catalog_path, db_path) == 2
+    store = VenueStore(db_path)
+
+    assert store.find("el prado").id == "museo-del-prado"
+    assert [record.id for record in store.by_type("park")] == ["parque-del-retiro"]
+    assert [record.name for record in store.by_district("Retiro")] == ["Museo del Prado", "Parque del Retiro"]
+    assert store.get("parque-del-retiro").accessibility == {"accessibility_score": 6.0}
+    assert list(store.index_entries())[0] == ("Museo del Prado", "museum", ["El Prado"])
+    store.close()
+
+
+@pytest.mark.unit
+def test_store_loads_lazily_caches_records_and_hot_reloads(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps(_catalog()), encoding="utf-8")
+    store = VenueStore(catalog_path, reload_interval=0.0)
+    assert store._connection is None
+
+    first = store.find("Prado")
+    assert store.find("El Prado") is first
+    assert store.get_stats()["cache_hits"] == 1
+    generation = store.generation
+
+    catalog_path.write_text(json.dumps(_catalog(score=5.0)), encoding="utf-8")
+    stat = catalog_path.stat()
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert store.find("Prado").accessibility == {"accessibility_score": 5.0}
+    assert store.generation == generation + 1
+
+
+@pytest.mark.unit
+def test_failed_reload_keeps_serving_the_previous_catalog(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps(_catalog()), encoding="utf-8")
+    store = VenueStore(catalog_path, reload_interval=0.0)
+    generation = store.generation
+
+    catalog_path.write_text(json.dumps(_catalog(score=5.0))[:40], encoding="utf-8")  # half-written
+    assert store.find("Museo del Prado").accessibility == {"accessibility_score": 9.2}
+
+    catalog_path.unlink()
+    assert store.find("Museo del Prado").id == "museo-del-prado"
+    assert store.generation == generation
+
+    catalog_path.write_text(json.dumps(_catalog(score=5.0)), encoding="utf-8")
+    assert store.find("Museo del Prado").accessibility == {"accessibility_score": 5.0}
+    assert store.generation == generation + 1
+
+
+@pytest.mark.unit
+def test_unreadable_catalog_fails_on_first_load(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text("{", encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        VenueStore(catalog_path).find("Museo del Prado")
+
+
+@pytest.mark.unit
+def test_store_built_with_an_older_schema_is_rejected(tmp_path):
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps(_catalog()), encoding="utf-8")
+    db_path = tmp_path / "venues.sqlite"
+    build_venue_store(catalog_path, db_path)
+    connection = sqlite3.connect(db_path)  # what a build from before the lat/lon columns looks like
+    connection.execute("DELETE FROM store_meta WHERE key = 'schema_version'")
+    connection.commit()
+    connection.close()
+
+    with pytest.raises(VenueStoreSchemaError, match="schema version 1, expected 2"):
+        VenueStore(db_path).find("Museo del Prado")
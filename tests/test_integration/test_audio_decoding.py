@@ -0,0 +1,109 @@
+"""WAV/PCM headers are parsed and decoded to float32 mono 16 kHz straight from bytes."""
+
+import io
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from integration.external_apis.audio_decoding import (
+    decode_audio,
+    decode_pcm16,
+    decode_wav,
+    parse_wav_header,
+    to_pcm16,
+    to_wav_bytes,
+)
+from shared.interfaces.stt_interface import AudioFormatError, STTServiceInterface
+
+
+def _tone(seconds: float, rate: int, frequency: float = 440.0) -> np.ndarray:
+    t = np.arange(int(seconds * rate)) / rate
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def _wav(samples: np.ndarray, rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    interleaved = np.repeat(samples, channels)
+    if sample_width == 2:
+        frames = (interleaved * 32767).astype("<i2").tobytes()
+    else:  # 24-bit
+        values = (interleaved * 8388607).astype("<i4")
+        frames = b"".join(struct.pack("<i", int(v))[:3] for v in values)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(frames)
+    return buffer.getvalue()
+
+
+def test_header_is_parsed_without_touching_disk():
+    info = parse_wav_header(_wav(_tone(1.5, 22050), 22050, channels=2))
+
+    assert (info.channels, info.sample_rate, info.bits_per_sample) == (2, 22050, 16)
+    assert info.frames == 33075
+    assert info.duration == pytest.approx(1.5)
+
+
+@pytest.mark.parametrize("rate,channels,sample_width", [(16000, 1, 2), (44100, 2, 2), (48000, 1, 3)])
+def test_wav_is_decoded_to_16k_mono_float32(rate, channels, sample_width):
+    tone = _tone(0.5, rate)
+    samples = decode_wav(_wav(tone, rate, channels, sample_width))
+
+    assert samples.dtype == np.float32
+    assert samples.size == 8000
+    assert np.max(np.abs(samples)) == pytest.approx(0.5, abs=0.01)
+
+
+def test_float_wav_and_roundtrip_through_to_wav_bytes():
+    tone = _tone(0.25, 16000)
+    float_wav = bytearray(to_wav_bytes(tone))
+    struct.pack_into("<HHIIHH", float_wav, 20, 3, 1, 16000, 64000, 4, 32)
+    payload = tone.astype("<f4").tobytes()
+    struct.pack_into("<I", float_wav, 40, len(payload))
+    float_wav = bytes(float_wav[:44]) + payload
+
+    assert np.allclose(decode_wav(float_wav), tone)
+    assert np.allclose(decode_wav(to_wav_bytes(tone)), tone, atol=1e-4)
+
+
+def test_raw_pcm_and_format_dispatch():
+    tone = _tone(0.25, 16000)
+
+    assert np.allclose(decode_pcm16(to_pcm16(tone)), tone, atol=1e-4)
+    assert decode_audio(to_pcm16(tone), "audio/L16;rate=16000").size == 4000
+    assert decode_audio(to_wav_bytes(tone), "application/octet-stream").size == 4000
+    assert decode_audio(b"\x1aE\xdf\xa3" + b"\x00" * 2000, "audio/webm;codecs=opus") is None
+
+
+def test_malformed_wav_is_rejected():
+    with pytest.raises(AudioFormatError):
+        decode_audio(b"\x00" * 2000, "audio/wav")
+    with pytest.raises(AudioFormatError):
+        parse_wav_header(b"RIFF\x00\x00\x00\x00WAVEjunk\x04\x00\x00\x00abcd")
+
+
+async def test_services_without_buffer_support_get_a_temporary_wav():
+    class FileOnlyService(STTServiceInterface):
+        async def transcribe_audio(self, audio_path, **kwargs):
+            self.path = audio_path
+            self.decoded = decode_wav(audio_path.read_bytes())
+            return "texto"
+
+        def is_service_available(self):
+            return True
+
+        def get_supported_formats(self):
+            return ["wav"]
+
+        def get_service_info(self):
+            return {}
+
+    service = FileOnlyService()
+    tone = _tone(0.5, 16000)
+
+    assert await service.transcribe_buffer(tone, language="es") == "texto"
+    assert np.allclose(service.decoded, tone, atol=1e-4)
+    assert not service.path.exists()
@@ -0,0 +1,278 @@
+"""Tests for the conversation repositories and their selection from settings."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import datetime
+
+import fakeredis
+import pytest
+
+from application.services.conversation_service import ConversationService
+from integration.configuration.settings import Settings
+from integration.data_persistence import redis_repository, sqlite_repository
+from integration.data_persistence.conversation_repository import (
+    InMemoryConversationRepository,
+    create_conversation_repository,
+)
+from integration.data_persistence.redis_repository import RedisConversationRepository
+from integration.data_persistence.sqlite_repository import SQLiteConversationRepository
+
+
+def _message(index: int, timestamp: str) -> dict:
+    return {
+        "id": f"m{index}",
+        "timestamp": timestamp,
+        "user_message": f"pregunta {index}",
+        "ai_response": f"respuesta {index}",
+        "message_type": "conversation_pair",
+    }
+
+
+@pytest.fixture
+def redis_server(monkeypatch):
+    """In-process fakeredis server behind every redis:// URL opened during the test."""
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis_repository.aioredis,
+        "from_url",
+        lambda url, **kwargs: fakeredis.FakeAsyncRedis(server=server, **kwargs),
+    )
+    return server
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+async def repository(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryConversationRepository()
+        return
+    if request.param == "redis":
+        request.getfixturevalue("redis_server")
+        repo = RedisConversationRepository("redis://localhost:6379/0")
+        yield repo
+        await repo.close()
+        return
+    repo = SQLiteConversationRepository(tmp_path / "conversations.db", batch_size=4)
+    yield repo
+    repo.close_sync()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_repositories_share_session_semantics(repository):
+    for index in range(6):
+        await repository.append_message("a" if index % 2 else "b", _message(index, f"2026-01-01T10:00:0{index}"))
+    await repository.append_message("c", _message(9, "2026-01-01T10:00:09"))
+
+    assert [m["id"] for m in await repository.load_conversation("a")] == ["m1", "m3", "m5"]
+    assert [s["session_id"] for s in await repository.list_sessions()] == ["c", "a", "b"]
+    assert [s["session_id"] for s in await repository.list_sessions(limit=1, offset=1)] == ["a"]
+    assert (await repository.get_session("a"))["message_count"] == 3
+    assert (await repository.get_session("a"))["last_activity"] == "2026-01-01T10:00:05"
+    assert [m["id"] for m in await repository.load_all_messages()] == ["m0", "m1", "m2", "m3", "m4", "m5", "m9"]
+
+    assert await repository.clear_messages("a") is True
+    assert await repository.load_conversation("a") == []
+    assert await repository.delete_conversation("b") is True
+    assert await repository.delete_conversation("b") is False
+    assert await repository.load_conversation("b") is None
+    assert await repository.clear_all() == 2
+    assert await repository.list_sessions() == []
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_repositories_stream_messages_by_time_range(repository, monkeypatch):
+    monkeypatch.setattr(sqlite_repository, "_EXPORT_CHUNK_ROWS", 2)  # cross keyset chunk boundaries
+    for index in range(7):
+        await repository.append_message(f"s{index % 2}", _message(index, f"2026-01-01T10:00:0{index}"))
+
+    async def exported(**filters) -> list[tuple[str, str]]:
+        return [(m["session_id"], m["id"]) async for m in repository.iter_messages(**filters)]
+
+    everything = await exported()
+    assert sorted(everything) == sorted((f"s{index % 2}", f"m{index}") for index in range(7))
+    assert [m for s, m in everything if s == "s0"] == ["m0", "m2", "m4", "m6"]  # in order within a session
+
+    window = {"start": datetime(2026, 1, 1, 10, 0, 2), "end": datetime(2026, 1, 1, 10, 0, 5)}
+    assert sorted(m for _, m in await exported(**window)) == ["m2", "m3", "m4"]
+    assert await exported(session_id="s1", **window) == [("s1", "m3")]
+    assert await exported(session_id="missing") == []
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_in_memory_repository_evicts_idle_sessions_by_ttl():
+    clock = FakeClock()
+    repo = InMemoryConversationRepository(ttl_seconds=60, clock=clock)
+    await repo.append_message("old", _message(1, "2026-01-01T10:00:00"))
+    clock.now += 30
+    await repo.append_message("recent", _message(2, "2026-01-01T10:00:30"))
+    clock.now += 40
+
+    assert await repo.load_conversation("old") is None
+    assert [s["session_id"] for s in await repo.list_sessions()] == ["recent"]
+    stats = repo.get_stats()
+    assert stats["evicted_sessions_ttl"] == 1
+    assert (stats["sessions"], stats["messages"]) == (1, 1)
+
+    await repo.append_message("recent", _message(3, "2026-01-01T10:01:10"))
+    clock.now += 50
+    assert [m["id"] for m in await repo.load_conversation("recent")] == ["m2", "m3"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_in_memory_repository_enforces_message_and_byte_caps():
+    repo = InMemoryConversationRepository(max_messages=4)
+    for index, session_id in enumerate(["s1", "s2", "s1", "s3", "s2"]):
+        await repo.append_message(session_id, _message(index, f"2026-01-01T10:00:0{index}"))
+    # s1 is least recently active once s3 and s2 are written, so it goes first
+    assert await repo.get_session("s1") is None
+    assert [s["session_id"] for s in await repo.list_sessions()] == ["s2", "s3"]
+
+    for index in range(5, 9):
+        await repo.append_message("s4", _message(index, f"2026-01-01T10:00:0{index}"))
+    # the session being written is never evicted, only trimmed from its oldest message
+    await repo.append_message("s4", _message(9, "2026-01-01T10:00:09"))
+    assert [m["id"] for m in await repo.load_conversation("s4")] == ["m6", "m7", "m8", "m9"]
+    stats = repo.get_stats()
+    assert stats["messages"] == 4
+    assert stats["evicted_sessions_capacity"] == 3
+    assert stats["evicted_messages"] == 6
+
+    small = InMemoryConversationRepository(max_bytes=1000)
+    for index in range(10):
+        await small.append_message(f"s{index}", _message(index, "2026-01-01T10:00:00"))
+    assert 0 < small.get_stats()["bytes"] <= 1000
+    assert (await small.list_sessions(limit=1))[0]["session_id"] == "s9"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_in_memory_repository_pages_by_recent_activity():
+    repo = InMemoryConversationRepository()
+    for index in range(10):
+        await repo.append_message(f"s{index}", _message(index, "2026-01-01T10:00:00"))
+    await repo.append_message("s3", _message(10, "2026-01-01T10:00:01"))
+
+    first_page = await repo.list_sessions(limit=3)
+    second_page = await repo.list_sessions(limit=3, offset=3)
+    assert [s["session_id"] for s in first_page] == ["s3", "s9", "s8"]
+    assert [s["session_id"] for s in second_page] == ["s7", "s6", "s5"]
+    assert first_page[0]["message_count"] == 2
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_sqlite_repository_persists_in_wal_mode_with_indexes(tmp_path):
+    path = tmp_path / "conversations.db"
+    repo = SQLiteConversationRepository(path)
+    await repo.save_conversation("s1", [_message(1, "2026-01-01T10:00:00"), _message(2, "2026-01-01T10:01:00")])
+    await repo.append_message("s1", _message(3, "2026-01-01T10:02:00"))
+    await repo.close()
+
+    reopened = SQLiteConversationRepository(path)
+    try:
+        assert [m["id"] for m in await reopened.load_conversation("s1")] == ["m1", "m2", "m3"]
+        assert (await reopened.get_session("s1"))["last_activity"] == "2026-01-01T10:02:00"
+        assert reopened.get_stats()["write_errors"] == 0
+    finally:
+        reopened.close_sync()
+
+    connection = sqlite3.connect(path)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    indexes = {row[1] for row in connection.execute("SELECT type, name FROM sqlite_master WHERE type = 'index'")}
+    connection.close()
+    assert {"idx_messages_session", "idx_sessions_last_activity"} <= indexes
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_sqlite_repository_survives_a_failing_write(tmp_path):
+    repo = SQLiteConversationRepository(tmp_path / "conversations.db")
+    try:
+        await repo.append_message("s1", _message(1, "2026-01-01T10:00:00"))
+        await repo.append_message("s1", {**_message(2, "2026-01-01T10:01:00"), "id": 2**70})  # cannot be bound
+        await repo.append_message("s2", _message(3, "2026-01-01T10:02:00"))
+
+        assert [m["id"] for m in await asyncio.wait_for(repo.load_conversation("s1"), 5)] == ["m1"]
+        assert [m["id"] for m in await repo.load_conversation("s2")] == ["m3"]
+        assert repo.get_stats()["write_errors"] == 1
+        assert repo.get_stats()["pending_writes"] == 0
+    finally:
+        repo.close_sync()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_repository_pipelines_caps_and_expires_sessions(redis_server, monkeypatch):
+    repo = RedisConversationRepository("redis://localhost:6379/0", ttl_seconds=60, max_session_messages=3)
+    try:
+        for index in range(5):
+            await repo.append_message("s1", _message(index, f"2026-01-01T10:00:0{index}"))
+        assert repo.get_stats()["pipelines_sent"] == 5  # one round trip per append
+        assert [m["id"] for m in await repo.load_conversation("s1")] == ["m2", "m3", "m4"]
+        assert (await repo.get_session("s1"))["message_count"] == 3
+        assert await repo.client.ttl("voiceflow:messages:s1") == 60
+
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 61)  # clock shared by fakeredis and the repo
+        assert await repo.load_conversation("s1") is None
+        assert await repo.list_sessions() == []
+    finally:
+        await repo.close()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_redis_repository_is_shared_between_workers(redis_server):
+    settings = Settings(database_url="redis://localhost:6379/0")
+    worker_a, worker_b = ConversationService(settings), ConversationService(settings)
+    try:
+        assert isinstance(worker_a.repository, RedisConversationRepository)
+        session_id = await worker_a.add_message("¿Es accesible el Prado?", "Sí, totalmente.")
+        await worker_b.add_message("¿Y el Retiro?", "En su mayor parte.", session_id=session_id)
+
+        # concurrent requests pipeline over the client's connection pool
+        await asyncio.gather(*(worker_b.add_message(f"pregunta {i}", "respuesta") for i in range(20)))
+
+        conversation = await worker_a.get_conversation(session_id)
+        assert [m["user_message"] for m in conversation["messages"]] == ["¿Es accesible el Prado?", "¿Y el Retiro?"]
+        assert len(await worker_a.list_conversations(limit=50)) == 21
+        assert worker_b.get_stats()["backend"] == "RedisConversationRepository"
+    finally:
+        await worker_a.close()
+        await worker_b.close()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_conversation_service_uses_database_url(tmp_path):
+    settings = Settings(database_url=f"sqlite:///{tmp_path / 'chat.db'}")
+    service = ConversationService(settings)
+    try:
+        assert isinstance(service.repository, SQLiteConversationRepository)
+        session_id = await service.add_message("¿Es accesible el Prado?", "Sí, totalmente.")
+        await service.add_message("¿Y el Retiro?", "En su mayor parte.", session_id=session_id)
+
+        conversation = await service.get_conversation(session_id)
+        assert [m["user_message"] for m in conversation["messages"]] == ["¿Es accesible el Prado?", "¿Y el Retiro?"]
+        assert (await service.list_conversations(limit=5))[0]["message_count"] == 2
+        assert (await service.export_conversation(session_id))["statistics"]["total_messages"] == 2
+    finally:
+        await service.close()
+
+    in_memory = create_conversation_repository(Settings(conversation_ttl_seconds=0, conversation_max_messages=50))
+    assert isinstance(in_memory, InMemoryConversationRepository)
+    assert (in_memory.get_stats()["ttl_seconds"], in_memory.get_stats()["max_messages"]) == (0, 50)
+    with pytest.raises(ValueError):
+        create_conversation_repository(Settings(database_url="postgresql://localhost/voiceflow"))
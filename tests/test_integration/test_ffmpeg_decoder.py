@@ -0,0 +1,116 @@
+"""Compressed audio is decoded through pre-spawned ffmpeg pipes with limits and latency stats."""
+
+import io
+import shutil
+import wave
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from integration.external_apis.audio_decoding import to_pcm16
+from integration.external_apis.ffmpeg_decoder import AudioDecodeError, FFmpegDecoderPool
+from tests.fakes.ffmpeg import write_fake_ffmpeg
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = FFmpegDecoderPool(ffmpeg_path=write_fake_ffmpeg(tmp_path), pool_size=2, timeout_seconds=2.0)
+    pool.start()
+    yield pool
+    pool.close()
+
+
+def test_decodes_through_a_warm_process(pool):
+    tone = np.linspace(-0.5, 0.5, 1600, dtype=np.float32)
+
+    samples = pool.decode(b"PCM:" + to_pcm16(tone))
+
+    stats = pool.get_stats()
+    assert np.allclose(samples, tone, atol=1e-4)
+    assert stats["decodes"] == 1
+    assert stats["warm_hits"] == 1
+    assert stats["idle_processes"] == 2  # replaced after use
+    assert stats["latency_ms"]["samples"] == 1
+
+
+def test_concurrent_decodes_are_bounded_by_the_pool(pool):
+    payload = b"PCM:" + b"\x01\x00" * 800
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(lambda _: pool.decode_pcm(payload), range(6)))
+
+    assert all(result == payload[4:] for result in results)
+    assert pool.get_stats()["decodes"] == 6
+
+
+async def test_stream_decoder_delivers_pcm_in_even_chunks(pool):
+    received = []
+
+    async def on_pcm(pcm: bytes):
+        received.append(pcm)
+
+    decoder = pool.open_stream(on_pcm)
+    await decoder.start()
+    for chunk in (b"PCM:", b"\x01\x00\x02", b"\x00\x03\x00"):
+        await decoder.write(chunk)
+    await decoder.finish()
+
+    assert b"".join(received) == b"\x01\x00\x02\x00\x03\x00"
+    assert all(len(pcm) % 2 == 0 for pcm in received)
+    assert pool.get_stats()["streams"] == 1
+
+
+def test_undecodable_input_reports_ffmpeg_error(pool):
+    with pytest.raises(AudioDecodeError) as error:
+        pool.decode_pcm(b"\x1aE\xdf\xa3not really webm")
+
+    assert error.value.reason == "failed"
+    assert "Invalid data found" in error.value.message
+    assert pool.get_stats()["failures"] == 1
+
+
+def test_hung_decode_is_killed_after_the_timeout(tmp_path):
+    pool = FFmpegDecoderPool(ffmpeg_path=write_fake_ffmpeg(tmp_path), pool_size=1, timeout_seconds=0.5)
+
+    with pytest.raises(AudioDecodeError) as error:
+        pool.decode_pcm(b"SLEEP")
+    pool.close()
+
+    assert error.value.reason == "timeout"
+    assert pool.get_stats()["timeouts"] == 1
+
+
+def test_oversized_input_is_rejected_before_spawning(tmp_path):
+    pool = FFmpegDecoderPool(ffmpeg_path=write_fake_ffmpeg(tmp_path), max_input_bytes=1000)
+
+    with pytest.raises(AudioDecodeError) as error:
+        pool.decode_pcm(b"PCM:" + b"\x00" * 2000)
+
+    assert error.value.reason == "rejected"
+    assert pool.get_stats()["spawned"] == 0
+
+
+def test_missing_ffmpeg_is_reported_as_unavailable():
+    pool = FFmpegDecoderPool(ffmpeg_path="definitely-not-ffmpeg")
+
+    with pytest.raises(AudioDecodeError) as error:
+        pool.decode_pcm(b"data")
+
+    assert error.value.reason == "unavailable"
+    assert pool.get_stats()["available"] is False
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+def test_real_ffmpeg_resamples_to_16k_mono():
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(48000)
+        wav_file.writeframes(b"\x00\x10" * 2 * 48000)
+    pool = FFmpegDecoderPool(pool_size=1)
+
+    samples = pool.decode(buffer.getvalue())
+    pool.close()
+
+    assert samples.size == pytest.approx(16000, abs=160)
@@ -0,0 +1,105 @@
+"""Integration tests for the gazetteer (lexicon trie) NER provider."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from integration.configuration.settings import Settings
+from integration.external_apis import spacy_ner_service
+from integration.external_apis.gazetteer_ner_service import GazetteerNERService
+from integration.external_apis.spacy_ner_service import SpacyNERService
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_gazetteer_prefers_longest_match_with_accent_folding():
+    """'Paseo del Prado' wins over the shorter 'prado' alias; accents and case are ignored."""
+    service = GazetteerNERService(settings=Settings(ner_enabled=True))
+
+    result = await service.extract_locations("Quiero pasear por el PASEO DEL PRADO hasta la estacion de Atocha")
+
+    assert result["status"] == "ok"
+    assert result["provider"] == "gazetteer"
+    assert result["locations"] == ["Paseo del Prado", "Estación de Atocha"]
+    assert result["top_location"] == "Paseo del Prado"
+    assert result["matches"][0]["text"] == "PASEO DEL PRADO"
+    assert result["matches"][1]["label"] == "FAC"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_gazetteer_loads_custom_lexicon_and_degrades_on_missing_file(tmp_path):
+    """Lexicon path comes from settings; a missing file yields model_unavailable."""
+    lexicon_path = tmp_path / "lexicon.json"
+    lexicon_path.write_text(
+        json.dumps(
+            {
+                "name": "test",
+                "version": "1",
+                "entries": [{"name": "Sagrada Família", "label": "FAC", "aliases": ["sagrada familia"]}],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    service = GazetteerNERService(settings=Settings(ner_gazetteer_path=str(lexicon_path)))
+    result = await service.extract_locations("Visita a la Sagrada Família", language="es")
+    assert result["locations"] == ["Sagrada Família"]
+    assert result["model"] == "test@1"
+
+    missing = GazetteerNERService(settings=Settings(ner_gazetteer_path=str(tmp_path / "missing.json")))
+    result = await missing.extract_locations("Sagrada Familia")
+    assert result["status"] == "model_unavailable"
+    assert result["locations"] == []
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_spacy_prepass_skips_model_only_on_confident_gazetteer_hit(monkeypatch):
+    """With the pre-pass enabled spaCy is only loaded when the gazetteer has no confident match."""
+    settings = Settings(ner_enabled=True, ner_gazetteer_prepass=True, ner_gazetteer_prepass_min_confidence=0.85)
+    loaded: list[str] = []
+
+    def _load(model_name: str, **_kwargs):
+        loaded.append(model_name)
+        return lambda _text: SimpleNamespace(ents=[SimpleNamespace(text="Cuenca", label_="GPE")])
+
+    spacy_ner_service.get_spacy_model_registry().clear()
+    monkeypatch.setattr(spacy_ner_service, "SPACY_AVAILABLE", True)
+    monkeypatch.setattr(spacy_ner_service, "spacy", SimpleNamespace(load=_load))
+    service = SpacyNERService(settings=settings)
+
+    confident = await service.extract_locations("Cómo llego al Museo del Prado", language="es")
+    assert confident["provider"] == "gazetteer"
+    assert confident["prepass"] is True
+    assert loaded == []
+
+    ambiguous = await service.extract_locations("Algo cerca del retiro en Cuenca", language="es")
+    assert ambiguous["provider"] == "spacy"
+    assert ambiguous["locations"] == ["Cuenca"]
+    assert len(loaded) == 1
+    spacy_ner_service.get_spacy_model_registry().clear()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_spacy_prepass_does_not_skip_the_model_on_a_city_match(monkeypatch):
+    """'Madrid' clears the confidence threshold, but an unknown venue next to it still reaches spaCy."""
+    settings = Settings(ner_enabled=True, ner_gazetteer_prepass=True, ner_gazetteer_prepass_min_confidence=0.85)
+    entities = [SimpleNamespace(text="Madrid", label_="GPE"), SimpleNamespace(text="Cuesta de Moyano", label_="LOC")]
+    spacy_ner_service.get_spacy_model_registry().clear()
+    monkeypatch.setattr(spacy_ner_service, "SPACY_AVAILABLE", True)
+    monkeypatch.setattr(
+        spacy_ner_service,
+        "spacy",
+        SimpleNamespace(load=lambda *_args, **_kwargs: lambda _text: SimpleNamespace(ents=entities)),
+    )
+    service = SpacyNERService(settings=settings)
+
+    result = await service.extract_locations("Quiero ir en Madrid a la Cuesta de Moyano", language="es")
+
+    assert result["provider"] == "spacy"
+    assert "prepass" not in result
+    assert result["locations"] == ["Madrid", "Cuesta de Moyano"]
+    spacy_ner_service.get_spacy_model_registry().clear()
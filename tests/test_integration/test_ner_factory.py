@@ -3,6 +3,7 @@
 import pytest
 
 from integration.configuration.settings import Settings
+from integration.external_apis.gazetteer_ner_service import GazetteerNERService
 from integration.external_apis.ner_factory import NERServiceFactory
 from integration.external_apis.spacy_ner_service import SpacyNERService
 from shared.interfaces.ner_interface import NERServiceInterface
@@ -44,6 +45,13 @@ def test_ner_factory_create_from_settings_uses_configured_provider():
     assert isinstance(service, SpacyNERService)
 
 
+@pytest.mark.integration
+def test_ner_factory_create_gazetteer_provider_from_settings():
+    """Built-in 'gazetteer' provider must be selectable through settings."""
+    service = NERServiceFactory.create_from_settings(Settings(ner_provider="gazetteer"))
+    assert isinstance(service, GazetteerNERService)
+
+
 @pytest.mark.integration
 def test_ner_factory_register_custom_provider_and_create():
     """Custom provider registration should be available via create_service."""
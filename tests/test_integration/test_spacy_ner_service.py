@@ -1,12 +1,23 @@
 """Integration tests for spaCy NER provider behavior."""
 
+import asyncio
+import threading
 from types import SimpleNamespace
 
 import pytest
 
 from integration.configuration.settings import Settings
 from integration.external_apis import spacy_ner_service
-from integration.external_apis.spacy_ner_service import SpacyNERService
+from integration.external_apis.spacy_batcher import SpacyBatcher
+from integration.external_apis.spacy_ner_service import SpacyModelRegistry, SpacyNERService
+
+
+@pytest.fixture(autouse=True)
+def _clear_spacy_model_registry():
+    """Models loaded through fake spaCy modules must not leak across tests."""
+    spacy_ner_service.get_spacy_model_registry().clear()
+    yield
+    spacy_ner_service.get_spacy_model_registry().clear()
 
 
 def _build_doc(entities: list[tuple[str, str]]):
@@ -38,7 +49,7 @@ async def test_spacy_service_extracts_locations_spanish(monkeypatch):
         spacy_ner_service,
         "spacy",
         SimpleNamespace(
-            load=lambda model: _build_fake_nlp(
+            load=lambda model, **_kwargs: _build_fake_nlp(
                 [
                     ("Barcelona", "GPE"),
                     ("Barcelona", "LOC"),
@@ -74,7 +85,7 @@ async def test_spacy_service_supports_english_model_map(monkeypatch):
     monkeypatch.setattr(
         spacy_ner_service,
         "spacy",
-        SimpleNamespace(load=lambda model: _build_fake_nlp([("London", "GPE"), ("Paris", "GPE")])),
+        SimpleNamespace(load=lambda model, **_kwargs: _build_fake_nlp([("London", "GPE"), ("Paris", "GPE")])),
     )
 
     result = await service.extract_locations("Trip from London to Paris", language="en")
@@ -97,7 +108,7 @@ async def test_spacy_service_fallback_when_primary_model_missing(monkeypatch):
     )
     service = SpacyNERService(settings=settings)
 
-    def _load(model_name: str):
+    def _load(model_name: str, **_kwargs):
         if model_name == "es_core_news_md":
             raise OSError("model not found")
         return _build_fake_nlp([("Madrid", "GPE")])
@@ -127,10 +138,121 @@ async def test_spacy_service_returns_model_unavailable_when_no_model_loads(monke
     monkeypatch.setattr(
         spacy_ner_service,
         "spacy",
-        SimpleNamespace(load=lambda _model: (_ for _ in ()).throw(OSError("model not found"))),
+        SimpleNamespace(load=lambda _model, **_kwargs: (_ for _ in ()).throw(OSError("model not found"))),
     )
 
     result = await service.extract_locations("Sevilla", language="es")
 
     assert result["status"] == "model_unavailable"
     assert result["locations"] == []
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_spacy_registry_shares_models_across_service_instances(monkeypatch):
+    """Models load once per process with NER-only components, whatever the number of services."""
+    settings = Settings(ner_enabled=True, ner_model_map='{"es":"es_core_news_md"}')
+    load_calls: list[tuple[str, list[str]]] = []
+
+    def _load(model_name: str, exclude=()):
+        load_calls.append((model_name, list(exclude)))
+        return _build_fake_nlp([("Madrid", "GPE")])
+
+    monkeypatch.setattr(spacy_ner_service, "SPACY_AVAILABLE", True)
+    monkeypatch.setattr(spacy_ner_service, "spacy", SimpleNamespace(load=_load))
+
+    for _ in range(3):
+        result = await SpacyNERService(settings=settings).extract_locations("Quiero ir a Madrid", language="es")
+        assert result["locations"] == ["Madrid"]
+
+    assert len(load_calls) == 1
+    assert load_calls[0][0] == "es_core_news_md"
+    assert "parser" in load_calls[0][1]
+    assert "ner" not in load_calls[0][1]
+
+
+@pytest.mark.integration
+def test_spacy_preload_reports_readiness_and_fallback(monkeypatch):
+    """Preloading records which model serves each language and per-model load stats."""
+    settings = Settings(
+        ner_enabled=True,
+        ner_model_map='{"es":"es_core_news_md","en":"en_core_web_sm"}',
+        ner_fallback_model="es_core_news_sm",
+    )
+    registry = SpacyModelRegistry()
+
+    def _load(model_name: str, **_kwargs):
+        if model_name == "es_core_news_md":
+            raise OSError("model not found")
+        return _build_fake_nlp([])
+
+    monkeypatch.setattr(spacy_ner_service, "SPACY_AVAILABLE", True)
+    monkeypatch.setattr(spacy_ner_service, "spacy", SimpleNamespace(load=_load))
+
+    languages = SpacyNERService(settings=settings, model_registry=registry).preload_models()
+
+    status = registry.get_status()
+    assert languages == {"en": "en_core_web_sm", "es": "es_core_news_sm"}
+    assert status["ready"] is True
+    assert status["models"]["es_core_news_md"]["status"] == "failed"
+    assert status["models"]["en_core_web_sm"]["status"] == "loaded"
+    assert "load_time_ms" in status["models"]["en_core_web_sm"]
+
+
+class _PipeRecordingNLP:
+    """Fake pipeline whose first pipe() call blocks until released, so later texts queue up."""
+
+    def __init__(self):
+        self.pipe_batches: list[list[str]] = []
+        self.release = threading.Event()
+
+    def __call__(self, text: str):
+        raise AssertionError("batched path must use nlp.pipe")
+
+    def pipe(self, texts, batch_size: int = 32):
+        self.release.wait(timeout=2)
+        texts = list(texts)
+        self.pipe_batches.append(texts)
+        return [_build_doc([(text, "GPE")]) for text in texts]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_spacy_service_batches_concurrent_requests_with_pipe(monkeypatch):
+    """Concurrent requests inside the window are processed by a single nlp.pipe call."""
+    nlp = _PipeRecordingNLP()
+    monkeypatch.setattr(spacy_ner_service, "SPACY_AVAILABLE", True)
+    monkeypatch.setattr(spacy_ner_service, "spacy", SimpleNamespace(load=lambda _model, **_kwargs: nlp))
+    batcher = SpacyBatcher(batch_size=8, window_ms=50)
+    service = SpacyNERService(settings=Settings(ner_enabled=True), batcher=batcher)
+
+    cities = ["Madrid", "Sevilla", "Toledo", "Bilbao", "Cádiz", "Lugo"]
+    pending = asyncio.gather(*(service.extract_locations(city, language="es") for city in cities))
+    await asyncio.sleep(0.05)
+    nlp.release.set()
+    results = await pending
+
+    assert [result["locations"] for result in results] == [[city] for city in cities]
+    assert [city for batch in nlp.pipe_batches for city in batch] == cities
+    assert len(nlp.pipe_batches) <= 2
+    assert batcher.get_stats()["processed"] == len(cities)
+    batcher.stop()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_spacy_service_runs_unbatched_when_batch_queue_full(monkeypatch):
+    """A full batch queue degrades to direct execution instead of failing the request."""
+    monkeypatch.setattr(spacy_ner_service, "SPACY_AVAILABLE", True)
+    monkeypatch.setattr(
+        spacy_ner_service,
+        "spacy",
+        SimpleNamespace(load=lambda _model, **_kwargs: _build_fake_nlp([("Granada", "GPE")])),
+    )
+    batcher = SpacyBatcher(queue_size=1)
+    monkeypatch.setattr(batcher, "submit", lambda _nlp, _text: None)
+    service = SpacyNERService(settings=Settings(ner_enabled=True), batcher=batcher)
+
+    result = await service.extract_locations("Alhambra de Granada", language="es")
+
+    assert result["locations"] == ["Granada"]
@@ -0,0 +1,139 @@
+"""Integration tests for the out-of-process spaCy NER worker pool."""
+
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from integration.configuration.settings import Settings
+from integration.external_apis import spacy_procpool_ner_service
+from integration.external_apis.spacy_procpool_ner_service import SpacyProcessPool, SpacyProcessPoolNERService
+
+FAKE_LOADER = "tests.test_integration.test_spacy_procpool_ner_service:fake_load"
+KNOWN_PLACES = ("Madrid", "Toledo", "Museo del Prado")
+
+
+def fake_load(model_name: str):
+    """Loader executed inside worker processes: tags known places, crashes on demand."""
+    if model_name == "missing_model":
+        raise OSError("model not found")
+    if model_name == "crash_on_load":
+        os._exit(4)
+
+    def _nlp(text: str):
+        if text == "__crash__":
+            os._exit(3)
+        ents = []
+        for place in KNOWN_PLACES:
+            start = text.find(place)
+            if start >= 0:
+                ents.append(SimpleNamespace(start_char=start, end_char=start + len(place), label_="GPE"))
+        ents.append(SimpleNamespace(start_char=0, end_char=1, label_="DATE"))
+        return SimpleNamespace(ents=ents)
+
+    return _nlp
+
+
+@pytest.fixture
+def pool():
+    process_pool = SpacyProcessPool(
+        pool_size=2,
+        model_map={"es": "es_core_news_md", "en": "missing_model"},
+        fallback_model="es_core_news_sm",
+        request_timeout=20.0,
+        model_loader=FAKE_LOADER,
+    )
+    yield process_pool
+    process_pool.stop()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_procpool_extracts_location_spans_from_workers(pool):
+    """Workers return only location spans; the parent slices text and builds the spaCy payload."""
+    service = SpacyProcessPoolNERService(settings=Settings(ner_enabled=True), pool=pool)
+
+    result = await service.extract_locations("Ruta de Madrid a Toledo", language="es")
+    english = await service.extract_locations("Trip to Madrid", language="en")
+
+    assert result["status"] == "ok"
+    assert result["provider"] == "spacy_procpool"
+    assert result["model"] == "es_core_news_md"
+    assert result["locations"] == ["Madrid", "Toledo"]
+    assert english["model"] == "es_core_news_sm"
+
+    health = await service.health_check()
+    assert health["healthy"] is True
+    assert len(health["workers"]) == 2
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_procpool_restarts_crashed_worker(pool):
+    """A crashing worker fails its request, is respawned, and the pool keeps serving."""
+    service = SpacyProcessPoolNERService(settings=Settings(ner_enabled=True), pool=pool)
+    await service.extract_locations("Madrid", language="es")
+
+    crashed = await service.extract_locations("__crash__", language="es")
+    assert crashed["status"] == "worker_error"
+
+    result = await service.extract_locations("Visita el Museo del Prado", language="es")
+    assert result["locations"] == ["Museo del Prado"]
+
+    stats = pool.get_stats()
+    assert stats["restarts"] == 1
+    assert len(stats["workers"]) == 2
+    assert (await pool.health_check(timeout=20.0))["healthy"] is True
+
+
+async def _wait_for(condition, timeout: float = 30.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.05)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_procpool_does_not_respawn_a_worker_that_cannot_load():
+    """A bad loader path is reported through READY and the slot is not respawned in a loop."""
+    pool = SpacyProcessPool(pool_size=1, model_map={"es": "es_core_news_md"}, model_loader="tests.no_such_module:load")
+    try:
+        pool.start()
+        await _wait_for(lambda: pool.get_stats()["abandoned_slots"] == 1)
+        await asyncio.sleep(0.5)
+
+        stats = pool.get_stats()
+        assert "cannot import NER model loader" in stats["workers"][0]["load_error"]
+        assert stats["restarts"] == 0
+        assert stats["ready"] is False
+        service = SpacyProcessPoolNERService(settings=Settings(ner_enabled=True), pool=pool)
+        assert (await service.extract_locations("Madrid", language="es"))["status"] == "worker_error"
+    finally:
+        pool.stop()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_procpool_backs_off_and_gives_up_on_a_crash_loop(monkeypatch):
+    """A worker that dies at startup is respawned with backoff, at most max_restarts times."""
+    monkeypatch.setattr(spacy_procpool_ner_service, "_RESTART_BACKOFF_INITIAL", 0.2)
+    pool = SpacyProcessPool(
+        pool_size=1,
+        model_map={"es": "crash_on_load"},
+        fallback_model="crash_on_load",
+        model_loader=FAKE_LOADER,
+        max_restarts=2,
+    )
+    try:
+        pool.start()
+        await _wait_for(lambda: pool.get_stats()["abandoned_slots"] == 1)
+        await asyncio.sleep(0.5)
+
+        stats = pool.get_stats()
+        assert stats["restarts"] == 2
+        assert stats["worker_errors"] == 3
+        assert stats["workers"][0]["alive"] is False
+    finally:
+        pool.stop()
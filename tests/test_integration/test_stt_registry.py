@@ -0,0 +1,97 @@
+"""The STT agent is created once per process and its status is served from cache."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from integration.external_apis.stt_registry import STTAgentRegistry
+from tests.fakes.stt_agent import FakeSTTAgent
+
+
+def test_agent_is_created_once_for_concurrent_callers():
+    created = []
+
+    def factory():
+        created.append(1)
+        return FakeSTTAgent()
+
+    registry = STTAgentRegistry(factory)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        agents = list(pool.map(lambda _: registry.get(), range(32)))
+
+    assert len(created) == 1
+    assert all(agent is agents[0] for agent in agents)
+    status = registry.get_status()
+    assert status["ready"] is True
+    assert status["service"] == "Fake STT"
+    assert status["supported_formats"] == ["wav"]
+
+
+def test_failed_creation_is_cached_and_reported():
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        raise ImportError("No module named 'azure'")
+
+    registry = STTAgentRegistry(factory)
+
+    assert registry.get() is None
+    assert registry.get() is None
+    assert len(attempts) == 1
+    status = registry.get_status()
+    assert status == {**status, "ready": False, "state": "failed", "error_type": "ImportError"}
+
+
+def test_status_does_not_wait_for_a_load_in_progress():
+    release = threading.Event()
+    registry = STTAgentRegistry(lambda: release.wait(5) and FakeSTTAgent())
+    registry.mark_loading()
+    loader = threading.Thread(target=registry.get)
+    loader.start()
+
+    try:
+        status = registry.get_status()
+    finally:
+        release.set()
+        loader.join()
+
+    assert status["ready"] is False
+    assert status["state"] == "loading"
+    assert registry.get_status()["ready"] is True
+
+
+def test_failed_creation_is_retried_after_the_cooldown(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("integration.external_apis.stt_registry.time.monotonic", lambda: clock[0])
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ImportError("No module named 'azure'")
+        return FakeSTTAgent()
+
+    registry = STTAgentRegistry(factory, retry_after=30.0)
+
+    assert registry.get() is None
+    assert registry.get_status()["retry_after_seconds"] == 30.0
+    clock[0] += 29.0
+    assert registry.get() is None
+    clock[0] += 1.0
+    assert registry.get() is not None
+    assert len(attempts) == 2
+    assert registry.get_status()["state"] == "ready"
+
+
+def test_failing_service_info_marks_the_load_failed():
+    agent = FakeSTTAgent()
+
+    def broken_info():
+        raise RuntimeError("model file missing")
+
+    agent.stt_service.get_service_info = broken_info
+    registry = STTAgentRegistry(lambda: agent)
+
+    assert registry.get() is None
+    status = registry.get_status()
+    assert status == {**status, "ready": False, "state": "failed", "error_type": "RuntimeError"}
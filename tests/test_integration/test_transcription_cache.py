@@ -0,0 +1,229 @@
+"""Identical audio is transcribed once: content-hash LRU with an optional SQLite tier."""
+
+import asyncio
+import importlib.util
+import sys
+import types
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from integration.configuration.settings import Settings
+from integration.external_apis.transcription_cache import TranscriptionCache, audio_fingerprint, cache_key
+
+
+def _tone(seconds: float = 1.0, frequency: float = 220.0) -> np.ndarray:
+    t = np.arange(int(seconds * 16000)) / 16000
+    return (0.3 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def test_fingerprint_depends_only_on_content():
+    clip = _tone()
+
+    assert audio_fingerprint(clip) == audio_fingerprint(clip.copy())
+    assert audio_fingerprint(clip) == audio_fingerprint(clip.astype(np.float64))
+    assert audio_fingerprint(clip) != audio_fingerprint(_tone(frequency=330.0))
+    assert audio_fingerprint(b"RIFF....") == audio_fingerprint(b"RIFF....")
+
+
+def test_key_changes_with_language_provider_and_options():
+    fingerprint = audio_fingerprint(_tone())
+    base = cache_key(fingerprint, "Whisper/base", "es-ES", {})
+
+    assert base == cache_key(fingerprint, "Whisper/base", "es-ES", {})
+    assert base != cache_key(fingerprint, "Whisper/base", "en-US", {})
+    assert base != cache_key(fingerprint, "Azure/default", "es-ES", {})
+    assert base != cache_key(fingerprint, "Whisper/base", "es-ES", {"initial_prompt": "Madrid"})
+
+
+async def test_lru_evicts_least_recently_used():
+    cache = TranscriptionCache(max_entries=2)
+    await cache.put("a", "uno")
+    await cache.put("b", "dos")
+    assert await cache.get("a") == "uno"  # "b" is now the oldest
+
+    await cache.put("c", "tres")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "uno"
+    assert await cache.get("c") == "tres"
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (3, 1, 3)
+
+
+async def test_empty_transcriptions_are_not_stored():
+    cache = TranscriptionCache()
+    await cache.put("silence", "  ")
+
+    assert await cache.get("silence") is None
+
+
+async def test_disk_tier_survives_a_restart(tmp_path):
+    path = tmp_path / "stt-cache.sqlite3"
+    first = TranscriptionCache(disk_path=str(path))
+    await first.put("key", "hola")
+    first.close()
+
+    second = TranscriptionCache(disk_path=str(path))
+    assert await second.get("key") == "hola"
+    assert await second.get("key") == "hola"  # promoted to memory
+    stats = second.get_stats()
+    second.close()
+
+    assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+    assert stats["disk_tier"]["entries"] == 1
+
+
+async def test_disk_tier_is_trimmed_to_its_bound(tmp_path):
+    cache = TranscriptionCache(max_entries=1, disk_path=str(tmp_path / "cache.sqlite3"), disk_max_entries=3)
+    for index in range(10):
+        await cache.put(f"key-{index}", f"texto {index}")
+    cache.close()
+
+    reopened = TranscriptionCache(disk_path=str(tmp_path / "cache.sqlite3"))
+    assert reopened.get_stats()["disk_tier"]["entries"] == 3
+    assert await reopened.get("key-9") == "texto 9"
+    reopened.close()
+
+
+def test_cache_can_be_disabled_from_settings(monkeypatch):
+    settings = Settings()
+    assert isinstance(TranscriptionCache.create_from_settings(settings), TranscriptionCache)
+
+    monkeypatch.setattr(settings, "stt_cache_enabled", False)
+    assert TranscriptionCache.create_from_settings(settings) is None
+
+
+class _CountingSTTService:
+    """STTServiceInterface stand-in that counts real transcriptions."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls: List[Dict[str, Any]] = []
+
+    async def transcribe_audio(self, audio_path: Path, **kwargs) -> str:
+        self.calls.append({"audio_path": audio_path, **kwargs})
+        return "desde fichero"
+
+    async def transcribe_buffer(self, audio: np.ndarray, **kwargs) -> str:
+        self.calls.append({"samples": audio.size, **kwargs})
+        await asyncio.sleep(self.delay)
+        return f"transcripción {len(self.calls)}"
+
+    def is_service_available(self) -> bool:
+        return True
+
+    def get_supported_formats(self) -> List[str]:
+        return ["wav"]
+
+    def get_service_info(self) -> Dict[str, Any]:
+        return {"service_name": "Counting STT", "model": "test"}
+
+
+def _failing_after(service: _CountingSTTService, delay: float):
+    async def transcribe_buffer(audio: np.ndarray, **kwargs) -> str:
+        service.calls.append({"samples": audio.size, **kwargs})
+        await asyncio.sleep(delay)
+        raise RuntimeError("STT backend unavailable")
+
+    return transcribe_buffer
+
+
+@pytest.fixture
+def agent_cls(monkeypatch):
+    # stt_agent imports the STT factory (and with it the Azure SDK) only for create_stt_agent();
+    # load a private copy against a stub factory so these tests run without the SDK
+    stub_factory = types.ModuleType("integration.external_apis.stt_factory")
+    stub_factory.STTServiceFactory = None
+    monkeypatch.setitem(sys.modules, stub_factory.__name__, stub_factory)
+    spec = importlib.util.find_spec("integration.external_apis.stt_agent")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.VoiceflowSTTAgent
+
+
+async def test_agent_serves_repeated_audio_from_cache(agent_cls):
+    service = _CountingSTTService()
+    agent = agent_cls(service, cache=TranscriptionCache())
+    clip = _tone()
+
+    first = await agent.transcribe_buffer_cached(clip, language="es-ES")
+    second = await agent.transcribe_buffer_cached(clip.copy(), language="es-ES")
+    other_language = await agent.transcribe_buffer_cached(clip, language="en-US")
+
+    assert (first.cache_hit, second.cache_hit, other_language.cache_hit) == (False, True, False)
+    assert second.text == first.text
+    assert len(service.calls) == 2
+    assert agent.get_service_info()["cache"]["hits"] == 1
+
+
+async def test_agent_cache_is_keyed_by_file_content(agent_cls, tmp_path):
+    service = _CountingSTTService()
+    agent = agent_cls(service, cache=TranscriptionCache())
+    for name in ("first.webm", "retry.webm"):
+        (tmp_path / name).write_bytes(b"\x1a\x45\xdf\xa3same upload")
+
+    assert (await agent.transcribe_audio_cached(tmp_path / "first.webm")).cache_hit is False
+    assert (await agent.transcribe_audio_cached(tmp_path / "retry.webm")).cache_hit is True
+    assert len(service.calls) == 1
+
+
+async def test_concurrent_retry_waits_for_the_first_transcription(agent_cls):
+    service = _CountingSTTService(delay=0.05)
+    agent = agent_cls(service, cache=TranscriptionCache())
+    clip = _tone()
+
+    first, retry = await asyncio.gather(agent.transcribe_buffer_cached(clip), agent.transcribe_buffer_cached(clip))
+
+    assert len(service.calls) == 1
+    assert retry == (first.text, True)
+    stats = agent.get_service_info()["cache"]
+    assert (stats["hits"], stats["coalesced_hits"], stats["misses"]) == (1, 1, 1)
+
+
+async def test_cancelling_the_first_caller_does_not_cancel_waiters(agent_cls):
+    service = _CountingSTTService(delay=0.05)
+    agent = agent_cls(service, cache=TranscriptionCache())
+    clip = _tone()
+
+    first = asyncio.create_task(agent.transcribe_buffer_cached(clip))
+    await asyncio.sleep(0.01)
+    retry = asyncio.create_task(agent.transcribe_buffer_cached(clip))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    result = await retry
+
+    assert first.cancelled()
+    assert result.cache_hit is False
+    assert len(service.calls) == 2
+    assert await agent.transcribe_buffer_cached(clip) == (result.text, True)
+
+
+async def test_transcription_errors_are_shared_with_waiters(agent_cls):
+    service = _CountingSTTService(delay=0.05)
+    service.transcribe_buffer = _failing_after(service, 0.05)
+    agent = agent_cls(service, cache=TranscriptionCache())
+    clip = _tone()
+
+    results = await asyncio.gather(
+        agent.transcribe_buffer_cached(clip), agent.transcribe_buffer_cached(clip), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert len(service.calls) == 1
+
+
+async def test_use_cache_false_always_transcribes(agent_cls):
+    service = _CountingSTTService()
+    agent = agent_cls(service, cache=TranscriptionCache())
+    clip = _tone()
+
+    await agent.transcribe_buffer(clip, use_cache=False)
+    await agent.transcribe_buffer(clip, use_cache=False)
+
+    assert len(service.calls) == 2
+    assert agent.get_service_info()["cache"]["stores"] == 0
@@ -0,0 +1,147 @@
+"""StreamingVAD finds utterance boundaries independently of how the audio is chunked."""
+
+import numpy as np
+import pytest
+
+from integration.external_apis.voice_activity import StreamingVAD, VADConfig, speech_segments, trim_silence
+
+RATE = 16000
+
+
+def _tone(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _noise(seconds: float, amplitude: float = 0.001) -> np.ndarray:
+    return (amplitude * np.random.default_rng(0).standard_normal(int(seconds * RATE))).astype(np.float32)
+
+
+def _events(vad: StreamingVAD, audio: np.ndarray, chunk: int):
+    events = []
+    for offset in range(0, audio.size, chunk):
+        events.extend(vad.process(audio[offset : offset + chunk]))
+    return [(event.kind, event.sample) for event in events]
+
+
+def test_detects_speech_between_silences():
+    audio = np.concatenate((_noise(1.0), _tone(1.5), _noise(1.0)))
+
+    events = _events(StreamingVAD(), audio, chunk=RATE)
+
+    assert [kind for kind, _ in events] == ["speech_start", "speech_end"]
+    (_, start), (_, end) = events
+    assert abs(start - RATE) <= 480
+    assert abs(end - int(2.5 * RATE)) <= 480
+
+
+def test_chunk_size_does_not_change_the_boundaries():
+    audio = np.concatenate((_noise(0.5), _tone(1.0), _noise(1.0), _tone(0.8), _noise(1.0)))
+
+    assert _events(StreamingVAD(), audio, chunk=137) == _events(StreamingVAD(), audio, chunk=RATE * 2)
+
+
+def test_short_pauses_stay_inside_the_utterance():
+    audio = np.concatenate((_noise(0.5), _tone(0.6), _noise(0.3), _tone(0.6), _noise(1.0)))
+
+    events = _events(StreamingVAD(VADConfig(hangover_ms=500)), audio, chunk=1024)
+
+    assert [kind for kind, _ in events] == ["speech_start", "speech_end"]
+
+
+def test_clicks_shorter_than_start_window_are_ignored():
+    audio = np.concatenate((_noise(0.5), _tone(0.03), _noise(1.0)))
+
+    assert _events(StreamingVAD(), audio, chunk=1024) == []
+
+
+def test_noise_floor_adapts_to_background_level():
+    faint = _tone(0.5, amplitude=0.02)  # ~ -37 dBFS
+
+    quiet_room = StreamingVAD()
+    quiet_room.process(np.zeros(RATE, dtype=np.float32))
+    quiet_room.process(faint)
+
+    noisy_room = StreamingVAD()
+    noisy_room.process(_noise(2.0, amplitude=0.005))  # ~ -46 dBFS background
+    noisy_room.process(faint)
+
+    assert quiet_room.in_speech
+    assert not noisy_room.in_speech
+
+
+def test_quiet_fricative_before_a_vowel_is_kept_in_the_segment():
+    hiss = _noise(0.3, amplitude=0.008)  # ~ -42 dBFS, below min_energy_db but crossing zero constantly
+    audio = np.concatenate((np.zeros(RATE // 2, dtype=np.float32), hiss, _tone(0.5), np.zeros(RATE, dtype=np.float32)))
+
+    ((start, _),) = speech_segments(audio, VADConfig(min_energy_db=-40.0))
+    ((start_without_zcr, _),) = speech_segments(audio, VADConfig(min_energy_db=-40.0, zcr_threshold=1.0))
+
+    assert abs(start - RATE // 2) <= 480
+    assert abs(start_without_zcr - int(0.8 * RATE)) <= 480
+
+
+def test_hiss_alone_does_not_open_a_segment():
+    assert speech_segments(_noise(1.0, amplitude=0.008), VADConfig(min_energy_db=-40.0)) == []
+
+
+def test_trim_silence_cuts_edges_and_shortens_pauses():
+    audio = np.concatenate((_noise(2.0), _tone(1.0), _noise(3.0), _tone(1.0), _noise(2.0)))
+
+    result = trim_silence(audio, padding_ms=200, max_pause_ms=500)
+
+    assert result.has_speech
+    assert len(result.segments) == 2
+    assert result.original_seconds == 9.0
+    # 2 x (1 s speech + 2 x 0.2 s padding) + 0.5 s pause
+    assert abs(result.trimmed_seconds - 3.3) < 0.1
+
+
+def test_trim_silence_keeps_speech_running_to_the_end():
+    audio = np.concatenate((_noise(1.0), _tone(1.0)))
+
+    result = trim_silence(audio, padding_ms=200)
+
+    assert result.segments[-1][1] == audio.size
+    assert abs(result.trimmed_seconds - 1.2) < 0.05
+
+
+def test_trim_silence_of_pure_silence_is_empty():
+    result = trim_silence(_noise(3.0))
+
+    assert not result.has_speech
+    assert result.samples.size == 0
+
+
+def _room_noise(seconds: float, level_db: float) -> np.ndarray:
+    amplitude = 10 ** (level_db / 20)  # white noise RMS in dBFS
+    return (amplitude * np.random.default_rng(1).standard_normal(int(seconds * RATE))).astype(np.float32)
+
+
+@pytest.mark.parametrize("level_db", [-44.0, -40.0, -30.0])
+def test_steady_room_noise_louder_than_min_energy_is_silence(level_db):
+    result = trim_silence(_room_noise(5.0, level_db))
+
+    assert not result.has_speech
+    assert result.samples.size == 0
+
+
+@pytest.mark.parametrize("level_db", [-44.0, -30.0])
+def test_speech_over_room_noise_opens_and_closes_a_segment(level_db):
+    audio = _room_noise(5.0, level_db)
+    audio[2 * RATE : 3 * RATE] += _tone(1.0)
+
+    events = _events(StreamingVAD(), audio, chunk=1024)
+
+    assert [kind for kind, _ in events] == ["speech_start", "speech_end"]
+    (_, start), (_, end) = events
+    assert abs(start - 2 * RATE) <= 480
+    assert abs(end - 3 * RATE) <= 480
+
+
+def test_speech_at_the_very_start_is_not_taken_for_the_noise_floor():
+    audio = np.concatenate((_tone(1.0), _noise(1.0)))
+
+    ((start, end),) = speech_segments(audio)
+    assert start == 0
+    assert abs(end - RATE) <= 480